@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Font Subsetter
+Cuts every font in this folder down to the characters the site uses and
+writes it as WOFF2.
+
+Usage:
+    cd src/assets/fonts/
+    python3 optimize_fonts.py [--jobs N]
+
+This script:
+1. Collects the characters in src/ and the HTML shells (plus printable ASCII)
+2. Subsets each .ttf / .otf / .woff2 here to the ones it has, keeping layout
+   features and variable axes
+3. Writes <name>.subset.woff2 next to the font
+4. Caches each subset by font hash plus glyph-set hash, so a rerun with the
+   same fonts and text does no work
+
+The source fonts stay in place (the Nissan 300ZX sketch loads them with
+p5); the @font-face rules in src/css/style.css and the preloads in
+index.html use the .subset.woff2 files. Re-run after adding text with new
+characters. See pipeline/fonts.py for details.
+Requires fontTools and brotli (pip install -r src/assets/requirements.txt).
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pipeline.cache import add_cache_arguments, open_cache
+from pipeline.fonts import find_fonts, fonttools_available, subset_fonts
+from pipeline.workers import add_jobs_argument
+
+def main():
+    parser = argparse.ArgumentParser(description="Subset the site's fonts to the characters it uses and write WOFF2")
+    add_cache_arguments(parser)
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    os.chdir(script_dir)
+
+    print("Font Subsetter")
+    print("=" * 60)
+
+    if not fonttools_available():
+        print("✗ fontTools/brotli not installed; pip install fonttools brotli to subset fonts")
+        sys.exit(1)
+
+    fonts = find_fonts(Path('.'))
+    if not fonts:
+        print("No fonts found.")
+        return
+
+    cache = open_cache(args)
+    summary = subset_fonts(cache, fonts, args.jobs)
+    cache.close()
+
+    print("\n" + "=" * 60)
+    print(f"Fonts subset: {summary['written']} written, {summary['cached']} cached, {len(summary['failed'])} failed")
+    if summary['source_bytes']:
+        print(f"Total: {summary['source_bytes']/1024:.1f}KB -> {summary['bytes']/1024:.1f}KB "
+              f"({(1 - summary['bytes'] / summary['source_bytes']) * 100:.0f}% smaller)")
+    if summary['failed']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
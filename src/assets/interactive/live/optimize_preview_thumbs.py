@@ -5,28 +5,48 @@ Creates 256x256 center-cropped WebP thumbnails for fast preview loading.
 
 Usage:
     cd src/assets/interactive/live/
-    python3 optimize_preview_thumbs.py
+    python3 optimize_preview_thumbs.py [--loops] [--atlas]
 
 This script:
 1. Processes the first image from each project gallery
 2. Creates 256x256 center-cropped square thumbnails
 3. Optimizes for fast loading in hover previews
-4. Handles both direct images and existing video thumbnails
+4. Handles both direct images and videos (using the poster frame that
+   optimize_videos.py recorded for the project's first video)
+5. With --loops (needs ffmpeg), also cuts a short 256x256 animated WebP
+   (<project>-loop.webp, same center crop, within a byte budget) from each
+   video project's first video, shown in place of the still on hover
+6. With --atlas, also packs the stills into preview-thumbs/atlas.webp and
+   atlas@2x.webp (coordinates in atlas.json and the manifest), so the page
+   can load one image instead of nine
+7. Rewrites preview-thumbs/manifest.js, which project-details.js reads
 """
 
 import os
 import sys
-from PIL import Image, ImageOps
-import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from pipeline.atlas import atlas_paths, write_atlas
+from pipeline.cache import add_cache_arguments, open_cache
+from pipeline.ingest import (PREVIEW_THUMB_PARAMS, IngestJob, Variant, encode_options,
+                             ingest_original, square_params, with_options)
+from pipeline.encoders import add_format_arguments, report_missing
+from pipeline.manifest import write_manifest
+from pipeline.quality import add_quality_arguments, print_savings_report
+from pipeline.trace import add_trace_arguments, finish_trace
+from pipeline.video import LoopJob, encode_loops, ffmpeg_available, loop_params, video_poster
+from pipeline.workers import add_jobs_argument, ingest_all
 
 # Project data mapping first images to generate thumbnails
 PROJECTS = {
     'sketching-flock': {
-        'first_image': 'sketching-flock/thumbnails/IMG_6871_optimized_thumb.jpg',  # Video thumbnail
+        'first_video': 'sketching-flock/IMG_6871_optimized.mp4',  # Poster from the catalog
         'output_name': 'sketching-flock.webp'
     },
     'we-play': {
-        'first_image': 'we-play/thumbnails/IMG_7210_optimized_thumb.jpg',  # Video thumbnail
+        'first_video': 'we-play/IMG_7210_optimized.mp4',  # Poster from the catalog
         'output_name': 'we-play.webp'
     },
     'blind-spots': {
@@ -34,11 +54,11 @@ PROJECTS = {
         'output_name': 'blind-spots.webp'
     },
     'the-reader': {
-        'first_image': 'the-reader/thumbnails/the-reader-video_optimized_thumb.jpg',  # Video thumbnail
+        'first_video': 'the-reader/the-reader-video_optimized.mp4',  # Poster from the catalog
         'output_name': 'the-reader.webp'
     },
     'long-winter-13-1': {
-        'first_image': 'lw-13-1/thumbnails/LW13-1_comp_optimized_thumb.jpg',  # Video thumbnail
+        'first_video': 'lw-13-1/LW13-1_comp_optimized.mp4',  # Poster from the catalog
         'output_name': 'long-winter-13-1.webp'
     },
     'game-set-match': {
@@ -46,77 +66,86 @@ PROJECTS = {
         'output_name': 'game-set-match.webp'
     },
     'live-coding': {
-        'first_image': 'live-coding/thumbnails/IMG_2870_optimized_thumb.jpg',  # Video thumbnail
+        'first_video': 'live-coding/IMG_2870_optimized.mp4',  # Poster from the catalog
         'output_name': 'live-coding.webp'
     },
     'bird-conductor': {
-        'first_image': 'bird-conductor/thumbnails/IMG_1681_optimized_thumb.jpg',  # Video thumbnail
+        'first_video': 'bird-conductor/IMG_1681_optimized.mp4',  # Poster from the catalog
         'output_name': 'bird-conductor.webp'
     },
     'surveil-yourself': {
-        'first_image': 'surveil-yourself/thumbnails/IMG_0288_optimized_thumb.jpg',  # Video thumbnail
+        'first_video': 'surveil-yourself/IMG_0288_optimized.mp4',  # Poster from the catalog
         'output_name': 'surveil-yourself.webp'
     }
 }
 
-def center_crop_to_square(image):
-    """
-    Crop image from center to create a perfect square.
-    Maintains aspect ratio by cropping the longer dimension.
-    """
-    width, height = image.size
-    
-    if width == height:
-        return image
-    
-    # Determine crop dimensions
-    crop_size = min(width, height)
-    
-    # Calculate crop coordinates (center crop)
-    left = (width - crop_size) // 2
-    top = (height - crop_size) // 2
-    right = left + crop_size
-    bottom = top + crop_size
-    
-    return image.crop((left, top, right, bottom))
-
-def optimize_preview_thumbnail(input_path, output_path, size=256):
+def optimize_preview_thumbnail(input_path, output_path, size=256, quality=85, method=6):
     """
     Create optimized preview thumbnail:
     1. Center crop to square
     2. Resize to target size
     3. Convert to WebP with optimization
     """
-    try:
-        # Open and process image
-        with Image.open(input_path) as img:
-            # Convert to RGB if necessary (handles RGBA, grayscale, etc.)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Center crop to square
-            img_square = center_crop_to_square(img)
-            
-            # Resize to target size with high quality resampling
-            img_resized = img_square.resize((size, size), Image.Resampling.LANCZOS)
-            
-            # Save as optimized WebP
-            img_resized.save(
-                output_path,
-                'WEBP',
-                quality=85,  # Good quality for small previews
-                method=6,    # Highest compression effort
-                optimize=True
-            )
-            
-            print(f"✓ Created preview thumbnail: {os.path.basename(output_path)} ({size}x{size})")
-            return True
-            
-    except Exception as e:
-        print(f"✗ Error processing {input_path}: {str(e)}")
-        return False
+    params = square_params('preview-thumb', size, quality, method)
+    return ingest_original(input_path, [Variant(params, [output_path])])[0] is not None
+
+def preview_input(cache, config):
+    """The image a project's still is cut from: its first image, or its first video's poster."""
+    if 'first_video' in config:
+        return str(video_poster(cache, config['first_video']) or config['first_video'])
+    return config['first_image']
+
+def loop_output_path(config):
+    return os.path.join('preview-thumbs', config['output_name'].replace('.webp', '-loop.webp'))
+
+def still_paths():
+    return [Path('preview-thumbs') / config['output_name'] for config in PROJECTS.values()]
+
+def manifest_paths():
+    """
+    Everything preview-thumbs/manifest.js lists. Loops and atlases made by
+    earlier runs stay listed (missing files are skipped).
+    """
+    paths = []
+    for config, still in zip(PROJECTS.values(), still_paths()):
+        paths += [still, Path(loop_output_path(config))]
+    paths.append(atlas_paths('preview-thumbs')[0])
+    return paths
+
+def make_loops(cache, jobs):
+    """Encode the animated hover loops for every project with a first video."""
+    if not ffmpeg_available():
+        print("⚠ ffmpeg/ffprobe not found on PATH; skipping hover loops")
+        return
+    loop_jobs = []
+    for project_slug, config in PROJECTS.items():
+        if 'first_video' not in config:
+            continue
+        if not os.path.exists(config['first_video']):
+            print(f"  ✗ Video not found for {project_slug} loop: {config['first_video']}")
+            continue
+        loop_jobs.append(LoopJob(config['first_video'], loop_output_path(config), loop_params()))
+    for job, status in zip(loop_jobs, encode_loops(cache, loop_jobs, jobs)):
+        if status in ('fresh', 'restored'):
+            print(f"✓ Up to date ({status}): {os.path.basename(job.output_path)}")
+        if os.path.exists(job.output_path):
+            print(f"  {os.path.basename(job.output_path)}: {os.path.getsize(job.output_path) / 1024:.1f}KB")
 
 def main():
+    parser = argparse.ArgumentParser(description="Create center-cropped preview thumbnails")
+    add_cache_arguments(parser)
+    add_jobs_argument(parser)
+    add_quality_arguments(parser)
+    add_format_arguments(parser)
+    add_trace_arguments(parser)
+    parser.add_argument('--loops', action='store_true',
+                        help='Also cut animated WebP hover loops from video projects (needs ffmpeg)')
+    parser.add_argument('--atlas', action='store_true',
+                        help='Also pack the stills into one sprite atlas (1x and 2x) with a coordinate map')
+    args = parser.parse_args()
+    options = encode_options(args)
+    report_missing(options['formats'])
+
     # Ensure we're in the right directory
     if not os.path.exists('preview-thumbs'):
         print("Creating preview-thumbs directory...")
@@ -127,9 +156,13 @@ def main():
     
     success_count = 0
     total_count = len(PROJECTS)
+    cache = open_cache(args)
+    
+    slugs = []
+    jobs = []
     
     for project_slug, config in PROJECTS.items():
-        input_path = config['first_image']
+        input_path = preview_input(cache, config)
         output_path = os.path.join('preview-thumbs', config['output_name'])
         
         print(f"\nProcessing {project_slug}...")
@@ -141,14 +174,33 @@ def main():
             print(f"  ✗ Input file not found: {input_path}")
             continue
         
-        # Create thumbnail
-        if optimize_preview_thumbnail(input_path, output_path):
+        # Thumbnail encodes run together below (skipped when the cache says they are up to date)
+        params = with_options(PREVIEW_THUMB_PARAMS, options)
+        slugs.append(project_slug)
+        jobs.append(IngestJob(input_path, [Variant(params, [output_path])]))
+    
+    statuses = [variant_statuses[0] for variant_statuses in ingest_all(cache, jobs, args.jobs)]
+    
+    for project_slug, job, status in zip(slugs, jobs, statuses):
+        output_path = job.variants[0].output_paths[0]
+        if status:
             success_count += 1
+            if status != 'encoded':
+                print(f"✓ Up to date ({status}): {os.path.basename(output_path)}")
         
         # Show file size info
         if os.path.exists(output_path):
             size_kb = os.path.getsize(output_path) / 1024
-            print(f"  Size: {size_kb:.1f}KB")
+            print(f"  {project_slug}: {size_kb:.1f}KB")
+    
+    print_savings_report([("Preview thumbnails", [cache.output_meta(job.variants[0].output_paths[0]) for job in jobs])])
+    if args.loops:
+        make_loops(cache, args.jobs)
+    if args.atlas:
+        write_atlas(cache, 'preview-thumbs', still_paths())
+    write_manifest('preview-thumbs', manifest_paths(), cache)
+    cache.close()
+    finish_trace(args, 'optimize_preview_thumbs')
     
     print("\n" + "=" * 60)
     print(f"Preview thumbnail optimization complete!")
@@ -159,10 +211,6 @@ def main():
         print("Check file paths and ensure all input images exist.")
     else:
         print("All preview thumbnails generated successfully!")
-        print("\nNext steps:")
-        print("1. Import the new thumbnails in project-details.js")
-        print("2. Update the loadPreviewMedia() function in sketch.js")
-        print("3. Test the improved preview loading performance")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
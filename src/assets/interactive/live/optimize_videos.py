@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Interactive Live Experiences - Video Optimizer
+Transcodes project videos for the web and extracts their poster frames.
+
+Usage:
+    cd src/assets/interactive/live/
+    python3 optimize_videos.py [--codecs h264,av1] [--jobs N] [--cpu-budget N]
+    python3 optimize_videos.py --create-import-dirs
+
+This script:
+1. Picks up new videos from each project's import/ folder (create one by
+   hand, or all of them with --create-import-dirs)
+2. Encodes <name>_optimized.mp4 (H.264, at most 1080 lines, bitrate-capped)
+   and, with --codecs h264,av1, <name>_optimized_av1.mp4 next to it
+3. Writes the poster frame to thumbnails/<name>_optimized_thumb.webp (and .jpg)
+4. Records duration, resolution, bitrate and poster in the asset catalog
+5. Moves the source videos to the project's originals/ folder
+
+Requires ffmpeg and ffprobe on PATH. New videos still need adding to
+src/views/Installations/project-details.js; re-run optimize_preview_thumbs.py
+afterwards if a project's first video changed.
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from pipeline.cache import add_cache_arguments, open_cache
+from pipeline.files import move_to_originals
+from pipeline.video import (MAX_HEIGHT, VIDEO_EXTENSIONS, VideoJob, encode_all, ffmpeg_available,
+                            output_paths_for, parse_codecs, video_params)
+from pipeline.workers import add_jobs_argument
+
+def find_imports():
+    """(project dir, video path) for every video waiting in a project's import/ folder."""
+    found = []
+    for project_dir in sorted(Path('.').iterdir()):
+        import_dir = project_dir / 'import'
+        if not import_dir.is_dir():
+            continue
+        for video_path in sorted(import_dir.iterdir()):
+            if video_path.suffix in VIDEO_EXTENSIONS:
+                found.append((project_dir, video_path))
+    return found
+
+def create_import_directories():
+    """Create an empty import/ folder in every project folder (originals/ is made on the first move)."""
+    for project_dir in sorted(Path('.').iterdir()):
+        if project_dir.is_dir() and project_dir.name not in ('preview-thumbs', '__pycache__'):
+            (project_dir / 'import').mkdir(exist_ok=True)
+
+def import_videos(cache, codecs, max_height=MAX_HEIGHT, jobs=1, cpu_budget=None):
+    """
+    Encode every video waiting in an import/ folder and move the ones that
+    fully succeeded to originals/. Projects without an import/ folder are
+    skipped. Returns (moved, found, output bytes).
+    """
+    imports = find_imports()
+
+    video_jobs = []
+    for project_dir, video_path in imports:
+        outputs, poster_paths = output_paths_for(video_path, project_dir, codecs)
+        outputs = [output._replace(params=video_params(output.params['codec'], max_height)) for output in outputs]
+        video_jobs.append(VideoJob(video_path, outputs, poster_paths))
+        print(f"  {project_dir.name}: {video_path.name}")
+    if not video_jobs:
+        return 0, 0, 0
+
+    statuses = encode_all(cache, video_jobs, jobs, cpu_budget)
+
+    moved = 0
+    total_bytes = 0
+    for job, job_statuses in zip(video_jobs, statuses):
+        # The original is only moved once every output and the poster exist
+        if not all(job_statuses):
+            print(f"✗ Keeping {job.input_path} in import/ (some outputs failed)")
+            continue
+        for output in job.outputs:
+            total_bytes += cache.output_meta(output.output_path).get('bytes', 0)
+        move_to_originals(job.input_path, job.input_path.parent.parent / 'originals')
+        moved += 1
+    return moved, len(video_jobs), total_bytes
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcode project videos and extract poster frames")
+    add_cache_arguments(parser)
+    add_jobs_argument(parser)
+    parser.add_argument('--codecs', type=parse_codecs, default='h264',
+                        help="Comma-separated codecs to encode: h264, av1 (H.264 is always included; default: %(default)s)")
+    parser.add_argument('--max-height', type=int, default=MAX_HEIGHT,
+                        help="Downscale taller videos to this many lines (default: %(default)s)")
+    parser.add_argument('--cpu-budget', type=int, default=None,
+                        help="Total ffmpeg threads shared by the parallel encodes (default: one per core)")
+    parser.add_argument('--create-import-dirs', action='store_true',
+                        help="Create an empty import/ folder in every project and exit")
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    os.chdir(script_dir)
+
+    print("Interactive Live Experiences - Video Optimizer")
+    print("=" * 60)
+
+    if args.create_import_dirs:
+        create_import_directories()
+        print("✓ Created import/ folders; drop videos in and run again")
+        return
+
+    if not ffmpeg_available():
+        print("✗ ffmpeg/ffprobe not found on PATH; install ffmpeg to transcode videos")
+        sys.exit(1)
+
+    cache = open_cache(args)
+    moved, total_videos, total_bytes = import_videos(cache, args.codecs, args.max_height, args.jobs, args.cpu_budget)
+    cache.close()
+    if not total_videos:
+        print("No new videos in any import/ folder.")
+        return
+
+    print("\n" + "=" * 60)
+    print("Video optimization complete!")
+    print(f"Successfully processed: {moved}/{total_videos} videos ({total_bytes/1024/1024:.1f}MB of output)")
+    if moved:
+        print("Add new videos to src/views/Installations/project-details.js")
+        if 'av1' in args.codecs:
+            print("(The _optimized_av1.mp4 files are not referenced by the pages yet.)")
+
+if __name__ == "__main__":
+    main()
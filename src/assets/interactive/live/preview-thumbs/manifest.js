@@ -0,0 +1,198 @@
+// Generated by src/assets/pipeline/manifest.py - do not edit.
+import asset0 from 'url:./sketching-flock.webp';
+import asset1 from 'url:./we-play.webp';
+import asset2 from 'url:./blind-spots.webp';
+import asset3 from 'url:./the-reader.webp';
+import asset4 from 'url:./long-winter-13-1.webp';
+import asset5 from 'url:./game-set-match.webp';
+import asset6 from 'url:./live-coding.webp';
+import asset7 from 'url:./bird-conductor.webp';
+import asset8 from 'url:./surveil-yourself.webp';
+import asset9 from 'url:./atlas.webp';
+import asset10 from 'url:./atlas@2x.webp';
+
+export const assets = {
+    "sketching-flock.webp": {
+        "url": asset0,
+        "width": 256,
+        "height": 256,
+        "bytes": 18374,
+        "sha256": "541132186b16a5fe616ae65db41ff6501763842d0ef8f494aee5f7f4bff4620d",
+        "placeholder": "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAACQBQCdASogACAAPu1qq1EppaOiqAqpMB2JQBfJBr7aIhU7A61niGTKQ6M8h4TD4ALwPR0AAAD++SzjFhwHiL8nHy2vUegOqcIggDtG+XhG3N9e9EqjCMO2zBKmiNQdvvtcO5d4/D4dw+DHZOFhhwTMaTCty5wSiqWdpYzZN/ADa1pGOMSOgAAA",
+        "color": "#403734",
+        "dominant": "#050602",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 1,
+            "y": 1,
+            "width": 128,
+            "height": 128
+        }
+    },
+    "we-play.webp": {
+        "url": asset1,
+        "width": 256,
+        "height": 256,
+        "bytes": 10598,
+        "sha256": "d2b294571016b534028625339d78cea31ddd66b069b9a6cfd1ee6cfa34d7c74f",
+        "placeholder": "data:image/webp;base64,UklGRsgAAABXRUJQVlA4ILwAAAAQBgCdASogACAAPuFSpE2opCOiN/qoARAcCWwApzGKArwiPsW9QvpDcDdeE/j3Nff0Gx63EQXMMEAA/sB/+sbDva0fJqsoEeWq8URckeGEaEVhEcoxBa76wONWEy5c3VwEN2UXYfDsMkwZWmTfaOlZZcpK+0CfC2XvrtYYiBKT6maL8cf2+nFhuf3Jkm4RmuiRwoK/qUoNXX2kTiKgXzohDCrHJUN4+LmPB0yRtDTCfZEG/xP4o6v2sx58AA==",
+        "color": "#4c4654",
+        "dominant": "#010126",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 131,
+            "y": 1,
+            "width": 128,
+            "height": 128
+        }
+    },
+    "blind-spots.webp": {
+        "url": asset2,
+        "width": 256,
+        "height": 256,
+        "bytes": 1844,
+        "sha256": "b45b7b3964ae566be0f0a049c95df6435fe0be350325e433d2e33e82cd44c777",
+        "placeholder": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAABwBACdASogACAAPu1qrU8ppiQiMBgIATAdiWcAygBmBWJkE8YMBCQyUwaagAD99owkMkCbCkUX3sM/vctFIrKvV368w2/UWQsAi8NXpe+LOF4J060KDforFzCkiVMYzeBBD666gAA=",
+        "color": "#817366",
+        "dominant": "#867567",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 261,
+            "y": 1,
+            "width": 128,
+            "height": 128
+        }
+    },
+    "the-reader.webp": {
+        "url": asset3,
+        "width": 256,
+        "height": 256,
+        "bytes": 26174,
+        "sha256": "4548c45e3e9fd071b4a1f99e2c1e4bd94cbd2db560bb3f12323fa2d1daf65b6a",
+        "placeholder": "data:image/webp;base64,UklGRqYAAABXRUJQVlA4IJoAAABQBQCdASogACAAPulkp02pJiOiMBgMASAdCWwAqPR7b/dJkd3DbgdTA4IDwU2r+oOrSyAA/vaJoS6zAxpZWyLEuHLK6+ShzdZhR3bTdItAbRJ73vwS7dbw7c2SE+/5OZERCkcRBBZnBshmB83K9hu/H4TeLsvGgB0wB7y3uf3qOmPPvaj3mjQjDWwAPPBjVPGeZQ34TOdDJewA",
+        "color": "#505f4e",
+        "dominant": "#375755",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 1,
+            "y": 131,
+            "width": 128,
+            "height": 128
+        }
+    },
+    "long-winter-13-1.webp": {
+        "url": asset4,
+        "width": 256,
+        "height": 256,
+        "bytes": 9654,
+        "sha256": "0a25c9df035935d6e599ffb443cff68bc55ddbe6d5c30cc79c5983802f81add6",
+        "placeholder": "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAAAQBQCdASogACAAPuFcpk2opSOiMAwBEBwJbACdOUF+AcfxXYRqADzCmtJz3H5skmkgAP72slBP3JO65DeZEY05yzcKwJP/Sh20s+a/8Vg/n2IjaqzlyJl4AzGK5+/qidqi338EhC+9pgICNXJKnKW2+oWFZftG4Fq5Pagdtj+B/jC++Pa5dYDEAXWRAAAA",
+        "color": "#870403",
+        "dominant": "#c80202",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 131,
+            "y": 131,
+            "width": 128,
+            "height": 128
+        }
+    },
+    "game-set-match.webp": {
+        "url": asset5,
+        "width": 256,
+        "height": 256,
+        "bytes": 10418,
+        "sha256": "e343b96cd0b5212c068ba2614b13c5a19e572c8bbce957715b974dbeb63f8066",
+        "placeholder": "data:image/webp;base64,UklGRqoAAABXRUJQVlA4IJ4AAAAQBQCdASogACAAPu1ip02ppaMiMAgBMB2JYgCdMtpKRsqyb634Irgqewv4jgq7wygAAP7s94Z2r4ekWpO88dQiLvYh5G/XAAhgacx/CX73dUhFvW1Nic3cIesz1PkNZCH7s41HKFi6BBnqxpfnjB3a0j2P0oUgTrCrUGo2zEVqnXcqE97cL6BBQB7U5k9ZtAzGbvwzvu0hxZnDlQAAAA==",
+        "color": "#506c65",
+        "dominant": "#28362c",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 261,
+            "y": 131,
+            "width": 128,
+            "height": 128
+        }
+    },
+    "live-coding.webp": {
+        "url": asset6,
+        "width": 256,
+        "height": 256,
+        "bytes": 6236,
+        "sha256": "1b00428cbcc4ee4637f7dbbf5bdac5c1d507b3451280cefddf4f96317d69377d",
+        "placeholder": "data:image/webp;base64,UklGRq4AAABXRUJQVlA4IKIAAACQBQCdASogACAAPu1wsVKppiSiqAgBMB2JagCdL68EpwbB6kuSW+qhXoRAt9bvblMULWflwAD+5AZLKdGd/B1UofmG+acSo0bjdMqRNOcT+KFhCKQO+A83J/Y5Q3lO8/wwOX4bIXSWokX8rs24qmPtzvMn6b+405oummDUxQBd6vaQd8sM8GUtb+WBf8wY4uaEt2mQKxBGYW0c1HSGQujGQAA=",
+        "color": "#693424",
+        "dominant": "#050001",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 1,
+            "y": 261,
+            "width": 128,
+            "height": 128
+        }
+    },
+    "bird-conductor.webp": {
+        "url": asset7,
+        "width": 256,
+        "height": 256,
+        "bytes": 2318,
+        "sha256": "18b1fae6151905db753e2b5e36ba9229a91835aa379c309f51cc01e5fdff4f07",
+        "placeholder": "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAAAQBACdASogACAAPtFUoU2oJKMjN+gBABoJYwDJEDJRA0KJ+IvmjBWAAAD+9onHKGAtjSPqj225voUDFcU96kAZwMkfZEFr/aFNBUs/W2xcIW/I6YPoAA==",
+        "color": "#251817",
+        "dominant": "#080000",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 131,
+            "y": 261,
+            "width": 128,
+            "height": 128
+        }
+    },
+    "surveil-yourself.webp": {
+        "url": asset8,
+        "width": 256,
+        "height": 256,
+        "bytes": 7578,
+        "sha256": "adb0bdc20894c901bc43e2683cd6002709a211f57b0733a9ad5e847c5e6ed111",
+        "placeholder": "data:image/webp;base64,UklGRqoAAABXRUJQVlA4IJ4AAACQBQCdASogACAAPu1oqk+ppiOiMBgIATAdiWQArABjIsPlIPNlRXSrmhbRjN63XRL2iP6EQAD+7lmT4gcf7HD3e63zyqnmmjs5Kq+48P5dJCkHQV9fV4gXrLVAAj9DJJweKjhnSBpQsIqoa/5iT47C7K/ECrR34Pv53fok13RqAU4tROnNLlfUB3B38c7MocdsK2KxhNKEUmSruOSAAA==",
+        "color": "#756365",
+        "dominant": "#050102",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 261,
+            "y": 261,
+            "width": 128,
+            "height": 128
+        }
+    },
+    "atlas.webp": {
+        "url": asset9,
+        "width": 390,
+        "height": 390,
+        "bytes": 31874,
+        "sha256": "d259058063c2c32fa9b931fbcbe4465499da7e90f6b778f095efe9a93c1ad95f",
+        "placeholder": "data:image/webp;base64,UklGRuAAAABXRUJQVlA4INQAAABwBgCdASogACAAPu1uslCppqUisBgIATAdiWwAsR71MyQjgZ4Uq7m4l2RL2lJjdsxb3gYYNNc6gtEsPuAA/trJDsNwWtbtVUPQj3tgpbJx9l8ytylOIo5L7+MGXev5Vn5NCDPQnMA8fUD7fpujBMP84PBlqlcTxW+odjt5BLGcCCr/SsLV1H+f46MjVAcXvyAfTIE47hOdDaMzlNCJtWUzQf2pc6AWk5W68oJNONTFnnKEavadVhb5i/7vgkZraUiOsuIEK7zTrHuJjphdi7LKWIAAAA==",
+        "color": "#5a4641",
+        "dominant": "#070202",
+        "variants": [
+            {
+                "url": asset10,
+                "file": "atlas@2x.webp",
+                "format": "webp",
+                "width": 780,
+                "height": 780,
+                "bytes": 88862,
+                "sha256": "b520504743a82f95bf1a008837647580bb4223c0b1bcda5db7a881bbc8647f73"
+            }
+        ]
+    }
+};
@@ -0,0 +1,198 @@
+// Generated by src/assets/pipeline/manifest.py - do not edit.
+import asset0 from 'url:./asteroids.webp';
+import asset1 from 'url:./dimension-door.webp';
+import asset2 from 'url:./flow-fields.webp';
+import asset3 from 'url:./galaxy-collision.webp';
+import asset4 from 'url:./infinite-bauhaus.webp';
+import asset5 from 'url:./koi-pond.webp';
+import asset6 from 'url:./lava-lamp.webp';
+import asset7 from 'url:./nissan-300zx-z31.webp';
+import asset8 from 'url:./strange-ink.webp';
+import asset9 from 'url:./atlas.webp';
+import asset10 from 'url:./atlas@2x.webp';
+
+export const assets = {
+    "asteroids.webp": {
+        "url": asset0,
+        "width": 512,
+        "height": 512,
+        "bytes": 6594,
+        "sha256": "b727bbc5e618f534d4119d22cb9fda1a065469993a45cc5170461a5b76c54a41",
+        "placeholder": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADwAwCdASogACAAPu1oqk8ppiOiMBgIATAdiWkAAJ7oSkSXhn0WSmwAAP7zozbWclJsSc0IPfrXInszSs5wISWpkMi2kPQA",
+        "color": "#040404",
+        "dominant": "#000000",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 1,
+            "y": 1,
+            "width": 256,
+            "height": 256
+        }
+    },
+    "dimension-door.webp": {
+        "url": asset1,
+        "width": 512,
+        "height": 512,
+        "bytes": 53344,
+        "sha256": "bb7193b9ae8bb286c60ade82715a1b6a32f374172b48f1633f2247a2d5ca70e7",
+        "placeholder": "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAAAQBQCdASogACAAPu1krVCppSQisBgIATAdiWIAygAPS5LMqLmeBlBbhedvTkMPE0MAAP7ytLpD5Q1XWHMHFnzpPQplCmN/oHBJ0WsERwdfV9GrUBybbcop2yXx7JncOUyi/38roxRBdwS/wSGY74FkvMlq2W+mRjeceXAEiN7a3DxSWOIzEy3K8YMU8QAA",
+        "color": "#51383a",
+        "dominant": "#0e0e0e",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 259,
+            "y": 1,
+            "width": 256,
+            "height": 256
+        }
+    },
+    "flow-fields.webp": {
+        "url": asset2,
+        "width": 512,
+        "height": 512,
+        "bytes": 25840,
+        "sha256": "718fd4c264025bfce91959ec3253d45e6221fa0a9565c83d3f60e447075d28e7",
+        "placeholder": "data:image/webp;base64,UklGRrwAAABXRUJQVlA4ILAAAABwBgCdASogACAAPu1ysVGppySiqAqpMB2JaQAUYEXGPFCbCgsBqEmu8EfL9xqCFSlrDaLkJSBJF6PTrMAA/vG6DHyVImJJErtUikzJWibhC0OZ4Osmaaj9P0wHdiVv50LddS93sGkCeHgFvyGzG+UICR6zB11DTy3mAUVb3uboW/DKi/avkp4KdpaYDaJJ9MjvZ8VIdDwOIYK2SRKEJM0jFdSCNUcFPE6tIYDtzhAAAA==",
+        "color": "#4b4b4b",
+        "dominant": "#383838",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 517,
+            "y": 1,
+            "width": 256,
+            "height": 256
+        }
+    },
+    "galaxy-collision.webp": {
+        "url": asset3,
+        "width": 512,
+        "height": 512,
+        "bytes": 43850,
+        "sha256": "bf6f21bcdff107a186ff9c61a4e6a64b55e0f590259b94928de2f7ef72c4df9b",
+        "placeholder": "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAACwBQCdASogACAAPu1qr1CppaQiqAqpMB2JbADA+8AJU1oiv+cOpIq+bgaQBp4lgzSrJPOAuQAA/v0Bw69O+L7S9pD3ddeI63ObFqAx+YEjoZY67Oa8w0BP9+Z0gv9Q07Br5E4yhAzfmh3qtJz+yRkAAAA=",
+        "color": "#231e23",
+        "dominant": "#060606",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 1,
+            "y": 259,
+            "width": 256,
+            "height": 256
+        }
+    },
+    "infinite-bauhaus.webp": {
+        "url": asset4,
+        "width": 512,
+        "height": 512,
+        "bytes": 53872,
+        "sha256": "36b3cbe9aa04c7661322fcbf3f1554aab62469393fcd1461cee3d0b5ec4b507b",
+        "placeholder": "data:image/webp;base64,UklGRvYAAABXRUJQVlA4IOoAAADwBgCdASogACAAPu1or1AppaSiqAqpMB2JbACdMoR6btby3bY+mkygF/3Gk6MRtBii6Pzqogq0XGdhsftR6CwAAM4r8IYieXKjVb7QmJQuIjQyZiS94V1YwLZjzvB1LcI3QDauasTEN+VWkwMNvsYotjGtnzo5zy5yno3LpdhFJfki/8seCr7ejbhZD6Oq+zWHI37vdugVtUjDYCfAdSfLkQaGbtVU309BynB0r6koy66yfHrkZhiX0qPDkgA1VLiFhux2Sz1FqevEHIFze/xLNxj3z2CERsZ7tPd/QfttJOdVq355ISMAAAA=",
+        "color": "#a28060",
+        "dominant": "#a62c0d",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 259,
+            "y": 259,
+            "width": 256,
+            "height": 256
+        }
+    },
+    "koi-pond.webp": {
+        "url": asset5,
+        "width": 512,
+        "height": 512,
+        "bytes": 29346,
+        "sha256": "876a837c3d06b5f22be77bd3c836724d22fdd55a02d044c715499e574ffe123b",
+        "placeholder": "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAACwBACdASogACAAPu1kqU2ppaOiMAgBMB2JbACdMoR+H0dAUaRRnjxOkShY3aAAAP5xaDcNk+GHVKchSzkQ4WjGmOmkR/Fs0GZCy0wTftMNar4CWolJljVwI6PbNyqWKsA6K2CNgdS3nY2ebjvl1dIn5PRXWGbHl+mQCh+gub/A4yb7o9L/QAaJncT6rUAA",
+        "color": "#50718e",
+        "dominant": "#397bba",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 517,
+            "y": 259,
+            "width": 256,
+            "height": 256
+        }
+    },
+    "lava-lamp.webp": {
+        "url": asset6,
+        "width": 512,
+        "height": 512,
+        "bytes": 8616,
+        "sha256": "419436a10fff8971affc44ea663a0a136c54446f112aa03a8049c8af161ff627",
+        "placeholder": "data:image/webp;base64,UklGRvAAAABXRUJQVlA4IOQAAABwBwCdASogACAAPu1orU2ppqSiMAgBMB2JbACdMuz1cKv3y7jZLnAA22YDxZW2ISYebk3NGq3aAOestpkffeE+bumnAAD+8QvHGgNdSxSlLDuYCMaIp/8SPdiPP9+9TK+nzdYkihf36VYoP1t210cxHCCKF8QboI1RmkeRlKPAr08G/OQwdKbkVj5dyn4/r+7g1Qe8pCpAHHd4YkSsB50Zs9NHpvw7mHqr9g44Zal/pNbSQbTke8rhrv2uhikMElmY6/wf7SfF11jLgtLj7/Nf5ffIJWlunsm0zF13NypigqwQQAA=",
+        "color": "#755c5c",
+        "dominant": "#15000e",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 1,
+            "y": 517,
+            "width": 256,
+            "height": 256
+        }
+    },
+    "nissan-300zx-z31.webp": {
+        "url": asset7,
+        "width": 512,
+        "height": 512,
+        "bytes": 21672,
+        "sha256": "30813136e3f3302f206095fa0b99c80f556f48dbdef348b6f7a8a9e13a0954c7",
+        "placeholder": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAABwBACdASogACAAPu1eq1AppKOisBgIATAdiUAAI91mrsExIQR+3RCejoeXgAD++9lsmdXmRhGDTdAh9Nf6PRaNTH6LZIp+SUcwZRlCw8Upth7knEIYDBNkx4GpwoElI2AAAA==",
+        "color": "#1d2220",
+        "dominant": "#141414",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 259,
+            "y": 517,
+            "width": 256,
+            "height": 256
+        }
+    },
+    "strange-ink.webp": {
+        "url": asset8,
+        "width": 512,
+        "height": 512,
+        "bytes": 3224,
+        "sha256": "a330b40b85202e3a76ecfedd16e79d7510349b1ee0f558eef28139cbdb355b0b",
+        "placeholder": "data:image/webp;base64,UklGRqwAAABXRUJQVlA4IKAAAABQBQCdASogACAAPu1eqE2ppKOiMBgMATAdiWkAAI91lXOSy0jemrLBe5wY/cBV7ednhwAA/vfpMDIdLSRLnz+kcxOe6Jt79y86qa6TkN3xQ0/PWeVEBF2tL0T8N4afs8NM9fOMgxMqBVzvx4JM9Mp1Qxxo2y4bV2s28gU+gdjwMtFY+Dx25Z9V6RkoWy2RrsblgwlhgRxqUsWQypB1Q0AA",
+        "color": "#bebebe",
+        "dominant": "#ffffff",
+        "variants": [],
+        "atlas": {
+            "file": "atlas.webp",
+            "x": 517,
+            "y": 517,
+            "width": 256,
+            "height": 256
+        }
+    },
+    "atlas.webp": {
+        "url": asset9,
+        "width": 774,
+        "height": 774,
+        "bytes": 95322,
+        "sha256": "caf05af13a2f4815c1dd329f41a4cd337c8538f6a24e5c80d8c76332f371c7e0",
+        "placeholder": "data:image/webp;base64,UklGRtAAAABXRUJQVlA4IMQAAAAwBgCdASogACAAPu1kp02ppaMiMBgMATAdiWwAuy+QFAAr4HOvLZMx3xtXi86E0BQnolFSd+cOLiqAAP7+h85c0fVs/uaFsRc+4vXaydT3TxjbcIeXG9O50VpJfo5nd/D0yN1E6q0DkO63VVn4nokW33WJzrVG+liMWtc0ygqhf3H0XrFPqc9PeHqh8tk1Lwye1WU7UQ7+Er8rvd+4SjfEPQwyzr3uqIWnes1Fe2AMbhudzdgq0blRLkSAfJPPDu+hAAAA",
+        "color": "#565051",
+        "dominant": "#050505",
+        "variants": [
+            {
+                "url": asset10,
+                "file": "atlas@2x.webp",
+                "format": "webp",
+                "width": 1548,
+                "height": 1548,
+                "bytes": 234430,
+                "sha256": "f05ec5bd77869467d7725b96abd60a324905fe8ba6f09bc378ad010884aa270d"
+            }
+        ]
+    }
+};
@@ -4,15 +4,32 @@ Web thumbnail optimization script for web experiences.
 Optimizes thumbnail images for web use while maintaining high quality.
 Resizes images so the longest side is 512px or less.
 Converts to WebP format for optimal web performance.
+With --atlas, also packs every thumbnail into atlas.webp / atlas@2x.webp
+with a coordinate map in atlas.json (see pipeline/atlas.py); once made, the
+atlas is kept up to date on every run. manifest.js lists the thumbnails
+(and where each sits in the atlas) for src/views/WebExperiences.
+optimize_photos.py --watch also watches this directory (see watch_target()).
 """
 
 import os
 import sys
-import shutil
-from PIL import Image, ImageOps
+import argparse
 import glob
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from pipeline.atlas import atlas_paths, write_atlas
+from pipeline.cache import add_cache_arguments, open_cache
+from pipeline.ingest import (IngestJob, Variant, add_decode_arguments, encode_options, fit_params, ingest_original,
+                             with_options)
+from pipeline.encoders import add_format_arguments, report_missing
+from pipeline.files import move_to_originals
+from pipeline.manifest import write_manifest
+from pipeline.quality import add_quality_arguments, print_savings_report
+from pipeline.trace import add_trace_arguments, finish_trace
+from pipeline.watch import WatchTarget
+from pipeline.workers import add_jobs_argument, ingest_all
+
 def optimize_thumbnail(input_path, output_path, max_size=512, quality=85):
     """
     Optimize a thumbnail image for web use.
@@ -23,44 +40,13 @@ def optimize_thumbnail(input_path, output_path, max_size=512, quality=85):
         max_size: Maximum dimension for longest side
         quality: WebP quality (0-100)
     """
-    try:
-        # Open and auto-rotate image based on EXIF
-        with Image.open(input_path) as img:
-            # Auto-rotate based on EXIF orientation
-            img = ImageOps.exif_transpose(img)
-            
-            # Convert to RGB if necessary (handles RGBA, P, etc.)
-            if img.mode in ('RGBA', 'LA', 'P'):
-                # Create white background for transparency
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                img = background
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Calculate new dimensions
-            width, height = img.size
-            if width > max_size or height > max_size:
-                if width > height:
-                    new_width = max_size
-                    new_height = int((height * max_size) / width)
-                else:
-                    new_height = max_size
-                    new_width = int((width * max_size) / height)
-                
-                # Resize with high-quality resampling
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Save with WebP optimization
-            img.save(output_path, 'WEBP', quality=quality, optimize=True)
-            print(f"✓ Optimized: {os.path.basename(input_path)} -> {os.path.basename(output_path)}")
-            return True
-            
-    except Exception as e:
-        print(f"✗ Error processing {input_path}: {e}")
-        return False
+    params = fit_params('web-thumb', max_size, quality)
+    return ingest_original(input_path, [Variant(params, [output_path])])[0] is not None
+
+def thumbnail_job(input_path, output_path, max_size=512, quality=85, options=None):
+    """IngestJob for one thumbnail; the params double as the cache key."""
+    params = with_options(fit_params('web-thumb', max_size, quality), options)
+    return IngestJob(input_path, [Variant(params, [output_path])])
 
 def create_slug_filename(original_name):
     """Convert original filename to web-friendly slug format."""
@@ -83,8 +69,84 @@ def create_slug_filename(original_name):
     
     return f"{slug}.webp"
 
+def published_thumbnails(script_dir):
+    """Every thumbnail in this directory, excluding the atlas sheets themselves."""
+    sheets = {path.name for path in atlas_paths(script_dir)}
+    return sorted(path for path in script_dir.glob("*.webp") if path.name not in sheets)
+
+def publish_thumbnails(cache, script_dir, atlas=False):
+    """Repack the atlas (with --atlas, or when an earlier run made one) and rewrite manifest.js."""
+    sheet, _, coordinates = atlas_paths(script_dir)
+    if atlas or coordinates.exists():
+        write_atlas(cache, script_dir, published_thumbnails(script_dir))
+    write_manifest(script_dir, published_thumbnails(script_dir) + [sheet], cache)
+
+def find_images(script_dir):
+    """Every image waiting in this directory to become a thumbnail."""
+    image_files = []
+    for ext in ['*.jpg', '*.jpeg', '*.png', '*.JPG', '*.JPEG', '*.PNG', '*.tiff', '*.TIFF']:
+        image_files.extend(glob.glob(str(script_dir / ext)))
+    
+    # Filter out already processed WebP files and the script itself
+    return [f for f in image_files if not f.endswith('.webp') and not f.endswith('.py')]
+
+def finish_thumbnail(job, status, originals_dir):
+    """Report one thumbnail and move its original once the thumbnail exists; returns True if moved."""
+    img_path = job.input_path
+    original_filename = img_path.name
+    output_filename = job.variants[0].output_paths[0].name
+    
+    print(f"Processing {original_filename} -> {output_filename}")
+    if status in ('fresh', 'restored'):
+        print(f"✓ Cached: {original_filename} -> {output_filename}")
+    
+    if not status:
+        print(f"  ✗ Failed to optimize {original_filename}")
+        return False
+    
+    try:
+        original_dest = move_to_originals(img_path, originals_dir)
+        print(f"  Moved original to: {original_dest.relative_to(originals_dir.parent)}")
+        return True
+    except Exception as e:
+        print(f"  ✗ Error moving original file: {e}")
+        return False
+
+def watch_target(options=None, cache=None):
+    """
+    WatchTarget for this directory (see pipeline/watch.py), used by
+    optimize_photos.py --watch: each image dropped here becomes its slug
+    thumbnail and its original moves to originals/. Given the cache, the
+    atlas and manifest.js are refreshed once the queue drains.
+    """
+    script_dir = Path(__file__).resolve().parent
+    originals_dir = script_dir / "originals"
+    originals_dir.mkdir(exist_ok=True)
+    
+    def plan(path):
+        return {'job': thumbnail_job(path, script_dir / create_slug_filename(path.name), options=options)}
+    
+    def finish(entry, statuses):
+        finish_thumbnail(entry['job'], statuses[0], originals_dir)
+    
+    publish = (lambda: publish_thumbnails(cache, script_dir)) if cache is not None else None
+    return WatchTarget(script_dir, plan, finish, publish)
+
 def main():
     """Main function to process all thumbnail images."""
+    parser = argparse.ArgumentParser(description="Optimize web experience thumbnails")
+    add_cache_arguments(parser)
+    add_jobs_argument(parser)
+    add_quality_arguments(parser)
+    add_format_arguments(parser)
+    add_decode_arguments(parser)
+    add_trace_arguments(parser)
+    parser.add_argument('--atlas', action='store_true',
+                        help='Also pack every thumbnail into one sprite atlas (1x and 2x) with a coordinate map')
+    args = parser.parse_args()
+    options = encode_options(args)
+    report_missing(options['formats'])
+    
     script_dir = Path(__file__).parent
     originals_dir = script_dir / "originals"
     
@@ -99,17 +161,14 @@ def main():
     print("- Originals moved to originals/ folder")
     print()
     
-    # Get all image files from current directory
-    image_files = []
-    for ext in ['*.jpg', '*.jpeg', '*.png', '*.JPG', '*.JPEG', '*.PNG', '*.tiff', '*.TIFF']:
-        image_files.extend(glob.glob(str(script_dir / ext)))
-    
-    # Filter out already processed WebP files and the script itself
-    image_files = [f for f in image_files if not f.endswith('.webp') and not f.endswith('.py')]
+    image_files = find_images(script_dir)
     
     if not image_files:
         print("No images found to optimize.")
         print("Place JPG, PNG, or TIFF files in this directory and run the script again.")
+        cache = open_cache(args)
+        publish_thumbnails(cache, script_dir, args.atlas)
+        cache.close()
         return
     
     # Sort files for consistent ordering
@@ -121,43 +180,26 @@ def main():
     print()
     
     processed_count = 0
-    
-    for img_path in image_files:
-        img_path = Path(img_path)
-        original_filename = img_path.name
-        
-        # Generate output filename with web-friendly slug
-        output_filename = create_slug_filename(original_filename)
-        output_path = script_dir / output_filename
-        
-        print(f"Processing {original_filename} -> {output_filename}")
-        
-        # Optimize the image
-        if optimize_thumbnail(img_path, output_path):
-            # Move original to originals folder
-            original_dest = originals_dir / original_filename
-            
-            # Handle filename conflicts
-            counter = 1
-            while original_dest.exists():
-                name_parts = original_filename.rsplit('.', 1)
-                if len(name_parts) == 2:
-                    original_dest = originals_dir / f"{name_parts[0]}_{counter}.{name_parts[1]}"
-                else:
-                    original_dest = originals_dir / f"{original_filename}_{counter}"
-                counter += 1
-            
-            try:
-                shutil.move(str(img_path), str(original_dest))
-                print(f"  Moved original to: {original_dest.relative_to(script_dir)}")
-                processed_count += 1
-            except Exception as e:
-                print(f"  ✗ Error moving original file: {e}")
-        else:
-            print(f"  ✗ Failed to optimize {original_filename}")
-        
+    cache = open_cache(args)
+    
+    # Generate output filenames with web-friendly slugs, then encode them all at once
+    jobs = [
+        thumbnail_job(Path(img_path), script_dir / create_slug_filename(os.path.basename(img_path)),
+                      options=options)
+        for img_path in image_files
+    ]
+    statuses = [variant_statuses[0] for variant_statuses in ingest_all(cache, jobs, args.jobs)]
+    
+    for job, status in zip(jobs, statuses):
+        if finish_thumbnail(job, status, originals_dir):
+            processed_count += 1
         print()  # Add spacing between files
     
+    print_savings_report([("Web thumbnails", [cache.output_meta(job.variants[0].output_paths[0]) for job in jobs])])
+    publish_thumbnails(cache, script_dir, args.atlas)
+    cache.close()
+    finish_trace(args, 'optimize_thumbnails')
+    
     print(f"=== Optimization Complete ===")
     print(f"Successfully processed: {processed_count} images")
     print("Thumbnails are optimized and ready for web deployment!")
@@ -165,8 +207,7 @@ def main():
     
     if processed_count > 0:
         print("\nOptimized thumbnails:")
-        webp_files = list(script_dir.glob("*.webp"))
-        for webp_file in sorted(webp_files):
+        for webp_file in published_thumbnails(script_dir):
             print(f"  - {webp_file.name}")
 
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+// Generated by src/assets/pipeline/manifest.py - do not edit.
+
+export const placeholders = {
+    "aberrant/hero.webp": "data:image/webp;base64,UklGRqwAAABXRUJQVlA4IKAAAACwBQCdASoaACAAPu1sqk6ppqOiMBgIATAdiWoAtwFAADpAO6nc/pW1nu/zQK5UK4wOdldaz8AA/H6Pr/AplXDwofs34qxYTo/ZZH3A+Lr8JBt2KXHs3fCmQ1s+vn60lr8Di8bNTjpseVIJV33tjdey5VTctF8iY91E1CKpHEGLiOvvsiy+xg1sK19K6HrRJcBi1N3bsPriunmPuxTT8vgA",
+    "aberrant/aberrant-15.webp": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAABQBQCdASoYACAAPu1qq04ppiQiMAgBMB2JYwDE2Bu10+Gt5hepvDTFhwp/RtJS5IXlqjAA/ujw4NNBP0coLdYxS8J0GLi1aBeVMfKVRJ7ffQcofL4CzBQ2FpKFA7wEF+RJ+wAA",
+    "aberrant/aberrant-13.webp": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAAAwBQCdASoaACAAPu1mq04ppaQiKA1RMB2JZQDA3A9oIsB7WthQH4MM04hmujyk52DbAAD4oGJQt0cI52utOpnHu5bEAjs65zIF+07E0UVzvRlf0hLqNp0//I3HOJ4h8rMo8Yumpk9ggAAA",
+    "aberrant/aberrant-01.webp": "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAAAQBACdASoWACAAPu1kqk2ppaQiMAgBMB2JZwAAW+uXaii+Q5pZlI9eAAD+8pdbLcNkRolU7qtFSqw6csXKqU83ABnAAA==",
+    "aberrant/aberrant-02.webp": "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAABwBACdASoaACAAPu1krU4ppaSiKA1RMB2JZQC9WEXfvgeOZnugeuE2/qekgAD++EiD8bADbRxd0N/8HFznaCRAe6svo4XMew/hPWe+nyLlCH/a/HHXTgNNRy1BucT90EOIaOBrlAAAAA==",
+    "aberrant/aberrant-07.webp": "data:image/webp;base64,UklGRqYAAABXRUJQVlA4IJoAAADQBACdASogACAAPulcqE2pJKQiN/VYASAdCWUAwzRFLyPfFVAxLQwRfjbzjrvRAAD+8TB0Vkw4g8HLtjr0h18K3X56HLxvfnODtQvPUAhRSTWNbQKoiY4vuF9/lCT1id/slHVAiAgwT5PLxEscW2Y5uVzrE0KgqHCgy/eZEHwPNS+77S7ZTa+dkh8q6Lc8jTL3yuDGPviqAAAA",
+    "aberrant/aberrant-08.webp": "data:image/webp;base64,UklGRowAAABXRUJQVlA4IIAAAABQBQCdASogACAAPu1iqk2ppaQiMAgBMB2JZwDKtCP/07x4JbjHuuItK/LNtUL7TWmWJAAA/uQGS/FfaAmb3mnOrXDYhkkskEXFvuI00UEb907IEsGbkq5zS1YnVZLZnVhs1U+Y1Q0rgSE5tWj4x1LCQrKN5croOvBaFJOekAAAAA==",
+    "aberrant/aberrant-03.webp": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAACQBACdASoaACAAPu1usFKppiSiqAgBMB2JZQDDNFbPHg6KDag3gFzOjBPTQAAA/vYI5YMyWRc9vqWKHDNfjywYRR8noM6j9szFHnVuWlSy0SKF+jCo6rDV1i2Zx+j7m2C3FuHmJAA=",
+    "aberrant/aberrant-04.webp": "data:image/webp;base64,UklGRpAAAABXRUJQVlA4IIQAAABQBQCdASogABoAPuFgp02opiOiN/qoARAcCWkAAEHL16SM/b9HBMumUyrd3XS4vkklrwAA/uzOU/S1BQWNzqIJLUMG+jmlj9m/DZSJ6jM5qkZBVtIk9LUTxsbbrl1ZWc7TlKV80mi5Rj+65uEPev5IHylH8QW2zO/RubV83zsKRrgAAAA=",
+    "aberrant/aberrant-05.webp": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAADwBACdASoaACAAPu1orVAppaQisBgIATAdiWkAACms9fh3XfRsEyHdWqIAX3aFSAAA/uXQU+dCP/9W7jigcMbXhfJujCvIo1ZVwDNORrBnMphWpxbuaGJixH2pan7B+Pm5cq0WDwkTAAAA",
+    "aberrant/aberrant-06.webp": "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAACQBQCdASoaACAAPtVgpE2oJiOiN/qoAQAaiWMAnTMAQzes9RvpQx6v/m21y7q7EJsAfL5X4AD+y9OwwNwozgt50xaWAn5nkb70ZZcpKeGzndCeY8h9puz6gwL1BJqk26E0DsCATs8TNsM7Ke6To7AlsZGlWkL51M6W+kpNEUwGR9TxFUjDuAAA",
+    "aberrant/aberrant-09.webp": "data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAACwBACdASoSACAAPu1oq08ppiOpsBgIATAdiWIAnQAQqY7HGiXzeeYrZdMZllRAAP69JO0pF2ZGDVtwv24WIywfmNyJvWt7evo65CvysTb5uorJ+HbU4LHNTSRxYlXSwjx6xEYzJ8DFcIxSBI95D1IM2L+BRmiJdzdECQAA",
+    "aberrant/aberrant-10.webp": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAQBQCdASogACAAPuFcqE2opSQiMAwBEBwJaQAAW/APaIRPNt4TSNDQyyrzem/YZAwAAP72i7/79sKr6ZI5tQW89AK8gaJcNaF/Ppzm8k3rvbCQKZ4CX0gSPpp4uLnPwAAAAA==",
+    "aberrant/aberrant-11.webp": "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAACwBQCdASoaACAAPu1oqk+ppiOiMBgIATAdiWIAx+Q0cLYr0T3F6aALxlgUoqSdbSFJgMhB+gAA/u1SKjCzXvby96CwwipO/HEXzB86ENKJe6jBletp3eu4YZb+h+Sk5X/Cjh/az2WpKblOjKLKNYuSlNc7g1vmGwFyRq7j3+C60Bos/tL837AA",
+    "aberrant/aberrant-12.webp": "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAABwBQCdASoaACAAPu1qrVCppaQiqAqpMB2JaQABFadEPpmf7V3K7ztXa83dTjplXfhXRbwAAP72SVA7gifv73oTgaA4dfvirx7jmHDO2AaQosfK20Oa7xAwX5Sv4olQ9o5ugZmQNyI4Fu95xHOfWnk6vmWWgokjXqBxhNlUvj+XnZf1f4ajwAAA",
+    "aberrant/aberrant-14.webp": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACwBACdASoWACAAPu1kq04ppaQiKA1RMB2JQBlACLv4JySec1H/zSgdHZP4XVFEAP76WulXnv175vEfOZD4ZKOfK7/9v/dv//Z6ElF+HZY9oNsAi9Qy6HN1lgThbDa5rJc6moAA"
+};
@@ -0,0 +1,15 @@
+// Generated by src/assets/pipeline/manifest.py - do not edit.
+
+export const placeholders = {
+    "astro/hero.webp": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAABwBACdASogABcAPu1mqU2ppaOiMAgBMB2JZwAAW+l2IRD9/sIBCu18kOoWKAD+7noIu/fech7/OxSIe4/syjU6wYwrDgYDc+hw/J72vYIpQAAA",
+    "astro/astro-01.webp": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADQBACdASogABYAPu1qrU8ppiQiMAgBMB2JYwABHu+4E60VJUYDfygS/VMSDuzPgAD+/QOdHW+idt16bOtEVfFlSVgtdxpJ2KeO9obpDUwoBYDAvC+7LxYUrwN4uznF/mSwjjw4IAA=",
+    "astro/astro-02.webp": "data:image/webp;base64,UklGRpgAAABXRUJQVlA4IIwAAADwBACdASoWACAAPuVepk2pJSOiN/VYASAciWoAnQBFVqFLUOG5yl4efzo9bGUZxgAA/u5+/UdkLa1SBehFn4yNv19iWkog0dGPfYkANUaLQegIQmbNtKJwBoXiVZqPOOyoYDUvB+rD4Nla6lz5JWjoc4G2pyiNozanm3IV0QUhXQOfXnY4jhYSuoAAAA==",
+    "astro/astro-09.webp": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAABwBACdASoaACAAPuFipU2opiOiN/VYARAcCUAVhnHYJZe9lERkrT9aLZGQAAD+402SHRJpjY8WD367eSj6h+LobdYRicop+1PGt1wPjjTrnnKAUYSm5SDLFkchwj0UYAA=",
+    "astro/astro-03.webp": "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAADQBQCdASogACAAPtlapE2oJSOiN/qoAQAbCWkAAOz2BXKEaGln7ehONG51BA+sm+JghHtlh1kAAP75xJzngCukORL4v7WDbBDrJU2HYL4GEiie3knGwDDTew5q2DmlTha3TCMc3bw+FJwxJEPWA9F9wP6l3gLdOZZ9wGTEAAA=",
+    "astro/astro-04.webp": "data:image/webp;base64,UklGRqAAAABXRUJQVlA4IJQAAACQBQCdASogABYAPu1mqk+ppaOiMBgIATAdiWoAnTMyTtgFhwvSQkoDUDrlv37O3Cs9wUzf3AD+7tjKHi9rd+n2FO59FHP4gNgJuaKrsc49Upz78+2RLdg8ezRr2LmLVP87TnGFd7oksSJBTkwdY1ecEL+S6BrrQYKKWfAmS4iugvxwzhc6Yl1Hw1GKHEosjoL4AAAA",
+    "astro/astro-05.webp": "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACwAwCdASogABYAPu1kqk2ppaQiMAgBMB2JZwDPZC8vokgdTRkN4AD+8LdN6uk9xCrK+hxVlHh6KlNRZLOGAAAA",
+    "astro/astro-06.webp": "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAAAQAwCdASogABYAPu1oq02ppiQiMAgBMB2JaQAAccCNIgAA/vEKtjIQAAAAAA==",
+    "astro/astro-07.webp": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAACQAwCdASoXACAAPu1sqlEppaOiqAqpMB2JZwDJEBWbErsaZFQAAP7tXl6+h6xWE99NImxhYkU2Hm4Njofr27z+qmX6x4+Dv/QAAA==",
+    "astro/astro-10.webp": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAABwBACdASogACAAPtVUoU2oJKMiN+gBABqJZADM0DJQb/4P12CAg81bhIHsAAD+9oDib8q2mOAQm7ogvTv5Z3O/4/w1gxlJd9+b/MaNR6a92MOhQrEo1wWqMNUL0mR/IAA=",
+    "astro/astro-11.webp": "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADQAwCdASogABAAPu1orU2ppqSiMAgBMB2JQBWAA83eWG9sXJtafAAA/uv+ilxxl5Ywvn4Brx357XhXfJIwhcb2apELO8YeiEI7H9YrX6Ibe6Ey1wAAAA=="
+};
@@ -0,0 +1,2493 @@
+// Generated by src/assets/pipeline/manifest.py - do not edit.
+import asset0 from 'url:./portrait/hero.webp';
+import asset1 from 'url:./portrait/sizes/hero-480.webp';
+import asset2 from 'url:./portrait/sizes/hero-960.webp';
+import asset3 from 'url:./aberrant/hero.webp';
+import asset4 from 'url:./aberrant/sizes/hero-480.webp';
+import asset5 from 'url:./aberrant/sizes/hero-960.webp';
+import asset6 from 'url:./aberrant/sizes/hero-1440.webp';
+import asset7 from 'url:./performance/hero.webp';
+import asset8 from 'url:./performance/sizes/hero-480.webp';
+import asset9 from 'url:./performance/sizes/hero-960.webp';
+import asset10 from 'url:./performance/sizes/hero-1440.webp';
+import asset11 from 'url:./astro/hero.webp';
+import asset12 from 'url:./astro/sizes/astro-08-480.webp';
+import asset13 from 'url:./astro/sizes/astro-08-960.webp';
+import asset14 from 'url:./astro/sizes/astro-08-1440.webp';
+import asset15 from 'url:./portrait/portrait-27.webp';
+import asset16 from 'url:./portrait/sizes/portrait-27-480.webp';
+import asset17 from 'url:./portrait/sizes/portrait-27-960.webp';
+import asset18 from 'url:./portrait/sizes/portrait-27-1440.webp';
+import asset19 from 'url:./portrait/portrait-26.webp';
+import asset20 from 'url:./portrait/sizes/portrait-26-480.webp';
+import asset21 from 'url:./portrait/sizes/portrait-26-960.webp';
+import asset22 from 'url:./portrait/sizes/portrait-26-1440.webp';
+import asset23 from 'url:./portrait/portrait-01.webp';
+import asset24 from 'url:./portrait/sizes/portrait-01-480.webp';
+import asset25 from 'url:./portrait/sizes/portrait-01-960.webp';
+import asset26 from 'url:./portrait/sizes/portrait-01-1440.webp';
+import asset27 from 'url:./portrait/portrait-17.webp';
+import asset28 from 'url:./portrait/sizes/portrait-17-480.webp';
+import asset29 from 'url:./portrait/sizes/portrait-17-960.webp';
+import asset30 from 'url:./portrait/sizes/portrait-17-1440.webp';
+import asset31 from 'url:./portrait/portrait-18.webp';
+import asset32 from 'url:./portrait/sizes/portrait-18-480.webp';
+import asset33 from 'url:./portrait/sizes/portrait-18-960.webp';
+import asset34 from 'url:./portrait/sizes/portrait-18-1440.webp';
+import asset35 from 'url:./portrait/portrait-15.webp';
+import asset36 from 'url:./portrait/sizes/portrait-15-480.webp';
+import asset37 from 'url:./portrait/sizes/portrait-15-960.webp';
+import asset38 from 'url:./portrait/sizes/portrait-15-1440.webp';
+import asset39 from 'url:./portrait/portrait-21.webp';
+import asset40 from 'url:./portrait/sizes/portrait-21-480.webp';
+import asset41 from 'url:./portrait/sizes/portrait-21-960.webp';
+import asset42 from 'url:./portrait/sizes/portrait-21-1440.webp';
+import asset43 from 'url:./portrait/portrait-28.webp';
+import asset44 from 'url:./portrait/sizes/portrait-28-480.webp';
+import asset45 from 'url:./portrait/sizes/portrait-28-960.webp';
+import asset46 from 'url:./portrait/sizes/portrait-28-1440.webp';
+import asset47 from 'url:./portrait/portrait-19.webp';
+import asset48 from 'url:./portrait/sizes/portrait-19-480.webp';
+import asset49 from 'url:./portrait/sizes/portrait-19-960.webp';
+import asset50 from 'url:./portrait/sizes/portrait-19-1440.webp';
+import asset51 from 'url:./portrait/portrait-10.webp';
+import asset52 from 'url:./portrait/sizes/portrait-10-480.webp';
+import asset53 from 'url:./portrait/sizes/portrait-10-960.webp';
+import asset54 from 'url:./portrait/sizes/portrait-10-1440.webp';
+import asset55 from 'url:./portrait/portrait-06.webp';
+import asset56 from 'url:./portrait/sizes/portrait-06-480.webp';
+import asset57 from 'url:./portrait/sizes/portrait-06-960.webp';
+import asset58 from 'url:./portrait/sizes/portrait-06-1440.webp';
+import asset59 from 'url:./portrait/portrait-24.webp';
+import asset60 from 'url:./portrait/sizes/portrait-24-480.webp';
+import asset61 from 'url:./portrait/sizes/portrait-24-960.webp';
+import asset62 from 'url:./portrait/sizes/portrait-24-1440.webp';
+import asset63 from 'url:./portrait/portrait-25.webp';
+import asset64 from 'url:./portrait/sizes/portrait-25-480.webp';
+import asset65 from 'url:./portrait/sizes/portrait-25-960.webp';
+import asset66 from 'url:./portrait/sizes/portrait-25-1440.webp';
+import asset67 from 'url:./portrait/portrait-11.webp';
+import asset68 from 'url:./portrait/sizes/portrait-11-480.webp';
+import asset69 from 'url:./portrait/sizes/portrait-11-960.webp';
+import asset70 from 'url:./portrait/sizes/portrait-11-1440.webp';
+import asset71 from 'url:./portrait/portrait-16.webp';
+import asset72 from 'url:./portrait/sizes/portrait-16-480.webp';
+import asset73 from 'url:./portrait/sizes/portrait-16-960.webp';
+import asset74 from 'url:./portrait/sizes/portrait-16-1440.webp';
+import asset75 from 'url:./portrait/portrait-04.webp';
+import asset76 from 'url:./portrait/sizes/portrait-04-480.webp';
+import asset77 from 'url:./portrait/sizes/portrait-04-960.webp';
+import asset78 from 'url:./portrait/sizes/portrait-04-1440.webp';
+import asset79 from 'url:./portrait/portrait-05.webp';
+import asset80 from 'url:./portrait/sizes/portrait-05-480.webp';
+import asset81 from 'url:./portrait/sizes/portrait-05-960.webp';
+import asset82 from 'url:./portrait/sizes/portrait-05-1440.webp';
+import asset83 from 'url:./portrait/portrait-07.webp';
+import asset84 from 'url:./portrait/sizes/portrait-07-480.webp';
+import asset85 from 'url:./portrait/sizes/portrait-07-960.webp';
+import asset86 from 'url:./portrait/sizes/portrait-07-1440.webp';
+import asset87 from 'url:./portrait/portrait-22.webp';
+import asset88 from 'url:./portrait/sizes/portrait-22-480.webp';
+import asset89 from 'url:./portrait/sizes/portrait-22-960.webp';
+import asset90 from 'url:./portrait/sizes/portrait-22-1440.webp';
+import asset91 from 'url:./portrait/portrait-08.webp';
+import asset92 from 'url:./portrait/sizes/portrait-08-480.webp';
+import asset93 from 'url:./portrait/sizes/portrait-08-960.webp';
+import asset94 from 'url:./portrait/sizes/portrait-08-1440.webp';
+import asset95 from 'url:./portrait/portrait-23.webp';
+import asset96 from 'url:./portrait/sizes/portrait-23-480.webp';
+import asset97 from 'url:./portrait/sizes/portrait-23-960.webp';
+import asset98 from 'url:./portrait/sizes/portrait-23-1440.webp';
+import asset99 from 'url:./portrait/portrait-09.webp';
+import asset100 from 'url:./portrait/sizes/portrait-09-480.webp';
+import asset101 from 'url:./portrait/sizes/portrait-09-960.webp';
+import asset102 from 'url:./portrait/sizes/portrait-09-1440.webp';
+import asset103 from 'url:./portrait/portrait-12.webp';
+import asset104 from 'url:./portrait/sizes/portrait-12-480.webp';
+import asset105 from 'url:./portrait/sizes/portrait-12-960.webp';
+import asset106 from 'url:./portrait/sizes/portrait-12-1440.webp';
+import asset107 from 'url:./portrait/portrait-13.webp';
+import asset108 from 'url:./portrait/sizes/portrait-13-480.webp';
+import asset109 from 'url:./portrait/sizes/portrait-13-960.webp';
+import asset110 from 'url:./portrait/sizes/portrait-13-1440.webp';
+import asset111 from 'url:./portrait/portrait-14.webp';
+import asset112 from 'url:./portrait/sizes/portrait-14-480.webp';
+import asset113 from 'url:./portrait/sizes/portrait-14-960.webp';
+import asset114 from 'url:./portrait/sizes/portrait-14-1440.webp';
+import asset115 from 'url:./portrait/portrait-02.webp';
+import asset116 from 'url:./portrait/sizes/portrait-02-480.webp';
+import asset117 from 'url:./portrait/sizes/portrait-02-960.webp';
+import asset118 from 'url:./portrait/sizes/portrait-02-1440.webp';
+import asset119 from 'url:./portrait/portrait-03.webp';
+import asset120 from 'url:./portrait/sizes/portrait-03-480.webp';
+import asset121 from 'url:./portrait/sizes/portrait-03-960.webp';
+import asset122 from 'url:./portrait/sizes/portrait-03-1440.webp';
+import asset123 from 'url:./aberrant/aberrant-15.webp';
+import asset124 from 'url:./aberrant/sizes/aberrant-15-480.webp';
+import asset125 from 'url:./aberrant/sizes/aberrant-15-960.webp';
+import asset126 from 'url:./aberrant/sizes/aberrant-15-1440.webp';
+import asset127 from 'url:./aberrant/aberrant-13.webp';
+import asset128 from 'url:./aberrant/sizes/aberrant-13-480.webp';
+import asset129 from 'url:./aberrant/sizes/aberrant-13-960.webp';
+import asset130 from 'url:./aberrant/sizes/aberrant-13-1440.webp';
+import asset131 from 'url:./aberrant/aberrant-01.webp';
+import asset132 from 'url:./aberrant/sizes/aberrant-01-480.webp';
+import asset133 from 'url:./aberrant/sizes/aberrant-01-960.webp';
+import asset134 from 'url:./aberrant/sizes/aberrant-01-1440.webp';
+import asset135 from 'url:./aberrant/aberrant-02.webp';
+import asset136 from 'url:./aberrant/sizes/aberrant-02-480.webp';
+import asset137 from 'url:./aberrant/sizes/aberrant-02-960.webp';
+import asset138 from 'url:./aberrant/sizes/aberrant-02-1440.webp';
+import asset139 from 'url:./aberrant/aberrant-07.webp';
+import asset140 from 'url:./aberrant/sizes/aberrant-07-480.webp';
+import asset141 from 'url:./aberrant/sizes/aberrant-07-960.webp';
+import asset142 from 'url:./aberrant/sizes/aberrant-07-1440.webp';
+import asset143 from 'url:./aberrant/aberrant-08.webp';
+import asset144 from 'url:./aberrant/sizes/aberrant-08-480.webp';
+import asset145 from 'url:./aberrant/sizes/aberrant-08-960.webp';
+import asset146 from 'url:./aberrant/sizes/aberrant-08-1440.webp';
+import asset147 from 'url:./aberrant/aberrant-03.webp';
+import asset148 from 'url:./aberrant/sizes/aberrant-03-480.webp';
+import asset149 from 'url:./aberrant/sizes/aberrant-03-960.webp';
+import asset150 from 'url:./aberrant/sizes/aberrant-03-1440.webp';
+import asset151 from 'url:./aberrant/aberrant-04.webp';
+import asset152 from 'url:./aberrant/sizes/aberrant-04-480.webp';
+import asset153 from 'url:./aberrant/sizes/aberrant-04-960.webp';
+import asset154 from 'url:./aberrant/sizes/aberrant-04-1440.webp';
+import asset155 from 'url:./aberrant/aberrant-05.webp';
+import asset156 from 'url:./aberrant/sizes/aberrant-05-480.webp';
+import asset157 from 'url:./aberrant/sizes/aberrant-05-960.webp';
+import asset158 from 'url:./aberrant/sizes/aberrant-05-1440.webp';
+import asset159 from 'url:./aberrant/aberrant-06.webp';
+import asset160 from 'url:./aberrant/sizes/aberrant-06-480.webp';
+import asset161 from 'url:./aberrant/sizes/aberrant-06-960.webp';
+import asset162 from 'url:./aberrant/sizes/aberrant-06-1440.webp';
+import asset163 from 'url:./aberrant/aberrant-09.webp';
+import asset164 from 'url:./aberrant/sizes/aberrant-09-480.webp';
+import asset165 from 'url:./aberrant/sizes/aberrant-09-960.webp';
+import asset166 from 'url:./aberrant/sizes/aberrant-09-1440.webp';
+import asset167 from 'url:./aberrant/aberrant-10.webp';
+import asset168 from 'url:./aberrant/sizes/aberrant-10-480.webp';
+import asset169 from 'url:./aberrant/sizes/aberrant-10-960.webp';
+import asset170 from 'url:./aberrant/sizes/aberrant-10-1440.webp';
+import asset171 from 'url:./aberrant/aberrant-11.webp';
+import asset172 from 'url:./aberrant/sizes/aberrant-11-480.webp';
+import asset173 from 'url:./aberrant/sizes/aberrant-11-960.webp';
+import asset174 from 'url:./aberrant/sizes/aberrant-11-1440.webp';
+import asset175 from 'url:./aberrant/aberrant-12.webp';
+import asset176 from 'url:./aberrant/sizes/aberrant-12-480.webp';
+import asset177 from 'url:./aberrant/sizes/aberrant-12-960.webp';
+import asset178 from 'url:./aberrant/sizes/aberrant-12-1440.webp';
+import asset179 from 'url:./aberrant/aberrant-14.webp';
+import asset180 from 'url:./aberrant/sizes/aberrant-14-480.webp';
+import asset181 from 'url:./aberrant/sizes/aberrant-14-960.webp';
+import asset182 from 'url:./aberrant/sizes/aberrant-14-1440.webp';
+import asset183 from 'url:./performance/performance-20.webp';
+import asset184 from 'url:./performance/sizes/performance-20-480.webp';
+import asset185 from 'url:./performance/sizes/performance-20-960.webp';
+import asset186 from 'url:./performance/sizes/performance-20-1440.webp';
+import asset187 from 'url:./performance/performance-18.webp';
+import asset188 from 'url:./performance/sizes/performance-18-480.webp';
+import asset189 from 'url:./performance/sizes/performance-18-960.webp';
+import asset190 from 'url:./performance/sizes/performance-18-1440.webp';
+import asset191 from 'url:./performance/performance-08.webp';
+import asset192 from 'url:./performance/sizes/performance-08-480.webp';
+import asset193 from 'url:./performance/sizes/performance-08-960.webp';
+import asset194 from 'url:./performance/sizes/performance-08-1440.webp';
+import asset195 from 'url:./performance/performance-09.webp';
+import asset196 from 'url:./performance/sizes/performance-09-480.webp';
+import asset197 from 'url:./performance/sizes/performance-09-960.webp';
+import asset198 from 'url:./performance/sizes/performance-09-1440.webp';
+import asset199 from 'url:./performance/performance-17.webp';
+import asset200 from 'url:./performance/sizes/performance-17-480.webp';
+import asset201 from 'url:./performance/sizes/performance-17-960.webp';
+import asset202 from 'url:./performance/sizes/performance-17-1440.webp';
+import asset203 from 'url:./performance/performance-01.webp';
+import asset204 from 'url:./performance/sizes/performance-01-480.webp';
+import asset205 from 'url:./performance/sizes/performance-01-960.webp';
+import asset206 from 'url:./performance/sizes/performance-01-1440.webp';
+import asset207 from 'url:./performance/performance-12.webp';
+import asset208 from 'url:./performance/sizes/performance-12-480.webp';
+import asset209 from 'url:./performance/sizes/performance-12-960.webp';
+import asset210 from 'url:./performance/sizes/performance-12-1440.webp';
+import asset211 from 'url:./performance/performance-14.webp';
+import asset212 from 'url:./performance/sizes/performance-14-480.webp';
+import asset213 from 'url:./performance/sizes/performance-14-960.webp';
+import asset214 from 'url:./performance/sizes/performance-14-1440.webp';
+import asset215 from 'url:./performance/performance-15.webp';
+import asset216 from 'url:./performance/sizes/performance-15-480.webp';
+import asset217 from 'url:./performance/sizes/performance-15-960.webp';
+import asset218 from 'url:./performance/sizes/performance-15-1440.webp';
+import asset219 from 'url:./performance/performance-11.webp';
+import asset220 from 'url:./performance/sizes/performance-11-480.webp';
+import asset221 from 'url:./performance/sizes/performance-11-960.webp';
+import asset222 from 'url:./performance/sizes/performance-11-1440.webp';
+import asset223 from 'url:./performance/performance-03.webp';
+import asset224 from 'url:./performance/sizes/performance-03-480.webp';
+import asset225 from 'url:./performance/sizes/performance-03-960.webp';
+import asset226 from 'url:./performance/sizes/performance-03-1440.webp';
+import asset227 from 'url:./performance/performance-10.webp';
+import asset228 from 'url:./performance/sizes/performance-10-480.webp';
+import asset229 from 'url:./performance/sizes/performance-10-960.webp';
+import asset230 from 'url:./performance/sizes/performance-10-1440.webp';
+import asset231 from 'url:./performance/performance-02.webp';
+import asset232 from 'url:./performance/sizes/performance-02-480.webp';
+import asset233 from 'url:./performance/sizes/performance-02-960.webp';
+import asset234 from 'url:./performance/sizes/performance-02-1440.webp';
+import asset235 from 'url:./performance/performance-19.webp';
+import asset236 from 'url:./performance/sizes/performance-19-480.webp';
+import asset237 from 'url:./performance/sizes/performance-19-960.webp';
+import asset238 from 'url:./performance/sizes/performance-19-1440.webp';
+import asset239 from 'url:./performance/performance-06.webp';
+import asset240 from 'url:./performance/sizes/performance-06-480.webp';
+import asset241 from 'url:./performance/sizes/performance-06-960.webp';
+import asset242 from 'url:./performance/sizes/performance-06-1440.webp';
+import asset243 from 'url:./performance/performance-07.webp';
+import asset244 from 'url:./performance/sizes/performance-07-480.webp';
+import asset245 from 'url:./performance/sizes/performance-07-960.webp';
+import asset246 from 'url:./performance/sizes/performance-07-1440.webp';
+import asset247 from 'url:./performance/performance-05.webp';
+import asset248 from 'url:./performance/sizes/performance-05-480.webp';
+import asset249 from 'url:./performance/sizes/performance-05-960.webp';
+import asset250 from 'url:./performance/sizes/performance-05-1440.webp';
+import asset251 from 'url:./performance/performance-21.webp';
+import asset252 from 'url:./performance/sizes/performance-21-480.webp';
+import asset253 from 'url:./performance/sizes/performance-21-960.webp';
+import asset254 from 'url:./performance/sizes/performance-21-1440.webp';
+import asset255 from 'url:./astro/astro-01.webp';
+import asset256 from 'url:./astro/sizes/astro-01-480.webp';
+import asset257 from 'url:./astro/sizes/astro-01-960.webp';
+import asset258 from 'url:./astro/sizes/astro-01-1440.webp';
+import asset259 from 'url:./astro/astro-02.webp';
+import asset260 from 'url:./astro/sizes/astro-02-480.webp';
+import asset261 from 'url:./astro/sizes/astro-02-960.webp';
+import asset262 from 'url:./astro/sizes/astro-02-1440.webp';
+import asset263 from 'url:./astro/astro-09.webp';
+import asset264 from 'url:./astro/sizes/astro-09-480.webp';
+import asset265 from 'url:./astro/sizes/astro-09-960.webp';
+import asset266 from 'url:./astro/sizes/astro-09-1440.webp';
+import asset267 from 'url:./astro/astro-03.webp';
+import asset268 from 'url:./astro/sizes/astro-03-480.webp';
+import asset269 from 'url:./astro/sizes/astro-03-960.webp';
+import asset270 from 'url:./astro/sizes/astro-03-1440.webp';
+import asset271 from 'url:./astro/astro-04.webp';
+import asset272 from 'url:./astro/sizes/astro-04-480.webp';
+import asset273 from 'url:./astro/sizes/astro-04-960.webp';
+import asset274 from 'url:./astro/sizes/astro-04-1440.webp';
+import asset275 from 'url:./astro/astro-05.webp';
+import asset276 from 'url:./astro/sizes/astro-05-480.webp';
+import asset277 from 'url:./astro/sizes/astro-05-960.webp';
+import asset278 from 'url:./astro/sizes/astro-05-1440.webp';
+import asset279 from 'url:./astro/astro-06.webp';
+import asset280 from 'url:./astro/sizes/astro-06-480.webp';
+import asset281 from 'url:./astro/sizes/astro-06-960.webp';
+import asset282 from 'url:./astro/sizes/astro-06-1440.webp';
+import asset283 from 'url:./astro/astro-07.webp';
+import asset284 from 'url:./astro/sizes/astro-07-480.webp';
+import asset285 from 'url:./astro/sizes/astro-07-960.webp';
+import asset286 from 'url:./astro/sizes/astro-07-1440.webp';
+import asset287 from 'url:./astro/astro-10.webp';
+import asset288 from 'url:./astro/sizes/astro-10-480.webp';
+import asset289 from 'url:./astro/sizes/astro-10-960.webp';
+import asset290 from 'url:./astro/sizes/astro-10-1440.webp';
+import asset291 from 'url:./astro/astro-11.webp';
+import asset292 from 'url:./astro/sizes/astro-11-480.webp';
+import asset293 from 'url:./astro/sizes/astro-11-960.webp';
+import asset294 from 'url:./astro/sizes/astro-11-1440.webp';
+import asset295 from 'url:./hero-thumbs/aberrant-hero.webp';
+import asset296 from 'url:./hero-thumbs/astro-hero.webp';
+import asset297 from 'url:./hero-thumbs/performance-hero.webp';
+import asset298 from 'url:./hero-thumbs/portrait-hero.webp';
+
+export const assets = {
+    "portrait/hero.webp": {
+        "url": asset0,
+        "width": 1080,
+        "height": 1440,
+        "bytes": 134344,
+        "color": "#26241e",
+        "dominant": "#100c08",
+        "variants": [
+            {
+                "url": asset1,
+                "format": "webp",
+                "width": 360,
+                "height": 480
+            },
+            {
+                "url": asset2,
+                "format": "webp",
+                "width": 720,
+                "height": 960
+            }
+        ]
+    },
+    "aberrant/hero.webp": {
+        "url": asset3,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 896530,
+        "color": "#59666a",
+        "dominant": "#182627",
+        "variants": [
+            {
+                "url": asset4,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset5,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset6,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/hero.webp": {
+        "url": asset7,
+        "width": 1280,
+        "height": 1600,
+        "bytes": 110284,
+        "color": "#201c31",
+        "dominant": "#070c09",
+        "variants": [
+            {
+                "url": asset8,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset9,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset10,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "astro/hero.webp": {
+        "url": asset11,
+        "width": 1920,
+        "height": 1371,
+        "bytes": 366438,
+        "color": "#2f2d2e",
+        "dominant": "#1b1718",
+        "variants": [
+            {
+                "url": asset12,
+                "format": "webp",
+                "width": 480,
+                "height": 342
+            },
+            {
+                "url": asset13,
+                "format": "webp",
+                "width": 960,
+                "height": 685
+            },
+            {
+                "url": asset14,
+                "format": "webp",
+                "width": 1440,
+                "height": 1028
+            }
+        ]
+    },
+    "portrait/portrait-27.webp": {
+        "url": asset15,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 617020,
+        "color": "#4a4636",
+        "dominant": "#140d08",
+        "variants": [
+            {
+                "url": asset16,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset17,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset18,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-26.webp": {
+        "url": asset19,
+        "width": 1535,
+        "height": 1920,
+        "bytes": 394002,
+        "color": "#665648",
+        "dominant": "#292313",
+        "variants": [
+            {
+                "url": asset20,
+                "format": "webp",
+                "width": 383,
+                "height": 480
+            },
+            {
+                "url": asset21,
+                "format": "webp",
+                "width": 767,
+                "height": 960
+            },
+            {
+                "url": asset22,
+                "format": "webp",
+                "width": 1151,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-01.webp": {
+        "url": asset23,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 59138,
+        "color": "#362019",
+        "dominant": "#271a17",
+        "variants": [
+            {
+                "url": asset24,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset25,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset26,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-17.webp": {
+        "url": asset27,
+        "width": 1280,
+        "height": 1600,
+        "bytes": 62636,
+        "color": "#6f6765",
+        "dominant": "#aca4a2",
+        "variants": [
+            {
+                "url": asset28,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset29,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset30,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-18.webp": {
+        "url": asset31,
+        "width": 1067,
+        "height": 1600,
+        "bytes": 77662,
+        "color": "#56211d",
+        "dominant": "#29140c",
+        "variants": [
+            {
+                "url": asset32,
+                "format": "webp",
+                "width": 320,
+                "height": 480
+            },
+            {
+                "url": asset33,
+                "format": "webp",
+                "width": 640,
+                "height": 960
+            },
+            {
+                "url": asset34,
+                "format": "webp",
+                "width": 960,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-15.webp": {
+        "url": asset35,
+        "width": 1067,
+        "height": 1600,
+        "bytes": 177776,
+        "color": "#554e47",
+        "dominant": "#151916",
+        "variants": [
+            {
+                "url": asset36,
+                "format": "webp",
+                "width": 320,
+                "height": 480
+            },
+            {
+                "url": asset37,
+                "format": "webp",
+                "width": 640,
+                "height": 960
+            },
+            {
+                "url": asset38,
+                "format": "webp",
+                "width": 960,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-21.webp": {
+        "url": asset39,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 137274,
+        "color": "#697f72",
+        "dominant": "#172919",
+        "variants": [
+            {
+                "url": asset40,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset41,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset42,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-28.webp": {
+        "url": asset43,
+        "width": 1080,
+        "height": 1440,
+        "bytes": 47856,
+        "color": "#454740",
+        "dominant": "#070c06",
+        "variants": [
+            {
+                "url": asset44,
+                "format": "webp",
+                "width": 360,
+                "height": 480
+            },
+            {
+                "url": asset45,
+                "format": "webp",
+                "width": 720,
+                "height": 960
+            },
+            {
+                "url": asset46,
+                "format": "webp",
+                "width": 1080,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-19.webp": {
+        "url": asset47,
+        "width": 1280,
+        "height": 1600,
+        "bytes": 64090,
+        "color": "#373b2e",
+        "dominant": "#0c140c",
+        "variants": [
+            {
+                "url": asset48,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset49,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset50,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-10.webp": {
+        "url": asset51,
+        "width": 1920,
+        "height": 1920,
+        "bytes": 264734,
+        "color": "#88827c",
+        "dominant": "#474738",
+        "variants": [
+            {
+                "url": asset52,
+                "format": "webp",
+                "width": 480,
+                "height": 480
+            },
+            {
+                "url": asset53,
+                "format": "webp",
+                "width": 960,
+                "height": 960
+            },
+            {
+                "url": asset54,
+                "format": "webp",
+                "width": 1440,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-06.webp": {
+        "url": asset55,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 113274,
+        "color": "#bab799",
+        "dominant": "#d5d7c9",
+        "variants": [
+            {
+                "url": asset56,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset57,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset58,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-24.webp": {
+        "url": asset59,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 360516,
+        "color": "#2e3a20",
+        "dominant": "#1b2714",
+        "variants": [
+            {
+                "url": asset60,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset61,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset62,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-25.webp": {
+        "url": asset63,
+        "width": 1920,
+        "height": 1371,
+        "bytes": 266232,
+        "color": "#b8998b",
+        "dominant": "#bbb4a9",
+        "variants": [
+            {
+                "url": asset64,
+                "format": "webp",
+                "width": 480,
+                "height": 342
+            },
+            {
+                "url": asset65,
+                "format": "webp",
+                "width": 960,
+                "height": 685
+            },
+            {
+                "url": asset66,
+                "format": "webp",
+                "width": 1440,
+                "height": 1028
+            }
+        ]
+    },
+    "portrait/portrait-11.webp": {
+        "url": asset67,
+        "width": 1920,
+        "height": 1920,
+        "bytes": 73818,
+        "color": "#dddddd",
+        "dominant": "#fafafa",
+        "variants": [
+            {
+                "url": asset68,
+                "format": "webp",
+                "width": 480,
+                "height": 480
+            },
+            {
+                "url": asset69,
+                "format": "webp",
+                "width": 960,
+                "height": 960
+            },
+            {
+                "url": asset70,
+                "format": "webp",
+                "width": 1440,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-16.webp": {
+        "url": asset71,
+        "width": 1280,
+        "height": 1600,
+        "bytes": 126030,
+        "color": "#a0887b",
+        "dominant": "#b4aaa6",
+        "variants": [
+            {
+                "url": asset72,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset73,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset74,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-04.webp": {
+        "url": asset75,
+        "width": 1535,
+        "height": 1920,
+        "bytes": 188616,
+        "color": "#9da4ac",
+        "dominant": "#e5e6ea",
+        "variants": [
+            {
+                "url": asset76,
+                "format": "webp",
+                "width": 383,
+                "height": 480
+            },
+            {
+                "url": asset77,
+                "format": "webp",
+                "width": 767,
+                "height": 960
+            },
+            {
+                "url": asset78,
+                "format": "webp",
+                "width": 1151,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-05.webp": {
+        "url": asset79,
+        "width": 1920,
+        "height": 1920,
+        "bytes": 115596,
+        "color": "#d5acaa",
+        "dominant": "#ebc8c8",
+        "variants": [
+            {
+                "url": asset80,
+                "format": "webp",
+                "width": 480,
+                "height": 480
+            },
+            {
+                "url": asset81,
+                "format": "webp",
+                "width": 960,
+                "height": 960
+            },
+            {
+                "url": asset82,
+                "format": "webp",
+                "width": 1440,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-07.webp": {
+        "url": asset83,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 218098,
+        "color": "#5d524b",
+        "dominant": "#4b5657",
+        "variants": [
+            {
+                "url": asset84,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset85,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset86,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-22.webp": {
+        "url": asset87,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 57562,
+        "color": "#94aea8",
+        "dominant": "#e7eae4",
+        "variants": [
+            {
+                "url": asset88,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset89,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset90,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-08.webp": {
+        "url": asset91,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 186218,
+        "color": "#525647",
+        "dominant": "#071308",
+        "variants": [
+            {
+                "url": asset92,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset93,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset94,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-23.webp": {
+        "url": asset95,
+        "width": 1371,
+        "height": 1920,
+        "bytes": 315580,
+        "color": "#75716b",
+        "dominant": "#383328",
+        "variants": [
+            {
+                "url": asset96,
+                "format": "webp",
+                "width": 342,
+                "height": 480
+            },
+            {
+                "url": asset97,
+                "format": "webp",
+                "width": 685,
+                "height": 960
+            },
+            {
+                "url": asset98,
+                "format": "webp",
+                "width": 1028,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-09.webp": {
+        "url": asset99,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 62926,
+        "color": "#cfa5bc",
+        "dominant": "#f8c7d8",
+        "variants": [
+            {
+                "url": asset100,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset101,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset102,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-12.webp": {
+        "url": asset103,
+        "width": 1440,
+        "height": 1800,
+        "bytes": 141098,
+        "color": "#737373",
+        "dominant": "#d8d8d8",
+        "variants": [
+            {
+                "url": asset104,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset105,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset106,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-13.webp": {
+        "url": asset107,
+        "width": 1535,
+        "height": 1920,
+        "bytes": 524422,
+        "color": "#94837b",
+        "dominant": "#fefefe",
+        "variants": [
+            {
+                "url": asset108,
+                "format": "webp",
+                "width": 383,
+                "height": 480
+            },
+            {
+                "url": asset109,
+                "format": "webp",
+                "width": 767,
+                "height": 960
+            },
+            {
+                "url": asset110,
+                "format": "webp",
+                "width": 1151,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-14.webp": {
+        "url": asset111,
+        "width": 1566,
+        "height": 1920,
+        "bytes": 292660,
+        "color": "#83837d",
+        "dominant": "#45360a",
+        "variants": [
+            {
+                "url": asset112,
+                "format": "webp",
+                "width": 391,
+                "height": 480
+            },
+            {
+                "url": asset113,
+                "format": "webp",
+                "width": 782,
+                "height": 960
+            },
+            {
+                "url": asset114,
+                "format": "webp",
+                "width": 1174,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-02.webp": {
+        "url": asset115,
+        "width": 1280,
+        "height": 1920,
+        "bytes": 114886,
+        "color": "#241a12",
+        "dominant": "#070606",
+        "variants": [
+            {
+                "url": asset116,
+                "format": "webp",
+                "width": 320,
+                "height": 480
+            },
+            {
+                "url": asset117,
+                "format": "webp",
+                "width": 640,
+                "height": 960
+            },
+            {
+                "url": asset118,
+                "format": "webp",
+                "width": 960,
+                "height": 1440
+            }
+        ]
+    },
+    "portrait/portrait-03.webp": {
+        "url": asset119,
+        "width": 1920,
+        "height": 960,
+        "bytes": 110376,
+        "color": "#5c6267",
+        "dominant": "#25282b",
+        "variants": [
+            {
+                "url": asset120,
+                "format": "webp",
+                "width": 480,
+                "height": 240
+            },
+            {
+                "url": asset121,
+                "format": "webp",
+                "width": 960,
+                "height": 480
+            },
+            {
+                "url": asset122,
+                "format": "webp",
+                "width": 1440,
+                "height": 720
+            }
+        ]
+    },
+    "aberrant/aberrant-15.webp": {
+        "url": asset123,
+        "width": 1080,
+        "height": 1440,
+        "bytes": 46136,
+        "color": "#515652",
+        "dominant": "#5a6465",
+        "variants": [
+            {
+                "url": asset124,
+                "format": "webp",
+                "width": 360,
+                "height": 480
+            },
+            {
+                "url": asset125,
+                "format": "webp",
+                "width": 720,
+                "height": 960
+            },
+            {
+                "url": asset126,
+                "format": "webp",
+                "width": 1080,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-13.webp": {
+        "url": asset127,
+        "width": 1080,
+        "height": 1350,
+        "bytes": 94298,
+        "color": "#4c5045",
+        "dominant": "#080d06",
+        "variants": [
+            {
+                "url": asset128,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset129,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset130,
+                "format": "webp",
+                "width": 1080,
+                "height": 1350
+            }
+        ]
+    },
+    "aberrant/aberrant-01.webp": {
+        "url": asset131,
+        "width": 1280,
+        "height": 1920,
+        "bytes": 47064,
+        "color": "#1c1a14",
+        "dominant": "#080b07",
+        "variants": [
+            {
+                "url": asset132,
+                "format": "webp",
+                "width": 320,
+                "height": 480
+            },
+            {
+                "url": asset133,
+                "format": "webp",
+                "width": 640,
+                "height": 960
+            },
+            {
+                "url": asset134,
+                "format": "webp",
+                "width": 960,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-02.webp": {
+        "url": asset135,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 296064,
+        "color": "#222317",
+        "dominant": "#081208",
+        "variants": [
+            {
+                "url": asset136,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset137,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset138,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-07.webp": {
+        "url": asset139,
+        "width": 1920,
+        "height": 1920,
+        "bytes": 570894,
+        "color": "#473e35",
+        "dominant": "#261b18",
+        "variants": [
+            {
+                "url": asset140,
+                "format": "webp",
+                "width": 480,
+                "height": 480
+            },
+            {
+                "url": asset141,
+                "format": "webp",
+                "width": 960,
+                "height": 960
+            },
+            {
+                "url": asset142,
+                "format": "webp",
+                "width": 1440,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-08.webp": {
+        "url": asset143,
+        "width": 1920,
+        "height": 1920,
+        "bytes": 128760,
+        "color": "#2a2624",
+        "dominant": "#110d0c",
+        "variants": [
+            {
+                "url": asset144,
+                "format": "webp",
+                "width": 480,
+                "height": 480
+            },
+            {
+                "url": asset145,
+                "format": "webp",
+                "width": 960,
+                "height": 960
+            },
+            {
+                "url": asset146,
+                "format": "webp",
+                "width": 1440,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-03.webp": {
+        "url": asset147,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 174928,
+        "color": "#747b7d",
+        "dominant": "#090808",
+        "variants": [
+            {
+                "url": asset148,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset149,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset150,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-04.webp": {
+        "url": asset151,
+        "width": 1920,
+        "height": 1536,
+        "bytes": 409928,
+        "color": "#4c4c4c",
+        "dominant": "#161616",
+        "variants": [
+            {
+                "url": asset152,
+                "format": "webp",
+                "width": 480,
+                "height": 384
+            },
+            {
+                "url": asset153,
+                "format": "webp",
+                "width": 960,
+                "height": 768
+            },
+            {
+                "url": asset154,
+                "format": "webp",
+                "width": 1440,
+                "height": 1152
+            }
+        ]
+    },
+    "aberrant/aberrant-05.webp": {
+        "url": asset155,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 235896,
+        "color": "#3f3f3f",
+        "dominant": "#161616",
+        "variants": [
+            {
+                "url": asset156,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset157,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset158,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-06.webp": {
+        "url": asset159,
+        "width": 1535,
+        "height": 1920,
+        "bytes": 645656,
+        "color": "#5c6e52",
+        "dominant": "#395735",
+        "variants": [
+            {
+                "url": asset160,
+                "format": "webp",
+                "width": 383,
+                "height": 480
+            },
+            {
+                "url": asset161,
+                "format": "webp",
+                "width": 767,
+                "height": 960
+            },
+            {
+                "url": asset162,
+                "format": "webp",
+                "width": 1151,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-09.webp": {
+        "url": asset163,
+        "width": 1080,
+        "height": 1920,
+        "bytes": 54840,
+        "color": "#5e4248",
+        "dominant": "#180d16",
+        "variants": [
+            {
+                "url": asset164,
+                "format": "webp",
+                "width": 270,
+                "height": 480
+            },
+            {
+                "url": asset165,
+                "format": "webp",
+                "width": 540,
+                "height": 960
+            },
+            {
+                "url": asset166,
+                "format": "webp",
+                "width": 810,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-10.webp": {
+        "url": asset167,
+        "width": 1920,
+        "height": 1920,
+        "bytes": 196260,
+        "color": "#181818",
+        "dominant": "#020202",
+        "variants": [
+            {
+                "url": asset168,
+                "format": "webp",
+                "width": 480,
+                "height": 480
+            },
+            {
+                "url": asset169,
+                "format": "webp",
+                "width": 960,
+                "height": 960
+            },
+            {
+                "url": asset170,
+                "format": "webp",
+                "width": 1440,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-11.webp": {
+        "url": asset171,
+        "width": 1535,
+        "height": 1920,
+        "bytes": 232280,
+        "color": "#85807f",
+        "dominant": "#e9e4e8",
+        "variants": [
+            {
+                "url": asset172,
+                "format": "webp",
+                "width": 383,
+                "height": 480
+            },
+            {
+                "url": asset173,
+                "format": "webp",
+                "width": 767,
+                "height": 960
+            },
+            {
+                "url": asset174,
+                "format": "webp",
+                "width": 1151,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-12.webp": {
+        "url": asset175,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 156948,
+        "color": "#9b9b9b",
+        "dominant": "#faf9fa",
+        "variants": [
+            {
+                "url": asset176,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset177,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset178,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "aberrant/aberrant-14.webp": {
+        "url": asset179,
+        "width": 1279,
+        "height": 1920,
+        "bytes": 261362,
+        "color": "#241d19",
+        "dominant": "#030101",
+        "variants": [
+            {
+                "url": asset180,
+                "format": "webp",
+                "width": 319,
+                "height": 480
+            },
+            {
+                "url": asset181,
+                "format": "webp",
+                "width": 639,
+                "height": 960
+            },
+            {
+                "url": asset182,
+                "format": "webp",
+                "width": 959,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-20.webp": {
+        "url": asset183,
+        "width": 1279,
+        "height": 1920,
+        "bytes": 110626,
+        "color": "#864940",
+        "dominant": "#181414",
+        "variants": [
+            {
+                "url": asset184,
+                "format": "webp",
+                "width": 319,
+                "height": 480
+            },
+            {
+                "url": asset185,
+                "format": "webp",
+                "width": 639,
+                "height": 960
+            },
+            {
+                "url": asset186,
+                "format": "webp",
+                "width": 959,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-18.webp": {
+        "url": asset187,
+        "width": 1920,
+        "height": 1279,
+        "bytes": 132372,
+        "color": "#4890e8",
+        "dominant": "#0459d8",
+        "variants": [
+            {
+                "url": asset188,
+                "format": "webp",
+                "width": 480,
+                "height": 319
+            },
+            {
+                "url": asset189,
+                "format": "webp",
+                "width": 960,
+                "height": 639
+            },
+            {
+                "url": asset190,
+                "format": "webp",
+                "width": 1440,
+                "height": 959
+            }
+        ]
+    },
+    "performance/performance-08.webp": {
+        "url": asset191,
+        "width": 1535,
+        "height": 1920,
+        "bytes": 209680,
+        "color": "#361b18",
+        "dominant": "#03140b",
+        "variants": [
+            {
+                "url": asset192,
+                "format": "webp",
+                "width": 383,
+                "height": 480
+            },
+            {
+                "url": asset193,
+                "format": "webp",
+                "width": 767,
+                "height": 960
+            },
+            {
+                "url": asset194,
+                "format": "webp",
+                "width": 1151,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-09.webp": {
+        "url": asset195,
+        "width": 1280,
+        "height": 1600,
+        "bytes": 74248,
+        "color": "#25292c",
+        "dominant": "#13171a",
+        "variants": [
+            {
+                "url": asset196,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset197,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset198,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-17.webp": {
+        "url": asset199,
+        "width": 1535,
+        "height": 1920,
+        "bytes": 130278,
+        "color": "#1f2783",
+        "dominant": "#0234a9",
+        "variants": [
+            {
+                "url": asset200,
+                "format": "webp",
+                "width": 383,
+                "height": 480
+            },
+            {
+                "url": asset201,
+                "format": "webp",
+                "width": 767,
+                "height": 960
+            },
+            {
+                "url": asset202,
+                "format": "webp",
+                "width": 1151,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-01.webp": {
+        "url": asset203,
+        "width": 1920,
+        "height": 1280,
+        "bytes": 144070,
+        "color": "#202522",
+        "dominant": "#08110f",
+        "variants": [
+            {
+                "url": asset204,
+                "format": "webp",
+                "width": 480,
+                "height": 320
+            },
+            {
+                "url": asset205,
+                "format": "webp",
+                "width": 960,
+                "height": 640
+            },
+            {
+                "url": asset206,
+                "format": "webp",
+                "width": 1440,
+                "height": 960
+            }
+        ]
+    },
+    "performance/performance-12.webp": {
+        "url": asset207,
+        "width": 1080,
+        "height": 1440,
+        "bytes": 32848,
+        "color": "#0d130d",
+        "dominant": "#060c06",
+        "variants": [
+            {
+                "url": asset208,
+                "format": "webp",
+                "width": 360,
+                "height": 480
+            },
+            {
+                "url": asset209,
+                "format": "webp",
+                "width": 720,
+                "height": 960
+            },
+            {
+                "url": asset210,
+                "format": "webp",
+                "width": 1080,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-14.webp": {
+        "url": asset211,
+        "width": 1080,
+        "height": 1440,
+        "bytes": 42462,
+        "color": "#5454c2",
+        "dominant": "#030597",
+        "variants": [
+            {
+                "url": asset212,
+                "format": "webp",
+                "width": 360,
+                "height": 480
+            },
+            {
+                "url": asset213,
+                "format": "webp",
+                "width": 720,
+                "height": 960
+            },
+            {
+                "url": asset214,
+                "format": "webp",
+                "width": 1080,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-15.webp": {
+        "url": asset215,
+        "width": 1080,
+        "height": 1440,
+        "bytes": 48786,
+        "color": "#374839",
+        "dominant": "#120d0a",
+        "variants": [
+            {
+                "url": asset216,
+                "format": "webp",
+                "width": 360,
+                "height": 480
+            },
+            {
+                "url": asset217,
+                "format": "webp",
+                "width": 720,
+                "height": 960
+            },
+            {
+                "url": asset218,
+                "format": "webp",
+                "width": 1080,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-11.webp": {
+        "url": asset219,
+        "width": 1280,
+        "height": 1600,
+        "bytes": 69606,
+        "color": "#3a0f09",
+        "dominant": "#160c08",
+        "variants": [
+            {
+                "url": asset220,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset221,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset222,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-03.webp": {
+        "url": asset223,
+        "width": 1920,
+        "height": 960,
+        "bytes": 234930,
+        "color": "#272727",
+        "dominant": "#151515",
+        "variants": [
+            {
+                "url": asset224,
+                "format": "webp",
+                "width": 480,
+                "height": 240
+            },
+            {
+                "url": asset225,
+                "format": "webp",
+                "width": 960,
+                "height": 480
+            },
+            {
+                "url": asset226,
+                "format": "webp",
+                "width": 1440,
+                "height": 720
+            }
+        ]
+    },
+    "performance/performance-10.webp": {
+        "url": asset227,
+        "width": 1143,
+        "height": 1600,
+        "bytes": 28646,
+        "color": "#23332a",
+        "dominant": "#080d08",
+        "variants": [
+            {
+                "url": asset228,
+                "format": "webp",
+                "width": 342,
+                "height": 480
+            },
+            {
+                "url": asset229,
+                "format": "webp",
+                "width": 685,
+                "height": 960
+            },
+            {
+                "url": asset230,
+                "format": "webp",
+                "width": 1028,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-02.webp": {
+        "url": asset231,
+        "width": 1920,
+        "height": 1280,
+        "bytes": 455598,
+        "color": "#484848",
+        "dominant": "#171717",
+        "variants": [
+            {
+                "url": asset232,
+                "format": "webp",
+                "width": 480,
+                "height": 320
+            },
+            {
+                "url": asset233,
+                "format": "webp",
+                "width": 960,
+                "height": 640
+            },
+            {
+                "url": asset234,
+                "format": "webp",
+                "width": 1440,
+                "height": 960
+            }
+        ]
+    },
+    "performance/performance-19.webp": {
+        "url": asset235,
+        "width": 1279,
+        "height": 1920,
+        "bytes": 95182,
+        "color": "#928080",
+        "dominant": "#f6faf9",
+        "variants": [
+            {
+                "url": asset236,
+                "format": "webp",
+                "width": 319,
+                "height": 480
+            },
+            {
+                "url": asset237,
+                "format": "webp",
+                "width": 639,
+                "height": 960
+            },
+            {
+                "url": asset238,
+                "format": "webp",
+                "width": 959,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-06.webp": {
+        "url": asset239,
+        "width": 1535,
+        "height": 1920,
+        "bytes": 290758,
+        "color": "#4a4c7b",
+        "dominant": "#011515",
+        "variants": [
+            {
+                "url": asset240,
+                "format": "webp",
+                "width": 383,
+                "height": 480
+            },
+            {
+                "url": asset241,
+                "format": "webp",
+                "width": 767,
+                "height": 960
+            },
+            {
+                "url": asset242,
+                "format": "webp",
+                "width": 1151,
+                "height": 1440
+            }
+        ]
+    },
+    "performance/performance-07.webp": {
+        "url": asset243,
+        "width": 1920,
+        "height": 1280,
+        "bytes": 137212,
+        "color": "#252720",
+        "dominant": "#030c0c",
+        "variants": [
+            {
+                "url": asset244,
+                "format": "webp",
+                "width": 480,
+                "height": 320
+            },
+            {
+                "url": asset245,
+                "format": "webp",
+                "width": 960,
+                "height": 640
+            },
+            {
+                "url": asset246,
+                "format": "webp",
+                "width": 1440,
+                "height": 960
+            }
+        ]
+    },
+    "performance/performance-05.webp": {
+        "url": asset247,
+        "width": 1920,
+        "height": 1279,
+        "bytes": 443032,
+        "color": "#433f39",
+        "dominant": "#060505",
+        "variants": [
+            {
+                "url": asset248,
+                "format": "webp",
+                "width": 480,
+                "height": 319
+            },
+            {
+                "url": asset249,
+                "format": "webp",
+                "width": 960,
+                "height": 639
+            },
+            {
+                "url": asset250,
+                "format": "webp",
+                "width": 1440,
+                "height": 959
+            }
+        ]
+    },
+    "performance/performance-21.webp": {
+        "url": asset251,
+        "width": 1279,
+        "height": 1920,
+        "bytes": 70264,
+        "color": "#1f78d6",
+        "dominant": "#0149b8",
+        "variants": [
+            {
+                "url": asset252,
+                "format": "webp",
+                "width": 319,
+                "height": 480
+            },
+            {
+                "url": asset253,
+                "format": "webp",
+                "width": 639,
+                "height": 960
+            },
+            {
+                "url": asset254,
+                "format": "webp",
+                "width": 959,
+                "height": 1440
+            }
+        ]
+    },
+    "astro/astro-01.webp": {
+        "url": asset255,
+        "width": 1920,
+        "height": 1280,
+        "bytes": 377490,
+        "color": "#2d2927",
+        "dominant": "#030202",
+        "variants": [
+            {
+                "url": asset256,
+                "format": "webp",
+                "width": 480,
+                "height": 320
+            },
+            {
+                "url": asset257,
+                "format": "webp",
+                "width": 960,
+                "height": 640
+            },
+            {
+                "url": asset258,
+                "format": "webp",
+                "width": 1440,
+                "height": 960
+            }
+        ]
+    },
+    "astro/astro-02.webp": {
+        "url": asset259,
+        "width": 1279,
+        "height": 1920,
+        "bytes": 466334,
+        "color": "#525b6e",
+        "dominant": "#262a66",
+        "variants": [
+            {
+                "url": asset260,
+                "format": "webp",
+                "width": 319,
+                "height": 480
+            },
+            {
+                "url": asset261,
+                "format": "webp",
+                "width": 639,
+                "height": 960
+            },
+            {
+                "url": asset262,
+                "format": "webp",
+                "width": 959,
+                "height": 1440
+            }
+        ]
+    },
+    "astro/astro-09.webp": {
+        "url": asset263,
+        "width": 1536,
+        "height": 1920,
+        "bytes": 100944,
+        "color": "#223a43",
+        "dominant": "#14242b",
+        "variants": [
+            {
+                "url": asset264,
+                "format": "webp",
+                "width": 384,
+                "height": 480
+            },
+            {
+                "url": asset265,
+                "format": "webp",
+                "width": 768,
+                "height": 960
+            },
+            {
+                "url": asset266,
+                "format": "webp",
+                "width": 1152,
+                "height": 1440
+            }
+        ]
+    },
+    "astro/astro-03.webp": {
+        "url": asset267,
+        "width": 1920,
+        "height": 1920,
+        "bytes": 279870,
+        "color": "#484645",
+        "dominant": "#010000",
+        "variants": [
+            {
+                "url": asset268,
+                "format": "webp",
+                "width": 480,
+                "height": 480
+            },
+            {
+                "url": asset269,
+                "format": "webp",
+                "width": 960,
+                "height": 960
+            },
+            {
+                "url": asset270,
+                "format": "webp",
+                "width": 1440,
+                "height": 1440
+            }
+        ]
+    },
+    "astro/astro-04.webp": {
+        "url": asset271,
+        "width": 1920,
+        "height": 1280,
+        "bytes": 281904,
+        "color": "#6b1f2c",
+        "dominant": "#480918",
+        "variants": [
+            {
+                "url": asset272,
+                "format": "webp",
+                "width": 480,
+                "height": 320
+            },
+            {
+                "url": asset273,
+                "format": "webp",
+                "width": 960,
+                "height": 640
+            },
+            {
+                "url": asset274,
+                "format": "webp",
+                "width": 1440,
+                "height": 960
+            }
+        ]
+    },
+    "astro/astro-05.webp": {
+        "url": asset275,
+        "width": 1920,
+        "height": 1280,
+        "bytes": 218714,
+        "color": "#080b11",
+        "dominant": "#05060a",
+        "variants": [
+            {
+                "url": asset276,
+                "format": "webp",
+                "width": 480,
+                "height": 320
+            },
+            {
+                "url": asset277,
+                "format": "webp",
+                "width": 960,
+                "height": 640
+            },
+            {
+                "url": asset278,
+                "format": "webp",
+                "width": 1440,
+                "height": 960
+            }
+        ]
+    },
+    "astro/astro-06.webp": {
+        "url": asset279,
+        "width": 1920,
+        "height": 1281,
+        "bytes": 67704,
+        "color": "#030303",
+        "dominant": "#020202",
+        "variants": [
+            {
+                "url": asset280,
+                "format": "webp",
+                "width": 480,
+                "height": 320
+            },
+            {
+                "url": asset281,
+                "format": "webp",
+                "width": 960,
+                "height": 640
+            },
+            {
+                "url": asset282,
+                "format": "webp",
+                "width": 1440,
+                "height": 960
+            }
+        ]
+    },
+    "astro/astro-07.webp": {
+        "url": asset283,
+        "width": 1371,
+        "height": 1920,
+        "bytes": 1350756,
+        "color": "#353344",
+        "dominant": "#373748",
+        "variants": [
+            {
+                "url": asset284,
+                "format": "webp",
+                "width": 342,
+                "height": 480
+            },
+            {
+                "url": asset285,
+                "format": "webp",
+                "width": 685,
+                "height": 960
+            },
+            {
+                "url": asset286,
+                "format": "webp",
+                "width": 1028,
+                "height": 1440
+            }
+        ]
+    },
+    "astro/astro-10.webp": {
+        "url": asset287,
+        "width": 1920,
+        "height": 1920,
+        "bytes": 25716,
+        "color": "#100803",
+        "dominant": "#040101",
+        "variants": [
+            {
+                "url": asset288,
+                "format": "webp",
+                "width": 480,
+                "height": 480
+            },
+            {
+                "url": asset289,
+                "format": "webp",
+                "width": 960,
+                "height": 960
+            },
+            {
+                "url": asset290,
+                "format": "webp",
+                "width": 1440,
+                "height": 1440
+            }
+        ]
+    },
+    "astro/astro-11.webp": {
+        "url": asset291,
+        "width": 1920,
+        "height": 960,
+        "bytes": 38920,
+        "color": "#2e2110",
+        "dominant": "#020101",
+        "variants": [
+            {
+                "url": asset292,
+                "format": "webp",
+                "width": 480,
+                "height": 240
+            },
+            {
+                "url": asset293,
+                "format": "webp",
+                "width": 960,
+                "height": 480
+            },
+            {
+                "url": asset294,
+                "format": "webp",
+                "width": 1440,
+                "height": 720
+            }
+        ]
+    },
+    "hero-thumbs/aberrant-hero.webp": {
+        "url": asset295,
+        "width": 768,
+        "height": 768,
+        "bytes": 249170,
+        "color": "#535d5f",
+        "dominant": "#182628",
+        "variants": []
+    },
+    "hero-thumbs/astro-hero.webp": {
+        "url": asset296,
+        "width": 768,
+        "height": 768,
+        "bytes": 152976,
+        "color": "#353435",
+        "dominant": "#1b1817",
+        "variants": []
+    },
+    "hero-thumbs/performance-hero.webp": {
+        "url": asset297,
+        "width": 768,
+        "height": 768,
+        "bytes": 51812,
+        "color": "#26213b",
+        "dominant": "#070c09",
+        "variants": []
+    },
+    "hero-thumbs/portrait-hero.webp": {
+        "url": asset298,
+        "width": 768,
+        "height": 768,
+        "bytes": 67538,
+        "color": "#2e2d26",
+        "dominant": "#0f0b07",
+        "variants": []
+    }
+};
+
+export const galleries = {
+    "portrait": [
+        27,
+        26,
+        1,
+        17,
+        18,
+        15,
+        21,
+        28,
+        19,
+        10,
+        6,
+        24,
+        25,
+        11,
+        16,
+        4,
+        5,
+        7,
+        22,
+        8,
+        23,
+        9,
+        12,
+        13,
+        14,
+        2,
+        3
+    ],
+    "aberrant": [
+        15,
+        13,
+        1,
+        2,
+        7,
+        8,
+        3,
+        4,
+        5,
+        6,
+        9,
+        10,
+        11,
+        12,
+        14
+    ],
+    "performance": [
+        20,
+        18,
+        8,
+        9,
+        17,
+        1,
+        12,
+        14,
+        15,
+        11,
+        3,
+        10,
+        2,
+        19,
+        6,
+        7,
+        5,
+        21
+    ],
+    "astro": [
+        1,
+        2,
+        9,
+        3,
+        4,
+        5,
+        6,
+        7,
+        10,
+        11
+    ]
+};
+
+export const placeholders = {
+    "portrait": () => import('./portrait/placeholders.js'),
+    "aberrant": () => import('./aberrant/placeholders.js'),
+    "performance": () => import('./performance/placeholders.js'),
+    "astro": () => import('./astro/placeholders.js')
+};
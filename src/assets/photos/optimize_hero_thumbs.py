@@ -12,12 +12,26 @@ This script:
 2. Creates 768x768 center-cropped square thumbnails
 3. Optimizes for fast loading in collection overview cards
 4. Maintains high quality for larger displays while reducing file sizes significantly
+
+Heroes imported through optimize_photos.py already get their thumbnail from
+the original during ingest; those are left alone here, so this script only
+fills in heroes that predate the ingest stage.
 """
 
 import os
 import sys
-from PIL import Image, ImageOps
-import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pipeline.cache import add_cache_arguments, open_cache
+from pipeline.ingest import (HERO_THUMB_PARAMS, IngestJob, Variant, encode_options,
+                             ingest_original, square_params, with_options)
+from pipeline.encoders import add_format_arguments, report_missing
+from pipeline.manifest import write_photo_manifest
+from pipeline.quality import add_quality_arguments, print_savings_report
+from pipeline.trace import add_trace_arguments, finish_trace
+from pipeline.workers import add_jobs_argument, ingest_all
 
 # Photo collections mapping
 COLLECTIONS = {
@@ -43,64 +57,27 @@ COLLECTIONS = {
     }
 }
 
-def center_crop_to_square(image):
-    """
-    Crop image from center to create a perfect square.
-    Maintains aspect ratio by cropping the longer dimension.
-    """
-    width, height = image.size
-    
-    if width == height:
-        return image
-    
-    # Determine crop dimensions
-    crop_size = min(width, height)
-    
-    # Calculate crop coordinates (center crop)
-    left = (width - crop_size) // 2
-    top = (height - crop_size) // 2
-    right = left + crop_size
-    bottom = top + crop_size
-    
-    return image.crop((left, top, right, bottom))
-
-def optimize_hero_thumbnail(input_path, output_path, size=768):
+def optimize_hero_thumbnail(input_path, output_path, size=768, quality=90, method=6):
     """
     Create optimized hero thumbnail:
     1. Center crop to square
     2. Resize to target size (768x768)
     3. Convert to WebP with high quality optimization
     """
-    try:
-        # Open and process image
-        with Image.open(input_path) as img:
-            # Convert to RGB if necessary (handles RGBA, grayscale, etc.)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Center crop to square
-            img_square = center_crop_to_square(img)
-            
-            # Resize to target size with high quality resampling
-            img_resized = img_square.resize((size, size), Image.Resampling.LANCZOS)
-            
-            # Save as optimized WebP with higher quality for hero images
-            img_resized.save(
-                output_path,
-                'WEBP',
-                quality=90,   # Higher quality for hero images
-                method=6,     # Highest compression effort
-                optimize=True
-            )
-            
-            print(f"✓ Created hero thumbnail: {os.path.basename(output_path)} ({size}x{size})")
-            return True
-            
-    except Exception as e:
-        print(f"✗ Error processing {input_path}: {str(e)}")
-        return False
+    params = square_params('hero-thumb', size, quality, method)
+    return ingest_original(input_path, [Variant(params, [output_path])])[0] is not None
 
 def main():
+    parser = argparse.ArgumentParser(description="Create center-cropped hero thumbnails")
+    add_cache_arguments(parser)
+    add_jobs_argument(parser)
+    add_quality_arguments(parser)
+    add_format_arguments(parser)
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+    options = encode_options(args)
+    report_missing(options['formats'])
+
     # Ensure we're in the right directory
     if not os.path.exists('hero-thumbs'):
         print("Creating hero-thumbs directory...")
@@ -113,6 +90,10 @@ def main():
     total_count = len(COLLECTIONS)
     total_size_before = 0
     total_size_after = 0
+    cache = open_cache(args)
+    
+    entries = []
+    jobs = []
     
     for collection_id, config in COLLECTIONS.items():
         input_path = config['input']
@@ -128,6 +109,22 @@ def main():
             print(f"  ✗ Input file not found: {input_path}")
             continue
         
+        # Already made from the original during photo ingest? Then keep it.
+        params = with_options(HERO_THUMB_PARAMS, options)
+        if cache.is_fresh_downstream(input_path, output_path, params):
+            entries.append((collection_name, input_path, output_path, 'from original'))
+            continue
+        
+        # Thumbnail encodes run together below (skipped when the cache says they are up to date)
+        entries.append((collection_name, input_path, output_path, len(jobs)))
+        jobs.append(IngestJob(input_path, [Variant(params, [output_path])]))
+    
+    job_statuses = ingest_all(cache, jobs, args.jobs)
+    
+    for collection_name, input_path, output_path, job_index in entries:
+        status = job_index if isinstance(job_index, str) else job_statuses[job_index][0]
+        print(f"\n{collection_name}:")
+        
         # Get original file size
         original_size = os.path.getsize(input_path)
         original_size_kb = original_size / 1024
@@ -135,9 +132,10 @@ def main():
         
         print(f"  Original size: {original_size_kb:.1f}KB")
         
-        # Create thumbnail
-        if optimize_hero_thumbnail(input_path, output_path):
+        if status:
             success_count += 1
+            if status != 'encoded':
+                print(f"  ✓ Up to date ({status}): {os.path.basename(output_path)}")
             
             # Show optimized file size and savings
             if os.path.exists(output_path):
@@ -149,6 +147,11 @@ def main():
                 print(f"  Optimized size: {new_size_kb:.1f}KB")
                 print(f"  Savings: {savings_percent:.1f}% reduction")
     
+    print_savings_report([("Hero thumbnails", [cache.output_meta(output_path) for _, _, output_path, _ in entries])])
+    write_photo_manifest('.', [c for c in COLLECTIONS if os.path.exists(c)], cache)
+    cache.close()
+    finish_trace(args, 'optimize_hero_thumbs')
+    
     print("\n" + "=" * 60)
     print(f"Hero thumbnail optimization complete!")
     print(f"Successfully processed: {success_count}/{total_count} collections")
@@ -164,10 +167,6 @@ def main():
         print("Check file paths and ensure all input images exist.")
     else:
         print("All hero thumbnails generated successfully!")
-        print("\nNext steps:")
-        print("1. Import the new hero thumbnails in photo-collections.js")
-        print("2. Update the collection data structure to use optimized heroes")
-        print("3. Test the improved loading performance")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,16 +4,61 @@ Photo optimization script for web deployment.
 Optimizes photos for web use while maintaining high quality.
 Processes new images from import/ folders and moves originals to originals/ folders.
 Resizes images so the longest side is 1920px or less.
-Renames files according to the naming scheme used in photo-collections.js
+Renames files according to the naming scheme used in photo-collections.js,
+appends new numbers to their collection's gallery order in galleries.json
+and rewrites manifest.json / manifest.js, which photo-collections.js reads.
+Each original is decoded once; a hero.* import also yields its gallery copy and
+its hero-thumbs/ thumbnail from that same decode.
+Imports that are perceptually the same photo as a published image or an
+original in any collection are left in import/ before anything is encoded
+(see pipeline/dedupe.py; --on-duplicate import to take them anyway).
+With --budget it re-encodes recorded originals so each collection (or the
+whole photo route) fits a total size (see pipeline/budget.py).
+With --rebuild it re-encodes every published photo from its original under
+the current settings (keeping the size and quality --budget chose for it),
+resumably, swapping each collection in whole once it
+is done (see pipeline/rebuild.py); originals imported before
+originals/imports.json existed are matched to their published file first.
+With --tiles astro (comma-separated collections) every recorded original in
+those collections also gets a deep-zoom tile pyramid under tiles/, for
+viewing at full resolution (see pipeline/pyramid.py).
+With --watch it keeps running afterwards, importing files as they land in any
+import/ folder or in interactive/web/thumbnails/ (see pipeline/watch.py).
 """
 
 import os
 import sys
-import shutil
-from PIL import Image, ImageOps
+import argparse
 import glob
+import importlib.util
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pipeline.budget import add_budget_arguments, fit_budgets
+from pipeline.cache import add_cache_arguments, file_sha256, image_size, open_cache
+from pipeline.dedupe import DEFAULT_MAX_DISTANCE, add_duplicate_arguments, build_index, image_hashes
+from pipeline.ingest import (HERO_THUMB_PARAMS, PHOTO_PARAMS, IngestJob, Variant, add_decode_arguments, encode_options,
+                             fit_params, ingest_original, with_options)
+from pipeline.ladder import DEFAULT_WIDTHS, gallery_files, ladder_variants, parse_widths, write_srcset_index
+from pipeline.manifest import GALLERIES_JSON, add_to_gallery, write_photo_manifest
+from pipeline.encoders import add_format_arguments, report_missing
+from pipeline.files import move_to_originals
+from pipeline.ledger import complete, load_ledger, prune_reservations, reserve, reserved_name, save_ledger
+from pipeline.pyramid import pyramid_paths, write_pyramids
+from pipeline.quality import add_quality_arguments, print_savings_report
+from pipeline.rebuild import RebuildItem, rebuild
+from pipeline.trace import add_trace_arguments, finish_trace
+from pipeline.watch import IMAGE_EXTENSIONS, WatchTarget, add_watch_arguments, watch
+from pipeline.workers import add_jobs_argument, ingest_all
+
+COLLECTIONS = ['portrait', 'aberrant', 'performance', 'astro']
+
+# Budget names covering more than one collection (the /photo route shows them all)
+ROUTE_COLLECTIONS = {'photo': COLLECTIONS}
+
+WEB_THUMBNAILS_SCRIPT = (Path(__file__).resolve().parent.parent
+                         / "interactive" / "web" / "thumbnails" / "optimize_thumbnails.py")
+
 def optimize_image(input_path, output_path, max_size=1920, quality=85):
     """
     Optimize an image for web use.
@@ -22,46 +67,16 @@ def optimize_image(input_path, output_path, max_size=1920, quality=85):
         input_path: Path to original image
         output_path: Path for optimized image
         max_size: Maximum dimension for longest side
-        quality: JPEG quality (0-100)
+        quality: WebP quality (0-100)
     """
-    try:
-        # Open and auto-rotate image based on EXIF
-        with Image.open(input_path) as img:
-            # Auto-rotate based on EXIF orientation
-            img = ImageOps.exif_transpose(img)
-            
-            # Convert to RGB if necessary (handles RGBA, P, etc.)
-            if img.mode in ('RGBA', 'LA', 'P'):
-                # Create white background for transparency
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                img = background
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Calculate new dimensions
-            width, height = img.size
-            if width > max_size or height > max_size:
-                if width > height:
-                    new_width = max_size
-                    new_height = int((height * max_size) / width)
-                else:
-                    new_height = max_size
-                    new_width = int((width * max_size) / height)
-                
-                # Resize with high-quality resampling
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Save with WebP optimization
-            img.save(output_path, 'WEBP', quality=quality, optimize=True)
-            print(f"✓ Optimized: {os.path.basename(input_path)} -> {os.path.basename(output_path)}")
-            return True
-            
-    except Exception as e:
-        print(f"✗ Error processing {input_path}: {e}")
-        return False
+    params = fit_params('photo', max_size, quality)
+    return ingest_original(input_path, [Variant(params, [output_path])])[0] is not None
+
+def report_cached(job, statuses):
+    for variant, status in zip(job.variants, statuses):
+        if status in ('fresh', 'restored'):
+            names = ', '.join(os.path.basename(p) for p in variant.output_paths)
+            print(f"✓ Cached: {os.path.basename(job.input_path)} -> {names}")
 
 def get_output_filename(collection, index, is_hero=False):
     """Generate output filename based on collection and index."""
@@ -70,26 +85,106 @@ def get_output_filename(collection, index, is_hero=False):
     else:
         return f"{collection}-{index:02d}.webp"
 
-def get_next_available_index(collection_dir, collection_name):
-    """Find the next available index for new images in a collection."""
-    existing_files = list(collection_dir.glob(f"{collection_name}-*.webp"))
-    if not existing_files:
-        return 1
+def get_next_available_index(collection_dir, collection_name, ledger=None):
+    """
+    Find the next available index for new images in a collection.
     
-    # Extract indices from existing files
+    Names reserved in the ledger for imports still in flight count as taken.
+    """
+    names = [file.name for file in collection_dir.glob(f"{collection_name}-*.webp")]
+    pending = [name for name, entry in (ledger or {}).items() if entry['original'] is None]
+    
+    # Extract indices from names like "portrait-01.webp"
     indices = []
-    for file in existing_files:
+    for name in names + pending:
         try:
-            # Extract number from filename like "portrait-01.webp"
-            name_part = file.stem.replace(f"{collection_name}-", "")
-            indices.append(int(name_part))
+            indices.append(int(Path(name).stem.replace(f"{collection_name}-", "")))
         except ValueError:
             continue
     
+    # A hero (published or on its way) is also gallery image 1
+    if (collection_dir / "hero.webp").exists() or "hero.webp" in pending:
+        indices.append(1)
+    
     return max(indices) + 1 if indices else 1
 
-def process_import_folder(collection_name):
-    """Process new images from a collection's import/ folder."""
+def gallery_variants(collection_name, output_filename, widths=DEFAULT_WIDTHS, options=None, photo=PHOTO_PARAMS):
+    """
+    Every variant published under output_filename: the gallery image and its
+    srcset ladder, and for hero.webp also the linked <collection>-01.webp and
+    the hero-thumbs/ thumbnail. photo is the gallery image's encode (another
+    one only where --budget chose it; see recorded_photo_params()).
+    """
+    collection_dir = Path(collection_name)
+    photo_params = with_options(photo, options)
+    ladder = dict(main_size=PHOTO_PARAMS['max_size'], quality=PHOTO_PARAMS['quality'], options=options)
+    if output_filename == "hero.webp":
+        gallery_path = collection_dir / get_output_filename(collection_name, 1)
+        hero_thumb_path = collection_dir.parent / "hero-thumbs" / f"{collection_name}-hero.webp"
+        hero_thumb_path.parent.mkdir(exist_ok=True)
+        return [
+            Variant(photo_params, [collection_dir / "hero.webp", gallery_path]),
+            Variant(with_options(HERO_THUMB_PARAMS, options), [hero_thumb_path]),
+        ] + ladder_variants(gallery_path, widths, **ladder)
+    gallery_path = collection_dir / output_filename
+    return [Variant(photo_params, [gallery_path])] + ladder_variants(gallery_path, widths, **ladder)
+
+def plan_import_file(collection_name, img_path, ledger, widths=DEFAULT_WIDTHS, options=None):
+    """
+    Decide the output names for one import file and reserve them in the ledger.
+    
+    A file that already holds a reservation (its run stopped before the
+    original was moved) gets the same names back; anything else takes the
+    next free index. Returns the plan entry for the file.
+    """
+    collection_dir = Path(collection_name)
+    img_path = Path(img_path)
+    original_filename = img_path.name
+    is_hero = original_filename.lower().startswith('hero.')
+    
+    output_filename = reserved_name(ledger, original_filename)
+    if output_filename is None:
+        if is_hero:
+            output_filename = get_output_filename(collection_name, 1, is_hero=True)
+        else:
+            output_filename = get_output_filename(collection_name,
+                                                  get_next_available_index(collection_dir, collection_name, ledger))
+        reserve(ledger, output_filename, img_path, file_sha256(img_path))
+    
+    job = IngestJob(img_path, gallery_variants(collection_name, output_filename, widths, options))
+    
+    # Check if this is intended as a hero image
+    if is_hero:
+        # Hero image also becomes the first gallery image (same bytes, linked)
+        # and gets its overview-card thumbnail from the same decode
+        hero_paths, (hero_thumb_path,) = job.variants[0].output_paths, job.variants[1].output_paths
+        print(f"  Hero image: {original_filename} -> hero.webp, {hero_paths[1].name}, "
+              f"{hero_thumb_path.parent.name}/{hero_thumb_path.name}")
+    else:
+        # Regular numbered image
+        print(f"  {original_filename} -> {output_filename}")
+    return {
+        'source': img_path,
+        'is_hero': is_hero,
+        'output': output_filename,
+        'job': job,
+    }
+
+def plan_import_folder(collection_name, widths=DEFAULT_WIDTHS, options=None, check_duplicates=None):
+    """
+    Decide every output name for a collection's import/ folder up front.
+    
+    Index assignment happens here, serially and in sorted filename order, so
+    the numbering is identical whether the encodes later run on one core or many.
+    The names are reserved in originals/imports.json (see pipeline/ledger.py)
+    before anything is encoded, so an interrupted run resumes with the same ones.
+    Every gallery image also gets its srcset ladder (see pipeline/ladder.py).
+    options (from encode_options()) turn on the quality search and alternate
+    formats for every variant.
+    check_duplicates (from duplicate_checker()) drops imports that are already
+    published before any name is reserved.
+    Returns a list of entries, one per import file, or None if there is nothing to do.
+    """
     collection_dir = Path(collection_name)
     import_dir = collection_dir / "import"
     originals_dir = collection_dir / "originals"
@@ -99,7 +194,7 @@ def process_import_folder(collection_name):
     
     if not import_dir.exists():
         print(f"No import directory found for {collection_name} (create {import_dir} to add new photos)")
-        return 0
+        return None
     
     # Get all image files from import directory
     image_files = []
@@ -108,97 +203,73 @@ def process_import_folder(collection_name):
     
     if not image_files:
         print(f"No new images found in {import_dir}")
-        return 0
+        return None
     
-    # Sort files for consistent ordering
-    image_files.sort()
+    # Sort files for consistent ordering, a hero first so it claims gallery index 1
+    image_files.sort(key=lambda f: (not os.path.basename(f).lower().startswith('hero.'), f))
     
-    print(f"\n--- Processing {collection_name.upper()} collection ---")
+    print(f"\n--- Planning {collection_name.upper()} collection ---")
     print(f"Found {len(image_files)} new images to import")
     
-    processed_count = 0
-    next_index = get_next_available_index(collection_dir, collection_name)
+    if check_duplicates is not None:
+        image_files = check_duplicates(collection_name, image_files)
+        if not image_files:
+            return None
     
-    for img_path in image_files:
-        img_path = Path(img_path)
-        original_filename = img_path.name
-        
-        # Check if this is intended as a hero image
-        if original_filename.lower().startswith('hero.'):
-            # Process as hero image
-            hero_output_path = collection_dir / "hero.webp"
-            print(f"  Processing hero image: {original_filename}")
-            
-            # Also create a numbered gallery version (first image)
-            gallery_output_filename = get_output_filename(collection_name, 1)
-            gallery_output_path = collection_dir / gallery_output_filename
-            
-            # Optimize and save both versions
-            if optimize_image(img_path, hero_output_path):
-                print(f"    Created hero.webp")
-                # Also save as first gallery image
-                if optimize_image(img_path, gallery_output_path):
-                    print(f"    Also created {gallery_output_filename} for gallery")
-                
-                # Move original to originals folder
-                original_dest = originals_dir / original_filename
-                
-                # Handle filename conflicts
-                counter = 1
-                while original_dest.exists():
-                    name_parts = original_filename.rsplit('.', 1)
-                    if len(name_parts) == 2:
-                        original_dest = originals_dir / f"{name_parts[0]}_{counter}.{name_parts[1]}"
-                    else:
-                        original_dest = originals_dir / f"{original_filename}_{counter}"
-                    counter += 1
-                
-                try:
-                    shutil.move(str(img_path), str(original_dest))
-                    print(f"    Moved original to: {original_dest.relative_to(collection_dir)}")
-                    processed_count += 1
-                except Exception as e:
-                    print(f"    ✗ Error moving original file: {e}")
-            else:
-                print(f"    ✗ Failed to optimize {original_filename}")
-            
-            continue  # Skip the normal processing for this file
-        
-        # Regular numbered image (skip index 1 if hero was processed)
-        if next_index == 1:
-            # Check if hero.webp exists, if so start from index 2
-            hero_path = collection_dir / "hero.webp"
-            if hero_path.exists():
-                next_index = 2
-        
-        output_filename = get_output_filename(collection_name, next_index)
-        output_path = collection_dir / output_filename
-        print(f"  Processing {original_filename} -> {output_filename}")
-        next_index += 1
-        
-        # Optimize the image (for regular numbered images)
-        if optimize_image(img_path, output_path):
-            # Move original to originals folder
-            original_dest = originals_dir / original_filename
-            
-            # Handle filename conflicts
-            counter = 1
-            while original_dest.exists():
-                name_parts = original_filename.rsplit('.', 1)
-                if len(name_parts) == 2:
-                    original_dest = originals_dir / f"{name_parts[0]}_{counter}.{name_parts[1]}"
-                else:
-                    original_dest = originals_dir / f"{original_filename}_{counter}"
-                counter += 1
-            
-            try:
-                shutil.move(str(img_path), str(original_dest))
-                print(f"    Moved original to: {original_dest.relative_to(collection_dir)}")
-                processed_count += 1
-            except Exception as e:
-                print(f"    ✗ Error moving original file: {e}")
-        else:
-            print(f"    ✗ Failed to optimize {original_filename}")
+    ledger = load_ledger(originals_dir)
+    prune_reservations(ledger, import_dir)
+    plan = [plan_import_file(collection_name, img_path, ledger, widths, options) for img_path in image_files]
+    save_ledger(originals_dir, ledger)
+    
+    return plan
+
+def finish_import_entry(collection_name, entry, entry_statuses, ledger):
+    """Report one encoded import file and move its original; returns True once it has been imported."""
+    collection_dir = Path(collection_name)
+    original_filename = entry['source'].name
+    report_cached(entry['job'], entry_statuses)
+    
+    # The first variant is the one that decides success (hero.webp for heroes)
+    if not entry_statuses[0]:
+        print(f"    ✗ Failed to optimize {original_filename}")
+        return False
+    
+    if entry['is_hero']:
+        hero_variant, thumb_variant = entry['job'].variants[:2]
+        print(f"    Created hero.webp")
+        print(f"    Also linked {hero_variant.output_paths[1].name} for gallery")
+        if entry_statuses[1]:
+            print(f"    Created hero thumbnail {thumb_variant.output_paths[0].name}")
+    
+    try:
+        original_dest = move_to_originals(entry['source'], collection_dir / "originals")
+        print(f"    Moved original to: {original_dest.relative_to(collection_dir)}")
+    except Exception as e:
+        print(f"    ✗ Error moving original file: {e}")
+        return False
+    complete(ledger, entry['output'], original_dest)
+    
+    # New numbers go to the end of the gallery; hero.webp is always shown first
+    if not entry['is_hero'] and add_to_gallery('.', collection_name, entry['output']):
+        print(f"    Added {entry['output']} to the end of the {collection_name} gallery in {GALLERIES_JSON}")
+    return True
+
+def finish_import_folder(collection_name, plan, statuses):
+    """
+    Move originals for every successfully encoded entry, in plan order.
+    
+    statuses holds the ingest_all() variant statuses for each plan entry.
+    """
+    collection_dir = Path(collection_name)
+    import_dir = collection_dir / "import"
+    originals_dir = collection_dir / "originals"
+    
+    print(f"\n--- Processing {collection_name.upper()} collection ---")
+    
+    ledger = load_ledger(originals_dir)
+    processed_count = sum(finish_import_entry(collection_name, entry, entry_statuses, ledger)
+                          for entry, entry_statuses in zip(plan, statuses))
+    save_ledger(originals_dir, ledger)
     
     # Keep import directory for future use (don't delete even if empty)
     if import_dir.exists():
@@ -206,9 +277,288 @@ def process_import_folder(collection_name):
     
     return processed_count
 
+def process_import_folder(collection_name, cache=None, jobs=1, widths=DEFAULT_WIDTHS, options=None):
+    """Process new images from a collection's import/ folder."""
+    plan = plan_import_folder(collection_name, widths, options)
+    if not plan:
+        return 0
+    
+    statuses = ingest_all(cache, [entry['job'] for entry in plan], jobs)
+    return finish_import_folder(collection_name, plan, statuses)
+
+def backfill_ladder_jobs(collection_name, widths, options=None, cache=None):
+    """
+    Ladder jobs for already-published gallery images (and a hero that isn't one of them).
+    
+    Their originals aren't mapped to an index, so the ladder is resized from
+    the published WebP instead, starting below its actual size (not every
+    published file is 1920px).
+    """
+    jobs = []
+    for gallery_path in gallery_files(collection_name, collection_name):
+        size = image_size(gallery_path, cache)
+        main_size = max(size['width'], size['height'])
+        jobs.append(IngestJob(gallery_path, ladder_variants(gallery_path, widths, main_size=main_size,
+                                                            options=options)))
+    return jobs
+
+def photo_watch_target(collection_name, publish, widths=DEFAULT_WIDTHS, options=None, check_duplicates=None):
+    """
+    WatchTarget for a collection's import/ folder (see pipeline/watch.py).
+    
+    Each settled file is planned and reserved in the ledger on its own, then
+    finished the same way a one-shot run finishes it.
+    """
+    collection_dir = Path(collection_name)
+    originals_dir = collection_dir / "originals"
+    
+    def plan(path):
+        path = Path(os.path.relpath(path))
+        print(f"\n--- New {collection_name.upper()} photo ---")
+        if check_duplicates is not None and not check_duplicates(collection_name, [path]):
+            return None
+        ledger = load_ledger(originals_dir)
+        prune_reservations(ledger, path.parent)
+        entry = plan_import_file(collection_name, path, ledger, widths, options)
+        save_ledger(originals_dir, ledger)
+        return entry
+    
+    def finish(entry, statuses):
+        ledger = load_ledger(originals_dir)
+        finish_import_entry(collection_name, entry, statuses, ledger)
+        save_ledger(originals_dir, ledger)
+    
+    return WatchTarget(collection_dir / "import", plan, finish, publish)
+
+def duplicate_checker(cache, collections, on_duplicate='skip', max_distance=DEFAULT_MAX_DISTANCE, jobs=1):
+    """
+    Index every published gallery image and original by perceptual hash and
+    return check(collection_name, image_files) -> the files to import.
+    
+    Each import is looked up before anything else happens to it and then
+    added to the index, so the same photo dropped twice is caught too. A
+    hero import that matches is only flagged: re-importing a gallery photo
+    as hero.jpg is how a collection's hero is changed.
+    """
+    published = []
+    for collection in collections:
+        collection_dir = Path(collection)
+        published.extend(sorted(collection_dir.glob("*.webp")))
+        published.extend(sorted(p for p in (collection_dir / "originals").glob("*")
+                                if p.suffix.lower() in IMAGE_EXTENSIONS))
+    index = build_index(cache, published, max_distance=max_distance, jobs=jobs)
+    
+    def check(collection_name, image_files):
+        kept = []
+        for img_path, hashes in zip(image_files, image_hashes(cache, image_files, jobs)):
+            name = os.path.basename(img_path)
+            match = index.find(hashes)
+            if match and on_duplicate == 'skip' and not name.lower().startswith('hero.'):
+                print(f"  ⚠ Skipping {name}: same photo as {match[0]} ({match[1]} bits apart); left in import/")
+                continue
+            if match:
+                print(f"  ⚠ {name} looks like {match[0]} ({match[1]} bits apart); importing anyway")
+            index.add(f"{collection_name}/import/{name}", hashes)
+            kept.append(img_path)
+        return kept
+    
+    return check
+
+def web_thumbnail_watch_target(options=None, cache=None):
+    """The web thumbnail script's WatchTarget (it lives outside this package, so it is loaded by path)."""
+    spec = importlib.util.spec_from_file_location("optimize_thumbnails", WEB_THUMBNAILS_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.watch_target(options, cache)
+
+def collections_or_routes():
+    """Names --budget accepts."""
+    return COLLECTIONS + list(ROUTE_COLLECTIONS)
+
+def budget_items(collections, budgets):
+    """
+    One budget item per published gallery file in a budgeted collection.
+    
+    hero.webp and its linked <collection>-01.webp are one item with two copies.
+    Items whose original is recorded in the ledger can be re-encoded.
+    """
+    items = []
+    for collection in collections:
+        groups = [name for name in budgets
+                  if name == collection or collection in ROUTE_COLLECTIONS.get(name, ())]
+        if not groups:
+            continue
+        collection_dir = Path(collection)
+        ledger = load_ledger(collection_dir / "originals")
+        paths = sorted(collection_dir.glob(f"{collection}-*.webp"))
+        hero_path = collection_dir / "hero.webp"
+        groups_of_paths = [[p] for p in paths]
+        if hero_path.exists():
+            linked = [p for p in paths if os.path.samefile(p, hero_path)]
+            groups_of_paths = [[hero_path] + linked] + [[p] for p in paths if p not in linked]
+        for output_paths in groups_of_paths:
+            name = output_paths[0].name
+            entry = ledger.get(name)
+            original = collection_dir / "originals" / entry['original'] if entry and entry['original'] else None
+            items.append({
+                'name': f"{collection}/{name}",
+                'collection': collection,
+                'ledger_name': name,
+                'paths': output_paths,
+                'copies': len(output_paths),
+                'bytes': output_paths[0].stat().st_size,
+                'groups': groups,
+                'original': original if original and original.exists() else None,
+            })
+    return items
+
+def apply_budgets(cache, collections, budgets, jobs=1):
+    """Fit the budgeted collections and record the chosen encode params in each ledger."""
+    print(f"\n--- Fitting byte budgets ---")
+    items = budget_items(collections, budgets)
+    chosen = fit_budgets(cache, items, budgets, jobs)
+    for collection in collections:
+        originals_dir = Path(collection) / "originals"
+        ledger = load_ledger(originals_dir)
+        changed = False
+        for item, params in zip(items, chosen):
+            if params is not None and item['collection'] == collection and item['ledger_name'] in ledger:
+                ledger[item['ledger_name']]['params'] = params
+                changed = True
+        if changed:
+            save_ledger(originals_dir, ledger)
+
+def map_originals(cache, collection_name, jobs=1):
+    """
+    Record in the ledger which published image each unrecorded original became.
+    
+    Photos imported before originals/imports.json existed only left their
+    original behind; each is matched to the closest published image by
+    perceptual hash (see pipeline/dedupe.py), closest pairs first, one
+    original per image. Returns the number of originals recorded.
+    """
+    collection_dir = Path(collection_name)
+    originals_dir = collection_dir / "originals"
+    ledger = load_ledger(originals_dir)
+    recorded = {entry['original'] for entry in ledger.values() if entry['original']}
+    originals = sorted(p for p in originals_dir.glob("*")
+                       if p.suffix.lower() in IMAGE_EXTENSIONS and p.name not in recorded)
+    
+    # <collection>-01.webp linked to hero.webp is the hero's
+    hero_path = collection_dir / "hero.webp"
+    published = [p for p in sorted(collection_dir.glob(f"{collection_name}-*.webp"))
+                 if p.name not in ledger and not (hero_path.exists() and os.path.samefile(p, hero_path))]
+    if hero_path.exists() and hero_path.name not in ledger:
+        published.insert(0, hero_path)
+    if not originals or not published:
+        return 0
+    
+    index = build_index(cache, published, collection_dir, jobs=jobs)
+    matches = sorted((match[1], match[0], original)
+                     for original, hashes in zip(originals, image_hashes(cache, originals, jobs))
+                     if (match := index.find(hashes)))
+    count = 0
+    for distance, name, original in matches:
+        if name in ledger:
+            continue
+        ledger[name] = {'source': original.name, 'sha256': cache.source_hash(original), 'original': original.name}
+        print(f"  Recorded {original.name} -> {name} ({distance} bits apart)")
+        count += 1
+    if count:
+        save_ledger(originals_dir, ledger)
+    return count
+
+def recorded_photo_params(entry):
+    """The gallery encode recorded in a ledger entry (by --budget or a rebuild), or the normal one."""
+    params = entry.get('params')
+    return fit_params('photo', params['max_size'], params['quality']) if params else PHOTO_PARAMS
+
+def rebuild_items(collection_name, widths=DEFAULT_WIDTHS, options=None):
+    """
+    One RebuildItem per published gallery image whose original is recorded.
+    
+    The hero goes first and claims <collection>-01.webp, exactly as its import did.
+    Each image keeps the size and quality recorded in the ledger, so a rebuild
+    doesn't undo what --budget chose.
+    Returns (items, published images left as they are for lack of an original).
+    """
+    collection_dir = Path(collection_name)
+    ledger = load_ledger(collection_dir / "originals")
+    names = sorted(ledger, key=lambda name: (name != "hero.webp", name))
+    items = []
+    claimed = set()
+    for name in names:
+        entry = ledger[name]
+        original = collection_dir / "originals" / (entry['original'] or '')
+        if not entry['original'] or not original.is_file() or not (collection_dir / name).exists():
+            continue
+        variants = gallery_variants(collection_name, name, widths, options, recorded_photo_params(entry))
+        outputs = {p for variant in variants for p in variant.output_paths}
+        if outputs & claimed:
+            continue
+        claimed |= outputs
+        items.append(RebuildItem(f"{collection_name}/{name}", collection_name, IngestJob(original, variants)))
+    
+    unmatched = [p for p in sorted(collection_dir.glob("*.webp")) if p not in claimed]
+    return items, unmatched
+
+def rebuild_library(cache, collections, widths=DEFAULT_WIDTHS, options=None, jobs=1):
+    """Re-encode every collection from its originals and record the new params in each ledger."""
+    print(f"\n--- Rebuilding published photos from originals/ ---")
+    items = []
+    for collection in collections:
+        map_originals(cache, collection, jobs)
+        collection_items, unmatched = rebuild_items(collection, widths, options)
+        items += collection_items
+        print(f"  {collection}: {len(collection_items)} images from originals")
+        if unmatched:
+            print(f"  ⚠ {collection}: {len(unmatched)} published images have no original and keep their encode")
+    
+    def swapped(collection, collection_items):
+        originals_dir = Path(collection) / "originals"
+        ledger = load_ledger(originals_dir)
+        for item in collection_items:
+            name = Path(item.name).name
+            if name in ledger:
+                ledger[name]['params'] = recorded_photo_params(ledger[name])
+        save_ledger(originals_dir, ledger)
+    
+    settings = {'photo': with_options(PHOTO_PARAMS, options), 'hero_thumb': with_options(HERO_THUMB_PARAMS, options),
+                'widths': list(widths)}
+    return rebuild(cache, items, settings, jobs, on_swapped=swapped)
+
+def pyramid_items(collection_name):
+    """(original, .dzi path) for every published gallery image whose original is recorded, each original once."""
+    collection_dir = Path(collection_name)
+    ledger = load_ledger(collection_dir / "originals")
+    items = []
+    seen = set()
+    for name in sorted(ledger, key=lambda name: (name != "hero.webp", name)):
+        entry = ledger[name]
+        original = collection_dir / "originals" / (entry['original'] or '')
+        if not entry['original'] or not original.is_file() or not (collection_dir / name).exists() or original in seen:
+            continue
+        seen.add(original)
+        items.append((original, pyramid_paths('.', collection_name, name)[0]))
+    return items
+
+def write_collection_pyramids(cache, collections, jobs=1):
+    """Tile the recorded originals of each collection; returns the originals that failed."""
+    failed = []
+    for collection in collections:
+        print(f"\n--- Tiling {collection} originals ---")
+        items = pyramid_items(collection)
+        if not items:
+            print(f"⚠ {collection}: no recorded originals to tile")
+            continue
+        summary = write_pyramids(cache, items, jobs)
+        print(f"  {collection}: {summary['built']} tiled, {summary['fresh']} up to date, {len(summary['failed'])} failed")
+        failed += summary['failed']
+    return failed
+
 def create_import_directories():
     """Create import directories for all collections if they don't exist."""
-    collections = ['portrait', 'aberrant', 'performance', 'astro']
+    collections = COLLECTIONS
     created_dirs = []
     
     for collection in collections:
@@ -227,34 +577,123 @@ def create_import_directories():
 
 def main():
     """Main function to process all collections."""
+    parser = argparse.ArgumentParser(description="Import and optimize photos for the web")
+    add_cache_arguments(parser)
+    add_jobs_argument(parser)
+    parser.add_argument('--widths', default=','.join(str(w) for w in DEFAULT_WIDTHS),
+                        help="Smaller srcset sizes (longest side) to emit per photo, '' for none (default: %(default)s)")
+    parser.add_argument('--backfill-ladder', action='store_true',
+                        help='Also build missing srcset sizes for already-published gallery images')
+    add_quality_arguments(parser)
+    add_format_arguments(parser)
+    add_decode_arguments(parser)
+    add_trace_arguments(parser)
+    add_budget_arguments(parser)
+    add_duplicate_arguments(parser)
+    add_watch_arguments(parser)
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Re-encode every published photo from originals/ under the current settings '
+                             '(resumes an interrupted rebuild)')
+    parser.add_argument('--tiles', type=lambda value: [c.strip() for c in value.split(',') if c.strip()], default=[],
+                        metavar='COLLECTIONS',
+                        help='Also write deep-zoom tile pyramids from the originals of these comma-separated '
+                             'collections (e.g. astro)')
+    args = parser.parse_args()
+    widths = parse_widths(args.widths)
+    options = encode_options(args)
+    unknown = [name for name in args.budget if name not in collections_or_routes()]
+    if unknown:
+        parser.error(f"unknown budget name(s): {', '.join(unknown)} "
+                     f"(choose from {', '.join(collections_or_routes())})")
+    unknown = [name for name in args.tiles if name not in COLLECTIONS]
+    if unknown:
+        parser.error(f"unknown collection(s) for --tiles: {', '.join(unknown)} (choose from {', '.join(COLLECTIONS)})")
+    
     script_dir = Path(__file__).parent
     os.chdir(script_dir)
     
-    collections = ['portrait', 'aberrant', 'performance', 'astro']
+    collections = COLLECTIONS
     
     print("=== Photo Import & Optimization Script ===")
     print("Processing new photos from import/ folders...")
     print("- Max dimension: 1920px")
-    print("- Quality: 85%")
-    print("- Format: WebP with optimization")
+    print(f"- Srcset sizes: {', '.join(f'{w}px' for w in widths) or 'none'}")
+    if args.target_ssim is None:
+        print("- Quality: 85%")
+    else:
+        print(f"- Quality: searched per image for SSIM >= {args.target_ssim}")
+    print(f"- Format: WebP with optimization{''.join(f', {f.upper()} when smaller' for f in options['formats'])}")
+    if options['reduced_decode']:
+        print("- Decode: reduced resolution for large originals")
     print("- Originals moved to originals/ folder")
     print()
     
+    report_missing(options['formats'])
+    
     # Create import directories if needed
     create_import_directories()
     
     total_processed = 0
     any_found = False
+    cache = open_cache(args)
+    
+    existing = [c for c in collections if os.path.exists(c)]
+    check_duplicates = duplicate_checker(cache, existing, args.on_duplicate, args.duplicate_distance, args.jobs)
     
+    # Plan every collection first so a single pool encodes across all of them
+    plans = []
     for collection in collections:
         if os.path.exists(collection):
-            processed = process_import_folder(collection)
-            total_processed += processed
-            if processed > 0:
-                any_found = True
+            plan = plan_import_folder(collection, widths, options, check_duplicates)
+            if plan:
+                plans.append((collection, plan))
         else:
             print(f"Collection directory '{collection}' not found")
     
+    all_jobs = [entry['job'] for _, plan in plans for entry in plan]
+    statuses = ingest_all(cache, all_jobs, args.jobs)
+    
+    position = 0
+    for collection, plan in plans:
+        processed = finish_import_folder(collection, plan, statuses[position:position + len(plan)])
+        position += len(plan)
+        total_processed += processed
+        if processed > 0:
+            any_found = True
+    
+    # Compare what the quality search produced against the fixed-quality baseline
+    print_savings_report([
+        (collection, [cache.output_meta(variant.output_paths[0])
+                      for entry in plan for variant in entry['job'].variants])
+        for collection, plan in plans
+    ])
+    
+    if args.backfill_ladder and widths:
+        print(f"\n--- Backfilling srcset sizes for published images ---")
+        backfill_jobs = [job for collection in collections if os.path.exists(collection)
+                         for job in backfill_ladder_jobs(collection, widths, options, cache)]
+        ingest_all(cache, backfill_jobs, args.jobs)
+    
+    if args.rebuild:
+        result = rebuild_library(cache, existing, widths, options, args.jobs)
+        if result['failed']:
+            print(f"✗ {len(result['failed'])} images failed to re-encode; their collections were not swapped in")
+    
+    if args.budget:
+        apply_budgets(cache, [c for c in collections if os.path.exists(c)], args.budget, args.jobs)
+    
+    if args.tiles:
+        failed = write_collection_pyramids(cache, [c for c in args.tiles if os.path.exists(c)], args.jobs)
+        if failed:
+            print(f"✗ {len(failed)} originals could not be tiled; their old pyramids (if any) were kept")
+    
+    # Record every size on disk for the front end
+    _, changed = write_srcset_index('.', existing, cache=cache)
+    print("Updated srcset.json" if changed else "srcset.json up to date")
+    write_photo_manifest('.', existing, cache)
+    cache.close()
+    finish_trace(args, 'optimize_photos')
+    
     print(f"\n=== Import Complete ===")
     if any_found:
         print(f"Total new images processed: {total_processed}")
@@ -267,6 +706,23 @@ def main():
         print("2. Run this script again")
         print("3. Name files 'hero.jpg' to replace hero image (will also become first gallery image)")
         print("4. Regular images get sequential numbering starting from the next available number")
+        print(f"   and are appended to the collection's gallery in {GALLERIES_JSON} (reorder or hide them there)")
+    
+    if args.watch:
+        cache = open_cache(args)
+        check_duplicates = duplicate_checker(cache, existing, args.on_duplicate, args.duplicate_distance, args.jobs)
+        
+        def publish():
+            write_srcset_index('.', existing, cache=cache)
+            write_photo_manifest('.', existing, cache)
+        
+        targets = [photo_watch_target(c, publish, widths, options, check_duplicates)
+                   for c in existing if (Path(c) / "import").is_dir()]
+        targets.append(web_thumbnail_watch_target(options, cache))
+        try:
+            watch(cache, targets, args.jobs, args.debounce, on_idle=lambda: finish_trace(args, 'optimize_photos'))
+        finally:
+            cache.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
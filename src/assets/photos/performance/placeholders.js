@@ -0,0 +1,23 @@
+// Generated by src/assets/pipeline/manifest.py - do not edit.
+
+export const placeholders = {
+    "performance/hero.webp": "data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAADQBACdASoaACAAPuVep02pJSOiN/VYASAciWgAALul4fcFB2AG7poyA96pwsqfgAD+93Za6sjMe42Ek3QU2Va7pu0Kj4FeRPRoHPaFJdJLPjK3s1u1MQUDvtKWeaan6XW3hAWYSvJCIi5V1GR2heRMud3n0WepMsQVKmb74NIGKYAA",
+    "performance/performance-20.webp": "data:image/webp;base64,UklGRqoAAABXRUJQVlA4IJ4AAABQBQCdASoWACAAPu1krFAppSQisBgIATAdiWwAnTKDLpQa8u/C9uErS8uJXhrITy0jscAA/sIs4V1IZo40NQATx94yclVNiJ7JAn1cl+CWbOuIzy0jUPf1isok0OmnoFC4DeNGOoG+8LzIEek98TcR2Z2lqjgrEBWo/PFGAHeSTzEZerTCX/8si3q2zMLJK4I4xGpOd5bnAPFvvrQAAA==",
+    "performance/performance-18.webp": "data:image/webp;base64,UklGRtgAAABXRUJQVlA4IMwAAAAwBgCdASogABYAPu1grE2ppaSiMBgMATAdiWwAnTKEYltwziIBWgUduC+MuKYWWfCJlfcHAt67fhXmAPaXNzjcGDJHd3NXJaZQHAzESrjHky66n3L1/3JBrYCoX1TTii1fOE5hQw8WnmTW5e+g+YK7LYXyXaJUOO/Y0Cgpjw6P1s5M6j5PwZBATYi9yr8wQNchUFcAWc7vJAR+JWtr1gyuZp+aHD7N6MVBbyxcSK2TQzWRb5iIgrEN/fV0KMQf7LsGtqVt0Fem9Iu+AAA=",
+    "performance/performance-08.webp": "data:image/webp;base64,UklGRowAAABXRUJQVlA4IIAAAAAQBQCdASoaACAAPt1YpU2opSOiN/qoARAbiWQAuwBXb+Hj8INJm/FvpeLPQYzlkwfAAP74SMTMTDA0akJ6OUrBnaN+sW4Y7O9DcVlRzedoL1xSHwvPj8Xbnu7soRoTXAtrR1W5SYEIiyB12LbtAxUzPxaaHQMuuciYWLXH1pAAAA==",
+    "performance/performance-09.webp": "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAABQBQCdASoaACAAPuFap02opSOiN/qoARAcCWkAy+Ah4auVz+Uv1MYOiG9Vd71QL7figAAA/vQrJ+ZC35ZqIZp+lEkIV6gxeRWKLrtgjxAcDYTbRDVFAOO9aI8qrGGZkvClVRN6VgBkamTaXhVj9LzgvqIAAA==",
+    "performance/performance-17.webp": "data:image/webp;base64,UklGRp4AAABXRUJQVlA4IJIAAAAwBQCdASoaACAAPu1mrE8ppaQiKA1RMB2JbACdMuIYPaCD1rHJjq8LQP9E/AxNUJqsPAD+8aBR+bjyTDshLjvtp2h9fqhKUCby34G3n5L2AP/1vJA/zTJEEyucTrGiDvOB+Pw4S5f1038DHs5/9gDnh/yIMaYdzJ2gtomaVmVUkWLDcfjx3Kz88IDzpl5eEzQ4AA==",
+    "performance/performance-01.webp": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAABwBACdASogABYAPu1oq0+ppiOiKA1RMB2JQBb3CLwA8pp8VEF34lrU1rSBgAD++RADqjxDlXEfc9x58rmYJ9RUIAb3hmcgGejaASaiTcpBSsPxt0yoEJjcLutgIpeRJiwF6j9AAAA=",
+    "performance/performance-12.webp": "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAABwBACdASoYACAAPuFcqE2opSQiMAwBEBwJaQAAW+s7BxsuPnZn52L7gDyVAAD+9BktUPxhn47abI39ivQifJgV+rr37QAAAAA=",
+    "performance/performance-14.webp": "data:image/webp;base64,UklGRqYAAABXRUJQVlA4IJoAAADwBQCdASoYACAAPulmq02pJiQiMBgMASAdCWwAnTKEdXD7w5w3vRgJr00M7bGkZUsdqwTZRKVhAAD+0OkdN+pPPm42xcQwVHM6n8iOfdvBK1/sUvS3vk2Frq2xUI4m+IS5a4ePixygNG1Veb4HwZbiP4QldUJkMbuPKR7KrQS+U3KjuLf+Vb6UavobfqWgmthPQxBGsuAAJWAA",
+    "performance/performance-15.webp": "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAAAQBQCdASoYACAAPu1mq08ppaOiKA1RMB2JQBibAhosgquNalVYMjmxpfx1JHVbUWXwAP7wyxSjtPvvhEBTZfZndQ1sQRU1Pti13ylBrTaAwEC4+O0qdKY9t6fEhZJwP8Vhwgx3/3IzYko61tzJDSW3HunILgAA",
+    "performance/performance-11.webp": "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAAAQBACdASoaACAAPu1qq1EppaOiqAqpMB2JaACdMoABW+NjAlsAzhUWMAD+TGUE9yhEj4DTo+2NC/5uS1K7/4IKs+OdHqP3vK4ZEG2l1CTeuK7BTxFkI9Rxr0fnUNHj1FtxJKMsI4AAAA==",
+    "performance/performance-03.webp": "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQBACdASogABAAPu1mqk4ppaOiMAgBMB2JaQAAW++X7HS1fS1ElyWPKAD+8NGzaHw47GxE0C8NTAPCgcRPbL4x5PG66lgYpM/hSAAA",
+    "performance/performance-10.webp": "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABwBQCdASoXACAAPtleo02oJaMiN/qoAQAbCWUAx+Qh4WwzIJQIB9QtwGy54Q4kojmGO2oAAP71chjAGNbi8KpmZHLzM7S6nPcKJE3uw/S58VRGQr5x2hV28ZOcXJRGJetWoXReRhrOY1b27u04vpIBxKbAAAAA",
+    "performance/performance-02.webp": "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABQBQCdASogABYAPu1kp04ppaMiMBgMATAdiWkAAI6qzHy0SDYwoSUvaaI8mqrX5BJg88AA/vKrZkgCjN+DyLAiRrp6OteMZn0frEtYIUuGx/1Nu9UcjCTnt9CW49iY3CBHlO5YDske+U/oKyS9oHSl7wit8AAA",
+    "performance/performance-19.webp": "data:image/webp;base64,UklGRowAAABXRUJQVlA4IIAAAABwBQCdASoWACAAPuleqE2pJSQiN/VYASAdCWIAuzLMBmHOaSJnWg3UDhhKNdF6zZuhnaEAAP6X342AsfrS1DFPk8TywLm5i1i4CuzO2FHdjwLOCfZCBtX2PGgf+zGGIXhD3L/CTV+HQKViXT5DTTiOnga0j3ZEg82RNtHNWLwAAA==",
+    "performance/performance-06.webp": "data:image/webp;base64,UklGRrYAAABXRUJQVlA4IKoAAADQBQCdASoaACAAPuVepU2pJSOiN/VYASAciWYArDKEgNhVRzYykSGniL5TUWWInfbPry7IpZTGAP73eBNx1Nn08/HRj9Gv27GuOuW7NdbW/HXU6ekeBL00XjDm4JHMpI2gLNg0aBhwn9dHUfmMYU/vIDTzfrwMJIdnkSMr6feF77GnisySq6zYo4u7ooi+ilf/RPB1BtJaQutcLIwWyYXsqqFbLWVBRcAAAA==",
+    "performance/performance-07.webp": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABwBACdASogABYAPu1iqU2ppaOiMAgBMB2JZQDGfCHfuPYaWK3ZZIIJ6fxTAAD+8qGFJuOVWn9L6XYDX+RcwvJ7eGpXtboap6mwwkSemUn5Xj3CZ/xDHW169KSUgHuAjLjsq/qgwKGdanAA",
+    "performance/performance-05.webp": "data:image/webp;base64,UklGRqAAAABXRUJQVlA4IJQAAAAQBQCdASogABYAPu1ur1IppiQiqAgBMB2JZgCo9FbQaOgxXWe5AgYoRRbtAm961hAAAP78RtTUJhG9Jwfbsi3+sCTmrX4rgP4EARVCQRlAi/0eRmCzbVMmKB1XJmy8QW18wPnhFzK2JTUhnx3liQ/oWxC/DUrFHn13ZV+z+6TMTaSyyxaz8r/M2PgtHndRjHHd8AAA",
+    "performance/performance-21.webp": "data:image/webp;base64,UklGRrgAAABXRUJQVlA4IKwAAACQBQCdASoWACAAPu1krE4ppaSiKA1RMB2JbACdMoMjbCGIfglFLzAmF85O7UrBr2EsZv+YAAD+y3VlCInJWJ4omurJ6fo2mFbOMr5/9V8hAs2D++G+hXZJ9oGvCuX5kwDXNJxwDMlZ2PSd4nDGm+CtGdHUa0EWb1NF539Die3BeGoCIbd7qk2KL4KR0uDy2xDFUA21B6PaZc3iZygOfl4ODRjVXHa7/Bbo9AAA"
+};
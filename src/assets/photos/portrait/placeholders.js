@@ -0,0 +1,32 @@
+// Generated by src/assets/pipeline/manifest.py - do not edit.
+
+export const placeholders = {
+    "portrait/hero.webp": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAACQBACdASoYACAAPuFcqE2opSQiMAwBEBwJZQDJECHgTphsgP5xdMSes1sqyAAA/vQjurpIEqmCCZK2t4maPCP2xp5AU0rHtG1oVJwJ7TcWF285G6uwqHJ7mGihpWqCTBsKKy9Eym6+AAAA",
+    "portrait/portrait-27.webp": "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAABQBQCdASoaACAAPuFWpk2opKOiN/qoARAcCWMArAAW8+dl48rMn1PVhIUy5TkwNZlc4AAA/M8YJ9TLTSGTNDX9VPtIQLuev9Y9yAl4Lbo3htYy+hPGffklTXg8g8K+ihJ2wOo4YC75tQ/5GCRKHyciX7SqR0QofyETWHAAAAA=",
+    "portrait/portrait-26.webp": "data:image/webp;base64,UklGRqwAAABXRUJQVlA4IKAAAACQBQCdASoaACAAPu1sr1EppaQiqAqpMB2JQBdmbIFIgDA7QJprDV8w9DsGEYZBC5AXzngJoAD++Qu3glPWiDF5CbB9SNw1ZOZtAYtX/xi0yjjxIAr7/tOj9k23PlE+Sk4PkMQ21LazOX/f8oISYZTEAIf0iXQ1myoPL4HlEGrCHdGNx2thinGwDhjRQaXpHc5BYKevW6FeX0Bmnm9DbAAA",
+    "portrait/portrait-01.webp": "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAABQBQCdASoaACAAPu1kqk6ppaQiMBgMATAdiUAAHg6yc64/j5uc1KztBXOgVO51lHJK7SgA/vhLwOK0+qtHpFSzz5h8cE4nK3AATFPWh9DhiOsNBfNxXY9jTI/MXd+faE+oRRJXGH9n7FrV0sXTZ4j72hgAAA==",
+    "portrait/portrait-17.webp": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAAAwBQCdASoaACAAPu1mrU8ppaQiKA1RMB2JZQDE2BEJnucwEk9hnibaN4dB/CsId9WnmAD9y4gv4x2hPcb0L6FOI+Rkt+JiBGy6iUnLOHl9mo24aDEe0GgZWPE+5Pm3Vmj+y9p6nRqPo4XQuZoQdkAA",
+    "portrait/portrait-18.webp": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAABQBACdASoWACAAPu1kqU2ppaOiMAgBMB2JYgC06CHfwnxe3lIFKCf0urCAAP7o5IuMeuZw8Qw20z6wa8f0qFwfOpEFL9Z+eSubG7jpRL26pFWqDpEy7zOSQ4Hqpg8GNedUAAAA",
+    "portrait/portrait-15.webp": "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAABQBQCdASoWACAAPu1cq02ppKQiMBgMATAdiWMAyywMKyQPcaJQdUS7SmVT8hhOBPfs0AAA/emFVxNpkWyVa8yDdHW+4q/oDx8PCcuxP0f6T6AqSd5q0AEPS1hKsPaUWvg3oi0fhojIueFNNhXuYPK2hLO3Wg0n65zF+PTAAAA=",
+    "portrait/portrait-21.webp": "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAADQBACdASoaACAAPuloqU2pJqQiMAwBIB0JYwDM0CGl6G+fYnW+FUgWaXrRsC8QAAD+5yud6f2z0N1E6XUA/r0GhkOmoPs2X0XhbHLXst7HDORSphNal0+qBXvIjj1XCUJ/ZTR82vx6ZwAAAAA=",
+    "portrait/portrait-28.webp": "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAADQBACdASoYACAAPu1qrU+ppiQiMBgIATAdiWMAwzQv0HqCl/p8iX3EXgc+BnHPwAD+8N/v3q6SDDItF9YWyxYY0coLNdxboptzBuFmPR33mBT+V6SQtxi9iaeeIqag4CdFYhHLJ+Xz9OEldPineFLKXc0XWUFxAAA=",
+    "portrait/portrait-19.webp": "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAACwBACdASoaACAAPu1sqlEppaOiqAqpMB2JZQDCgAtJB/o9cfa0m2CRVWb0P5WAAP6M6nkQEFzM3auL5zNR1Qn9RPk78z7yyMozM2MHu5WVJ3dMSuwKqQwORFbnqDEO5IjQCta9SdCVV4OqgAA=",
+    "portrait/portrait-10.webp": "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAABQBQCdASogACAAPu1wslKppiSiqAgBMB2JYwDBzFHW5JrTKXgp6u7xkx5LvnliSdwR4AAA/s2OnwyOnNgzfGBjUVIzTVzlouTBxAI4If74em1DCKfDdaHZZhEovuLya+zVn28xKwodFM54CgztX3+lsQee1pR5q+/Ra1VjkAA=",
+    "portrait/portrait-06.webp": "data:image/webp;base64,UklGRqAAAABXRUJQVlA4IJQAAADQBQCdASoaACAAPulep02pJSOiN/VYASAdCWYAnTOR/KiWp1z3klb/8PP/+CoqlI/vANg8BwWAAP7oJBp1WAsSJi8q2tZLFuqAJ1k0mUDwHibNlOagblIkqif9ZFINd8/Dk3CL6SVsgg1fcRvvo1k6cjH+BbtocISRB8kqYr58KVY68zfT1npKPAYkvk6yg/pg2eAA",
+    "portrait/portrait-24.webp": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAABQBQCdASoaACAAPu1mpU4ppaMiMBgMATAdiWUApawQ+HFJU64CCAslazSN82v2CdXTRBQA/uvuDr2yjUyaGSXiEBEl3mVYMZU3dF3P7fbEWp6JHspEt80zHxNdwZsxiZMhxAAA",
+    "portrait/portrait-25.webp": "data:image/webp;base64,UklGRowAAABXRUJQVlA4IIAAAAAQBQCdASogABcAPu1mqU2ppaOiMAgBMB2JQA8ZwIrYElY4IoV1VMgGYjMLreot+s4AAP7rIb/J32ItDmm1ZRC4P6dXKNTvu29sCG9aDYVtmAnJfr6Hva7ovirW3tHCiZqduGN1Z3eMDIyR8PvsIlenK1aBBXxAgi1uBVn4jfDQAA==",
+    "portrait/portrait-11.webp": "data:image/webp;base64,UklGRpgAAABXRUJQVlA4IIwAAAAwBQCdASogACAAPu1iqE2ppaOiMAgBMB2JaQABHutgHnsCChdLelahvdbxC3V9hEg0AAD+/fsmArl5DzNoUi6djchw4iQJAl8tdWD6cGd8t6uPaBJU0ug78r5XMBWX1O3Dt7Ci/YiDexaQdMHBQfKsSQKjriSr0MOsIuxLPQq7hWptG5LedZ6zpgAAAA==",
+    "portrait/portrait-16.webp": "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAAAQBQCdASoaACAAPu1kq06ppaQiKA1RMB2JYgCdMyGBSNtFykv1aI9LPkM0ZyaFe2iIAP6TQjDvPcdrRo05BUeY3JyD0AH5RjYfCzUIqk4R8jp7ng83dlz6qP+4RhibXdAhPe+rb1oM8Ucl5uosZWVtjh4HOOqY44AAAA==",
+    "portrait/portrait-04.webp": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAADQBACdASoaACAAPu1krFAppSQisBgIATAdiUAYUAYp78rK7R2IOfF6cVHrRpr2gAD+nsY+agNGo87ViKuYYZmvpJV5vOAf7dP4q/ZYsu3m7in9JTOM0JMO/i7DYmGG1nODgEpJNeA3yAXqWQWAAAAA",
+    "portrait/portrait-05.webp": "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAADQBACdASogACAAPu1kp02ppaMiMBgMATAdiWIAtsg0b/EVu9149Xa6Q1gT5HbB2AD+3qtuqDKXNYwP1y+F2j8jnelKlvhkQIeYy0HXcfG/eF4Sl+QAncPCcrOQlTdetaDlbBNYDp2awIAxLICWvR8RNJnoEZEX5agAAA==",
+    "portrait/portrait-07.webp": "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAAAQBQCdASoaACAAPtVao02oJSMiN+gBABqJYgC26NiEa7a5D5Yg1+25T7iKgP+r9Z+AAP6dlJ9ENvWHRNYtyoBrsedr/YIsrNeHopav5f4PSh1CH+OheJNrgr/gCtPt0f2StGqTL0gRsrP1K9lGcTnyNeq+mkvv8SfjEywJhAhGWNMBbY5fzFvDtWTq8AAA",
+    "portrait/portrait-22.webp": "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAABwBACdASoaACAAPu1krVAppSQisBgIATAdiWMAxzAPDBdAg/XyhLWLKe3J4AD+50F9M3NPMf4cXDzX+xI1GoNH3Tj3+avjxsUpf3ywnNlMq5CbiuxDJQ4H8oYF5uvJ0OB5T8ZRhDg6+3YZduAAAA==",
+    "portrait/portrait-08.webp": "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAAAwBQCdASoaACAAPu1oq04ppiQiMAgBMB2JZQDE2CFUG/oqtJZt4j28cjx8QSwHhMY4AAD+8qQodwvy8Omzl3Gg1c58hF40kEMaXH3uZ7aIbCxbBgFMd3Qqh2yMWrrd7NQWc6ZWr9m1hMhg8dhc4ftMgAA=",
+    "portrait/portrait-23.webp": "data:image/webp;base64,UklGRpYAAABXRUJQVlA4IIoAAABQBQCdASoXACAAPuFgpU2opaOiN/VYARAcCWUAyNQKXbfRh7IFM4t7C6XcDo2nnkCs62wA/pOlFJOfYnnvpuvrSW3QWQ3cHqJ64pLJotVhr7+kozVtPKsdmRUHzBTi88Z/f7TmE+7cv9PxNWj8TDvcyL1V/IJ/2CnpWyd95rg5Wj0u4oFNIqgAAAA=",
+    "portrait/portrait-09.webp": "data:image/webp;base64,UklGRpIAAABXRUJQVlA4IIYAAACwBQCdASoaACAAPu1aqE2ppKQiN/VYATAdiWIArDMvwX5fOxN3NP7+sEEjzI/5xhhpGOfsgEAA/dJjz7CYMNLhtB0C9wGmkTHZsEA6lj0hiKchQdwUDgYYT6F86s1om/Wl/8ayzbgZQR2Ats+f1CTk4YV/SVOucFkeGgLRxSjUdAN4/kcAAA==",
+    "portrait/portrait-12.webp": "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAABwBACdASoaACAAPt1apU2opSOiN/qoARAbiWkAAFu5/wvXVjXXTa0mjN8sFAD+3q5j+I+DelUolsuzq36nIpFBBr2uWjNu0tlVgvQHSHD2VEB8AAA=",
+    "portrait/portrait-13.webp": "data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAABQBQCdASoaACAAPu1urVCppqQiqA1RMB2JYwC7ADxoUmp4zG+gpvEKa36qlLBeV1U7BBAA/vVXNnh71Nav4F0YjJCbIXDHybkpPNgMsXZueJzCrqtzH2cGZ+P3DtB8Bca451ucNxTAZMpRphzgwAMTDZmq92yfP8zZ1z9RsIEF8AAA",
+    "portrait/portrait-14.webp": "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAADwBACdASoaACAAPu1mqk+ppaOiKA1RMB2JYwDDrEJu3qfk1eWbMsUY8l5csOMJybAA/uf3AsJaQhaxCQkAGoZl6xkbsNa4FBe1eYVgA02dXteXg1lm80hjWKPLWetnA8yqceWsEfCGA1Z/r7Kgia5/9ebYbLZh4cD1/m3GAAA=",
+    "portrait/portrait-02.webp": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAADQBACdASoWACAAPu1ep06ppKMiMBgMATAdiWMAzNA0b8bDsFpLcEguv0HZSo/KUAD++E2+qWKhWydov4EaiqLr3o040/UJS59GQ2gZxSs2ZlE0+BTM6Gl1m/TCMIy9YUArMN7ABee6vAAA",
+    "portrait/portrait-03.webp": "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAACwAgCdASogABAAA4BaJZwAAlxUHOakwyJgZcmhAgAA/u9Kn/us216ndSzPtMmhbgyriDhqZfg2LjG0OOrm5iekKIDtpEO+3mmQS9pgAAA="
+};
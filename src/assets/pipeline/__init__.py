@@ -0,0 +1,6 @@
+"""
+Shared helpers for the asset optimization scripts.
+
+The scripts in photos/, interactive/live/ and interactive/web/thumbnails/
+stay runnable on their own; this package holds the pieces they have in common.
+"""
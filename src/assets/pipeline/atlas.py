@@ -0,0 +1,159 @@
+"""
+Sprite atlases: every thumbnail for a page packed into one image.
+
+A page that shows a grid of small thumbnails otherwise pays one request per
+file, which on a high-latency connection is a waterfall. An atlas replaces
+them with a single request:
+
+    <dir>/atlas@2x.webp    members at their published size
+    <dir>/atlas.webp       the same sheet at half size, for small or 1x screens
+    <dir>/atlas.json       where each member sits, in atlas.webp pixels:
+
+    {
+      "width": 390, "height": 390,
+      "images": {"1": "atlas.webp", "2": "atlas@2x.webp"},
+      "frames": {
+        "we-play.webp": {"x": 1, "y": 1, "width": 128, "height": 128, "sha256": "9b0e..."}
+      }
+    }
+
+Members are packed left to right in shelves and each is surrounded by
+copies of its own edge pixels, so a browser sampling a scaled slice never
+bleeds in the neighbour. Sheets are cached under a key made from every
+member's content hash, so an unchanged set of thumbnails is never
+re-encoded. The members are the published WebPs (the originals are already
+in originals/ by then), so each sheet is one more lossy generation at the
+members' quality; for the preview stills that still comes out slightly
+smaller than the nine files it replaces.
+"""
+
+import hashlib
+import io
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from .cache import key_for
+from .files import atomic_write_bytes
+
+ATLAS_NAME = 'atlas'
+ATLAS_QUALITY = 85
+EXTRUDE = 1  # edge pixels repeated around each member, at 1x
+
+
+def atlas_paths(root, name=ATLAS_NAME):
+    """(1x sheet, 2x sheet, coordinate map) for an atlas in root."""
+    root = Path(root)
+    return root / f"{name}.webp", root / f"{name}@2x.webp", root / f"{name}.json"
+
+
+def pack(sizes, gap):
+    """
+    Shelf-pack sizes (each padded by gap on every side) into a roughly square
+    sheet; returns ([(x, y), ...], width, height) with x, y inside the padding.
+    """
+    cells = [(w + 2 * gap, h + 2 * gap) for w, h in sizes]
+    row_width = max(max(w for w, _ in cells), math.ceil(math.sqrt(sum(w * h for w, h in cells))))
+    positions = []
+    x = y = shelf = width = 0
+    for w, h in cells:
+        if x and x + w > row_width:
+            x, y, shelf = 0, y + shelf, 0
+        positions.append((x + gap, y + gap))
+        x += w
+        shelf = max(shelf, h)
+        width = max(width, x)
+    return positions, width, y + shelf
+
+
+def render(images, positions, size, gap):
+    """Paste images at positions on an opaque black sheet, extruding gap edge pixels around each."""
+    sheet = np.zeros((size[1], size[0], 4), np.uint8)
+    sheet[:, :, 3] = 255
+    for img, (x, y) in zip(images, positions):
+        pixels = np.asarray(img.convert('RGBA'))
+        padded = np.pad(pixels, ((gap, gap), (gap, gap), (0, 0)), mode='edge')
+        sheet[y - gap:y - gap + padded.shape[0], x - gap:x - gap + padded.shape[1]] = padded
+    return Image.fromarray(sheet, 'RGBA')
+
+
+def _encode(img, quality):
+    buffer = io.BytesIO()
+    if img.getextrema()[3][0] == 255:
+        img = img.convert('RGB')
+    img.save(buffer, 'WEBP', quality=quality, method=6)
+    return buffer.getvalue()
+
+
+def write_atlas(cache, root, paths, name=ATLAS_NAME, quality=ATLAS_QUALITY):
+    """
+    Pack the existing files among paths into root's atlas sheets and
+    coordinate map (keyed by path relative to root); returns the map, or
+    None when there is nothing to pack.
+    """
+    root = Path(root)
+    paths = [Path(p) for p in paths if Path(p).exists()]
+    if not paths:
+        return None
+    sheet_1x, sheet_2x, map_path = atlas_paths(root, name)
+    hashes = [cache.source_hash(p) for p in paths]
+    members_sha = hashlib.sha256(''.join(hashes).encode()).hexdigest()
+
+    sizes = []
+    for path in paths:
+        with Image.open(path) as img:
+            sizes.append(img.size)
+    # The 2x sheet holds members at their published size; 1x is everything halved
+    sizes_2x = [(w + w % 2, h + h % 2) for w, h in sizes]
+    positions_1x, width, height = pack([(w // 2, h // 2) for w, h in sizes_2x], EXTRUDE)
+
+    statuses = []
+    for density, sheet_path in ((1, sheet_1x), (2, sheet_2x)):
+        params = {'kind': 'atlas', 'density': density, 'quality': quality, 'extrude': EXTRUDE}
+        key = key_for(members_sha, params)
+        if cache.is_fresh(key, sheet_path):
+            statuses.append('fresh')
+            continue
+        if cache.restore(key, sheet_path):
+            statuses.append('restored')
+            continue
+        scaled = []
+        for path, size in zip(paths, sizes_2x):
+            with Image.open(path) as img:
+                target = (size[0] * density // 2, size[1] * density // 2)
+                scaled.append(img.copy() if img.size == target else img.resize(target, Image.Resampling.LANCZOS))
+        sheet = render(scaled, [(x * density, y * density) for x, y in positions_1x],
+                       (width * density, height * density), EXTRUDE * density)
+        atlas_bytes = _encode(sheet, quality)
+        atomic_write_bytes(sheet_path, atlas_bytes)
+        cache.store(key, sheet_path, meta={'width': sheet.width, 'height': sheet.height, 'bytes': len(atlas_bytes),
+                                           'members': len(paths)})
+        statuses.append('encoded')
+
+    coordinates = {
+        'width': width,
+        'height': height,
+        'images': {'1': sheet_1x.name, '2': sheet_2x.name},
+        'frames': {
+            path.relative_to(root).as_posix(): {'x': x, 'y': y, 'width': w // 2, 'height': h // 2, 'sha256': sha}
+            for path, (x, y), (w, h), sha in zip(paths, positions_1x, sizes_2x, hashes)
+        },
+    }
+    atomic_write_bytes(map_path, (json.dumps(coordinates, indent=2) + '\n').encode())
+
+    sizes_kb = ', '.join(f"{p.name} {p.stat().st_size / 1024:.1f}KB" for p in (sheet_1x, sheet_2x))
+    state = 'up to date' if statuses == ['fresh', 'fresh'] else 'written'
+    print(f"✓ Atlas {state}: {len(paths)} images -> {sizes_kb} ({map_path.name})")
+    return coordinates
+
+
+def load_atlas(root, name=ATLAS_NAME):
+    """The coordinate map written by write_atlas, or None."""
+    try:
+        with open(atlas_paths(root, name)[2]) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
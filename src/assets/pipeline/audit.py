@@ -0,0 +1,325 @@
+"""
+Recompression audit for the images committed under src/assets.
+
+    cd src/assets
+    python3 -m pipeline.audit [--jobs N] [--threshold 10] [--min-ssim 0.99] [--apply]
+
+Every .webp / .jpg / .png (outside originals/, import/ and the deep-zoom
+tiles/) is decoded and re-encoded in memory with the current best
+settings, without metadata (EXIF orientation is applied to the pixels;
+ICC profiles are kept):
+
+    .webp   lossy WebP method 6 at the lowest quality that still scores
+            --min-ssim against the file as it is now, and lossless WebP
+            when the image is lossless already, has transparency or has
+            at most LOSSLESS_COLORS colors
+    .jpg    progressive, optimized JPEG at the lowest quality passing the
+            same check; the WebP candidates are reported as "as WebP"
+    .png    optimized PNG (lossless); WebP reported as "as WebP"
+
+Files stay in their format because the front end imports them by name.
+The lossy quality search runs at WebP method 4 and the chosen quality is
+then encoded (and checked again) at method 6. The report lists every file
+whose best candidate saves at least --threshold percent, then totals per
+route (see ROUTES). With --apply those files are rewritten in place
+(atomically, keeping hard links), and the manifests and srcset.json that
+list them are refreshed.
+
+Files the asset catalog knows as pipeline outputs, and sprite atlas
+members, are reported but never rewritten: the scripts would restore
+their own encode on the next run. Rebuild those with new settings instead
+(optimize_photos.py --rebuild). Animated WebPs (hover loops) are skipped.
+Files are audited in parallel; hard-linked names are audited once.
+"""
+
+import argparse
+import io
+import json
+import os
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from .atlas import ATLAS_NAME, load_atlas
+from .cache import ASSETS_DIR, AssetCache
+from .files import write_outputs
+from .ladder import write_srcset_index
+from .manifest import HERO_THUMBS_DIR, MANIFEST_JSON, write_manifest, write_photo_manifest
+from .pyramid import TILES_DIR
+from .quality import decode_score, search_quality
+from .rebuild import REBUILD_DIR
+from .workers import add_jobs_argument, resolve_jobs, run_parallel
+
+AUDIT_EXTENSIONS = ('.webp', '.jpg', '.jpeg', '.png')
+SKIP_DIRS = ('originals', 'import', 'pipeline', '__pycache__', REBUILD_DIR, TILES_DIR)
+DEFAULT_THRESHOLD = 10.0
+DEFAULT_MIN_SSIM = 0.99
+WEBP_METHOD = 6
+SEARCH_METHOD = 4
+LOSSLESS_COLORS = 4096
+QUALITY_STEP = 2  # raised until the method 6 encode passes the check again
+
+# (path prefix relative to src/assets, route); the first match wins
+ROUTES = (
+    ('photos/', '/photo'),
+    ('interactive/live/', '/interactive/live'),
+    ('interactive/web/', '/interactive/web'),
+    ('about/', '/about'),
+    ('', 'every route'),
+)
+
+
+def route_for(relative_path):
+    return next(route for prefix, route in ROUTES if relative_path.startswith(prefix))
+
+
+def find_assets(root):
+    """Auditable images under root, as lists of hard-linked names (one list per file on disk)."""
+    groups = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.'))
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            if path.suffix.lower() in AUDIT_EXTENSIONS and not name.startswith('.'):
+                stat = path.stat()
+                groups.setdefault((stat.st_dev, stat.st_ino), []).append(path)
+    return list(groups.values())
+
+
+def atlas_members(root):
+    """Every file some atlas.json under root was packed from."""
+    members = set()
+    for atlas_json in Path(root).rglob(f'{ATLAS_NAME}.json'):
+        atlas = load_atlas(atlas_json.parent) or {'frames': {}}
+        members.update((atlas_json.parent / name).resolve() for name in atlas['frames'])
+    return members
+
+
+def _has_alpha(img):
+    return img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info)
+
+
+def _webp(img, quality, method, lossless=False):
+    buffer = io.BytesIO()
+    img.save(buffer, 'WEBP', quality=quality, method=method, lossless=lossless)
+    return buffer.getvalue()
+
+
+def _jpeg(img, quality, icc):
+    buffer = io.BytesIO()
+    img.convert('RGB').save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True,
+                            **({'icc_profile': icc} if icc else {}))
+    return buffer.getvalue()
+
+
+def _png(img, icc):
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', optimize=True, **({'icc_profile': icc} if icc else {}))
+    return buffer.getvalue()
+
+
+def _lossy(img, encode_at, min_ssim, ceiling):
+    """(quality, data, score) of the cheapest encode passing min_ssim, or None if none does."""
+    quality, _, score = search_quality(img, lambda q: encode_at(q, SEARCH_METHOD), min_ssim, ceiling=ceiling)
+    while True:
+        data = encode_at(quality, WEBP_METHOD)
+        score = decode_score(img, data)
+        if score >= min_ssim:
+            return quality, data, score
+        if quality >= ceiling:
+            return None
+        quality = min(ceiling, quality + QUALITY_STEP)
+
+
+def webp_candidates(img, lossless_source, min_ssim):
+    candidates = []
+    found = _lossy(img, lambda q, method: _webp(img, q, method), min_ssim, ceiling=100)
+    if found:
+        quality, data, score = found
+        candidates.append({'format': 'webp', 'setting': f'q{quality}', 'data': data, 'ssim': score})
+    if lossless_source or _has_alpha(img) or img.getcolors(LOSSLESS_COLORS) is not None:
+        candidates.append({'format': 'webp', 'setting': 'lossless',
+                           'data': _webp(img, 100, WEBP_METHOD, lossless=True), 'ssim': 1.0})
+    return candidates
+
+
+def jpeg_candidates(img, icc, min_ssim):
+    found = _lossy(img, lambda q, method: _jpeg(img, q, icc), min_ssim, ceiling=95)
+    if not found:
+        return []
+    quality, data, score = found
+    return [{'format': 'jpeg', 'setting': f'q{quality}', 'data': data, 'ssim': score}]
+
+
+def _smallest(candidates):
+    return min(candidates, key=lambda c: len(c['data'])) if candidates else None
+
+
+def audit_file(paths, min_ssim=DEFAULT_MIN_SSIM, threshold=DEFAULT_THRESHOLD, apply=False):
+    """
+    Re-encode one file (all its hard-linked names) and report what it would save.
+
+    Returns {'paths', 'bytes', 'best', 'as_webp', 'passes', 'rewritten', 'skipped'};
+    best / as_webp are {'format', 'setting', 'bytes', 'ssim'} or None.
+    """
+    path = paths[0]
+    size = path.stat().st_size
+    report = {'paths': [str(p) for p in paths], 'bytes': size, 'best': None, 'as_webp': None,
+              'passes': False, 'rewritten': False, 'skipped': None}
+    try:
+        with Image.open(path) as img:
+            if getattr(img, 'n_frames', 1) > 1:
+                report['skipped'] = 'animated'
+                return report
+            kind = img.format
+            icc = img.info.get('icc_profile')
+            with open(path, 'rb') as f:
+                head = f.read(64)
+            lossless = kind == 'PNG' or (kind == 'WEBP' and b'VP8L' in head)
+            img = ImageOps.exif_transpose(img)
+            img.load()
+    except Exception as e:
+        report['skipped'] = f'unreadable: {e}'
+        return report
+
+    if img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+        img = img.convert('RGBA' if _has_alpha(img) else 'RGB')
+    try:
+        webp = webp_candidates(img.convert('RGBA') if _has_alpha(img) else img.convert('RGB'), lossless, min_ssim)
+        if kind == 'WEBP':
+            best = _smallest(webp)
+        elif kind == 'JPEG':
+            best = _smallest(jpeg_candidates(img, icc, min_ssim))
+            report['as_webp'] = _smallest(webp)
+        elif kind == 'PNG':
+            best = {'format': 'png', 'setting': 'optimized', 'data': _png(img, icc), 'ssim': 1.0}
+            report['as_webp'] = _smallest(webp)
+        else:
+            report['skipped'] = f'{kind} is not audited'
+            return report
+    except Exception as e:
+        report['skipped'] = f'could not re-encode: {e}'
+        return report
+
+    report['passes'] = bool(best) and len(best['data']) <= size * (1 - threshold / 100)
+    if apply and report['passes']:
+        write_outputs(best['data'], paths)
+        report['rewritten'] = True
+    for key in ('best', 'as_webp'):
+        candidate = best if key == 'best' else report['as_webp']
+        if candidate is not None:
+            report[key] = {'format': candidate['format'], 'setting': candidate['setting'],
+                           'bytes': len(candidate['data']), 'ssim': round(candidate['ssim'], 5)}
+    return report
+
+
+def _saving(before, after):
+    return f"{before/1024:.1f}KB -> {after/1024:.1f}KB ({(after - before) / before * 100:+.0f}%)"
+
+
+def print_report(reports, root, threshold):
+    """Files worth rewriting (and worth converting), then totals per route."""
+    print(f"\n--- Files saving at least {threshold:g}% ---")
+    routes = {}
+    for report in sorted(reports, key=lambda r: -(r['bytes'] - (r['best'] or {}).get('bytes', r['bytes']))):
+        name = os.path.relpath(report['paths'][0], root)
+        totals = routes.setdefault(route_for(name), {'files': 0, 'bytes': 0, 'possible': 0, 'webp': 0, 'saved': 0})
+        totals['files'] += 1
+        totals['bytes'] += report['bytes']
+        best, as_webp = report['best'], report['as_webp']
+        if best and report['passes']:
+            totals['possible'] += report['bytes'] - best['bytes']
+            mark = '✓ Rewrote' if report['rewritten'] else ('⚠ Kept' if report['held'] else ' ')
+            if report['rewritten']:
+                totals['saved'] += report['bytes'] - best['bytes']
+            linked = f" (+{len(report['paths']) - 1} linked)" if len(report['paths']) > 1 else ''
+            print(f"{mark} {name}{linked}: {_saving(report['bytes'], best['bytes'])}, "
+                  f"{best['format']} {best['setting']}, SSIM {best['ssim']:.4f}"
+                  + (f" - {report['held']}" if report['held'] else ''))
+        webp_bytes = min(b['bytes'] for b in (best, as_webp) if b) if (best or as_webp) else report['bytes']
+        totals['webp'] += max(0, report['bytes'] - webp_bytes)
+        if as_webp and as_webp['bytes'] <= report['bytes'] * (1 - threshold / 100) \
+                and (not best or as_webp['bytes'] < best['bytes']):
+            print(f"  {name}: as WebP {_saving(report['bytes'], as_webp['bytes'])}, {as_webp['setting']}, "
+                  f"SSIM {as_webp['ssim']:.4f} (needs the references renamed)")
+
+    skipped = [r for r in reports if r['skipped']]
+    if skipped:
+        print(f"\nSkipped {len(skipped)} files: " + ', '.join(
+            f"{os.path.relpath(r['paths'][0], root)} ({r['skipped']})" for r in skipped[:5])
+              + (' ...' if len(skipped) > 5 else ''))
+
+    print("\n--- Savings by route ---")
+    for route, totals in sorted(routes.items(), key=lambda item: -item[1]['possible']):
+        print(f"  {route}: {totals['files']} files, {totals['bytes']/1024/1024:.2f}MB; "
+              f"{totals['possible']/1024:.0f}KB in place, {totals['webp']/1024:.0f}KB with WebP"
+              + (f", {totals['saved']/1024:.0f}KB saved" if totals['saved'] else ''))
+    return routes
+
+
+def refresh_listings(root, rewritten, cache):
+    """Rewrite the manifests (and photos/srcset.json) that list a rewritten file."""
+    rewritten = {Path(p).resolve() for p in rewritten}
+    for manifest_json in sorted(Path(root).rglob(MANIFEST_JSON)):
+        directory = manifest_json.parent
+        with open(manifest_json) as f:
+            manifest = json.load(f)
+        listed = [directory / key for key in manifest]
+        files = listed + [directory / v['file'] for entry in manifest.values() for v in entry.get('variants', [])]
+        if not any(p.resolve() in rewritten for p in files):
+            continue
+        if directory.resolve() == (Path(root) / 'photos').resolve():
+            collections = dict.fromkeys(key.split('/')[0] for key in manifest)
+            write_photo_manifest(directory, [c for c in collections if c != HERO_THUMBS_DIR], cache)
+        else:
+            write_manifest(directory, listed, cache)
+    srcset_json = Path(root) / 'photos' / 'srcset.json'
+    if srcset_json.exists():
+        with open(srcset_json) as f:
+            index = json.load(f)
+        files = [srcset_json.parent / e['file'] for entries in index.values() for e in entries]
+        if any(p.resolve() in rewritten for p in files):
+            write_srcset_index(srcset_json.parent, sorted({key.split('/')[0] for key in index}), cache=cache)
+            print(f"✓ Updated {srcset_json.relative_to(root)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report (and optionally take) recompression savings in src/assets")
+    add_jobs_argument(parser)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Smallest saving, in percent, worth rewriting a file for (default: %(default)s)')
+    parser.add_argument('--min-ssim', type=float, default=DEFAULT_MIN_SSIM,
+                        help='Lowest SSIM a lossy re-encode may score against the current file (default: %(default)s)')
+    parser.add_argument('--apply', action='store_true',
+                        help='Rewrite files that pass the threshold and the SSIM check in place')
+    args = parser.parse_args()
+
+    root = ASSETS_DIR
+    groups = find_assets(root)
+    atlased = atlas_members(root)
+    with AssetCache() as cache:
+        held = {}
+        for i, paths in enumerate(groups):
+            if any(cache.is_output(p) for p in paths):
+                held[i] = 'pipeline output, rebuild it with the scripts'
+            elif any(p.resolve() in atlased for p in paths):
+                held[i] = 'atlas member'
+
+        print(f"=== Recompression audit: {len(groups)} files, {resolve_jobs(args.jobs)} workers ===")
+        reports = run_parallel(audit_file, [(paths, args.min_ssim, args.threshold, args.apply and i not in held)
+                                            for i, paths in enumerate(groups)], args.jobs)
+        for i, report in enumerate(reports):
+            report['held'] = held.get(i) if report['passes'] else None
+
+        print_report(reports, root, args.threshold)
+        rewritten = [p for report in reports if report['rewritten'] for p in report['paths']]
+        if rewritten:
+            refresh_listings(root, rewritten, cache)
+            saved = sum(r['bytes'] - r['best']['bytes'] for r in reports if r['rewritten'])
+            print(f"\n✓ Rewrote {sum(r['rewritten'] for r in reports)} files, {saved/1024:.0f}KB smaller")
+        elif not args.apply and any(r['passes'] and not r['held'] for r in reports):
+            print("\nRun with --apply to rewrite the files marked above")
+
+
+if __name__ == '__main__':
+    main()
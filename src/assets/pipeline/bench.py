@@ -0,0 +1,290 @@
+"""
+Benchmark the image pipeline on a deterministic synthetic corpus.
+
+The corpus covers every input the ingest stage has a code path for: plain
+RGB JPEGs, a 24MP+ JPEG, EXIF-rotated JPEGs, palette (P), RGBA and LA
+PNGs, 16-bit grayscale PNG and a 16-bit RGB TIFF. It is generated from a
+fixed seed (so two machines benchmark the same pixels) and kept in a temp
+directory between runs.
+
+Each script's core work - ingest_original() with that script's variants -
+runs on every corpus image in a fresh process; stage times come from the
+trace.py instrumentation (decode, exif_transpose, convert, resize, encode,
+write) and peak RSS from /proc:
+
+    optimize_photos            1920px gallery image + srcset ladder
+    optimize_hero_thumbnail    768px center-square
+    optimize_thumbnails        512px web thumbnail
+    optimize_preview_thumbs    256px center-square
+
+Results are written as JSON (by default next to the corpus, in
+RESULTS_DIR, so runs never land in the repo); --compare checks a run
+against an earlier one and exits non-zero when any case got slower than --threshold (and by
+more than MIN_SLOWDOWN_S, so timer noise on the small cases doesn't count).
+
+    cd src/assets
+    python3 -m pipeline.bench                          # writes $TMPDIR/asset-bench-results/bench-<time>.json
+    python3 -m pipeline.bench --quick --scripts optimize_thumbnails
+    python3 -m pipeline.bench --compare $TMPDIR/asset-bench-results/bench-<earlier>.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import platform
+import statistics
+import struct
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import PIL
+from PIL import Image
+
+from . import trace
+from .decode_check import _peak_rss_kb
+from .ingest import HERO_THUMB_PARAMS, PHOTO_PARAMS, PREVIEW_THUMB_PARAMS, WEB_THUMB_PARAMS, Variant, ingest_original
+from .ladder import DEFAULT_WIDTHS, ladder_variants
+from .trace import STAGES
+
+SEED = 64
+DEFAULT_THRESHOLD = 0.10
+MIN_SLOWDOWN_S = 0.02  # below this a relative change is timer noise, not a regression
+RESULTS_DIR = Path(tempfile.gettempdir()) / 'asset-bench-results'
+SCRIPTS = ('optimize_photos', 'optimize_hero_thumbnail', 'optimize_thumbnails', 'optimize_preview_thumbs')
+
+# name -> (width, height, mode, extension, EXIF orientation)
+CORPUS = {
+    'rgb-12mp': (4000, 3000, 'RGB', '.jpg', None),
+    'rgb-24mp': (6000, 4000, 'RGB', '.jpg', None),
+    'portrait-exif6': (4000, 3000, 'RGB', '.jpg', 6),
+    'mirrored-exif7': (3000, 2000, 'RGB', '.jpg', 7),
+    'palette': (1600, 1200, 'P', '.png', None),
+    'rgba': (2400, 1600, 'RGBA', '.png', None),
+    'gray-alpha': (1600, 1600, 'LA', '.png', None),
+    'gray-16bit': (3000, 2000, 'I;16', '.png', None),
+    'rgb-16bit': (4000, 3000, 'RGB;16', '.tif', None),
+}
+
+
+def script_variants(script, output_dir):
+    """The variants one script derives from each original, writing into output_dir."""
+    output_dir = Path(output_dir)
+    if script == 'optimize_photos':
+        gallery = output_dir / 'gallery.webp'
+        return [Variant(PHOTO_PARAMS, [gallery])] + ladder_variants(gallery, DEFAULT_WIDTHS)
+    params = {
+        'optimize_hero_thumbnail': HERO_THUMB_PARAMS,
+        'optimize_thumbnails': WEB_THUMB_PARAMS,
+        'optimize_preview_thumbs': PREVIEW_THUMB_PARAMS,
+    }[script]
+    return [Variant(params, [output_dir / f"{params['kind']}.webp"])]
+
+
+def _photo_like(rng, width, height, channels, dtype=np.uint8, scale=1):
+    """Smooth gradients, soft blobs and sensor-like noise, so encoders see realistic content."""
+    x = np.linspace(0, 1, width, dtype=np.float32)
+    y = np.linspace(0, 1, height, dtype=np.float32)[:, None]
+    pixels = np.empty((height, width, channels), dtype)
+    for c in range(channels):
+        plane = 80 + 90 * x * rng.uniform(-1, 1) + 90 * y * rng.uniform(-1, 1)
+        for _ in range(6):
+            # Gaussians are separable: one outer product per blob instead of a full-frame exp()
+            cx, cy, r = rng.uniform(0, 1), rng.uniform(0, 1), rng.uniform(0.05, 0.3)
+            plane += rng.uniform(-80, 80) * np.exp(-((y - cy) / r) ** 2) * np.exp(-((x - cx) / r) ** 2)
+        plane += rng.standard_normal((height, width), dtype=np.float32) * 6
+        pixels[:, :, c] = np.clip(plane * scale, 0, np.iinfo(dtype).max)
+    return pixels
+
+
+def _write_tiff_16bit(path, pixels):
+    """Minimal uncompressed 16-bit RGB TIFF (Pillow can't write one from an array)."""
+    height, width, _ = pixels.shape
+    data = pixels.astype('<u2', copy=False).tobytes()
+    entries = [
+        (256, 4, 1, width), (257, 4, 1, height), (258, 3, 3, 8 + len(data)), (259, 3, 1, 1), (262, 3, 1, 2),
+        (273, 4, 1, 8), (277, 3, 1, 3), (278, 4, 1, height), (279, 4, 1, len(data)), (284, 3, 1, 1),
+    ]
+    ifd_offset = 8 + len(data) + 6
+    ifd = struct.pack('<H', len(entries)) + b''.join(struct.pack('<HHII', *entry) for entry in entries)
+    with open(path, 'wb') as f:
+        f.write(b'II*\x00' + struct.pack('<I', ifd_offset) + data)
+        f.write(struct.pack('<3H', 16, 16, 16))  # BitsPerSample values, pointed to by tag 258
+        f.write(ifd + struct.pack('<I', 0))
+
+
+def make_image(path, width, height, mode, orientation, seed):
+    rng = np.random.default_rng(seed)
+    if mode == 'RGB;16':
+        _write_tiff_16bit(path, _photo_like(rng, width, height, 3, np.uint16, 257))
+        return
+    if mode == 'I;16':
+        img = Image.fromarray(_photo_like(rng, width, height, 1, np.uint16, 257)[:, :, 0])
+    elif mode == 'LA':
+        img = Image.fromarray(_photo_like(rng, width, height, 2), 'LA')
+    elif mode == 'P':
+        img = Image.fromarray(_photo_like(rng, width, height, 3), 'RGB').quantize(256)
+    else:
+        img = Image.fromarray(_photo_like(rng, width, height, len(mode)), mode)
+    if orientation:
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        img.save(path, quality=92, exif=exif)
+    else:
+        img.save(path, **({'quality': 92} if path.suffix == '.jpg' else {}))
+
+
+def make_corpus(directory, scale=1.0):
+    """Generate (or reuse) the corpus for scale in directory; returns {name: path}."""
+    directory = Path(directory) / f"seed{SEED}-x{scale:g}"
+    directory.mkdir(parents=True, exist_ok=True)
+    corpus = {}
+    for i, (name, (width, height, mode, extension, orientation)) in enumerate(CORPUS.items()):
+        path = directory / f"{name}{extension}"
+        if not path.exists():
+            partial = path.with_name(f".partial-{path.name}")
+            make_image(partial, max(16, round(width * scale)), max(16, round(height * scale)), mode, orientation,
+                       SEED + i)
+            partial.rename(path)
+        corpus[name] = path
+    return corpus
+
+
+def _run_case(input_path, script, repeat):
+    """Runs in a fresh process: median stage times (from trace.py), peak RSS growth and output bytes."""
+    baseline = _peak_rss_kb()
+    runs = []
+    with tempfile.TemporaryDirectory(prefix='bench-') as output_dir:
+        variants = script_variants(script, output_dir)
+        for _ in range(repeat):
+            trace.drain()
+            with contextlib.redirect_stdout(io.StringIO()):
+                metas = ingest_original(input_path, variants)
+            if None in metas:
+                raise RuntimeError(f"{script} failed on {input_path}")
+            runs.append(trace.summarize(trace.drain())[1])
+    return {
+        'stages': {stage: round(statistics.median(run.get(stage, 0.0) for run in runs), 4) for stage in STAGES},
+        'peak_rss_mb': round((_peak_rss_kb() - baseline) / 1024, 1),
+        'output_bytes': sum(meta['bytes'] for meta in metas),
+    }
+
+
+def run_case(input_path, script, repeat=1):
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(_run_case, input_path, script, repeat).result()
+
+
+def run(corpus, scripts, repeat=1):
+    cases = []
+    for script in scripts:
+        for name, path in corpus.items():
+            result = run_case(path, script, repeat)
+            total = sum(result['stages'].values())
+            with Image.open(path) as img:
+                size, mode = img.size, img.mode
+            cases.append({'script': script, 'image': name, 'mode': mode, 'size': list(size),
+                          'input_bytes': path.stat().st_size, 'seconds': round(total, 4), **result})
+            stages = ', '.join(f"{stage} {seconds*1000:.0f}ms" for stage, seconds in result['stages'].items())
+            print(f"✓ {script} {name}: {total*1000:.0f}ms ({stages}), peak +{result['peak_rss_mb']:.0f}MB, "
+                  f"{result['output_bytes']/1024:.1f}KB")
+    return cases
+
+
+def summarize(cases):
+    summary = {}
+    for script in dict.fromkeys(case['script'] for case in cases):
+        own = [case for case in cases if case['script'] == script]
+        seconds = sum(case['seconds'] for case in own)
+        summary[script] = {
+            'images': len(own),
+            'seconds': round(seconds, 3),
+            'images_per_s': round(len(own) / seconds, 2) if seconds else None,
+            'stages': {stage: round(sum(case['stages'][stage] for case in own), 3) for stage in STAGES},
+            'peak_rss_mb': max(case['peak_rss_mb'] for case in own),
+            'output_bytes': sum(case['output_bytes'] for case in own),
+        }
+    return summary
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Print per-case changes against a baseline run; returns the number of regressions."""
+    before = {(case['script'], case['image']): case for case in baseline['cases']}
+    regressions = 0
+    for case in current['cases']:
+        old = before.get((case['script'], case['image']))
+        if not old or not old['seconds']:
+            continue
+        change = case['seconds'] / old['seconds'] - 1
+        bytes_change = case['output_bytes'] / old['output_bytes'] - 1 if old['output_bytes'] else 0
+        slower = change > threshold and case['seconds'] - old['seconds'] > MIN_SLOWDOWN_S
+        regressions += slower
+        print(f"{'✗' if slower else '✓'} {case['script']} {case['image']}: {change*100:+.0f}% time, "
+              f"{bytes_change*100:+.1f}% bytes, peak {old['peak_rss_mb']:.0f} -> {case['peak_rss_mb']:.0f}MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the image pipeline on a synthetic corpus")
+    parser.add_argument('--scripts', default=','.join(SCRIPTS),
+                        help='Comma-separated scripts to benchmark (default: all)')
+    parser.add_argument('--quick', action='store_true', help='Quarter-size corpus (24MP case becomes 1.5MP)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per case; stage times are medians (default: %(default)s)')
+    parser.add_argument('--corpus-dir', default=str(Path(tempfile.gettempdir()) / 'asset-bench-corpus'),
+                        help='Where the generated corpus is kept between runs (default: %(default)s)')
+    parser.add_argument('--output', help=f'Results file (default: {RESULTS_DIR}/bench-<date>-<time>.json)')
+    parser.add_argument('--compare', metavar='BASELINE', help='Earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Slowdown per case that counts as a regression (default: %(default)s)')
+    args = parser.parse_args()
+
+    scripts = [name.strip() for name in args.scripts.split(',') if name.strip()]
+    unknown = [name for name in scripts if name not in SCRIPTS]
+    if unknown:
+        parser.error(f"unknown script(s): {', '.join(unknown)} (choose from {', '.join(SCRIPTS)})")
+
+    scale = 0.25 if args.quick else 1.0
+    print(f"Generating corpus in {args.corpus_dir} (scale {scale:g})...")
+    corpus = make_corpus(args.corpus_dir, scale)
+
+    start = time.perf_counter()
+    cases = run(corpus, scripts, args.repeat)
+    results = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'machine': {'python': platform.python_version(), 'pillow': PIL.__version__,
+                    'platform': platform.platform(), 'cpus': multiprocessing.cpu_count()},
+        'corpus': {'seed': SEED, 'scale': scale, 'repeat': args.repeat},
+        'wall_seconds': round(time.perf_counter() - start, 2),
+        'summary': summarize(cases),
+        'cases': cases,
+    }
+    output = Path(args.output or RESULTS_DIR / time.strftime('bench-%Y%m%d-%H%M%S.json'))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + '\n')
+
+    print()
+    for script, totals in results['summary'].items():
+        print(f"{script}: {totals['images_per_s']} images/s, peak +{totals['peak_rss_mb']:.0f}MB, "
+              f"{totals['output_bytes']/1024:.0f}KB out")
+    print(f"✓ Results written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline['corpus'] != results['corpus']:
+            print(f"⚠ Baseline corpus {baseline['corpus']} differs from this run's {results['corpus']}")
+        regressions = compare(results, baseline, args.threshold)
+        print(f"\n{regressions} regression(s) over {args.threshold*100:.0f}%")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
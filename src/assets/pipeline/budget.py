@@ -0,0 +1,236 @@
+"""
+Byte budgets: fit a group of published photos into a total size.
+
+A budget names a collection (or a route covering several) and a total:
+
+    --budget portrait=4.5MB,astro=3MB,photo=16MB
+
+Only images whose original is recorded in originals/imports.json (see
+ledger.py) can be re-encoded; everything else in the group counts at its
+current size. For each re-encodable image the original is decoded once
+and every (size, quality) on a small grid is encoded and scored:
+
+    size      BUDGET_SIZES (longest side; 1920 is the normal gallery size)
+    quality   BUDGET_QUALITIES (85 is the normal quality, so the top
+              candidate is exactly what optimize_photos.py publishes)
+    score     SSIM against the normal 1920px pixels, smaller sizes scaled
+              back up first so lost resolution counts as lost quality
+
+These measurements are stored in the asset catalog under the original's
+hash, so a rerun only measures new originals. The allocation then finds
+the highest SSIM floor every budget can afford (binary search over the
+measured scores, each image taking its cheapest candidate at or above the
+floor) and spends whatever is left by repeatedly upgrading the worst image
+that still fits. An image never goes above the normal encode, so a budget
+only ever takes bytes away. The chosen encodes go through the normal
+ingest path, from the originals, and their params are recorded in the ledger.
+"""
+
+import io
+from pathlib import Path
+
+from PIL import Image
+
+from .cache import key_for
+from .ingest import PHOTO_PARAMS, IngestJob, Variant, decode_original, derive, encode, fit_params
+from .quality import ssim
+from .workers import ingest_all, run_parallel
+
+BUDGET_SIZES = (1920, 1600, 1280)
+BUDGET_QUALITIES = tuple(range(85, 35, -5))
+UNITS = {'KB': 1024, 'MB': 1024 * 1024, 'GB': 1024 * 1024 * 1024, 'B': 1}
+
+
+def parse_size(value):
+    """'4.5MB', '800KB' or a plain byte count -> bytes."""
+    value = value.strip().upper()
+    for unit, factor in UNITS.items():
+        if value.endswith(unit):
+            return int(float(value[:-len(unit)]) * factor)
+    return int(value)
+
+
+def parse_budgets(value):
+    """'portrait=4.5MB,photo=16MB' -> {'portrait': bytes, 'photo': bytes}."""
+    budgets = {}
+    for part in filter(None, (p.strip() for p in (value or '').split(','))):
+        name, _, size = part.partition('=')
+        if not size:
+            raise ValueError(f"budget '{part}' needs a size, e.g. {part}=4MB")
+        budgets[name.strip()] = parse_size(size)
+    return budgets
+
+
+def add_budget_arguments(parser):
+    """Add the --budget flag."""
+    parser.add_argument('--budget', type=parse_budgets, default={},
+                        help="Total bytes per collection or route, e.g. portrait=4.5MB,photo=16MB; "
+                             "re-encodes images from originals/ to fit")
+
+
+def measure(original_path, sizes=BUDGET_SIZES, qualities=BUDGET_QUALITIES):
+    """Encode original_path at every (size, quality) and score each; returns the candidate list."""
+    reference_params = fit_params('photo', max(sizes), max(qualities))
+    img = decode_original(original_path, [Variant(reference_params, [])])
+    reference = derive(img, reference_params)
+    candidates = []
+    seen_sizes = set()
+    for size in sizes:
+        pixels = derive(img, fit_params('photo', size, max(qualities)))
+        if pixels.size in seen_sizes:
+            continue  # original smaller than this step
+        seen_sizes.add(pixels.size)
+        for quality in qualities:
+            data = encode(pixels, PHOTO_PARAMS, quality)
+            with Image.open(io.BytesIO(data)) as decoded:
+                if decoded.size != reference.size:
+                    decoded = decoded.resize(reference.size, Image.Resampling.LANCZOS)
+                score = ssim(reference, decoded)
+            candidates.append({'max_size': size, 'quality': quality, 'bytes': len(data), 'ssim': round(score, 5)})
+    return candidates
+
+
+def pareto(candidates):
+    """Candidates worth choosing, cheapest first: each one scores higher than every cheaper one."""
+    front = []
+    for candidate in sorted(candidates, key=lambda c: (c['bytes'], -c['ssim'])):
+        if not front or candidate['ssim'] > front[-1]['ssim']:
+            front.append(candidate)
+    return front
+
+
+def measure_all(cache, originals, jobs=1):
+    """Candidates for every original, measuring only what the catalog doesn't have yet."""
+    params = {'kind': 'budget-candidates', 'sizes': list(BUDGET_SIZES), 'qualities': list(BUDGET_QUALITIES)}
+    keys = [key_for(cache.source_hash(path), params) for path in originals]
+    results = [cache.lookup_meta(key) for key in keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        print(f"Measuring {len(missing)} originals at {len(BUDGET_SIZES) * len(BUDGET_QUALITIES)} "
+              f"size/quality settings each...")
+    for i, candidates in zip(missing, run_parallel(measure, [(originals[i],) for i in missing], jobs)):
+        cache.store_meta(keys[i], {'candidates': candidates})
+        results[i] = {'candidates': candidates}
+    return [result['candidates'] for result in results]
+
+
+def allocate(items, budgets):
+    """
+    Pick one candidate per adjustable item.
+
+    items: dicts with 'copies' (output files sharing the bytes), 'groups'
+    (budget names it counts against), 'bytes' (current size per copy) and
+    'front' (pareto() candidates, or None for fixed items). Returns (choice
+    index per item, None for fixed; bytes per group; groups over budget).
+    """
+    adjustable = [i for i, item in enumerate(items) if item['front']]
+    fixed = {name: 0 for name in budgets}
+    for item in items:
+        if not item['front']:
+            for name in item['groups']:
+                fixed[name] += item['bytes'] * item['copies']
+
+    def totals(choice):
+        sums = dict(fixed)
+        for i in adjustable:
+            item = items[i]
+            for name in item['groups']:
+                sums[name] += item['front'][choice[i]]['bytes'] * item['copies']
+        return sums
+
+    def at_floor(floor):
+        # Cheapest candidate reaching floor; the best one for images that can't reach it
+        choice = [None] * len(items)
+        for i in adjustable:
+            front = items[i]['front']
+            choice[i] = next((k for k, c in enumerate(front) if c['ssim'] >= floor), len(front) - 1)
+        return choice
+
+    def fits(choice):
+        return all(total <= budgets[name] for name, total in totals(choice).items())
+
+    floors = sorted({c['ssim'] for i in adjustable for c in items[i]['front']})
+    lo, hi = 0, len(floors) - 1
+    best = at_floor(floors[0]) if floors else [None] * len(items)
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        choice = at_floor(floors[mid])
+        if fits(choice):
+            best, lo = choice, mid + 1
+        else:
+            hi = mid - 1
+
+    # Spend what is left: upgrade the lowest-scoring image that still fits, until none does
+    sums = totals(best)
+    while True:
+        for i in sorted(adjustable, key=lambda i: items[i]['front'][best[i]]['ssim']):
+            item = items[i]
+            if best[i] + 1 >= len(item['front']):
+                continue
+            extra = (item['front'][best[i] + 1]['bytes'] - item['front'][best[i]]['bytes']) * item['copies']
+            if all(sums[name] + extra <= budgets[name] for name in item['groups']):
+                best[i] += 1
+                for name in item['groups']:
+                    sums[name] += extra
+                break
+        else:
+            break
+
+    over = [name for name, total in sums.items() if total > budgets[name]]
+    return best, sums, over
+
+
+def fit_budgets(cache, items, budgets, jobs=1):
+    """
+    Re-encode items (see allocate(); each also has 'name', 'paths' and
+    'original') so every budget is met; returns the chosen params per item.
+    """
+    adjustable = [item for item in items if item['original'] is not None]
+    for item, candidates in zip(adjustable, measure_all(cache, [item['original'] for item in adjustable], jobs)):
+        item['front'] = pareto(candidates)
+    for item in items:
+        item.setdefault('front', None)
+
+    choice, sums, over = allocate(items, budgets)
+
+    ingest_jobs = []
+    chosen = [None] * len(items)
+    for i, item in enumerate(items):
+        if choice[i] is None:
+            continue
+        candidate = item['front'][choice[i]]
+        chosen[i] = fit_params('photo', candidate['max_size'], candidate['quality'])
+        ingest_jobs.append(IngestJob(item['original'], [Variant(chosen[i], item['paths'])]))
+    ingest_all(cache, ingest_jobs, jobs)
+
+    print_budget_report(items, choice, budgets, sums, over)
+    return chosen
+
+
+def print_budget_report(items, choice, budgets, sums, over):
+    """Per budget: total against the limit, then every image the budget pushed below the normal encode."""
+    print("\n--- Byte budgets ---")
+    for name, budget in budgets.items():
+        members = [i for i, item in enumerate(items) if name in item['groups']]
+        before = sum(items[i]['bytes'] * items[i]['copies'] for i in members)
+        scores = [items[i]['front'][choice[i]]['ssim'] for i in members if choice[i] is not None]
+        mark = '✗' if name in over else '✓'
+        floor = f", lowest SSIM {min(scores):.4f}" if scores else ''
+        print(f"{mark} {name}: {sums[name]/1024/1024:.2f}MB of {budget/1024/1024:.2f}MB "
+              f"(was {before/1024/1024:.2f}MB){floor}")
+        fixed = [i for i in members if choice[i] is None]
+        if fixed:
+            fixed_bytes = sum(items[i]['bytes'] * items[i]['copies'] for i in fixed)
+            print(f"  {len(fixed)} images ({fixed_bytes/1024/1024:.2f}MB) have no recorded original and keep their size")
+        for i in members:
+            if choice[i] is None:
+                continue
+            item = items[i]
+            candidate, top = item['front'][choice[i]], item['front'][-1]
+            if candidate is top:
+                continue
+            print(f"  {Path(item['name']).name}: {top['bytes']/1024:.0f}KB -> {candidate['bytes']/1024:.0f}KB "
+                  f"({candidate['max_size']}px q{candidate['quality']}, "
+                  f"SSIM {top['ssim']:.4f} -> {candidate['ssim']:.4f})")
+        if name in over:
+            print(f"  ✗ Still {(sums[name] - budget)/1024:.0f}KB over at the lowest size and quality")
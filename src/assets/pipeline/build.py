@@ -0,0 +1,469 @@
+"""
+One build for every derived asset, rebuilding only what is stale.
+
+Usage:
+    cd src/assets/
+    python3 -m pipeline.build [--jobs N] [--dry-run] [--only hero-thumb/]
+
+The outputs the four image scripts, the video script and the font script
+make form a graph:
+
+    photos:ingest ------------> hero-thumb/<collection> --> photos:manifest
+      (import/ -> gallery, hero)   (hero original or hero.webp)
+                 \--------------> photos:tiles ------------/
+                                   (pyramids from originals)
+    videos:ingest ------------> preview-thumb/<project> --> preview-thumbs:atlas --> preview-thumbs:manifest
+      (import/ -> mp4, poster)     (first image or video poster)
+    web-thumbs:ingest --------> web-thumbs:atlas --------------------------------> web-thumbs:manifest
+    fonts:subset                   (fonts + the text in src/ and the HTML shells)
+
+Each node declares its inputs (files, hashed through the catalog), its
+parameters (the same params dicts the scripts encode with - HERO_THUMB_PARAMS
+and friends in ingest.py) and its outputs. After a node runs, those are
+recorded in the catalog; on the next build a node is rebuilt only when its
+params differ, an input's content changed, or an output is missing or was
+touched since. Changing HERO_THUMB_PARAMS therefore reruns the four
+hero-thumb nodes (and the manifest, whose inputs they are) and nothing else.
+
+Nodes run as soon as their dependencies have finished. Their encodes share
+one process pool, so independent branches (photos, previews, web thumbs)
+encode side by side; the bookkeeping (moving originals, manifests, atlases)
+happens in this process. The video transcode runs inside its node with its
+own ffmpeg threads, and the font subsets are made inside theirs. The atlas
+nodes only exist where the scripts' --atlas has been used before,
+photos:tiles only for collections optimize_photos.py --tiles has tiled,
+and fonts:subset only when fontTools and brotli are installed;
+hover loops stay with optimize_preview_thumbs.py --loops.
+
+The nodes call into the scripts themselves (loaded by path), so a build and
+a script run produce the same files and share the cache.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+
+from . import trace
+from .atlas import ATLAS_QUALITY, EXTRUDE, atlas_paths, write_atlas
+from .cache import ASSETS_DIR, add_cache_arguments, key_for, open_cache
+from .fonts import FONTS_DIR, SUBSET_PARAMS, find_fonts, fonttools_available, subset_fonts, subset_path, text_files
+from .ingest import HERO_THUMB_PARAMS, PHOTO_PARAMS, PREVIEW_THUMB_PARAMS, WEB_THUMB_PARAMS, IngestJob, Variant
+from .ladder import DEFAULT_WIDTHS, SIZES_DIR, write_srcset_index
+from .ledger import load_ledger
+from .manifest import (GALLERIES_JSON, MANIFEST_JS, MANIFEST_JSON, photo_chunks, photo_files, write_manifest,
+                       write_photo_manifest)
+from .pyramid import PYRAMID_PARAMS, TILES_DIR, write_pyramids
+from .trace import add_trace_arguments, finish_trace
+from .video import MAX_HEIGHT, ffmpeg_available, parse_codecs
+from .watch import IMAGE_EXTENSIONS
+from .workers import add_jobs_argument, ingest_args, ingest_traced, lookup_variants, resolve_jobs, store_results
+
+PHOTOS_DIR = ASSETS_DIR / 'photos'
+LIVE_DIR = ASSETS_DIR / 'interactive' / 'live'
+WEB_THUMBS_DIR = ASSETS_DIR / 'interactive' / 'web' / 'thumbnails'
+
+# directory: where inputs/outputs are relative to and where run() executes
+# inputs(cache) -> paths; outputs() -> paths; run(cache) -> (IngestJobs, finish(statuses) or None)
+Node = namedtuple('Node', 'name directory deps inputs params outputs run')
+
+_scripts = {}
+
+
+def load_script(path):
+    """Import one of the optimization scripts by path (they live outside this package)."""
+    path = Path(path)
+    if path not in _scripts:
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _scripts[path] = module
+    return _scripts[path]
+
+
+@contextmanager
+def in_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _files(directories, extensions):
+    return [p for d in directories for p in sorted(Path(d).glob('*')) if p.suffix.lower() in extensions]
+
+
+def photo_nodes(jobs):
+    photos = load_script(PHOTOS_DIR / 'optimize_photos.py')
+    heroes = load_script(PHOTOS_DIR / 'optimize_hero_thumbs.py')
+    collections = [c for c in photos.COLLECTIONS if (PHOTOS_DIR / c).is_dir()]
+
+    def ingest(cache):
+        check = photos.duplicate_checker(cache, collections, jobs=jobs)
+        plans = [(c, plan) for c in collections
+                 if (plan := photos.plan_import_folder(c, DEFAULT_WIDTHS, None, check))]
+
+        def finish(statuses):
+            position = 0
+            for collection, plan in plans:
+                photos.finish_import_folder(collection, plan, statuses[position:position + len(plan)])
+                position += len(plan)
+
+        return [entry['job'] for _, plan in plans for entry in plan], finish
+
+    nodes = [Node('photos:ingest', PHOTOS_DIR, [],
+                  lambda cache: _files([Path(c) / 'import' for c in collections], IMAGE_EXTENSIONS),
+                  {'photo': PHOTO_PARAMS, 'widths': list(DEFAULT_WIDTHS)}, lambda: [], ingest)]
+
+    def hero_source(collection, config):
+        # The hero's original when the ledger knows it, so the thumbnail is cut from full resolution
+        entry = load_ledger(Path(collection) / 'originals').get('hero.webp')
+        if entry and entry['original'] and (Path(collection) / 'originals' / entry['original']).exists():
+            return Path(collection) / 'originals' / entry['original']
+        return Path(config['input'])
+
+    def hero_thumb(collection, config):
+        def run(cache):
+            source, output = hero_source(collection, config), Path(config['output'])
+            output.parent.mkdir(exist_ok=True)
+            if not source.exists():
+                print(f"⚠ {collection}: no hero image yet ({source})")
+                return [], None
+            if source == Path(config['input']) and cache.is_fresh_downstream(source, output, HERO_THUMB_PARAMS):
+                return [], None
+            return [IngestJob(source, [Variant(HERO_THUMB_PARAMS, [output])])], None
+        return Node(f'hero-thumb/{collection}', PHOTOS_DIR, ['photos:ingest'],
+                    lambda cache: [hero_source(collection, config)], HERO_THUMB_PARAMS,
+                    lambda: [Path(config['output'])], run)
+
+    hero_nodes = [hero_thumb(c, config) for c, config in heroes.COLLECTIONS.items() if c in collections]
+
+    def manifest(cache):
+        def finish(statuses):
+            write_srcset_index('.', collections, cache=cache)
+            write_photo_manifest('.', collections, cache)
+        return [], finish
+
+    nodes += hero_nodes
+    manifest_deps = ['photos:ingest'] + [n.name for n in hero_nodes]
+
+    tiled = [c for c in collections if (PHOTOS_DIR / TILES_DIR / c).is_dir()]
+    if tiled:
+        def pyramid_items():
+            return [item for c in tiled for item in photos.pyramid_items(c)]
+
+        def tiles(cache):
+            def finish(statuses):
+                failed = write_pyramids(cache, pyramid_items(), jobs)['failed']
+                if failed:
+                    raise RuntimeError(f"could not tile {', '.join(failed)}")
+            return [], finish
+        nodes.append(Node('photos:tiles', PHOTOS_DIR, ['photos:ingest'],
+                          lambda cache: [original for original, _ in pyramid_items()], PYRAMID_PARAMS,
+                          lambda: [dzi for _, dzi in pyramid_items()], tiles))
+        manifest_deps.append('photos:tiles')
+
+    nodes.append(Node('photos:manifest', PHOTOS_DIR, manifest_deps,
+                      lambda cache: [p for p in photo_files('.', collections) if p.exists()]
+                      + [p for c in collections for p in sorted((Path(c) / SIZES_DIR).glob('*.webp'))]
+                      + [p for c in tiled for p in sorted((Path(TILES_DIR) / c).glob('*.dzi'))]
+                      + [p for p in [Path(GALLERIES_JSON)] if p.exists()],
+                      {}, lambda: [Path(MANIFEST_JSON), Path(MANIFEST_JS), Path('srcset.json')]
+                      + [Path(p) for p in photo_chunks(collections)], manifest))
+    return nodes
+
+
+def preview_nodes(jobs):
+    videos = load_script(LIVE_DIR / 'optimize_videos.py')
+    previews = load_script(LIVE_DIR / 'optimize_preview_thumbs.py')
+    codecs = parse_codecs('h264')
+
+    def import_videos(cache):
+        def finish(statuses):
+            if videos.find_imports() and not ffmpeg_available():
+                raise RuntimeError("ffmpeg/ffprobe not found on PATH; install ffmpeg to transcode videos")
+            videos.import_videos(cache, codecs, MAX_HEIGHT, jobs)
+        return [], finish
+
+    nodes = [Node('videos:ingest', LIVE_DIR, [],
+                  lambda cache: [path for _, path in videos.find_imports()],
+                  {'codecs': codecs, 'max_height': MAX_HEIGHT}, lambda: [], import_videos)]
+
+    def preview_thumb(slug, config):
+        output = Path('preview-thumbs') / config['output_name']
+
+        def run(cache):
+            output.parent.mkdir(exist_ok=True)
+            source = previews.preview_input(cache, config)
+            if not os.path.exists(source):
+                raise FileNotFoundError(f"input not found: {source}")
+            return [IngestJob(Path(source), [Variant(PREVIEW_THUMB_PARAMS, [output])])], None
+        return Node(f'preview-thumb/{slug}', LIVE_DIR, ['videos:ingest'],
+                    lambda cache: [Path(previews.preview_input(cache, config))], PREVIEW_THUMB_PARAMS,
+                    lambda: [output], run)
+
+    thumb_nodes = [preview_thumb(slug, config) for slug, config in previews.PROJECTS.items()]
+    nodes += thumb_nodes
+    manifest_deps = [n.name for n in thumb_nodes]
+
+    if atlas_paths(LIVE_DIR / 'preview-thumbs')[2].exists():
+        nodes.append(Node('preview-thumbs:atlas', LIVE_DIR, manifest_deps,
+                          lambda cache: [p for p in previews.still_paths() if p.exists()],
+                          {'quality': ATLAS_QUALITY, 'extrude': EXTRUDE},
+                          lambda: list(atlas_paths('preview-thumbs')),
+                          lambda cache: ([], lambda statuses: write_atlas(cache, 'preview-thumbs',
+                                                                          previews.still_paths()))))
+        manifest_deps = manifest_deps + ['preview-thumbs:atlas']
+
+    nodes.append(Node('preview-thumbs:manifest', LIVE_DIR, manifest_deps,
+                      lambda cache: [p for p in previews.manifest_paths() if p.exists()], {},
+                      lambda: [Path('preview-thumbs') / MANIFEST_JSON, Path('preview-thumbs') / MANIFEST_JS],
+                      lambda cache: ([], lambda statuses: write_manifest('preview-thumbs', previews.manifest_paths(),
+                                                                         cache))))
+    return nodes
+
+
+def web_thumb_nodes(jobs):
+    thumbs = load_script(WEB_THUMBS_DIR / 'optimize_thumbnails.py')
+
+    def ingest(cache):
+        Path('originals').mkdir(exist_ok=True)
+        ingest_jobs = [thumbs.thumbnail_job(Path(f), Path(thumbs.create_slug_filename(os.path.basename(f))))
+                       for f in sorted(thumbs.find_images(Path('.')))]
+
+        def finish(statuses):
+            for job, job_statuses in zip(ingest_jobs, statuses):
+                thumbs.finish_thumbnail(job, job_statuses[0], Path('originals'))
+        return ingest_jobs, finish
+
+    nodes = [Node('web-thumbs:ingest', WEB_THUMBS_DIR, [],
+                  lambda cache: [Path(f) for f in sorted(thumbs.find_images(Path('.')))],
+                  {'thumb': WEB_THUMB_PARAMS}, lambda: [], ingest)]
+
+    if atlas_paths(WEB_THUMBS_DIR)[2].exists():
+        nodes.append(Node('web-thumbs:atlas', WEB_THUMBS_DIR, ['web-thumbs:ingest'],
+                          lambda cache: thumbs.published_thumbnails(Path('.')),
+                          {'quality': ATLAS_QUALITY, 'extrude': EXTRUDE},
+                          lambda: list(atlas_paths('.')),
+                          lambda cache: ([], lambda statuses: write_atlas(cache, '.',
+                                                                          thumbs.published_thumbnails(Path('.'))))))
+    nodes.append(Node('web-thumbs:manifest', WEB_THUMBS_DIR, [n.name for n in nodes],
+                      lambda cache: thumbs.published_thumbnails(Path('.')) + [p for p in atlas_paths('.') if p.exists()],
+                      {}, lambda: [Path(MANIFEST_JSON), Path(MANIFEST_JS)],
+                      lambda cache: ([], lambda statuses: write_manifest('.', thumbs.published_thumbnails(Path('.'))
+                                                                         + [atlas_paths('.')[0]], cache))))
+    return nodes
+
+
+def font_nodes(jobs):
+    if not fonttools_available():
+        print("⚠ fontTools/brotli not installed; skipping fonts:subset (pip install -r requirements.txt)")
+        return []
+
+    def run(cache):
+        def finish(statuses):
+            summary = subset_fonts(cache, find_fonts(Path('.')), jobs)
+            if summary['failed']:
+                raise RuntimeError(f"could not subset {', '.join(summary['failed'])}")
+        return [], finish
+
+    return [Node('fonts:subset', FONTS_DIR, [],
+                 lambda cache: find_fonts(Path('.')) + text_files(), SUBSET_PARAMS,
+                 lambda: [subset_path(p) for p in find_fonts(Path('.'))], run)]
+
+
+def build_graph(jobs=1):
+    """Every node, dependencies before dependents."""
+    return photo_nodes(jobs) + preview_nodes(jobs) + web_thumb_nodes(jobs) + font_nodes(jobs)
+
+
+def _node_key(node):
+    return key_for('build-node', {'node': node.name})
+
+
+def _plain(params):
+    return json.loads(json.dumps(params, sort_keys=True))
+
+
+def _snapshot(cache, node):
+    """(input hashes, output stats) for node, run inside its directory."""
+    inputs = {}
+    for path in node.inputs(cache):
+        inputs[Path(path).as_posix()] = cache.source_hash(path) if Path(path).is_file() else None
+    outputs = {}
+    for path in node.outputs():
+        outputs[Path(path).as_posix()] = [os.stat(path).st_size, os.stat(path).st_mtime_ns] if os.path.exists(path) else None
+    return inputs, outputs
+
+
+def stale_reason(cache, node):
+    """Why node has to run, or None when its record matches."""
+    record = cache.lookup_meta(_node_key(node))
+    if record is None:
+        return 'forced' if cache.force else 'never built'
+    params = _plain(node.params)
+    if record['params'] != params:
+        changed = sorted(k for k in set(params) | set(record['params']) if params.get(k) != record['params'].get(k))
+        return 'params changed: ' + ', '.join(
+            f"{k} {json.dumps(record['params'].get(k))} -> {json.dumps(params.get(k))}" for k in changed)
+    inputs, outputs = _snapshot(cache, node)
+    changed = sorted(set(inputs) ^ set(record['inputs'])
+                     | {p for p in inputs if p in record['inputs'] and inputs[p] != record['inputs'][p]})
+    if changed:
+        more = f" (+{len(changed) - 3} more)" if len(changed) > 3 else ''
+        return 'inputs changed: ' + ', '.join(changed[:3]) + more
+    for path, stat in outputs.items():
+        if stat is None:
+            return f'output missing: {path}'
+        if stat != record['outputs'].get(path):
+            return f'output changed since the last build: {path}'
+    return None
+
+
+def _record(cache, node):
+    inputs, outputs = _snapshot(cache, node)
+    cache.store_meta(_node_key(node), {'params': _plain(node.params), 'inputs': inputs, 'outputs': outputs})
+
+
+def _absolute_job(job):
+    return IngestJob(Path(os.path.abspath(job.input_path)),
+                     [Variant(v.params, [Path(os.path.abspath(p)) for p in v.output_paths]) for v in job.variants])
+
+
+def build(cache, nodes, jobs=1, dry_run=False):
+    """
+    Run every stale node once its dependencies are done; returns {name: state},
+    state being 'fresh', 'built', 'stale' (dry run), 'failed' or 'skipped'.
+    """
+    names = {node.name for node in nodes}
+    state = {}
+    active = {}     # name -> [node, jobs, statuses, finish, outstanding encodes]
+    running = {}    # future -> (name, job index, stale variants)
+    pool = None
+
+    def complete(name):
+        node, node_jobs, statuses, finish, _ = active.pop(name)
+        try:
+            with in_directory(node.directory):
+                if finish is not None:
+                    finish(statuses)
+                if all(all(job_statuses) for job_statuses in statuses):
+                    _record(cache, node)
+                else:
+                    print(f"⚠ {name}: some encodes failed; it will run again next build")
+            state[name] = 'built'
+        except Exception as e:
+            print(f"✗ {name}: {e}")
+            state[name] = 'failed'
+
+    def start(node):
+        nonlocal pool
+        with in_directory(node.directory):
+            reason = stale_reason(cache, node)
+        if reason is None:
+            state[node.name] = 'fresh'
+            return
+        print(f"→ {node.name}: {reason}")
+        if dry_run:
+            state[node.name] = 'stale'
+            return
+        try:
+            with in_directory(node.directory):
+                node_jobs, finish = node.run(cache)
+                node_jobs = [_absolute_job(job) for job in node_jobs]
+        except Exception as e:
+            print(f"✗ {node.name}: {e}")
+            state[node.name] = 'failed'
+            return
+        statuses = []
+        outstanding = 0
+        for i, job in enumerate(node_jobs):
+            job_statuses, stale = lookup_variants(cache, job)
+            statuses.append(job_statuses)
+            if stale:
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=resolve_jobs(jobs))
+                running[pool.submit(ingest_traced, *ingest_args(job, stale))] = (node.name, i, stale)
+                outstanding += 1
+        state[node.name] = 'running'
+        active[node.name] = [node, node_jobs, statuses, finish, outstanding]
+        if not outstanding:
+            complete(node.name)
+
+    try:
+        while len(state) < len(nodes) or running:
+            for node in nodes:
+                if node.name in state:
+                    continue
+                deps = [state.get(dep) for dep in node.deps if dep in names]
+                if any(dep in ('failed', 'skipped') for dep in deps):
+                    print(f"✗ {node.name}: skipped (a dependency failed)")
+                    state[node.name] = 'skipped'
+                elif all(dep in ('fresh', 'built', 'stale') for dep in deps):
+                    start(node)
+
+            if not running:
+                if all(node.name in state and state[node.name] != 'running' for node in nodes):
+                    break
+                continue
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                name, i, stale = running.pop(future)
+                node, node_jobs, statuses = active[name][:3]
+                try:
+                    metas, events = future.result()
+                except Exception as e:
+                    print(f"✗ Error processing {node_jobs[i].input_path}: {e}")
+                    metas, events = [None] * len(stale), []
+                trace.extend(events)
+                store_results(cache, node_jobs[i], stale, metas, statuses[i])
+                active[name][4] -= 1
+                if not active[name][4]:
+                    complete(name)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild every stale derived asset")
+    add_cache_arguments(parser)
+    add_jobs_argument(parser)
+    add_trace_arguments(parser)
+    parser.add_argument('--dry-run', action='store_true', help='Only list the nodes that would run, and why')
+    parser.add_argument('--only', default=None,
+                        help='Only consider nodes whose name starts with this (e.g. hero-thumb/, photos:)')
+    args = parser.parse_args()
+
+    print("=== Asset Build ===")
+    nodes = build_graph(args.jobs)
+    if args.only:
+        nodes = [node for node in nodes if node.name.startswith(args.only)]
+        if not nodes:
+            parser.error(f"no node name starts with {args.only!r}")
+
+    cache = open_cache(args)
+    state = build(cache, nodes, args.jobs, args.dry_run)
+    cache.close()
+    finish_trace(args, 'build')
+
+    counts = {}
+    for value in state.values():
+        counts[value] = counts.get(value, 0) + 1
+    print(f"\n=== Build {'plan' if args.dry_run else 'complete'}: "
+          + ', '.join(f"{counts[k]} {k}" for k in ('built', 'stale', 'fresh', 'failed', 'skipped') if k in counts)
+          + " ===")
+    if counts.get('failed') or counts.get('skipped'):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+"""
+Persistent encode cache shared by the asset optimization scripts.
+
+Every encode is keyed by the SHA-256 of the source file plus the encode
+parameters (size, quality, method, crop, ...). The catalog is a small SQLite
+database next to the assets:
+
+- sources: source path -> content hash, memoized by (size, mtime) so an
+  unchanged file is never re-read
+- outputs: output path -> key and source hash that produced it, plus the
+  size/mtime we wrote
+- blobs:   key -> encoded bytes, evicted least-recently-used once the total
+  goes over max_bytes
+- encodes: key -> JSON metadata about the encode (quality chosen, bytes,
+  dimensions, ...); tiny, so never evicted
+
+A rerun with nothing changed only stats files and queries the catalog.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from .files import write_outputs
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_PATH = ASSETS_DIR / '.asset-cache.sqlite'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DIMENSIONS_PARAMS = {'kind': 'dimensions'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outputs (
+    path TEXT PRIMARY KEY,
+    key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    source_sha256 TEXT
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS encodes (
+    key TEXT PRIMARY KEY,
+    meta TEXT NOT NULL
+);
+"""
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """Hash a file in chunks so large originals never sit in memory whole."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AssetCache:
+    """
+    Content-hash cache for encoded assets.
+
+    Args:
+        path: SQLite catalog location
+        max_bytes: Upper bound on stored encoded bytes before LRU eviction
+        force: Ignore cached results (entries are still refreshed)
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, force=False):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.force = force
+        self.db = sqlite3.connect(str(self.path))
+        self.db.executescript(SCHEMA)
+        columns = [row[1] for row in self.db.execute('PRAGMA table_info(outputs)')]
+        if 'source_sha256' not in columns:
+            self.db.execute('ALTER TABLE outputs ADD COLUMN source_sha256 TEXT')
+
+    def commit(self):
+        """Make everything recorded so far durable (long runs call this at their checkpoints)."""
+        self.db.commit()
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def source_hash(self, source_path):
+        """Content hash of a source file, re-hashed only when size or mtime change."""
+        source_path = os.path.abspath(source_path)
+        stat = os.stat(source_path)
+        row = self.db.execute(
+            'SELECT size, mtime_ns, sha256 FROM sources WHERE path = ?', (source_path,)
+        ).fetchone()
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+
+        digest = file_sha256(source_path)
+        self.db.execute(
+            'INSERT OR REPLACE INTO sources (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)',
+            (source_path, stat.st_size, stat.st_mtime_ns, digest)
+        )
+        return digest
+
+    def make_key(self, source_path, **params):
+        """Cache key for encoding source_path with the given parameters."""
+        return key_for(self.source_hash(source_path), params)
+
+    def is_fresh(self, key, output_paths):
+        """True if every output path on disk is exactly what this key produced last time."""
+        if self.force:
+            return False
+        for output_path in _as_list(output_paths):
+            row = self._output_row(output_path)
+            if not row or row[0] != key:
+                return False
+        self._touch(key)
+        return True
+
+    def is_output(self, path):
+        """True if path is exactly the file the pipeline last wrote there."""
+        return self._output_row(path) is not None
+
+    def is_fresh_downstream(self, upstream_path, output_path, params):
+        """
+        True if output_path was derived with params from the same original as upstream_path.
+
+        Lets a script that would normally re-decode a pipeline output (e.g. the
+        hero thumb made from hero.webp) accept the version the ingest stage
+        already produced straight from the original.
+        """
+        if self.force:
+            return False
+        upstream = self._output_row(upstream_path)
+        if not upstream or not upstream[1]:
+            return False
+        return self.is_fresh(key_for(upstream[1], params), output_path)
+
+    def restore(self, key, output_paths, source_path=None):
+        """Write a cached encode to every output path. Returns False on a miss."""
+        if self.force:
+            return False
+        row = self.db.execute('SELECT data FROM blobs WHERE key = ?', (key,)).fetchone()
+        if not row:
+            return False
+        write_outputs(row[0], _as_list(output_paths))
+        self.record_outputs(key, output_paths, source_path)
+        self._touch(key)
+        return True
+
+    def store(self, key, output_paths, source_path=None, meta=None, keep_blob=True):
+        """
+        Record freshly encoded output paths (all holding the same bytes) under key.
+
+        keep_blob=False records the outputs and metadata only, for files too
+        large to be worth keeping a second copy of (videos).
+        """
+        output_paths = _as_list(output_paths)
+        if keep_blob:
+            with open(output_paths[0], 'rb') as f:
+                data = f.read()
+            self.db.execute(
+                'INSERT OR REPLACE INTO blobs (key, data, size, last_used) VALUES (?, ?, ?, ?)',
+                (key, data, len(data), time.time())
+            )
+        if meta:
+            self.db.execute(
+                'INSERT OR REPLACE INTO encodes (key, meta) VALUES (?, ?)', (key, json.dumps(meta))
+            )
+        self.record_outputs(key, output_paths, source_path)
+        self.evict()
+
+    def output_meta(self, output_path):
+        """Metadata stored for the encode currently at output_path, or {} if unknown."""
+        row = self.db.execute(
+            'SELECT encodes.meta FROM outputs JOIN encodes ON outputs.key = encodes.key '
+            'WHERE outputs.path = ?', (os.path.abspath(output_path),)
+        ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def lookup_meta(self, key):
+        """Metadata stored under key, or None (also None under --force)."""
+        if self.force:
+            return None
+        row = self.db.execute('SELECT meta FROM encodes WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def store_meta(self, key, meta):
+        """Keep metadata under key without any output file (e.g. measurements)."""
+        self.db.execute('INSERT OR REPLACE INTO encodes (key, meta) VALUES (?, ?)', (key, json.dumps(meta)))
+
+    def record_outputs(self, key, output_paths, source_path=None):
+        """Remember which key (and source) produced the files now at output_paths."""
+        source_sha = self.source_hash(source_path) if source_path else None
+        for output_path in _as_list(output_paths):
+            stat = os.stat(output_path)
+            self.db.execute(
+                'INSERT OR REPLACE INTO outputs (path, key, size, mtime_ns, source_sha256) '
+                'VALUES (?, ?, ?, ?, COALESCE(?, (SELECT source_sha256 FROM outputs WHERE path = ?)))',
+                (os.path.abspath(output_path), key, stat.st_size, stat.st_mtime_ns,
+                 source_sha, os.path.abspath(output_path))
+            )
+
+    def evict(self):
+        """Drop least-recently-used blobs until the total fits in max_bytes."""
+        total = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self.db.execute('SELECT key, size FROM blobs ORDER BY last_used').fetchall():
+            if total <= self.max_bytes:
+                break
+            self.db.execute('DELETE FROM blobs WHERE key = ?', (key,))
+            total -= size
+
+    def _output_row(self, output_path):
+        """(key, source_sha256) for output_path, or None if it changed since we wrote it."""
+        if not os.path.exists(output_path):
+            return None
+        row = self.db.execute(
+            'SELECT key, size, mtime_ns, source_sha256 FROM outputs WHERE path = ?',
+            (os.path.abspath(output_path),)
+        ).fetchone()
+        if not row:
+            return None
+        stat = os.stat(output_path)
+        if stat.st_size != row[1] or stat.st_mtime_ns != row[2]:
+            return None
+        return row[0], row[3]
+
+    def _touch(self, key):
+        self.db.execute('UPDATE blobs SET last_used = ? WHERE key = ?', (time.time(), key))
+
+
+def key_for(source_sha, params):
+    """Cache key for a source content hash plus encode parameters."""
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(f"{source_sha}:{payload}".encode()).hexdigest()
+
+
+def image_size(path, cache=None):
+    """
+    {'width', 'height'} of an image file ({} if Pillow can't open it).
+
+    With a cache they come from the encode metadata when the pipeline wrote
+    the file, else from an earlier lookup of the same content, so an
+    unchanged file is not opened again.
+    """
+    if cache is None:
+        return _read_size(path)
+    meta = cache.output_meta(path) if cache.is_output(path) else {}
+    if 'width' in meta and 'height' in meta:
+        return {'width': meta['width'], 'height': meta['height']}
+    key = key_for(cache.source_hash(path), DIMENSIONS_PARAMS)
+    meta = cache.lookup_meta(key)
+    if meta is None:
+        meta = _read_size(path)
+        cache.store_meta(key, meta)
+    return meta
+
+
+def _read_size(path):
+    # Pillow only when a file has to be opened; payload.py uses this module without it
+    from PIL import Image
+    try:
+        with Image.open(path) as img:
+            return {'width': img.width, 'height': img.height}
+    except Exception:
+        return {}
+
+
+def _as_list(paths):
+    return [paths] if isinstance(paths, (str, os.PathLike)) else list(paths)
+
+
+def add_cache_arguments(parser):
+    """Add the --force / --cache-max-mb flags every script shares."""
+    parser.add_argument('--force', action='store_true',
+                        help='Re-encode everything, ignoring the asset cache')
+    parser.add_argument('--cache-max-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help='Size limit for cached encodes before LRU eviction (default: %(default)s)')
+
+
+def open_cache(args):
+    """Open the shared cache using parsed --force / --cache-max-mb flags."""
+    return AssetCache(max_bytes=args.cache_max_mb * 1024 * 1024, force=args.force)
@@ -0,0 +1,97 @@
+"""
+Check reduced-resolution decode against the full decode.
+
+For each image, the gallery variant is derived twice - once from a full
+decode, once with --reduced-decode - each in a fresh process so peak memory
+is measured per path. Prints decode+resize time, peak RSS and the SSIM of
+the reduced result against the full one; exits non-zero if any image falls
+below --min-ssim or comes out a different size.
+
+    cd src/assets
+    python3 -m pipeline.decode_check photos/portrait/originals/*.jpg
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+from .ingest import PHOTO_PARAMS, Variant, derive, encode, fit_params, load_original, required_size
+from .quality import ssim
+
+DEFAULT_MIN_SSIM = 0.995
+
+
+def _peak_rss_kb():
+    """High-water RSS of this process. VmHWM resets on exec; ru_maxrss carries over from the parent."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _derive_once(input_path, max_size, reduced):
+    """Runs in a fresh process: (seconds, peak RSS growth in MB, size, raw RGB, encoded bytes)."""
+    params = fit_params('photo', max_size, PHOTO_PARAMS['quality'])
+    if reduced:
+        params = dict(params, reduced_decode=True)
+    baseline = _peak_rss_kb()
+
+    start = time.perf_counter()
+    reduce_to = required_size([Variant(params, [])]) if reduced else None
+    img = derive(load_original(input_path, reduce_to), params)
+    elapsed = time.perf_counter() - start
+
+    peak_mb = (_peak_rss_kb() - baseline) / 1024
+    return elapsed, peak_mb, img.size, img.tobytes(), len(encode(img, params))
+
+
+def _run_isolated(input_path, max_size, reduced):
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(_derive_once, input_path, max_size, reduced).result()
+
+
+def check_image(input_path, max_size=PHOTO_PARAMS['max_size'], min_ssim=DEFAULT_MIN_SSIM):
+    """Compare both decode paths for one image; returns True when the reduced path is equivalent."""
+    full = _run_isolated(input_path, max_size, False)
+    reduced = _run_isolated(input_path, max_size, True)
+
+    if full[2] != reduced[2]:
+        print(f"✗ {input_path}: size differs ({full[2]} vs {reduced[2]})")
+        return False
+
+    score = ssim(Image.frombytes('RGB', full[2], full[3]), Image.frombytes('RGB', reduced[2], reduced[3]))
+    ok = score >= min_ssim
+    print(f"{'✓' if ok else '✗'} {input_path}: SSIM {score:.4f}, "
+          f"{full[0]*1000:.0f}ms -> {reduced[0]*1000:.0f}ms, "
+          f"peak +{full[1]:.0f}MB -> +{reduced[1]:.0f}MB, "
+          f"{full[4]/1024:.1f}KB -> {reduced[4]/1024:.1f}KB")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare reduced-resolution decode with the full decode")
+    parser.add_argument('images', nargs='+', help='Original images to check')
+    parser.add_argument('--max-size', type=int, default=PHOTO_PARAMS['max_size'],
+                        help='Longest side of the derived variant (default: %(default)s)')
+    parser.add_argument('--min-ssim', type=float, default=DEFAULT_MIN_SSIM,
+                        help='Lowest acceptable SSIM of reduced vs full decode (default: %(default)s)')
+    args = parser.parse_args()
+
+    results = [check_image(path, args.max_size, args.min_ssim) for path in args.images]
+    failed = results.count(False)
+    print(f"\n{len(results) - failed}/{len(results)} images equivalent")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Encoder backends for pipeline outputs.
+
+WebP is always written. AVIF and JPEG XL can be emitted next to it
+(hero.webp -> hero.avif / hero.jxl) with whatever codecs are installed
+locally: Pillow's own AVIF support, the pillow-jxl-plugin, or the
+avifenc/avifdec and cjxl/djxl command-line tools.
+
+An alternate format is only kept when it is actually smaller at equal
+quality: its quality is searched until it matches the SSIM the WebP
+reached, and if the result isn't smaller than the WebP it's dropped.
+
+All per-format settings live in FORMAT_SETTINGS.
+"""
+
+import argparse
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+from abc import ABC, abstractmethod
+
+from PIL import Image, features
+
+FORMAT_SETTINGS = {
+    'webp': {'extension': '.webp', 'save': {'optimize': True}},
+    'avif': {'extension': '.avif', 'save': {'speed': 6}, 'cli_speed': 6},
+    'jxl': {'extension': '.jxl', 'save': {'effort': 7}, 'cli_effort': 7},
+}
+
+
+class Encoder(ABC):
+    """One output format. Subclasses implement available(), encode() and decode()."""
+
+    def __init__(self, name):
+        self.name = name
+        self.settings = FORMAT_SETTINGS[name]
+        self.extension = self.settings['extension']
+
+    @abstractmethod
+    def available(self):
+        """True if this backend's codec is installed."""
+
+    @abstractmethod
+    def encode(self, img, quality):
+        """Encode an RGB image at quality; returns the file's bytes."""
+
+    @abstractmethod
+    def decode(self, data):
+        """Decode bytes this backend wrote back to an RGB image."""
+
+
+class PillowEncoder(Encoder):
+    """Encoder backed by a Pillow plugin (built in, or registered by importing `plugin`)."""
+
+    def __init__(self, name, pil_format, feature=None, plugin=None):
+        super().__init__(name)
+        self.pil_format = pil_format
+        self.feature = feature
+        self.plugin = plugin
+
+    def available(self):
+        if self.plugin:
+            try:
+                __import__(self.plugin)
+            except ImportError:
+                return False
+        if self.feature:
+            return bool(features.check(self.feature))
+        return self.pil_format in Image.SAVE
+
+    def encode(self, img, quality):
+        buffer = io.BytesIO()
+        img.save(buffer, self.pil_format, quality=quality, **self.settings['save'])
+        return buffer.getvalue()
+
+    def decode(self, data):
+        with Image.open(io.BytesIO(data)) as img:
+            return img.convert('RGB')
+
+
+class CommandEncoder(Encoder):
+    """Encoder driving an installed command-line codec through temp files."""
+
+    def __init__(self, name, encode_cmd, decode_cmd):
+        super().__init__(name)
+        self.encode_cmd = encode_cmd
+        self.decode_cmd = decode_cmd
+
+    def available(self):
+        return bool(shutil.which(self.encode_cmd[0]) and shutil.which(self.decode_cmd[0]))
+
+    def _run(self, cmd, input_bytes, input_ext, output_ext):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, 'in' + input_ext)
+            dst = os.path.join(tmp, 'out' + output_ext)
+            with open(src, 'wb') as f:
+                f.write(input_bytes)
+            subprocess.run([part.format(src=src, dst=dst, **self.settings) for part in cmd],
+                           check=True, capture_output=True)
+            with open(dst, 'rb') as f:
+                return f.read()
+
+    def encode(self, img, quality):
+        buffer = io.BytesIO()
+        img.save(buffer, 'PNG', compress_level=1)
+        cmd = [part.replace('{quality}', str(quality)) for part in self.encode_cmd]
+        return self._run(cmd, buffer.getvalue(), '.png', self.extension)
+
+    def decode(self, data):
+        png = self._run(self.decode_cmd, data, self.extension, '.png')
+        with Image.open(io.BytesIO(png)) as img:
+            return img.convert('RGB')
+
+
+# Candidates per format, in order of preference
+BACKENDS = {
+    'avif': [
+        PillowEncoder('avif', 'AVIF', feature='avif'),
+        PillowEncoder('avif', 'AVIF', plugin='pillow_avif'),
+        CommandEncoder('avif', ['avifenc', '-q', '{quality}', '-s', '{cli_speed}', '{src}', '{dst}'],
+                       ['avifdec', '{src}', '{dst}']),
+    ],
+    'jxl': [
+        PillowEncoder('jxl', 'JXL', plugin='pillow_jxl'),
+        CommandEncoder('jxl', ['cjxl', '{src}', '{dst}', '-q', '{quality}', '-e', '{cli_effort}'],
+                       ['djxl', '{src}', '{dst}']),
+    ],
+}
+
+_resolved = {}
+
+
+def get_encoder(name):
+    """First available backend for an alternate format, or None if no codec is installed."""
+    if name not in _resolved:
+        _resolved[name] = next((b for b in BACKENDS.get(name, []) if b.available()), None)
+    return _resolved[name]
+
+
+def parse_formats(value):
+    """Parse a --formats value like 'avif,jxl' into a sorted list of known formats."""
+    names = sorted({name.strip().lower() for name in value.split(',') if name.strip()} - {'webp'})
+    unknown = [name for name in names if name not in BACKENDS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown format(s): {', '.join(unknown)} (choose from {', '.join(BACKENDS)})")
+    return names
+
+
+def add_format_arguments(parser):
+    """Add the --formats flag the scripts share."""
+    parser.add_argument('--formats', type=parse_formats, default=[],
+                        help="Alternate formats to emit next to WebP when smaller, e.g. 'avif' or 'avif,jxl'")
+
+
+def with_formats(params, formats):
+    """params plus the alternate formats to try, or params unchanged when there are none."""
+    if not formats:
+        return params
+    return dict(params, formats=list(formats))
+
+
+def alternate_path(output_path, name):
+    return os.path.splitext(os.fspath(output_path))[0] + FORMAT_SETTINGS[name]['extension']
+
+
+def report_missing(formats):
+    """Warn once per run about requested formats with no installed codec."""
+    for name in formats:
+        if get_encoder(name) is None:
+            print(f"⚠ No {name.upper()} encoder installed; only WebP will be written")
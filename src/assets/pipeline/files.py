@@ -0,0 +1,131 @@
+"""
+File-writing helpers for pipeline outputs.
+
+Outputs are always replaced via a temp file + rename, never truncated in
+place. That matters because identical outputs (hero.webp and <collection>-01.webp)
+are hard-linked: writing through one name must not silently change the other.
+
+AsyncWriter runs those writes on a background thread, so the encode of the
+next file doesn't wait for the disk.
+"""
+
+import filecmp
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future
+
+WRITE_QUEUE_DEPTH = 8
+
+
+def atomic_write_bytes(path, data):
+    """Write data to path via a temp file in the same directory and os.replace()."""
+    path = os.fspath(path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_if_changed(path, data):
+    """atomic_write_bytes() unless path already holds exactly data; returns True if it wrote."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+def same_file(a, b):
+    """True for hard links, or for copies of each other (a git checkout doesn't keep hard links)."""
+    a, b = os.fspath(a), os.fspath(b)
+    return os.path.samefile(a, b) or (os.path.getsize(a) == os.path.getsize(b) and filecmp.cmp(a, b, shallow=False))
+
+
+def link_or_copy(source, dest):
+    """Hard-link dest to source (replacing dest), falling back to a copy across filesystems."""
+    source, dest = os.fspath(source), os.fspath(dest)
+    if os.path.exists(dest) and os.path.samefile(source, dest):
+        return
+    tmp_path = os.path.join(os.path.dirname(dest) or '.', f".tmp-link-{os.path.basename(dest)}")
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, dest)
+
+
+def write_outputs(data, output_paths):
+    """Write data to the first path and link every other path to it."""
+    first = output_paths[0]
+    atomic_write_bytes(first, data)
+    for other in output_paths[1:]:
+        link_or_copy(first, other)
+
+
+def move_to_originals(source_path, originals_dir):
+    """Move an imported original into originals/, suffixing _1, _2... on name conflicts."""
+    originals_dir.mkdir(exist_ok=True)
+    original_filename = source_path.name
+    original_dest = originals_dir / original_filename
+
+    # Handle filename conflicts
+    counter = 1
+    while original_dest.exists():
+        name_parts = original_filename.rsplit('.', 1)
+        if len(name_parts) == 2:
+            original_dest = originals_dir / f"{name_parts[0]}_{counter}.{name_parts[1]}"
+        else:
+            original_dest = originals_dir / f"{original_filename}_{counter}"
+        counter += 1
+
+    shutil.move(str(source_path), str(original_dest))
+    return original_dest
+
+
+class AsyncWriter:
+    """
+    One background thread running write calls in submission order.
+
+    submit() blocks while WRITE_QUEUE_DEPTH writes are already waiting, which
+    caps how many encoded files sit in memory when the disk falls behind.
+    """
+
+    def __init__(self, depth=WRITE_QUEUE_DEPTH):
+        self.queue = queue.Queue(maxsize=depth)
+        self.thread = threading.Thread(target=self._run, name='asset-writer', daemon=True)
+        self.thread.start()
+
+    def submit(self, func, *args):
+        """Queue func(*args); returns a Future for its result."""
+        future = Future()
+        self.queue.put((future, func, args))
+        return future
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            future, func, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def close(self):
+        """Finish every queued write, then stop the thread."""
+        self.queue.put(None)
+        self.thread.join()
@@ -0,0 +1,169 @@
+"""
+Font subsets holding only the characters the site uses, written as WOFF2.
+
+The text is everything the front end can draw: the .js / .css / .html under
+src/ (the assets themselves left out), the HTML shells at the repository
+root and in about/, contact/, interactive/, links/, photo/ and
+sketch-runner/. JS and CSS escapes and HTML entities are decoded first.
+Printable ASCII is always kept, since typed input and numbers or dates
+built at runtime never appear in the source.
+
+Each font is cut down to the characters it actually has among those
+(fontTools' subsetter, layout features kept so ligatures and kerning still
+work). Variation tables are subset rather than dropped, so a variable font
+keeps its axes. The result is saved as <name>.subset.woff2 next to the
+font; a WOFF2 source gets a subset of its own.
+
+A subset is cached under the font's content hash plus a hash of the
+codepoints kept (and SUBSET_PARAMS), so a rerun only does work when a font
+changes or the text gains a character that font can draw.
+
+Needs fontTools and brotli (pip install -r src/assets/requirements.txt).
+"""
+
+import hashlib
+import html
+import io
+import re
+from pathlib import Path
+
+from .cache import ASSETS_DIR
+from .files import write_outputs
+from .workers import run_parallel
+
+ROOT_DIR = ASSETS_DIR.parents[1]
+FONTS_DIR = ASSETS_DIR / 'fonts'
+FONT_EXTENSIONS = ('.ttf', '.otf', '.woff', '.woff2')
+SUBSET_SUFFIX = '.subset.woff2'
+TEXT_EXTENSIONS = ('.js', '.css', '.html')
+SHELL_DIRS = ('about', 'contact', 'interactive', 'links', 'photo', 'sketch-runner')
+BASELINE = range(0x20, 0x7f)
+SUBSET_PARAMS = {'kind': 'font-subset', 'flavor': 'woff2', 'layout_features': '*', 'notdef_outline': True}
+
+JS_ESCAPE = re.compile(r'\\u\{([0-9a-fA-F]{1,6})\}|\\u([0-9a-fA-F]{4})|\\x([0-9a-fA-F]{2})')
+CSS_ESCAPE = re.compile(r'\\([0-9a-fA-F]{1,6})\s?')
+
+
+def fonttools_available():
+    try:
+        import brotli  # noqa: F401 - the WOFF2 writer needs it
+        import fontTools.subset  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def subset_path(font_path):
+    font_path = Path(font_path)
+    return font_path.with_name(font_path.name.split('.')[0] + SUBSET_SUFFIX)
+
+
+def find_fonts(directory=FONTS_DIR):
+    """Source fonts in directory (subsets left out)."""
+    return [p for p in sorted(Path(directory).iterdir())
+            if p.suffix.lower() in FONT_EXTENSIONS and not p.name.endswith(SUBSET_SUFFIX)]
+
+
+def text_files(root=ROOT_DIR):
+    """Every file whose text the site can show."""
+    files = [p for p in sorted((root / 'src').rglob('*'))
+             if p.suffix.lower() in TEXT_EXTENSIONS and ASSETS_DIR not in p.parents]
+    files += sorted(root.glob('*.html'))
+    for directory in SHELL_DIRS:
+        files += sorted((root / directory).rglob('*.html'))
+    return files
+
+
+def _decode_escapes(text, suffix):
+    if suffix == '.html':
+        return html.unescape(text)
+    if suffix == '.css':
+        return CSS_ESCAPE.sub(lambda m: chr(int(m.group(1), 16)) if int(m.group(1), 16) < 0x110000 else '', text)
+    return JS_ESCAPE.sub(lambda m: chr(int(next(g for g in m.groups() if g), 16)), text)
+
+
+def used_codepoints(paths):
+    """Printable ASCII plus every character in paths."""
+    codepoints = set(BASELINE)
+    for path in paths:
+        text = Path(path).read_text(encoding='utf-8', errors='ignore')
+        codepoints.update(ord(c) for c in _decode_escapes(text, Path(path).suffix.lower()) if c.isprintable())
+    return codepoints
+
+
+def font_codepoints(font_path):
+    """Codepoints font_path has a glyph for."""
+    from fontTools.ttLib import TTFont
+    with TTFont(font_path, lazy=True) as font:
+        return set(font.getBestCmap() or {})
+
+
+def glyph_set_hash(codepoints):
+    return hashlib.sha256(','.join(f'{c:x}' for c in sorted(codepoints)).encode()).hexdigest()[:16]
+
+
+def subset_font(font_path, codepoints):
+    """(WOFF2 bytes, meta) of font_path cut down to codepoints, or None if it fails."""
+    from fontTools import subset
+    try:
+        options = subset.Options()
+        options.flavor = 'woff2'
+        options.layout_features = ['*']
+        options.notdef_outline = True
+        font = subset.load_font(str(font_path), options)
+        axes = [axis.axisTag for axis in font['fvar'].axes] if 'fvar' in font else []
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        buffer = io.BytesIO()
+        subset.save_font(font, buffer, options)
+        glyphs = len(font.getGlyphOrder())
+        font.close()
+    except Exception as e:
+        print(f"✗ Error subsetting {font_path}: {e}")
+        return None
+    data = buffer.getvalue()
+    return data, {'bytes': len(data), 'source_bytes': Path(font_path).stat().st_size,
+                  'codepoints': len(codepoints), 'glyphs': glyphs, 'axes': axes}
+
+
+def _describe(font_path, meta):
+    axes = f", axes {' '.join(meta['axes'])}" if meta.get('axes') else ''
+    return (f"{meta['source_bytes']/1024:.1f}KB -> {meta['bytes']/1024:.1f}KB "
+            f"({meta['codepoints']} characters, {meta['glyphs']} glyphs{axes})")
+
+
+def subset_fonts(cache, font_paths, jobs=1, text_paths=None):
+    """
+    Write the subset of every font, reusing cached ones. Returns
+    {'written', 'cached', 'failed', 'source_bytes', 'bytes'}.
+    """
+    used = used_codepoints(text_files() if text_paths is None else text_paths)
+    summary = {'written': 0, 'cached': 0, 'failed': [], 'source_bytes': 0, 'bytes': 0}
+    pending = []
+    for font_path in font_paths:
+        output = subset_path(font_path)
+        keep = sorted(used & font_codepoints(font_path))
+        key = cache.make_key(font_path, **SUBSET_PARAMS, glyphs=glyph_set_hash(keep))
+        if cache.is_fresh(key, output) or cache.restore(key, output, font_path):
+            meta = cache.output_meta(output)
+            print(f"✓ Cached {output.name}: {_describe(font_path, meta)}")
+            summary['cached'] += 1
+            summary['source_bytes'] += meta['source_bytes']
+            summary['bytes'] += meta['bytes']
+            continue
+        pending.append((font_path, output, key, keep))
+
+    results = run_parallel(subset_font, [(font_path, keep) for font_path, _, _, keep in pending], jobs)
+    for (font_path, output, key, keep), result in zip(pending, results):
+        if result is None:
+            summary['failed'].append(font_path.name)
+            continue
+        data, meta = result
+        write_outputs(data, [output])
+        cache.store(key, output, font_path, meta)
+        print(f"✓ Subset {font_path.name} -> {output.name}: {_describe(font_path, meta)}")
+        summary['written'] += 1
+        summary['source_bytes'] += meta['source_bytes']
+        summary['bytes'] += meta['bytes']
+    return summary
@@ -0,0 +1,427 @@
+"""
+Single-decode ingest stage.
+
+An original is opened, EXIF-rotated and flattened to RGB exactly once; every
+derived artifact (gallery image, hero, hero thumb, preview thumb) is then
+resized from that in-memory image. Variants with identical parameters are
+encoded once and the extra output names are hard-linked to the first.
+
+A variant is described entirely by its params dict, which is also what the
+asset cache keys on:
+
+    {'kind': 'photo', 'max_size': 1920, 'quality': 85}
+        -> longest side fitted to max_size
+    {'kind': 'hero-thumb', 'size': 768, 'quality': 90, 'method': 6, 'crop': 'center-square'}
+        -> center-cropped square of size x size
+    {'kind': 'photo-ladder', 'max_size': 960, 'quality': 85, 'cascade': [1920, 1440, 960, 480]}
+        -> fitted like 'photo', but resized from the next larger step in memory
+
+Adding 'target_ssim' to any params replaces the fixed quality with a
+per-image search (see quality.py); 'quality' then only serves as the
+baseline the savings are reported against. Adding 'formats': ['avif', ...]
+also writes those formats next to the WebP when they come out smaller at
+the same SSIM (see encoders.py).
+
+When every variant of a job carries 'reduced_decode': True, the original is
+decoded at reduced resolution: JPEG DCT scaling via Image.draft(), then an
+integer reduce(), stopping at REDUCE_MARGIN x the largest size any variant
+needs. The final LANCZOS step (with reducing_gap) does the rest. Output
+dimensions are still computed from the full-resolution size.
+
+TIFFs whose decoded frame would exceed the memory limit ('memory_limit_mb',
+default TIFF_MEMORY_LIMIT_MB) are always read that way, strip by strip (see
+tiled.py), whatever 'reduced_decode' says.
+"""
+
+import io
+import math
+import os
+from collections import namedtuple
+
+import numpy as np
+from PIL import Image, ImageOps
+
+from .encoders import FORMAT_SETTINGS, alternate_path, get_encoder, with_formats
+from .files import write_outputs
+from .quality import decode_score, search_quality, with_target
+from .tiled import TIFF_MEMORY_LIMIT_MB, open_large_tiff
+from .trace import stage
+
+# params: encode settings (see module docstring); output_paths: every name that gets these bytes
+Variant = namedtuple('Variant', 'params output_paths')
+IngestJob = namedtuple('IngestJob', 'input_path variants')
+
+
+def fit_params(kind, max_size, quality):
+    """Params for a variant whose longest side is capped at max_size."""
+    return {'kind': kind, 'max_size': max_size, 'quality': quality}
+
+
+def square_params(kind, size, quality, method=6):
+    """Params for a center-cropped size x size variant."""
+    return {'kind': kind, 'size': size, 'quality': quality, 'method': method, 'crop': 'center-square'}
+
+
+PHOTO_PARAMS = fit_params('photo', 1920, 85)
+WEB_THUMB_PARAMS = fit_params('web-thumb', 512, 85)
+HERO_THUMB_PARAMS = square_params('hero-thumb', 768, 90)
+PREVIEW_THUMB_PARAMS = square_params('preview-thumb', 256, 85)
+
+# Reduced decode stops at this multiple of the needed size; LANCZOS does the rest
+REDUCE_MARGIN = 1.5
+REDUCING_GAP = 3.0
+
+
+def encode_options(args):
+    """Per-run encode options from the shared --target-ssim / --formats / decode flags."""
+    return {
+        'target_ssim': args.target_ssim,
+        'formats': args.formats,
+        'reduced_decode': getattr(args, 'reduced_decode', False),
+        'memory_limit_mb': getattr(args, 'memory_limit_mb', None),
+    }
+
+
+def with_options(params, options=None):
+    """params plus whichever per-run encode options are set."""
+    options = options or {}
+    params = with_formats(with_target(params, options.get('target_ssim')), options.get('formats'))
+    if options.get('reduced_decode'):
+        params = dict(params, reduced_decode=True)
+    if options.get('memory_limit_mb'):
+        params = dict(params, memory_limit_mb=options['memory_limit_mb'])
+    return params
+
+
+def add_decode_arguments(parser):
+    """Add the --reduced-decode / --memory-limit-mb flags for scripts that ingest camera originals."""
+    parser.add_argument('--reduced-decode', action='store_true',
+                        help='Decode large originals at reduced resolution (JPEG draft + reduce) before resizing')
+    parser.add_argument('--memory-limit-mb', type=int, default=None,
+                        help=f'Stream TIFFs whose decoded frame exceeds this many MB per worker '
+                             f'(default: {TIFF_MEMORY_LIMIT_MB})')
+
+
+def required_size(variants):
+    """(longest, shortest) side the decoded original must keep for every variant."""
+    longest = max([v.params['max_size'] for v in variants if 'max_size' in v.params] or [0])
+    shortest = max([v.params['size'] for v in variants if 'size' in v.params] or [0])
+    return longest, shortest
+
+
+def reduce_scale(full_size, reduce_to):
+    """Fraction of full_size that still leaves REDUCE_MARGIN x the (longest, shortest) sizes needed."""
+    longest, shortest = reduce_to
+    return max(longest / max(full_size), shortest / min(full_size)) * REDUCE_MARGIN
+
+
+def flatten_to_rgb(img):
+    """Flatten transparency onto white and convert to RGB (16-bit and int samples scaled to 8 bits)."""
+    if img.mode.startswith('I'):
+        # convert() would clip every value above 255; scale the way tiled.py does for streamed TIFFs
+        pixels = np.rint(np.asarray(img, dtype=np.float32) / 257)
+        img = Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), 'L')
+    # Convert to RGB if necessary (handles RGBA, P, etc.)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        # Create white background for transparency
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+
+def load_large_tiff(tiff, reduce_to, memory_limit_mb):
+    """Stream a LargeTiff down to the smallest integer reduction that still covers reduce_to."""
+    factor = max(1, int(1 / reduce_scale(tiff.full_size, reduce_to)))
+    # Decode, box reduction and orientation all happen strip by strip inside reduced()
+    with stage('decode', tiff.path, bytes_in=os.path.getsize(tiff.path)):
+        img = tiff.reduced(factor, memory_limit_mb)
+    with stage('convert', tiff.path):
+        img = flatten_to_rgb(img)
+    img.info['full_size'] = tiff.full_size
+    return img
+
+
+def load_original(input_path, reduce_to=None, data=None):
+    """
+    Open an image, apply EXIF rotation and flatten it onto white RGB.
+
+    reduce_to=(longest, shortest) allows decoding at reduced resolution as long
+    as both sides stay at least REDUCE_MARGIN x those sizes. The
+    full-resolution (rotated) size is kept in img.info['full_size']. data is
+    the file's bytes when they have already been read (see workers.py).
+    """
+    with Image.open(io.BytesIO(data) if data is not None else input_path) as img:
+        full_size = img.size
+
+        scale = reduce_scale(img.size, reduce_to) if reduce_to else 1.0
+        if scale < 1.0:
+            # JPEG only: DCT-domain scaling while decoding (no-op for other formats)
+            img.draft('RGB', (math.ceil(img.width * scale), math.ceil(img.height * scale)))
+
+        # Bytes read ahead were already counted by the 'read' stage
+        counters = {} if data is not None else {'bytes_in': os.path.getsize(input_path)}
+        with stage('decode', input_path, **counters):
+            img.load()
+
+        # Auto-rotate based on EXIF orientation
+        with stage('exif_transpose', input_path):
+            img = ImageOps.exif_transpose(img)
+
+        with stage('convert', input_path):
+            img = flatten_to_rgb(img)
+            img.load()
+
+        # Rotated by exif_transpose (or already by libtiff for TIFFs)?
+        if (img.width > img.height) != (full_size[0] > full_size[1]):
+            full_size = full_size[::-1]
+
+        # Integer box reduction for whatever draft() couldn't do (TIFF, PNG, small JPEG scales)
+        if scale < 1.0:
+            factor = int(min(img.width / (full_size[0] * scale), img.height / (full_size[1] * scale)))
+            if factor >= 2:
+                with stage('resize', input_path):
+                    img = img.reduce(factor)
+
+        img.info['full_size'] = full_size
+        return img
+
+
+def fit_within(img, max_size, reference_size=None):
+    """
+    Resize so the longest side is at most max_size (never upscales).
+
+    reference_size is the full-resolution size when img was decoded reduced;
+    the output dimensions are computed from it so they match a full decode.
+    """
+    width, height = reference_size or img.size
+    if width <= max_size and height <= max_size:
+        return img
+
+    if width > height:
+        new_width = max_size
+        new_height = int((height * max_size) / width)
+    else:
+        new_height = max_size
+        new_width = int((width * max_size) / height)
+
+    # Resize with high-quality resampling
+    if reference_size:
+        return img.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+    return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+
+
+def center_crop_to_square(image):
+    """
+    Crop image from center to create a perfect square.
+    Maintains aspect ratio by cropping the longer dimension.
+    """
+    width, height = image.size
+
+    if width == height:
+        return image
+
+    # Determine crop dimensions
+    crop_size = min(width, height)
+
+    # Calculate crop coordinates (center crop)
+    left = (width - crop_size) // 2
+    top = (height - crop_size) // 2
+    right = left + crop_size
+    bottom = top + crop_size
+
+    return image.crop((left, top, right, bottom))
+
+
+def square_thumbnail(img, size):
+    """Center crop to square, then resize to size x size."""
+    return center_crop_to_square(img).resize((size, size), Image.Resampling.LANCZOS)
+
+
+def derive(img, params, fitted=None):
+    """
+    Produce the pixels for one variant from the decoded original.
+
+    fitted maps max_size -> already-resized image, so cascade steps reuse the
+    next larger step instead of resizing the original again. Square crops
+    always come from the original so their pixels never depend on which
+    other variants happen to be stale.
+    """
+    if params.get('crop') == 'center-square':
+        return square_thumbnail(img, params['size'])
+
+    if fitted is None:
+        fitted = {}
+    full_size = img.info.get('full_size')
+    reference_size = full_size if full_size and full_size != img.size else None
+
+    # Walk the cascade from the top so a step always starts from the same
+    # pixels, whether or not the larger steps are being written this run
+    source = img
+    for step in params.get('cascade', ()):
+        if step <= params['max_size']:
+            break
+        if step not in fitted:
+            fitted[step] = fit_within(source, step, reference_size)
+        source = fitted[step]
+
+    resized = fit_within(source, params['max_size'], reference_size)
+    fitted[params['max_size']] = resized
+    return resized
+
+
+def encode(img, params, quality=None):
+    """Encode a derived image to WebP bytes (at params['quality'] unless overridden)."""
+    save_kwargs = dict(FORMAT_SETTINGS['webp']['save'], quality=params['quality'] if quality is None else quality)
+    if 'method' in params:
+        save_kwargs['method'] = params['method']
+    buffer = io.BytesIO()
+    img.save(buffer, 'WEBP', **save_kwargs)
+    return buffer.getvalue()
+
+
+def encode_alternates(img, params, data, meta):
+    """
+    Try each requested alternate format at the SSIM the WebP reached.
+
+    Returns {format: bytes} for the formats that came out smaller; meta gets
+    an 'alternates' entry recording every attempt (None = not kept).
+    """
+    target = meta.get('ssim') or decode_score(img, data)
+    kept = {}
+    meta['alternates'] = {}
+    for name in params['formats']:
+        encoder = get_encoder(name)
+        if encoder is None:
+            continue
+        quality, alt_data, score = search_quality(
+            img, lambda q: encoder.encode(img, q), target, floor=20, ceiling=95, decode=encoder.decode
+        )
+        if score >= target and len(alt_data) < len(data):
+            kept[name] = alt_data
+            meta['alternates'][name] = {'quality': quality, 'bytes': len(alt_data)}
+        else:
+            meta['alternates'][name] = None
+    return kept
+
+
+def encode_variant(img, params):
+    """
+    Encode a derived image, running the quality search if params ask for one.
+
+    Returns (data, meta, alternates); meta is what the cache stores about
+    this encode, alternates maps extra formats to their bytes.
+    """
+    meta = {'width': img.width, 'height': img.height}
+    if 'target_ssim' in params:
+        quality, data, score = search_quality(img, lambda q: encode(img, params, q), params['target_ssim'])
+        meta.update(quality=quality, ssim=round(score, 5),
+                    baseline_bytes=len(encode(img, params)))
+    else:
+        data = encode(img, params)
+        meta['quality'] = params['quality']
+    meta['bytes'] = len(data)
+    alternates = encode_alternates(img, params, data, meta) if params.get('formats') else {}
+    return data, meta, alternates
+
+
+def write_alternates(params, output_paths, alternates):
+    """Write kept alternate formats next to each output; remove ones no longer kept."""
+    for name in params.get('formats', []):
+        paths = [alternate_path(p, name) for p in output_paths]
+        if name in alternates:
+            write_outputs(alternates[name], paths)
+        else:
+            for path in paths:
+                if os.path.exists(path):
+                    os.unlink(path)
+
+
+def decode_original(input_path, variants, data=None):
+    """
+    Decode input_path as needed for variants: streamed for huge TIFFs, reduced
+    if every variant allows it, from data when its bytes were read ahead.
+    """
+    reduce_to = None
+    if variants and all(v.params.get('reduced_decode') for v in variants):
+        reduce_to = required_size(variants)
+    memory_limit_mb = max([v.params.get('memory_limit_mb', TIFF_MEMORY_LIMIT_MB) for v in variants] or [0])
+    tiff = open_large_tiff(input_path, memory_limit_mb)
+    if tiff is not None:
+        return load_large_tiff(tiff, required_size(variants), memory_limit_mb)
+    return load_original(input_path, reduce_to, data)
+
+
+def derive_order(variants):
+    """Indices of variants, largest fitted size first (so cascade steps reuse the previous image)."""
+    return sorted(range(len(variants)), key=lambda i: -variants[i].params.get('max_size', 0))
+
+
+def encode_original(input_path, variants, data=None):
+    """
+    Decode input_path once and encode every variant, without writing anything.
+
+    Fitted variants are produced largest first so every cascade step can
+    start from the previous in-memory image. Returns, per variant in the
+    order given, (data, meta, alternates) as encode_variant() makes them,
+    or None on failure.
+    """
+    try:
+        img = decode_original(input_path, variants, data)
+    except Exception as e:
+        print(f"✗ Error processing {input_path}: {e}")
+        return [None] * len(variants)
+
+    results = [None] * len(variants)
+    fitted = {}
+    for i in derive_order(variants):
+        params = variants[i].params
+        try:
+            with stage('resize', input_path):
+                derived = derive(img, params, fitted)
+            with stage('encode', input_path):
+                results[i] = encode_variant(derived, params)
+        except Exception as e:
+            print(f"✗ Error processing {input_path}: {e}")
+    return results
+
+
+def write_variant(input_path, variant, encoded):
+    """Write one variant encode_original() produced; returns its metadata, or None on failure."""
+    data, meta, alternates = encoded
+    params, output_paths = variant
+    try:
+        with stage('write', input_path, bytes_out=len(data) + sum(len(alt) for alt in alternates.values())):
+            write_outputs(data, output_paths)
+            write_alternates(params, output_paths, alternates)
+    except Exception as e:
+        print(f"✗ Error writing {output_paths[0]}: {e}")
+        return None
+
+    linked = ''.join(f", {os.path.basename(p)}" for p in output_paths[1:])
+    searched = f" (q{meta['quality']})" if 'target_ssim' in params else ''
+    extras = ''.join(
+        f" +{fmt} {(1 - len(alt) / len(data)) * 100:.0f}% smaller" for fmt, alt in alternates.items()
+    )
+    print(f"✓ Optimized: {os.path.basename(input_path)} -> {os.path.basename(output_paths[0])}{linked}{searched}{extras}")
+    return meta
+
+
+def ingest_original(input_path, variants):
+    """
+    Decode input_path once and write every variant.
+
+    Returns, per variant in the order given, the encode metadata or None on
+    failure. workers.ingest_all() runs the same two halves as separate
+    pipeline stages.
+    """
+    encoded = encode_original(input_path, variants)
+    results = [None] * len(variants)
+    for i in derive_order(variants):
+        if encoded[i] is not None:
+            results[i] = write_variant(input_path, variants[i], encoded[i])
+    return results
@@ -0,0 +1,100 @@
+"""
+Responsive resolution ladder (srcset variants) for gallery photos.
+
+Next to every <collection>-NN.webp (and hero.webp, unless it is a copy of
+one of those) the pipeline writes smaller copies to
+<collection>/sizes/<collection>-NN-<size>.webp, where size caps the longest
+side just like the main 1920px file. Each step is resized from
+the next larger one in memory rather than from the original, so the extra
+steps cost a fraction of the main 1920px resize.
+
+photos/srcset.json records what exists on disk (rewritten only when that
+changes) so the front end can pick the smallest file that covers the
+display size:
+
+    {
+      "portrait/portrait-05.webp": [
+        {"width": 480, "height": 320, "file": "portrait/sizes/portrait-05-480.webp", "bytes": 21834},
+        ...
+        {"width": 1920, "height": 1280, "file": "portrait/portrait-05.webp", "bytes": 115596}
+      ]
+    }
+"""
+
+import json
+from pathlib import Path
+
+from .cache import image_size
+from .files import same_file, write_if_changed
+from .ingest import Variant, with_options
+
+DEFAULT_WIDTHS = (480, 960, 1440)
+SIZES_DIR = 'sizes'
+
+
+def parse_widths(value):
+    """Parse a --widths value like '480,960,1440' ('' disables the ladder)."""
+    return tuple(sorted({int(w) for w in value.split(',') if w.strip()}, reverse=True))
+
+
+def ladder_path(gallery_path, size):
+    gallery_path = Path(gallery_path)
+    return gallery_path.parent / SIZES_DIR / f"{gallery_path.stem}-{size}.webp"
+
+
+def ladder_variants(gallery_path, widths, main_size=1920, quality=85, options=None):
+    """
+    Variants for every ladder step below main_size.
+
+    The 'cascade' entry lists the full chain of steps, so the cache key
+    changes if a step the resize starts from is added or removed.
+    """
+    sizes = [w for w in sorted(widths, reverse=True) if w < main_size]
+    if not sizes:
+        return []
+    (Path(gallery_path).parent / SIZES_DIR).mkdir(exist_ok=True)
+    cascade = [main_size] + sizes
+    return [
+        Variant(with_options({'kind': 'photo-ladder', 'max_size': size, 'quality': quality, 'cascade': cascade},
+                             options),
+                [ladder_path(gallery_path, size)])
+        for size in sizes
+    ]
+
+
+def _describe(path, root, cache=None):
+    size = image_size(path, cache)
+    return {
+        'width': size['width'],
+        'height': size['height'],
+        'file': path.relative_to(root).as_posix(),
+        'bytes': path.stat().st_size,
+    }
+
+
+def gallery_files(collection_dir, collection):
+    """The collection's <collection>-NN.webp files, plus hero.webp when it isn't a copy of one of them."""
+    collection_dir = Path(collection_dir)
+    files = sorted(collection_dir.glob(f"{collection}-*.webp"))
+    hero_path = collection_dir / 'hero.webp'
+    if hero_path.exists() and not any(same_file(hero_path, p) for p in files):
+        files.insert(0, hero_path)
+    return files
+
+
+def write_srcset_index(root, collections, index_name='srcset.json', cache=None):
+    """Rewrite root/srcset.json from the gallery and ladder files on disk; returns (index, changed)."""
+    root = Path(root)
+    index = {}
+    for collection in collections:
+        collection_dir = root / collection
+        for gallery_path in gallery_files(collection_dir, collection):
+            entries = [
+                _describe(p, root, cache)
+                for p in (collection_dir / SIZES_DIR).glob(f"{gallery_path.stem}-*.webp")
+            ]
+            entries.append(_describe(gallery_path, root, cache))
+            index[gallery_path.relative_to(root).as_posix()] = sorted(entries, key=lambda e: e['width'])
+
+    changed = write_if_changed(root / index_name, (json.dumps(index, indent=2) + '\n').encode())
+    return index, changed
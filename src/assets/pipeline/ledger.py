@@ -0,0 +1,71 @@
+"""
+Import ledger: which import file became which published name.
+
+Each collection keeps originals/imports.json, keyed by published name:
+
+    {
+      "portrait-07.webp": {"source": "IMG_1234.jpg", "sha256": "9b0e...", "original": "IMG_1234.jpg"},
+      "portrait-08.webp": {"source": "IMG_1240.jpg", "sha256": "41c2...", "original": null}
+    }
+
+An entry is written as soon as an import file is given its name, before
+anything is encoded, and "original" is filled in once the file has been
+moved to originals/ (under that name, which may carry a _1 suffix). An
+entry whose original is still null is a reservation: if the run dies
+between the two, the next run (or a restarted --watch) gives the same
+import file the same name instead of the next free number, and the asset
+cache finds whatever outputs were already written. Entries re-encoded
+from their original - to fit a byte budget (see budget.py) or by a
+rebuild (see rebuild.py) - also carry the "params" they were encoded with,
+so the same encode can be made again.
+"""
+
+import json
+from pathlib import Path
+
+from .files import atomic_write_bytes
+
+LEDGER_NAME = 'imports.json'
+
+
+def ledger_path(originals_dir):
+    return Path(originals_dir) / LEDGER_NAME
+
+
+def load_ledger(originals_dir):
+    """The collection's ledger, or an empty one."""
+    try:
+        with open(ledger_path(originals_dir)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_ledger(originals_dir, ledger):
+    Path(originals_dir).mkdir(exist_ok=True)
+    atomic_write_bytes(ledger_path(originals_dir), (json.dumps(ledger, indent=2, sort_keys=True) + '\n').encode())
+
+
+def reserved_name(ledger, source_name):
+    """The published name reserved for an import file that hasn't been moved yet, or None."""
+    for name, entry in ledger.items():
+        if entry['original'] is None and entry['source'] == source_name:
+            return name
+    return None
+
+
+def prune_reservations(ledger, import_dir):
+    """Drop reservations whose import file is gone (deleted by hand rather than imported)."""
+    for name in [name for name, entry in ledger.items()
+                 if entry['original'] is None and not (Path(import_dir) / entry['source']).exists()]:
+        del ledger[name]
+
+
+def reserve(ledger, name, source_path, sha256):
+    ledger[name] = {'source': Path(source_path).name, 'sha256': sha256, 'original': None}
+
+
+def complete(ledger, name, original_path):
+    """Record where the original of name ended up in originals/."""
+    if name in ledger:
+        ledger[name]['original'] = Path(original_path).name
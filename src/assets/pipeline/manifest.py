@@ -0,0 +1,301 @@
+"""
+Generated asset manifests.
+
+After each run a script regenerates manifest.json and manifest.js in the
+directory whose outputs it owns (photos/, interactive/live/preview-thumbs/).
+Both describe every published file, keyed by its path relative to that
+directory:
+
+    "portrait/portrait-05.webp": {
+      "width": 1920, "height": 1280, "bytes": 115596, "sha256": "3f1c...",
+      "placeholder": "data:image/webp;base64,...", "color": "#6b5a4e", "dominant": "#2f2b29",
+      "variants": [
+        {"file": "portrait/sizes/portrait-05-480.webp", "format": "webp", "width": 480, ...},
+        {"file": "portrait/portrait-05.avif", "format": "avif", "width": 1920, ...}
+      ]
+    }
+
+manifest.js carries the same data as an ES module whose files are imported
+with Parcel's url: scheme, so the front end looks assets up by path instead
+of keeping one hand-written import line per file:
+
+    import { assets } from '../../interactive/live/preview-thumbs/manifest.js';
+    assets['we-play.webp'].url
+
+The photo manifest.js is in the startup bundle, so it only carries what the
+galleries show: each collection's hero, the numbers photos/galleries.json
+lists (in that order; numbers left out stay published but hidden) and the
+hero thumbnails. It leaves out the sha256 and placeholder (and keeps only
+the format and size of each variant); each gallery's placeholders are in
+<collection>/placeholders.js, loaded on demand:
+
+    import { assets, galleries, placeholders } from '../../assets/photos/manifest.js';
+    galleries.portrait                                  [27, 26, 1, ...]
+    (await placeholders.portrait()).placeholders['portrait/portrait-27.webp']
+
+optimize_photos.py appends each imported number to the end of its
+collection's list; reorder or drop numbers in galleries.json by hand.
+
+When the directory has a sprite atlas (see atlas.py), each member's entry
+also says where it sits in the sheet, in atlas.webp pixels, as long as the
+atlas was built from the file as it is now:
+
+    "we-play.webp": {..., "atlas": {"file": "atlas.webp", "x": 131, "y": 1, "width": 128, "height": 128}}
+
+and atlas.webp itself is listed with atlas@2x.webp among its variants.
+
+A photo with a deep-zoom pyramid (see pyramid.py) says where the site
+serves its .dzi and how large the full image is:
+
+    "astro/astro-03.webp": {..., "tiles": {"url": "/tiles/astro/astro-03.dzi", "width": 7952, "height": 5304}}
+
+Placeholders (see placeholder.py) are always computed from the published
+file itself, never from the pixels an encode started from, so a file gets
+the same placeholder whether it was just encoded, restored from the cache
+or committed long ago. The result is kept in the asset catalog under the
+file's sha256 (and PLACEHOLDER_PARAMS), so each file is decoded for it once.
+
+Every generated file is written atomically, and only when its content
+changed, so a rerun with nothing to do leaves them alone; none of them
+should be edited by hand.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+from PIL import Image
+
+from .atlas import load_atlas
+from .cache import file_sha256, image_size, key_for
+from .encoders import FORMAT_SETTINGS
+from .files import same_file, write_if_changed
+from .ladder import SIZES_DIR
+from .placeholder import PLACEHOLDER_QUALITY, PLACEHOLDER_SIZE, placeholder_meta
+from .pyramid import TILES_DIR, TILES_URL, load_dzi
+
+PLACEHOLDER_PARAMS = {'kind': 'placeholder', 'size': PLACEHOLDER_SIZE, 'quality': PLACEHOLDER_QUALITY}
+
+MANIFEST_JSON = 'manifest.json'
+MANIFEST_JS = 'manifest.js'
+GALLERIES_JSON = 'galleries.json'
+PLACEHOLDERS_JS = 'placeholders.js'
+HERO_THUMBS_DIR = 'hero-thumbs'
+JS_HEADER = "// Generated by src/assets/pipeline/manifest.py - do not edit.\n"
+
+
+def describe(path, root, cache=None):
+    """
+    Size, dimensions and content hash of one file (dimensions omitted if Pillow can't open it).
+
+    With a cache the hash is the catalog's (re-read only when size or mtime
+    change) and the dimensions come from the encode metadata or an earlier
+    run, so an unchanged file is only stat()ed.
+    """
+    sha256 = cache.source_hash(path) if cache else file_sha256(path)
+    entry = {'file': path.relative_to(root).as_posix(), 'format': path.suffix[1:].lower()}
+    entry.update(image_size(path, cache))
+    entry['bytes'] = path.stat().st_size
+    entry['sha256'] = sha256
+    return entry
+
+
+def _ladder_files(path):
+    return sorted((path.parent / SIZES_DIR).glob(f"{path.stem}-*.webp"), key=lambda p: int(p.stem.rsplit('-', 1)[1]))
+
+
+def variant_files(path):
+    """
+    Srcset ladder steps, alternate formats and a high-DPI @2x copy written next to an output.
+
+    A name holding the same file as a gallery image (hero.webp and
+    <collection>-01.webp) shares that image's ladder.
+    """
+    ladder = _ladder_files(path)
+    if not ladder and (path.parent / SIZES_DIR).is_dir():
+        twins = (p for p in sorted(path.parent.glob(f"*{path.suffix}")) if p != path and same_file(p, path))
+        ladder = next((steps for twin in twins if (steps := _ladder_files(twin))), [])
+    alternates = [path.with_suffix(settings['extension']) for name, settings in FORMAT_SETTINGS.items()
+                  if name != 'webp']
+    alternates.append(path.with_name(f"{path.stem}@2x{path.suffix}"))
+    return ladder + [p for p in alternates if p.exists()]
+
+
+def _placeholder(path, sha256, cache):
+    """Placeholder and colors of the published file at path, looked up in the catalog by content hash."""
+    key = key_for(sha256, PLACEHOLDER_PARAMS)
+    meta = cache.lookup_meta(key) if cache else None
+    if meta is None:
+        with Image.open(path) as img:
+            meta = placeholder_meta(img)
+        if cache:
+            cache.store_meta(key, meta)
+    return meta
+
+
+def build_manifest(root, paths, cache=None):
+    """{relative path: entry} for every existing path, in the order given."""
+    root = Path(root)
+    atlas = load_atlas(root) or {'images': {}, 'frames': {}}
+    manifest = {}
+    for path in paths:
+        path = Path(path)
+        if not path.exists():
+            continue
+        entry = describe(path, root, cache)
+        key = entry.pop('file')
+        entry.pop('format')
+        entry.update(_placeholder(path, entry['sha256'], cache))
+        entry['variants'] = [describe(p, root, cache) for p in variant_files(path)]
+        frame = atlas['frames'].get(key)
+        if frame and frame['sha256'] == entry['sha256']:
+            entry['atlas'] = {'file': atlas['images']['1'], **{k: frame[k] for k in ('x', 'y', 'width', 'height')}}
+        dzi = Path(key).with_suffix('.dzi').as_posix()
+        tiles = load_dzi(root / TILES_DIR / dzi)
+        if tiles:
+            entry['tiles'] = {'url': TILES_URL + dzi, 'width': tiles[0], 'height': tiles[1]}
+        manifest[key] = entry
+    return manifest
+
+
+def _js_value(value):
+    """value as JS source; strings of the form @@code@@ become the code itself."""
+    return re.sub(r'"@@(.*?)@@"', r'\1', json.dumps(value, indent=4))
+
+
+def _js_module(exports, imports=()):
+    """ES module text: the imports, then `export const name = value;` for each export."""
+    body = ''.join(f"\nexport const {name} = {_js_value(value)};\n" for name, value in exports.items())
+    return JS_HEADER + ''.join(f"{line}\n" for line in imports) + body
+
+
+def _js_assets(manifest, imports, leave_out=(), variant_keys=None):
+    """
+    manifest entries with a url: import for each file and variant (the import
+    lines go to imports), without the leave_out keys; variant_keys limits
+    what each variant keeps besides its url.
+    """
+    def url(file):
+        name = f"asset{len(imports)}"
+        imports.append(f"import {name} from 'url:./{file}';")
+        return f"@@{name}@@"
+
+    assets = {}
+    for key, entry in manifest.items():
+        entry = {k: v for k, v in entry.items() if k not in leave_out}
+        assets[key] = {'url': url(key), **entry}
+        assets[key]['variants'] = [
+            {'url': url(variant['file']), **{k: v for k, v in variant.items() if variant_keys is None or k in variant_keys}}
+            for variant in entry['variants']
+        ]
+    return assets
+
+
+def _write_files(root, files, count):
+    """Write {name: text} under root, each only if it changed, and report the manifest."""
+    changed = False
+    for name, text in files.items():
+        changed |= write_if_changed(Path(root) / name, text.encode())
+    state = 'updated' if changed else 'up to date'
+    print(f"✓ Manifest {state}: {Path(root) / MANIFEST_JS} ({count} assets)")
+
+
+def write_manifest(root, paths, cache=None):
+    """Rewrite root/manifest.json and root/manifest.js for paths (only if they changed); returns the manifest."""
+    root = Path(root)
+    manifest = build_manifest(root, paths, cache)
+    imports = []
+    assets = _js_assets(manifest, imports)
+    _write_files(root, {MANIFEST_JSON: json.dumps(manifest, indent=2) + '\n',
+                        MANIFEST_JS: _js_module({'assets': assets}, imports)}, len(manifest))
+    return manifest
+
+
+def photo_files(root, collections):
+    """Every published photo: each collection's hero and gallery images, then the hero thumbnails."""
+    root = Path(root)
+    files = []
+    for collection in collections:
+        files.append(root / collection / 'hero.webp')
+        files.extend(sorted((root / collection).glob(f"{collection}-*.webp")))
+    files.extend(sorted((root / 'hero-thumbs').glob('*.webp')))
+    return files
+
+
+def load_galleries(root):
+    """{collection: [gallery numbers in display order]} from root/galleries.json, or {}."""
+    try:
+        with open(Path(root) / GALLERIES_JSON) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def add_to_gallery(root, collection, name):
+    """Append a newly published <collection>-NN.webp to the end of its collection's gallery order."""
+    number = int(Path(name).stem.rsplit('-', 1)[1])
+    galleries = load_galleries(root)
+    order = galleries.setdefault(collection, [])
+    if number in order:
+        return False
+    order.append(number)
+    write_if_changed(Path(root) / GALLERIES_JSON, _galleries_json(galleries).encode())
+    return True
+
+
+def _galleries_json(galleries):
+    # One collection per line keeps hand edits and diffs readable
+    lines = [f"  {json.dumps(c)}: {json.dumps(order)}" for c, order in galleries.items()]
+    return '{\n' + ',\n'.join(lines) + '\n}\n'
+
+
+def gallery_name(collection, number):
+    return f"{collection}/{collection}-{number:02d}.webp"
+
+
+def photo_chunks(collections):
+    """Relative paths of the per-collection placeholder modules."""
+    return [f"{collection}/{PLACEHOLDERS_JS}" for collection in collections]
+
+
+def write_photo_manifest(root, collections, cache=None):
+    """
+    Rewrite the photo manifests; returns the manifest.
+
+    manifest.json lists every published photo. manifest.js, which the
+    startup bundle imports, only carries what the site shows: each
+    collection's hero, its gallery in galleries.json order and the hero
+    thumbnails, without placeholders. The placeholders of each gallery go
+    to <collection>/placeholders.js, which the front end imports when that
+    gallery opens.
+    """
+    root = Path(root)
+    manifest = build_manifest(root, photo_files(root, collections), cache)
+    galleries = {}
+    listed = load_galleries(root)
+    for collection in collections:
+        order = listed.get(collection, [])
+        missing = [n for n in order if gallery_name(collection, n) not in manifest]
+        if missing:
+            print(f"⚠ {GALLERIES_JSON} lists {collection} " + ', '.join(str(n) for n in missing)
+                  + ", which are not published; left out")
+        galleries[collection] = [n for n in order if n not in missing]
+
+    shown = [f"{c}/hero.webp" for c in collections] + [gallery_name(c, n) for c, order in galleries.items() for n in order]
+    shown += [key for key in manifest if key.startswith(f"{HERO_THUMBS_DIR}/")]
+    shown = [key for key in dict.fromkeys(shown) if key in manifest]
+
+    imports = []
+    assets = _js_assets({key: manifest[key] for key in shown}, imports, leave_out=('placeholder', 'sha256'),
+                        variant_keys=('format', 'width', 'height'))
+    loaders = {}
+    files = {MANIFEST_JSON: json.dumps(manifest, indent=2) + '\n'}
+    for chunk_path in photo_chunks(collections):
+        chunk = chunk_path.split('/')[0]
+        placeholders = {key: manifest[key]['placeholder'] for key in shown if key.startswith(f"{chunk}/")}
+        files[chunk_path] = _js_module({'placeholders': placeholders})
+        loaders[chunk] = f"@@() => import('./{chunk_path}')@@"
+    files[MANIFEST_JS] = _js_module({'assets': assets, 'galleries': galleries, 'placeholders': loaders}, imports)
+    _write_files(root, files, len(shown))
+    return manifest
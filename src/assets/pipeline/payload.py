@@ -0,0 +1,366 @@
+"""
+Bytes each route of the site pulls from src/assets, and a budget gate.
+
+    cd src/assets
+    python3 -m pipeline.payload [--verbose]        # report, exit 1 over budget
+    python3 -m pipeline.payload --update-budget    # accept the current payload
+
+The asset references are read from the same files the front end builds
+from, so the report follows the code rather than a hand-kept list:
+
+    index.html, css/style.css        favicons and fonts (every route)
+    Photo/photo-collections.js       hero thumbs and galleries, in the order
+                                     photos/galleries.json gives, resolved
+                                     through photos/manifest.json
+    Installations/project-details.js url: imports per project, video posters
+                                     and preview stills / loops / atlas
+    WebExperiences/project-details.js  web thumbnails or their atlas, resolved
+                                     through the thumbnail manifest
+    Links/link-data.js               links to local files, if any
+    About/about.js                   url: imports
+
+Each file counts as initial (fetched when the route first renders) or
+on-demand (fetched on scroll, hover, expand or play):
+
+    /photo                 hero thumbs
+    /photo/<slug>          first INITIAL_GALLERY_IMAGES gallery images;
+                           the rest of the lazy grid is on-demand
+    /interactive/live      preview atlas (or each preview still); loops
+                           on-demand
+    /interactive/live/<p>  the above plus the project's stills and posters;
+                           videos on-demand
+    /interactive/web       web thumbnail atlas (or each thumbnail)
+
+Sizes are bytes on disk; Parcel copies url: imports unchanged. A file used
+by a route under several names counts once.
+
+The budget lives in payload-budget.json next to this package:
+
+    {"/photo/portrait": {"initial_kb": 1200, "total_kb": 5200,
+                         "files": {"photos/portrait/hero.webp": 107743, ...}}, ...}
+
+--update-budget records the current payload plus --headroom percent. A
+route over its initial or total budget fails the check with a diff of its
+files against the snapshot taken then (added, grown, shrunk, removed).
+Routes missing from the budget are reported but not gated. A referenced
+file missing from the checkout fails the check, and --update-budget
+refuses to record a payload measured without it.
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+from pathlib import Path
+
+from .cache import ASSETS_DIR
+from .files import atomic_write_bytes
+
+SRC_DIR = ASSETS_DIR.parent
+INDEX_HTML = SRC_DIR.parent / 'index.html'
+STYLESHEET = SRC_DIR / 'css' / 'style.css'
+VIEWS_DIR = SRC_DIR / 'views'
+PHOTO_COLLECTIONS_JS = VIEWS_DIR / 'Photo' / 'photo-collections.js'
+INSTALLATIONS_JS = VIEWS_DIR / 'Installations' / 'project-details.js'
+WEB_EXPERIENCES_JS = VIEWS_DIR / 'WebExperiences' / 'project-details.js'
+LINKS_JS = VIEWS_DIR / 'Links' / 'link-data.js'
+ABOUT_JS = VIEWS_DIR / 'About' / 'about.js'
+PHOTO_MANIFEST = ASSETS_DIR / 'photos' / 'manifest.json'
+PHOTO_GALLERIES = ASSETS_DIR / 'photos' / 'galleries.json'
+PREVIEW_MANIFEST = ASSETS_DIR / 'interactive' / 'live' / 'preview-thumbs' / 'manifest.json'
+WEB_THUMBS_MANIFEST = ASSETS_DIR / 'interactive' / 'web' / 'thumbnails' / 'manifest.json'
+BUDGET_JSON = ASSETS_DIR / 'payload-budget.json'
+
+INITIAL_GALLERY_IMAGES = 6  # the lazy grid's first rows, on screen when the page opens
+DEFAULT_HEADROOM = 10
+INITIAL = 'initial'
+ON_DEMAND = 'on-demand'
+VIDEO_EXTENSIONS = ('.mp4', '.webm', '.mov')
+
+URL_IMPORT = re.compile(r"""import\s+(\w+)\s+from\s+['"]url:([^'"]+)['"]""")
+HTML_ASSET = re.compile(r"""href="(\./src/assets/[^"]+)\"""")
+CSS_URL = re.compile(r"""url\(\s*['"]?([^'")]+)['"]?\s*\)""")
+
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def _blocks(text, key):
+    """(value, body) for each object literal introduced by `key: '<value>'`, up to the next one."""
+    pattern = re.compile(rf"""{key}:\s*['"]([^'"]+)['"](.*?)(?={key}:\s*['"]|\Z)""", re.S)
+    return pattern.findall(text)
+
+
+def url_imports(js_path):
+    """{imported name: resolved Path} for the `url:` imports of a module."""
+    js_path = Path(js_path)
+    return {name: (js_path.parent / target).resolve() for name, target in URL_IMPORT.findall(_read(js_path))}
+
+
+def _in_assets(path):
+    return Path(path).resolve().is_relative_to(ASSETS_DIR)
+
+
+def _load_manifest(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def shared_files():
+    """Favicons linked from index.html and fonts from style.css: every route loads them."""
+    files = [INDEX_HTML.parent / href for href in HTML_ASSET.findall(_read(INDEX_HTML))]
+    files += [STYLESHEET.parent / url for url in CSS_URL.findall(_read(STYLESHEET))]
+    return [(p.resolve(), INITIAL) for p in files if _in_assets(p)]
+
+
+def photo_routes():
+    """/photo and /photo/<slug> from photo-collections.js and galleries.json, resolved through the photo manifest."""
+    root = PHOTO_MANIFEST.parent
+    manifest = _load_manifest(PHOTO_MANIFEST)
+    galleries = _load_manifest(PHOTO_GALLERIES)
+
+    def photo(key):
+        if key not in manifest:
+            raise ValueError(f"{PHOTO_COLLECTIONS_JS.name} uses {key}, which is not in {PHOTO_MANIFEST.name}")
+        return (root / key).resolve()
+
+    landing = []
+    routes = {}
+    for slug, body in _blocks(_read(PHOTO_COLLECTIONS_JS), 'slug'):
+        thumb = re.search(r"heroImageThumb:\s*photo\('([^']+)'\)", body)
+        if thumb:
+            landing.append((photo(thumb.group(1)), INITIAL))
+        gallery = re.search(r"gallery\('([\w-]+)'\)", body)
+        if not gallery:
+            continue
+        keys = [f"{slug}/hero.webp"] + [f"{slug}/{slug}-{n:02d}.webp" for n in galleries.get(gallery.group(1), [])]
+        routes[f"/photo/{slug}"] = [(photo(key), INITIAL if i < INITIAL_GALLERY_IMAGES else ON_DEMAND)
+                                    for i, key in enumerate(keys)]
+    return {'/photo': landing, **routes}
+
+
+def live_routes():
+    """/interactive/live and one route per project in project-details.js."""
+    imports = url_imports(INSTALLATIONS_JS)
+    previews = _load_manifest(PREVIEW_MANIFEST) if PREVIEW_MANIFEST.exists() else {}
+    preview_root = PREVIEW_MANIFEST.parent
+
+    def preview(key):
+        return (preview_root / key).resolve() if key in previews else None
+
+    landing = []
+    projects = {}
+    for slug, body in _blocks(_read(INSTALLATIONS_JS), 'slug'):
+        files = []
+        images = re.search(r"images:\s*\[(.*?)\]", body, re.S)
+        for name in re.findall(r'\w+', images.group(1)) if images else []:
+            if name in imports:
+                path = imports[name]
+                files.append((path, ON_DEMAND if path.suffix.lower() in VIDEO_EXTENSIONS else INITIAL))
+        posters = re.search(r"thumbnails:\s*\{(.*?)\}", body, re.S)
+        for _, name in re.findall(r"\[(\w+)\]:\s*(\w+)", posters.group(1)) if posters else []:
+            if name in imports:
+                files.append((imports[name], INITIAL))
+        projects[f"/interactive/live/{slug}"] = files
+
+        still = re.search(r"previewThumbnail:\s*previewThumbs\['([^']+)'\]", body)
+        entry = previews.get(still.group(1)) if still else None
+        if entry and entry.get('atlas'):
+            landing.append((preview(entry['atlas']['file']), INITIAL))
+        elif entry:
+            landing.append((preview(still.group(1)), INITIAL))
+        loop = re.search(r"previewLoop:\s*previewThumbs\['([^']+)'\]", body)
+        if loop and preview(loop.group(1)):
+            landing.append((preview(loop.group(1)), ON_DEMAND))
+
+    routes = {'/interactive/live': landing}
+    for route, files in projects.items():
+        routes[route] = landing + files
+    return routes
+
+
+def web_routes():
+    """/interactive/web: the thumbnail atlas, or each thumbnail, resolved through the web thumbnail manifest."""
+    thumbs = _load_manifest(WEB_THUMBS_MANIFEST) if WEB_THUMBS_MANIFEST.exists() else {}
+    files = []
+    for key in re.findall(r"image:\s*webThumbs\['([^']+)'\]", _read(WEB_EXPERIENCES_JS)):
+        entry = thumbs.get(key)
+        if entry:
+            files.append(((WEB_THUMBS_MANIFEST.parent / entry.get('atlas', {}).get('file', key)).resolve(), INITIAL))
+    return {'/interactive/web': files}
+
+
+def links_routes():
+    """/links: link-data.js entries pointing at a file under src/assets (the rest are external)."""
+    files = []
+    for url in re.findall(r"""url:\s*['"]([^'"]+)['"]""", _read(LINKS_JS)):
+        path = (LINKS_JS.parent / url).resolve()
+        if '://' not in url and path.is_file() and _in_assets(path):
+            files.append((path, ON_DEMAND))
+    return {'/links': files}
+
+
+def about_routes():
+    return {'/about': [(p, INITIAL) for p in url_imports(ABOUT_JS).values() if _in_assets(p)]}
+
+
+def route_files():
+    """{route: [(Path, INITIAL or ON_DEMAND)]}, shared files included, each file once per route."""
+    shared = shared_files()
+    routes = {'/': [], '/interactive': []}
+    for collect in (photo_routes, live_routes, web_routes, links_routes, about_routes):
+        routes.update(collect())
+    result = {}
+    for route, files in routes.items():
+        seen = {}
+        for path, when in shared + files:
+            # Fetched up front for any reason means initial
+            if seen.get(path) != INITIAL:
+                seen[path] = when
+        result[route] = seen
+    return result
+
+
+def measure(routes):
+    """{route: {'initial', 'on_demand', 'files': {relative path: bytes}, 'missing': [...]}}."""
+    report = {}
+    for route, files in routes.items():
+        totals = {'initial': 0, 'on_demand': 0, 'files': {}, 'missing': []}
+        for path, when in files.items():
+            name = path.relative_to(ASSETS_DIR).as_posix()
+            if not path.exists():
+                totals['missing'].append(name)
+                continue
+            size = path.stat().st_size
+            totals['files'][name] = size
+            totals['initial' if when == INITIAL else 'on_demand'] += size
+        report[route] = totals
+    return report
+
+
+def _kb(size):
+    return f"{size / 1024:.0f}KB"
+
+
+def print_payload(report, verbose=False, routes=None):
+    print(f"{'route':<34} {'initial':>9} {'on-demand':>10} {'total':>9} {'files':>6}")
+    for route, totals in report.items():
+        print(f"{route:<34} {_kb(totals['initial']):>9} {_kb(totals['on_demand']):>10} "
+              f"{_kb(totals['initial'] + totals['on_demand']):>9} {len(totals['files']):>6}")
+        for name in totals['missing']:
+            print(f"  ✗ {name} is referenced but missing")
+        if verbose:
+            for name, size in sorted(totals['files'].items(), key=lambda item: -item[1]):
+                when = routes[route][ASSETS_DIR / name] if routes else ''
+                print(f"    {_kb(size):>8}  {when:<9}  {name}")
+
+
+def load_budget(path=BUDGET_JSON):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def budget_for(report, headroom=DEFAULT_HEADROOM):
+    """A budget allowing headroom percent over the current payload, with a snapshot of its files."""
+    def allowance(size):
+        return math.ceil(size * (1 + headroom / 100) / 1024)
+    return {
+        route: {'initial_kb': allowance(totals['initial']),
+                'total_kb': allowance(totals['initial'] + totals['on_demand']),
+                'files': dict(sorted(totals['files'].items()))}
+        for route, totals in report.items()
+    }
+
+
+def file_diff(snapshot, files):
+    """Lines describing how files changed since the budget snapshot, largest change first."""
+    changes = []
+    for name in set(snapshot) | set(files):
+        before, after = snapshot.get(name), files.get(name)
+        if before == after:
+            continue
+        if before is None:
+            changes.append((after, f"+ {name}  {_kb(after)}"))
+        elif after is None:
+            changes.append((-before, f"- {name}  {_kb(before)}"))
+        else:
+            changes.append((after - before, f"{'↑' if after > before else '↓'} {name}  "
+                                            f"{_kb(before)} -> {_kb(after)} ({after - before:+,d} bytes)"))
+    return [line for _, line in sorted(changes, key=lambda change: -abs(change[0]))]
+
+
+def check_budget(report, budget):
+    """Print a verdict per budgeted route; returns the routes over budget."""
+    over = []
+    for route, totals in report.items():
+        limits = budget.get(route)
+        if limits is None:
+            print(f"⚠ {route}: no budget")
+            continue
+        measured = {'initial_kb': totals['initial'] / 1024,
+                    'total_kb': (totals['initial'] + totals['on_demand']) / 1024}
+        exceeded = [(key, measured[key], limits[key]) for key in ('initial_kb', 'total_kb')
+                    if key in limits and measured[key] > limits[key]]
+        if not exceeded:
+            continue
+        over.append(route)
+        for key, value, limit in exceeded:
+            print(f"✗ {route} {key[:-3]}: {value:.0f}KB over its {limit}KB budget "
+                  f"(+{value - limit:.0f}KB, +{(value - limit) / limit * 100:.0f}%)")
+        for line in file_diff(limits.get('files', {}), totals['files']):
+            print(f"    {line}")
+    for route in budget:
+        if route not in report:
+            print(f"⚠ {route} is in the budget but no longer a route")
+    return over
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report per-route payload from src/assets and check it against the budget")
+    parser.add_argument('--budget', type=Path, default=BUDGET_JSON,
+                        help=f'Budget file (default: src/assets/{BUDGET_JSON.name})')
+    parser.add_argument('--update-budget', action='store_true',
+                        help='Write the current payload plus --headroom to the budget file instead of checking it')
+    parser.add_argument('--headroom', type=float, default=DEFAULT_HEADROOM,
+                        help='Percent allowed over the current payload when updating the budget (default: %(default)s)')
+    parser.add_argument('--verbose', '-v', action='store_true', help='List every file per route')
+    args = parser.parse_args()
+
+    routes = route_files()
+    report = measure(routes)
+    print_payload(report, args.verbose, routes)
+    print()
+
+    # Without them the payload is understated, so neither check nor record it
+    missing = sorted({name for totals in report.values() for name in totals['missing']})
+    if missing:
+        print(f"✗ {len(missing)} referenced file(s) missing from the checkout; restore them before "
+              f"{'updating' if args.update_budget else 'checking'} the budget")
+        return 1
+
+    if args.update_budget:
+        atomic_write_bytes(args.budget, (json.dumps(budget_for(report, args.headroom), indent=2) + '\n').encode())
+        print(f"✓ Budget updated: {args.budget} ({len(report)} routes, {args.headroom:g}% headroom)")
+        return 0
+
+    budget = load_budget(args.budget)
+    if not budget:
+        print(f"⚠ No budget at {args.budget}; run with --update-budget to record one")
+        return 0
+    over = check_budget(report, budget)
+    if over:
+        print(f"\n✗ {len(over)} route(s) over budget. Shrink the files above, or accept the new payload "
+              f"with --update-budget")
+        return 1
+    print(f"✓ All {sum(route in budget for route in report)} budgeted routes within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Low-quality placeholders and representative colors.
+
+For every output the manifest carries:
+
+    'placeholder': 'data:image/webp;base64,...'   ~32px blurred WebP (a few hundred bytes)
+    'color': '#6b5a4e'                            average color
+    'dominant': '#2f2b29'                         most common coarse color
+
+so the front end can paint a frame immediately and swap in the real image
+once it has loaded. Both are computed from the published file, so they
+describe exactly the bytes the site serves (see manifest.py). The color
+statistics are a couple of NumPy passes over the 32px thumbnail, so the
+cost per file is the decode.
+"""
+
+import base64
+import io
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+PLACEHOLDER_SIZE = 32
+PLACEHOLDER_QUALITY = 40
+COLOR_BITS = 4  # per channel when binning for the dominant color
+
+
+def _hex(rgb):
+    return '#' + ''.join(f"{int(round(c)):02x}" for c in rgb)
+
+
+def tiny(img, size=PLACEHOLDER_SIZE):
+    """img shrunk so its longest side is size (integer reduce first, then one small resize)."""
+    factor = max(img.size) // (size * 2)
+    if factor >= 2:
+        img = img.reduce(factor)
+    scale = size / max(img.size)
+    if scale < 1:
+        img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))),
+                         Image.Resampling.BOX)
+    return img.convert('RGB')
+
+
+def colors(small):
+    """(average, dominant) hex colors of a small RGB image."""
+    pixels = np.asarray(small, dtype=np.uint8).reshape(-1, 3)
+    average = pixels.mean(axis=0)
+
+    shift = 8 - COLOR_BITS
+    bins = pixels >> shift
+    index = (bins[:, 0].astype(np.int32) << (2 * COLOR_BITS)) | (bins[:, 1].astype(np.int32) << COLOR_BITS) | bins[:, 2]
+    counts = np.bincount(index, minlength=1 << (3 * COLOR_BITS))
+    dominant = pixels[index == counts.argmax()].mean(axis=0)
+    return _hex(average), _hex(dominant)
+
+
+def data_uri(small):
+    buffer = io.BytesIO()
+    small.filter(ImageFilter.GaussianBlur(1)).save(buffer, 'WEBP', quality=PLACEHOLDER_QUALITY, method=6)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def placeholder_meta(img):
+    """{'placeholder', 'color', 'dominant'} for an image."""
+    small = tiny(img)
+    average, dominant = colors(small)
+    return {'placeholder': data_uri(small), 'color': average, 'dominant': dominant}
@@ -0,0 +1,268 @@
+"""
+Deep-zoom tile pyramids, so an original can be viewed at full resolution.
+
+Published photos stop at 1920px. For collections that want more (astro),
+each recorded original also gets a Deep Zoom (DZI) pyramid, the layout
+OpenSeadragon and most IIIF-era viewers read directly:
+
+    photos/tiles/astro/astro-03.dzi              size, tile size, overlap, format
+    photos/tiles/astro/astro-03_files/13/4_7.webp   level 13, column 4, row 7
+
+Level L is the image scaled by 1 / 2^(max - L), max being the level at
+full size, down to level 0 at 1x1. Every level is cut into TILE_SIZE
+tiles with OVERLAP pixels shared with each neighbour, so a viewer only
+fetches the tiles covering the viewport at the current zoom.
+
+The original is decoded once, and rows flow down the levels in bands: a
+level cuts a row of tiles as soon as it holds those rows (plus overlap),
+averages each pair of rows 2x2 into the level below, and then drops what
+it no longer needs. Only about one tile row per level is held besides
+the source band. Large TIFFs (see tiled.py) are read strip by strip, so
+the full-resolution frame never has to be in memory either; other
+formats are decoded whole once. The tiles are WebP-encoded by a process
+pool as they are cut, with at most IN_FLIGHT_PER_WORKER per worker
+waiting.
+
+A pyramid is written to <name>_files.partial/ and renamed into place
+before the .dzi is written, so a viewer sees the old pyramid or the new
+one. The catalog records the .dzi under the original's hash and
+PYRAMID_PARAMS, so unchanged originals are skipped. The pyramids are
+static files fetched by URL (not through Parcel); npm run deploy copies
+photos/tiles/ to /tiles/ on the site, the URL the manifest gives.
+"""
+
+import os
+import re
+import shutil
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from .files import atomic_write_bytes
+from .ingest import load_original
+from .tiled import open_large_tiff
+from .trace import stage
+from .workers import resolve_jobs
+
+TILE_SIZE = 256
+OVERLAP = 1
+TILE_FORMAT = 'webp'
+TILE_QUALITY = 80
+TILES_DIR = 'tiles'
+TILES_URL = '/tiles/'
+IN_FLIGHT_PER_WORKER = 4
+PYRAMID_PARAMS = {'kind': 'dzi', 'tile_size': TILE_SIZE, 'overlap': OVERLAP, 'format': TILE_FORMAT,
+                  'quality': TILE_QUALITY, 'downsample': 'box-2x2'}
+
+DZI_SIZE = re.compile(r'<Size\s+Width="(\d+)"\s+Height="(\d+)"')
+
+
+def max_level(width, height):
+    """Index of the full-size level: ceil(log2(longest side))."""
+    return (max(width, height) - 1).bit_length()
+
+
+def level_size(width, height, level):
+    scale = 1 << (max_level(width, height) - level)
+    return -(-width // scale), -(-height // scale)
+
+
+def pyramid_paths(root, collection, name):
+    """(.dzi, tile folder) for a published image name in collection, under root."""
+    dzi = Path(root) / TILES_DIR / collection / f"{Path(name).stem}.dzi"
+    return dzi, dzi.with_name(f"{dzi.stem}_files")
+
+
+def dzi_xml(width, height):
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" Format="{TILE_FORMAT}" '
+            f'Overlap="{OVERLAP}" TileSize="{TILE_SIZE}">\n'
+            f'  <Size Width="{width}" Height="{height}"/>\n'
+            f'</Image>\n')
+
+
+def load_dzi(path):
+    """(width, height) from a .dzi, or None."""
+    try:
+        with open(path) as f:
+            match = DZI_SIZE.search(f.read())
+    except OSError:
+        return None
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def _rgb8(band, tiff):
+    """A LargeTiff band as 8-bit RGB, transparency flattened onto white like load_original."""
+    pixels = band.astype(np.float32) / 257 if tiff.bits == 16 else band.astype(np.float32)
+    if tiff.samples in (2, 4):
+        alpha = pixels[..., -1:] / 255
+        pixels = pixels[..., :-1] * alpha + 255 * (1 - alpha)
+    if pixels.shape[2] == 1:
+        pixels = np.repeat(pixels, 3, axis=2)
+    return np.rint(pixels).astype(np.uint8)
+
+
+def source_bands(input_path):
+    """(width, height, iterator of (rows, width, 3) uint8 bands from top to bottom) for an original."""
+    tiff = open_large_tiff(input_path)
+    if tiff is not None and tiff.orientation == 1:
+        return tiff.width, tiff.height, (_rgb8(band, tiff) for band in tiff.bands())
+
+    # Rotated large TIFFs and everything else: one full decode
+    with stage('decode', input_path):
+        pixels = np.asarray(load_original(input_path))
+    height, width = pixels.shape[:2]
+    return width, height, (pixels[top:top + TILE_SIZE] for top in range(0, height, TILE_SIZE))
+
+
+def _halve(rows):
+    """2x2 box average; an odd last column is paired with itself, a single row is averaged across only."""
+    if rows.shape[1] % 2:
+        rows = np.concatenate([rows, rows[:, -1:]], axis=1)
+    if len(rows) == 1:
+        rows = np.concatenate([rows, rows])
+    height, width, samples = rows.shape
+    reduced = rows.reshape(height // 2, 2, width // 2, 2, samples).mean(axis=(1, 3), dtype=np.float32)
+    return np.rint(reduced).astype(np.uint8)
+
+
+class Level:
+    """One pyramid level fed rows from the top down; cuts tiles and feeds the level below."""
+
+    def __init__(self, level, width, height, cut, below=None):
+        self.level = level
+        self.width = width
+        self.height = height
+        self.cut = cut              # cut(level, column, row, pixels)
+        self.below = below
+        self.rows = np.empty((0, width, 3), np.uint8)
+        self.top = 0                # row of the image self.rows starts at
+        self.tile_row = 0           # next row of tiles to cut
+        self.odd_row = None         # waiting for its pair before going to the level below
+
+    def push(self, band):
+        self.rows = np.concatenate([self.rows, band]) if len(self.rows) else band
+        self._cut_ready()
+        if self.below is not None:
+            if self.odd_row is not None:
+                band = np.concatenate([self.odd_row, band])
+                self.odd_row = None
+            if len(band) % 2:
+                self.odd_row = band[-1:].copy()
+                band = band[:-1]
+            if len(band):
+                self.below.push(_halve(band))
+
+    def finish(self):
+        if self.below is not None:
+            if self.odd_row is not None:
+                self.below.push(_halve(self.odd_row))
+            self.below.finish()
+
+    def _cut_ready(self):
+        available = self.top + len(self.rows)
+        while self.tile_row * TILE_SIZE < self.height:
+            start = max(0, self.tile_row * TILE_SIZE - OVERLAP)
+            end = min(self.height, (self.tile_row + 1) * TILE_SIZE + OVERLAP)
+            if end > available:
+                return
+            strip = self.rows[start - self.top:end - self.top]
+            for column in range(-(-self.width // TILE_SIZE)):
+                left = max(0, column * TILE_SIZE - OVERLAP)
+                right = min(self.width, (column + 1) * TILE_SIZE + OVERLAP)
+                self.cut(self.level, column, self.tile_row, np.ascontiguousarray(strip[:, left:right]))
+            self.tile_row += 1
+            # Keep only the rows the next tile row overlaps
+            keep = self.tile_row * TILE_SIZE - OVERLAP
+            self.rows = self.rows[keep - self.top:]
+            self.top = keep
+
+
+def encode_tile(pixels, path, quality=TILE_QUALITY):
+    """Write one tile; returns its size in bytes."""
+    Image.fromarray(pixels).save(path, 'WEBP', quality=quality, method=4)
+    return os.path.getsize(path)
+
+
+def build_pyramid(input_path, dzi_path, jobs=1):
+    """
+    Write the DZI pyramid of input_path (tiles encoded on jobs workers).
+    Returns {'width', 'height', 'levels', 'tiles', 'bytes'}.
+    """
+    dzi_path = Path(dzi_path)
+    files_dir = dzi_path.with_name(f"{dzi_path.stem}_files")
+    partial = files_dir.with_name(files_dir.name + '.partial')
+    shutil.rmtree(partial, ignore_errors=True)
+
+    width, height, bands = source_bands(input_path)
+    top = max_level(width, height)
+    for level in range(top + 1):
+        (partial / str(level)).mkdir(parents=True)
+
+    jobs = resolve_jobs(jobs)
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    pending = deque()
+    written = []
+
+    def cut(level, column, row, pixels):
+        path = partial / str(level) / f"{column}_{row}.{TILE_FORMAT}"
+        if pool is None:
+            written.append(encode_tile(pixels, path))
+            return
+        pending.append(pool.submit(encode_tile, pixels, path))
+        while len(pending) > jobs * IN_FLIGHT_PER_WORKER:
+            written.append(pending.popleft().result())
+
+    # Level 0 first, so each level can hand its rows to the one below; rows enter at full size
+    head = None
+    for level in range(top + 1):
+        head = Level(level, *level_size(width, height, level), cut, head)
+    try:
+        with stage('encode', input_path):
+            for band in bands:
+                head.push(band)
+            head.finish()
+            while pending:
+                written.append(pending.popleft().result())
+    except BaseException:
+        shutil.rmtree(partial, ignore_errors=True)
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    with stage('write', input_path):
+        shutil.rmtree(files_dir, ignore_errors=True)
+        os.replace(partial, files_dir)
+        atomic_write_bytes(dzi_path, dzi_xml(width, height).encode())
+    return {'width': width, 'height': height, 'levels': top + 1, 'tiles': len(written), 'bytes': sum(written)}
+
+
+def write_pyramids(cache, items, jobs=1):
+    """
+    Build the pyramid of every (original, .dzi path) in items whose catalog
+    record is stale. Returns {'built', 'fresh', 'failed'}.
+    """
+    summary = {'built': 0, 'fresh': 0, 'failed': []}
+    for original, dzi_path in items:
+        dzi_path = Path(dzi_path)
+        key = cache.make_key(original, **PYRAMID_PARAMS)
+        if cache.is_fresh(key, dzi_path) and dzi_path.with_name(f"{dzi_path.stem}_files").is_dir():
+            summary['fresh'] += 1
+            continue
+        dzi_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            meta = build_pyramid(original, dzi_path, jobs)
+        except Exception as e:
+            print(f"✗ Error tiling {original}: {e}")
+            summary['failed'].append(str(original))
+            continue
+        cache.store(key, dzi_path, original, meta, keep_blob=False)
+        cache.commit()
+        summary['built'] += 1
+        print(f"✓ Tiled {original} -> {dzi_path}: {meta['width']}x{meta['height']}, {meta['levels']} levels, "
+              f"{meta['tiles']} tiles, {meta['bytes']/1024/1024:.1f}MB")
+    return summary
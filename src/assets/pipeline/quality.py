@@ -0,0 +1,138 @@
+"""
+Perceptual quality search for WebP encodes.
+
+Instead of a fixed quality, a variant can ask for a target SSIM: the encoder
+quality is binary-searched for the lowest setting whose decoded result still
+scores at least the target against the uncompressed pixels. Flat images
+(astro skies) land well below the old fixed 85; busy ones (stage lighting,
+crowds) are allowed to go above it.
+
+SSIM is computed on luma with 8x8 box windows. Window sums come from 2D
+cumulative sums (integral images), so the whole map is a handful of
+vectorized NumPy passes - a 1920px frame scores in tens of milliseconds and
+a full search is ~7 encodes.
+"""
+
+import io
+
+import numpy as np
+from PIL import Image
+
+DEFAULT_TARGET_SSIM = 0.985
+QUALITY_FLOOR = 40
+QUALITY_CEILING = 95
+
+WINDOW = 8
+C1 = (0.01 * 255) ** 2
+C2 = (0.03 * 255) ** 2
+
+
+def _luma(img):
+    return np.asarray(img.convert('L'), dtype=np.float64)
+
+
+def _window_means(x, size=WINDOW):
+    """Mean over every size x size window (valid positions only), via an integral image."""
+    integral = np.zeros((x.shape[0] + 1, x.shape[1] + 1))
+    integral[1:, 1:] = x.cumsum(axis=0).cumsum(axis=1)
+    sums = (integral[size:, size:] - integral[:-size, size:]
+            - integral[size:, :-size] + integral[:-size, :-size])
+    return sums / (size * size)
+
+
+def ssim(reference, candidate):
+    """Mean SSIM between two same-sized PIL images (1.0 = identical)."""
+    x = _luma(reference)
+    y = _luma(candidate)
+    if min(x.shape) < WINDOW:
+        return 1.0 if np.array_equal(x, y) else 0.0
+
+    mu_x = _window_means(x)
+    mu_y = _window_means(y)
+    var_x = _window_means(x * x) - mu_x * mu_x
+    var_y = _window_means(y * y) - mu_y * mu_y
+    cov_xy = _window_means(x * y) - mu_x * mu_y
+
+    ssim_map = ((2 * mu_x * mu_y + C1) * (2 * cov_xy + C2)) / (
+        (mu_x * mu_x + mu_y * mu_y + C1) * (var_x + var_y + C2)
+    )
+    return float(ssim_map.mean())
+
+
+def decode_score(img, data, decode=None):
+    """SSIM of encoded bytes against the pixels they were encoded from."""
+    if decode is not None:
+        return ssim(img, decode(data))
+    with Image.open(io.BytesIO(data)) as decoded:
+        return ssim(img, decoded)
+
+
+def search_quality(img, encode_at, target, floor=QUALITY_FLOOR, ceiling=QUALITY_CEILING, decode=None):
+    """
+    Binary-search the lowest quality whose encode scores >= target SSIM.
+
+    encode_at(quality) must return encoded bytes; decode(data), if given,
+    turns them back into an image for formats Pillow can't open. Returns
+    (quality, data, score); if even the ceiling misses the target, the
+    ceiling encode is returned.
+    """
+    best = None
+    lo, hi = floor, ceiling
+    while lo <= hi:
+        quality = (lo + hi) // 2
+        data = encode_at(quality)
+        score = decode_score(img, data, decode)
+        if score >= target:
+            best = (quality, data, score)
+            hi = quality - 1
+        else:
+            lo = quality + 1
+
+    if best is None:
+        data = encode_at(ceiling)
+        best = (ceiling, data, decode_score(img, data, decode))
+    return best
+
+
+def add_quality_arguments(parser):
+    """Add the --target-ssim flag the scripts share."""
+    parser.add_argument('--target-ssim', type=float, nargs='?', const=DEFAULT_TARGET_SSIM, default=None,
+                        help=f'Search encoder quality per image for this SSIM instead of using the '
+                             f'fixed quality (bare flag = {DEFAULT_TARGET_SSIM})')
+
+
+def with_target(params, target_ssim):
+    """params plus the quality-search target, or params unchanged when target_ssim is None."""
+    if target_ssim is None:
+        return params
+    return dict(params, target_ssim=target_ssim)
+
+
+def print_savings_report(groups):
+    """
+    Print bytes saved by the quality search versus the fixed-quality baseline.
+
+    groups is a list of (label, metas) where each meta is the encode metadata
+    the cache stored for one output.
+    """
+    rows = []
+    for label, metas in groups:
+        searched = [m for m in metas if 'baseline_bytes' in m]
+        if searched:
+            rows.append((label, searched))
+    if not rows:
+        return
+
+    print("\n--- Quality search vs fixed quality ---")
+    total_bytes = total_baseline = 0
+    for label, metas in rows:
+        size = sum(m['bytes'] for m in metas)
+        baseline = sum(m['baseline_bytes'] for m in metas)
+        qualities = [m['quality'] for m in metas]
+        total_bytes += size
+        total_baseline += baseline
+        print(f"  {label}: {len(metas)} files, {size/1024:.1f}KB vs {baseline/1024:.1f}KB "
+              f"({(baseline - size)/1024:+.1f}KB saved, quality {min(qualities)}-{max(qualities)})")
+    if total_baseline:
+        print(f"  Total: {(total_baseline - total_bytes)/1024:+.1f}KB saved "
+              f"({(total_baseline - total_bytes) / total_baseline * 100:.1f}%)")
@@ -0,0 +1,211 @@
+"""
+Resumable re-encode of published files from their originals.
+
+rebuild() takes RebuildItems - one per published file (or set of linked
+files), each an IngestJob naming the published paths - and never writes
+those paths while encoding. Every output is written to the same relative
+path under .rebuild/ instead, in batches of BATCH_PER_WORKER x jobs files.
+After each batch the asset catalog is committed and .rebuild/checkpoint.json
+lists the items whose staged outputs are complete:
+
+    {
+      "settings": {...},
+      "done": ["portrait/portrait-07.webp", ...],
+      "swapping": {"astro": [[".rebuild/astro/astro-03.webp", "astro/astro-03.webp"], ...]},
+      "swapped": ["portrait"]
+    }
+
+A run that stops (Ctrl-C, a crash) picks up from the checkpoint when it is
+started again with the same settings; different settings discard the staged
+files and start over.
+
+Items belong to a group (a collection), and a group is only swapped in
+once every one of its items is staged. The renames are written to the
+checkpoint first and then each staged file is os.replace()d over its
+published name, so a swap cut short is finished before anything else on the
+next run: a group is either all old or all new. Items whose published files
+are already exactly this encode (per the catalog) are left alone.
+"""
+
+import json
+import os
+import shutil
+from collections import namedtuple
+from pathlib import Path
+
+from .files import atomic_write_bytes
+from .ingest import IngestJob, Variant
+from .workers import ingest_all, resolve_jobs
+
+REBUILD_DIR = '.rebuild'
+CHECKPOINT_NAME = 'checkpoint.json'
+BATCH_PER_WORKER = 8
+
+# name: label used in the checkpoint and reports; group: swapped in together
+RebuildItem = namedtuple('RebuildItem', 'name group job')
+
+
+def staged_path(path, root='.'):
+    return Path(root) / REBUILD_DIR / os.path.relpath(path, root)
+
+
+def staged_job(job, root='.'):
+    """job with every output moved under the staging directory."""
+    variants = [Variant(v.params, [staged_path(p, root) for p in v.output_paths]) for v in job.variants]
+    for variant in variants:
+        for path in variant.output_paths:
+            path.parent.mkdir(parents=True, exist_ok=True)
+    return IngestJob(job.input_path, variants)
+
+
+def checkpoint_path(root='.'):
+    return Path(root) / REBUILD_DIR / CHECKPOINT_NAME
+
+
+def load_checkpoint(root='.'):
+    try:
+        with open(checkpoint_path(root)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_checkpoint(root, state):
+    checkpoint_path(root).parent.mkdir(exist_ok=True)
+    atomic_write_bytes(checkpoint_path(root), (json.dumps(state, indent=2) + '\n').encode())
+
+
+def _plain(settings):
+    return json.loads(json.dumps(settings, sort_keys=True, default=str))
+
+
+def is_published(cache, job):
+    """True if every published output of job is already exactly this encode."""
+    return all(cache.is_fresh(cache.make_key(job.input_path, **v.params), v.output_paths) for v in job.variants)
+
+
+def is_staged(item, root='.'):
+    return all(staged_path(p, root).exists() for v in item.job.variants for p in v.output_paths)
+
+
+def finish_swap(pairs):
+    """Move staged files over their published names (those already moved on an earlier attempt are gone)."""
+    for staged, published in pairs:
+        if os.path.exists(staged):
+            os.replace(staged, published)
+
+
+def record_swapped(cache, items):
+    """Point the catalog at the published names the staged encodes now live under."""
+    for item in items:
+        for variant in item.job.variants:
+            key = cache.make_key(item.job.input_path, **variant.params)
+            cache.record_outputs(key, variant.output_paths, item.job.input_path)
+
+
+def rebuild(cache, items, settings, jobs=1, root='.', on_swapped=None):
+    """
+    Re-encode items and swap each finished group in.
+
+    settings describes the encode (params, widths, ...) and decides whether a
+    checkpoint can be resumed. on_swapped(group, items) runs after a group's
+    files are in place. Returns {'rebuilt', 'unchanged', 'failed', 'groups'}:
+    item counts, failed item names and the groups swapped in.
+    """
+    root = Path(root)
+    settings = _plain(settings)
+    by_group = {}
+    for item in items:
+        by_group.setdefault(item.group, []).append(item)
+
+    state = load_checkpoint(root)
+    if state is not None:
+        # Finish a swap that was cut short before anything else, whatever the settings
+        for group, pairs in state['swapping'].items():
+            print(f"  Finishing the interrupted swap of {group}")
+            finish_swap(pairs)
+            if state['settings'] == settings and group in by_group:
+                record_swapped(cache, [item for item in by_group[group] if item.name in state['done']])
+                if on_swapped is not None:
+                    on_swapped(group, [item for item in by_group[group] if item.name in state['done']])
+            state['swapped'].append(group)
+        state['swapping'] = {}
+        if state['settings'] != settings:
+            print(f"  Settings changed since the interrupted rebuild; starting over")
+            state = None
+        else:
+            print(f"  Resuming: {len(state['done'])} files already staged, "
+                  f"{len(state['swapped'])} collections already swapped in")
+    if state is None:
+        shutil.rmtree(root / REBUILD_DIR, ignore_errors=True)
+        state = {'settings': settings, 'done': [], 'swapping': {}, 'swapped': []}
+        save_checkpoint(root, state)
+
+    done = set(state['done'])
+    unchanged = set()
+    pending = []
+    for item in items:
+        if item.group in state['swapped']:
+            continue
+        if item.name in done and is_staged(item, root):
+            continue
+        done.discard(item.name)
+        if is_published(cache, item.job):
+            unchanged.add(item.name)
+        else:
+            pending.append(item)
+    state['done'] = sorted(done)
+
+    print(f"  {len(pending)} files to re-encode, {len(done)} staged by an earlier run, {len(unchanged)} unchanged")
+    failed = []
+    batch_size = BATCH_PER_WORKER * resolve_jobs(jobs)
+    try:
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            statuses = ingest_all(cache, [staged_job(item.job, root) for item in batch], jobs)
+            for item, item_statuses in zip(batch, statuses):
+                if all(item_statuses):
+                    done.add(item.name)
+                else:
+                    failed.append(item.name)
+            cache.commit()
+            state['done'] = sorted(done)
+            save_checkpoint(root, state)
+            print(f"  Checkpoint: {len(done)} files staged, {len(pending) - start - len(batch)} to go")
+    except KeyboardInterrupt:
+        print(f"\n  Interrupted; run the rebuild again with the same settings to resume")
+        raise
+
+    swapped = []
+    for group, group_items in by_group.items():
+        if group in state['swapped']:
+            continue
+        missing = [item.name for item in group_items if item.name not in done and item.name not in unchanged]
+        if missing:
+            print(f"  ✗ Keeping the published {group} files: {len(missing)} could not be re-encoded")
+            continue
+        staged_items = [item for item in group_items if item.name in done]
+        if not staged_items:
+            print(f"  ✓ {group}: up to date")
+            continue
+        pairs = [[str(staged_path(p, root)), str(p)]
+                 for item in staged_items for v in item.job.variants for p in v.output_paths]
+        state['swapping'][group] = pairs
+        save_checkpoint(root, state)
+        finish_swap(pairs)
+        record_swapped(cache, staged_items)
+        if on_swapped is not None:
+            on_swapped(group, staged_items)
+        del state['swapping'][group]
+        state['swapped'].append(group)
+        cache.commit()
+        save_checkpoint(root, state)
+        swapped.append(group)
+        print(f"  ✓ Swapped in {group}: {len(staged_items)} re-encoded, "
+              f"{sum(item.name in unchanged for item in group_items)} unchanged")
+
+    if failed:
+        print(f"  Staged files and the checkpoint stay in {REBUILD_DIR}/ for the next run")
+    else:
+        shutil.rmtree(root / REBUILD_DIR, ignore_errors=True)
+    return {'rebuilt': len(done), 'unchanged': len(unchanged), 'failed': failed, 'groups': swapped}
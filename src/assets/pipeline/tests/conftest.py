@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from pipeline.cache import AssetCache
+
+
+@pytest.fixture
+def make_image(tmp_path):
+    """Write a seeded noise-and-gradient image to tmp_path/name and return its path."""
+    def make(name, size=(320, 240), mode='RGB', seed=0):
+        rng = np.random.default_rng(seed)
+        w, h = size
+        gradient = np.linspace(0, 255, w, dtype=np.float32)[None, :, None].repeat(h, 0).repeat(3, 2)
+        pixels = np.clip(gradient + rng.normal(0, 24, (h, w, 3)), 0, 255).astype(np.uint8)
+        path = tmp_path / name
+        Image.fromarray(pixels).convert(mode).save(path)
+        return path
+    return make
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AssetCache(tmp_path / 'cache.sqlite')
+    yield cache
+    cache.close()
@@ -0,0 +1,47 @@
+from PIL import Image
+
+from pipeline.bench import CORPUS, compare, make_corpus
+
+SCALE = 0.02
+
+
+def test_corpus_is_deterministic(tmp_path):
+    first = make_corpus(tmp_path / 'a', SCALE)
+    second = make_corpus(tmp_path / 'b', SCALE)
+    assert list(first) == list(CORPUS)
+    for name in CORPUS:
+        assert first[name].read_bytes() == second[name].read_bytes(), name
+
+
+def test_corpus_is_reused(tmp_path):
+    corpus = make_corpus(tmp_path, SCALE)
+    mtimes = {name: path.stat().st_mtime_ns for name, path in corpus.items()}
+    assert {name: path.stat().st_mtime_ns for name, path in make_corpus(tmp_path, SCALE).items()} == mtimes
+    assert not list(corpus['rgb-12mp'].parent.glob('.partial-*'))
+
+
+def test_corpus_covers_each_input_kind(tmp_path):
+    corpus = make_corpus(tmp_path, SCALE)
+    for name, (width, height, mode, extension, orientation) in CORPUS.items():
+        assert corpus[name].suffix == extension
+        if mode == 'RGB;16':
+            continue  # Pillow can't open 16-bit RGB TIFFs; ingest streams them itself
+        with Image.open(corpus[name]) as img:
+            assert img.size == (max(16, round(width * SCALE)), max(16, round(height * SCALE)))
+            assert img.mode == (mode if extension == '.png' else 'RGB')
+            assert img.getexif().get(0x0112) == orientation
+
+
+def _case(image, seconds):
+    return {'script': 'optimize_photos', 'image': image, 'seconds': seconds, 'output_bytes': 1000,
+            'peak_rss_mb': 10}
+
+
+def test_compare_counts_only_real_slowdowns(capsys):
+    baseline = {'cases': [_case('big', 1.0), _case('tiny', 0.01), _case('steady', 1.0)]}
+    current = {'cases': [_case('big', 1.5), _case('tiny', 0.02), _case('steady', 1.05), _case('new', 1.0)]}
+    assert compare(current, baseline, threshold=0.10) == 1
+    output = capsys.readouterr().out
+    assert '✗ optimize_photos big' in output
+    assert '✓ optimize_photos tiny' in output
+    assert 'new' not in output
@@ -0,0 +1,96 @@
+import itertools
+import random
+
+import pytest
+
+from pipeline.budget import allocate, pareto, parse_budgets
+
+
+def _candidates(rng):
+    """A synthetic measure() grid: bytes and SSIM both fall with size and quality, with some noise."""
+    candidates = []
+    for size, quality in itertools.product((1920, 1600, 1280), range(85, 35, -5)):
+        scale = (size / 1920) ** 2 * (0.3 + quality / 100)
+        candidates.append({'max_size': size, 'quality': quality, 'bytes': int(rng.uniform(0.8, 1.2) * scale * 400_000),
+                           'ssim': round(1 - (1 - scale / 1.15) * rng.uniform(0.05, 0.1), 5)})
+    return candidates
+
+
+def _items(seed):
+    rng = random.Random(seed)
+    items = [{'copies': 1, 'groups': ['astro', 'photo'], 'bytes': 0, 'front': pareto(_candidates(rng))}
+             for _ in range(2)]
+    items.append({'copies': 2, 'groups': ['portrait', 'photo'], 'bytes': 0, 'front': pareto(_candidates(rng))})
+    items.append({'copies': 1, 'groups': ['portrait', 'photo'], 'bytes': 150_000, 'front': None})
+    return items
+
+
+def _sums(items, choice):
+    sums = {}
+    for item, k in zip(items, choice):
+        for name in item['groups']:
+            size = item['bytes'] if k is None else item['front'][k]['bytes']
+            sums[name] = sums.get(name, 0) + size * item['copies']
+    return sums
+
+
+def _feasible(items, budgets):
+    """Every choice that fits every budget (brute force)."""
+    options = [range(len(item['front'])) if item['front'] else [None] for item in items]
+    for choice in itertools.product(*options):
+        if all(total <= budgets[name] for name, total in _sums(items, choice).items()):
+            yield choice
+
+
+def test_pareto_front_drops_dominated_candidates():
+    front = pareto([{'bytes': 100, 'ssim': 0.9}, {'bytes': 120, 'ssim': 0.85}, {'bytes': 90, 'ssim': 0.92},
+                    {'bytes': 200, 'ssim': 0.99}])
+    assert front == [{'bytes': 90, 'ssim': 0.92}, {'bytes': 200, 'ssim': 0.99}]
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('tightness', [0.55, 0.7, 0.85])
+def test_allocation_fits_and_cannot_be_improved(seed, tightness):
+    items = _items(seed)
+    top = _sums(items, [len(item['front']) - 1 if item['front'] else None for item in items])
+    budgets = {name: int(total * tightness) for name, total in top.items()}
+
+    choice, sums, over = allocate(items, budgets)
+    assert over == []
+    assert sums == _sums(items, choice)
+    assert all(sums[name] <= budget for name, budget in budgets.items())
+
+    def scores(c):
+        return [item['front'][k]['ssim'] for item, k in zip(items, c) if k is not None]
+
+    feasible = list(_feasible(items, budgets))
+    # The worst image is as good as any allocation within budget can make it...
+    assert min(scores(choice)) == max(min(scores(c)) for c in feasible)
+    # ...and no allocation within budget is at least as good everywhere and better somewhere
+    for other in feasible:
+        assert not (all(o >= s for o, s in zip(scores(other), scores(choice))) and scores(other) != scores(choice))
+
+
+def test_roomy_budget_keeps_the_normal_encode():
+    items = _items(0)
+    choice, sums, over = allocate(items, {'astro': 10 ** 9, 'portrait': 10 ** 9, 'photo': 10 ** 9})
+    assert over == []
+    assert choice == [len(item['front']) - 1 if item['front'] else None for item in items]
+
+
+def test_infeasible_budget_takes_the_cheapest_and_reports_it():
+    items = _items(1)
+    budgets = {'astro': 10 ** 9, 'portrait': 200_000, 'photo': 10 ** 9}
+    choice, sums, over = allocate(items, budgets)
+    assert over == ['portrait']
+    assert choice[2] == 0
+    assert sums['portrait'] == items[2]['front'][0]['bytes'] * 2 + 150_000
+    # The budgets that can be met still spend what they have
+    assert choice[:2] == [len(items[0]['front']) - 1, len(items[1]['front']) - 1]
+
+
+def test_parse_budgets():
+    assert parse_budgets('portrait=4.5MB, astro=800KB,photo=1000') == {
+        'portrait': int(4.5 * 1024 * 1024), 'astro': 800 * 1024, 'photo': 1000}
+    with pytest.raises(ValueError):
+        parse_budgets('portrait')
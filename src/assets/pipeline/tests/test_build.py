@@ -0,0 +1,77 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pipeline.build import Node, build, stale_reason
+from pipeline.ingest import IngestJob, Variant, fit_params
+
+
+def _graph(tmp_path, gallery_quality=80, thumb_size=64):
+    """
+    gallery (a.png -> a.webp) --> thumb (a.webp -> b.webp) --> manifest (b.webp, c.webp -> manifest.json)
+    other   (c.png -> c.webp) ----------------------------------/
+    """
+    def encode_node(name, deps, source, params, output):
+        return Node(name, tmp_path, deps, lambda cache: [Path(source)], params, lambda: [Path(output)],
+                    lambda cache: ([IngestJob(Path(source), [Variant(params, [Path(output)])])], None))
+
+    def manifest(cache):
+        def finish(statuses):
+            Path('manifest.json').write_text(json.dumps({p: os.path.getsize(p) for p in ('b.webp', 'c.webp')}))
+        return [], finish
+
+    return [
+        encode_node('gallery', [], 'a.png', fit_params('gallery', 160, gallery_quality), 'a.webp'),
+        encode_node('thumb', ['gallery'], 'a.webp', fit_params('thumb', thumb_size, 80), 'b.webp'),
+        encode_node('other', [], 'c.png', fit_params('other', 160, 80), 'c.webp'),
+        Node('manifest', tmp_path, ['thumb', 'other'], lambda cache: [Path('b.webp'), Path('c.webp')], {},
+             lambda: [Path('manifest.json')], manifest),
+    ]
+
+
+@pytest.fixture
+def built(make_image, tmp_path, cache, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # stale_reason() resolves a node's paths in its directory, as build() does
+    make_image('a.png', seed=1)
+    make_image('c.png', seed=2)
+    assert set(build(cache, _graph(tmp_path)).values()) == {'built'}
+    assert set(build(cache, _graph(tmp_path)).values()) == {'fresh'}
+
+
+def _rebuilt(cache, nodes, **kwargs):
+    return sorted(name for name, state in build(cache, nodes, **kwargs).items() if state != 'fresh')
+
+
+def test_source_change_rebuilds_its_branch(built, make_image, tmp_path, cache):
+    make_image('a.png', seed=3)
+    assert _rebuilt(cache, _graph(tmp_path)) == ['gallery', 'manifest', 'thumb']
+    assert _rebuilt(cache, _graph(tmp_path)) == []
+
+
+def test_param_change_rebuilds_the_node_and_what_reads_its_output(built, tmp_path, cache):
+    assert stale_reason(cache, _graph(tmp_path, thumb_size=48)[1]) == 'params changed: max_size 64 -> 48'
+    assert _rebuilt(cache, _graph(tmp_path, thumb_size=48)) == ['manifest', 'thumb']
+
+
+def test_missing_output_restored_with_the_same_bytes_stops_there(built, tmp_path, cache):
+    (tmp_path / 'c.webp').unlink()
+    assert stale_reason(cache, _graph(tmp_path)[2]) == 'output missing: c.webp'
+    # Restored from the cache, so the manifest's inputs hash the same as before
+    assert _rebuilt(cache, _graph(tmp_path)) == ['other']
+
+
+def test_touched_output_reruns_only_its_node(built, tmp_path, cache):
+    (tmp_path / 'manifest.json').write_text('{}')
+    assert stale_reason(cache, _graph(tmp_path)[3]) == 'output changed since the last build: manifest.json'
+    assert _rebuilt(cache, _graph(tmp_path)) == ['manifest']
+    assert json.loads((tmp_path / 'manifest.json').read_text())
+
+
+def test_dry_run_changes_nothing(built, make_image, tmp_path, cache):
+    make_image('c.png', seed=4)
+    before = (tmp_path / 'c.webp').read_bytes()
+    state = build(cache, _graph(tmp_path), dry_run=True)
+    assert state == {'gallery': 'fresh', 'thumb': 'fresh', 'other': 'stale', 'manifest': 'fresh'}
+    assert (tmp_path / 'c.webp').read_bytes() == before
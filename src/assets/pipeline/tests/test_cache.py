@@ -0,0 +1,89 @@
+import os
+
+from pipeline.cache import AssetCache
+
+
+def _encode(cache, source, output, data, **params):
+    """Stand-in for an encode: write data to output and record it under source + params."""
+    key = cache.make_key(source, **params)
+    output.write_bytes(data)
+    cache.store(key, output, source, meta={'bytes': len(data)})
+    return key
+
+
+def test_unchanged_output_is_fresh(make_image, tmp_path, cache):
+    source = make_image('src.png')
+    output = tmp_path / 'out.webp'
+    key = _encode(cache, source, output, b'encoded', quality=85)
+
+    assert cache.is_fresh(key, output)
+    assert cache.make_key(source, quality=85) == key
+    assert not cache.is_fresh(cache.make_key(source, quality=80), output)
+    assert cache.output_meta(output) == {'bytes': 7}
+
+
+def test_edited_source_gets_a_new_key(make_image, tmp_path, cache):
+    source = make_image('src.png', seed=1)
+    output = tmp_path / 'out.webp'
+    key = _encode(cache, source, output, b'encoded', quality=85)
+
+    make_image('src.png', seed=2)
+    os.utime(source, ns=(1, 1))  # so the (size, mtime) memo notices even on a coarse clock
+    assert cache.make_key(source, quality=85) != key
+    assert not cache.is_fresh(cache.make_key(source, quality=85), output)
+
+
+def test_modified_output_is_stale(make_image, tmp_path, cache):
+    source = make_image('src.png')
+    output = tmp_path / 'out.webp'
+    key = _encode(cache, source, output, b'encoded', quality=85)
+
+    output.write_bytes(b'edited by hand')
+    assert not cache.is_fresh(key, output)
+
+
+def test_deleted_output_is_restored_from_the_blob(make_image, tmp_path, cache):
+    source = make_image('src.png')
+    output, copy = tmp_path / 'out.webp', tmp_path / 'copy.webp'
+    key = _encode(cache, source, output, b'encoded', quality=85)
+
+    output.unlink()
+    assert not cache.is_fresh(key, output)
+    assert cache.restore(key, [output, copy], source)
+    assert output.read_bytes() == copy.read_bytes() == b'encoded'
+    assert cache.is_fresh(key, [output, copy])
+    assert not cache.restore(cache.make_key(source, quality=1), output)
+
+
+def test_force_bypasses_freshness(make_image, tmp_path):
+    source = make_image('src.png')
+    output = tmp_path / 'out.webp'
+    with AssetCache(tmp_path / 'cache.sqlite') as cache:
+        key = _encode(cache, source, output, b'encoded', quality=85)
+
+    with AssetCache(tmp_path / 'cache.sqlite', force=True) as forced:
+        assert not forced.is_fresh(key, output)
+        assert not forced.restore(key, output)
+        assert forced.lookup_meta(key) is None
+        _encode(forced, source, output, b'encoded again', quality=85)
+
+    with AssetCache(tmp_path / 'cache.sqlite') as cache:
+        assert cache.is_fresh(key, output)
+        assert cache.output_meta(output) == {'bytes': 13}
+
+
+def test_least_recently_used_blobs_are_evicted(make_image, tmp_path):
+    source = make_image('src.png')
+    outputs = [tmp_path / f"out-{n}.webp" for n in range(3)]
+    with AssetCache(tmp_path / 'cache.sqlite', max_bytes=250) as cache:
+        keys = [_encode(cache, source, output, bytes(100), n=n) for n, output in enumerate(outputs[:2])]
+        assert cache.is_fresh(keys[0], outputs[0])  # touch: out-1 is now the least recently used
+        keys.append(_encode(cache, source, outputs[2], bytes(100), n=2))
+
+        for output in outputs:
+            output.unlink()
+        assert cache.restore(keys[0], outputs[0])
+        assert not cache.restore(keys[1], outputs[1])
+        assert cache.restore(keys[2], outputs[2])
+        # Metadata is never evicted
+        assert cache.lookup_meta(keys[1]) == {'bytes': 100}
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+from PIL import Image
+
+from pipeline import dedupe
+from pipeline.bench import make_image as make_photo
+from pipeline.dedupe import DHASH_MAX_DISTANCE, HASH_BITS, PerceptualIndex, build_index, hamming, image_hashes
+
+
+def _flip(value, bits):
+    for bit in bits:
+        value ^= 1 << bit
+    return value
+
+
+def test_bands_cover_every_bit_once():
+    for max_distance in (0, 8, 15):
+        index = PerceptualIndex(max_distance)
+        covered = 0
+        for shift, mask in index.layout:
+            assert covered & (mask << shift) == 0
+            covered |= mask << shift
+        assert covered == (1 << HASH_BITS) - 1
+        assert len(index.layout) == max_distance + 1
+    with pytest.raises(ValueError):
+        PerceptualIndex(16)
+
+
+def test_find_within_max_distance():
+    index = PerceptualIndex(8)
+    dhash, phash = 0x0123456789abcdef, 0xfedcba9876543210
+    index.add('a.webp', (dhash, phash))
+    assert index.find((dhash, phash)) == ('a.webp', 0)
+    # One flipped bit in every other band still leaves a band that matches exactly
+    assert index.find((dhash, _flip(phash, range(0, 64, 8)))) == ('a.webp', 8)
+    assert index.find((dhash, _flip(phash, range(0, 63, 7)))) is None
+    assert index.find((_flip(dhash, range(DHASH_MAX_DISTANCE + 1)), phash)) is None
+    assert index.find(None) is None
+
+
+def test_find_agrees_with_a_full_scan():
+    rng = random.Random(18)
+    index = PerceptualIndex(8)
+    entries = [(f"{i}.webp", (rng.getrandbits(64), rng.getrandbits(64))) for i in range(300)]
+    for label, hashes in entries:
+        index.add(label, hashes)
+
+    for _, (dhash, phash) in rng.sample(entries, 100):
+        query = (_flip(dhash, rng.sample(range(64), rng.randint(0, 6))),
+                 _flip(phash, rng.sample(range(64), rng.randint(0, 10))))
+        within = [hamming(query[1], p) for _, (d, p) in entries
+                  if hamming(query[1], p) <= 8 and hamming(query[0], d) <= DHASH_MAX_DISTANCE]
+        found = index.find(query)
+        assert (found[1] if found else None) == (min(within) if within else None)
+
+
+def test_resized_copy_matches_and_other_photo_does_not(tmp_path, cache):
+    # The benchmark's photo-like content (gradients and blobs), not plain noise
+    published = tmp_path / 'published.png'
+    make_photo(published, 640, 480, 'RGB', None, seed=1)
+    make_photo(tmp_path / 'other.png', 640, 480, 'RGB', None, seed=2)
+    with Image.open(published) as img:
+        img.resize((300, 225), Image.Resampling.LANCZOS).save(tmp_path / 'copy.jpg', quality=50)
+
+    index = build_index(cache, [published], root=tmp_path)
+    copy, other = image_hashes(cache, [tmp_path / 'copy.jpg', tmp_path / 'other.png'])
+    assert index.find(copy)[0] == 'published.png'
+    assert index.find(other) is None
+
+
+def test_hashes_come_from_the_catalog_on_rerun(make_image, cache, monkeypatch):
+    path = make_image('src.png')
+    first = image_hashes(cache, [path])
+
+    def fail(paths):
+        raise AssertionError('hashed again')
+    monkeypatch.setattr(dedupe, 'compute_hashes', fail)
+    assert image_hashes(cache, [path]) == first
@@ -0,0 +1,101 @@
+import argparse
+
+import pytest
+from PIL import Image
+
+from pipeline import encoders
+from pipeline.encoders import Encoder, alternate_path, get_encoder, parse_formats, with_formats
+from pipeline.ingest import encode_variant, fit_params
+
+
+class FakeEncoder(Encoder):
+    """A 'jxl' backend that returns fixed bytes and decodes to a fixed image."""
+
+    def __init__(self, available, data=b'', decoded=None):
+        super().__init__('jxl')
+        self._available = available
+        self.data = data
+        self.decoded = decoded
+
+    def available(self):
+        return self._available
+
+    def encode(self, img, quality):
+        return self.data
+
+    def decode(self, data):
+        return self.decoded
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    """Swap in fake jxl backends (and forget already-resolved encoders)."""
+    monkeypatch.setattr(encoders, '_resolved', {})
+
+    def use(*candidates):
+        monkeypatch.setitem(encoders.BACKENDS, 'jxl', list(candidates))
+    return use
+
+
+def test_parse_formats():
+    assert parse_formats('JXL, webp,avif,avif') == ['avif', 'jxl']
+    assert parse_formats('webp') == []
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_formats('avif,heic')
+
+
+def test_with_formats_and_alternate_path():
+    params = fit_params('photo', 1920, 85)
+    assert with_formats(params, []) is params
+    assert with_formats(params, ('avif',)) == dict(params, formats=['avif'])
+    assert alternate_path('photos/astro/hero.webp', 'avif') == 'photos/astro/hero.avif'
+
+
+def test_get_encoder_picks_the_first_available_backend(backends):
+    first, second = FakeEncoder(False), FakeEncoder(True)
+    backends(first, second)
+    assert get_encoder('jxl') is second
+    assert get_encoder('heic') is None
+
+
+def test_get_encoder_without_a_codec(backends):
+    backends(FakeEncoder(False))
+    assert get_encoder('jxl') is None
+
+
+def test_alternate_is_kept_only_when_smaller(backends):
+    img = Image.new('RGB', (64, 48), (200, 40, 90))
+    params = dict(fit_params('test', 64, 80), formats=['jxl'])
+
+    backends(FakeEncoder(True, data=b'x', decoded=img.copy()))
+    data, meta, alternates = encode_variant(img, params)
+    assert alternates == {'jxl': b'x'}
+    assert meta['alternates']['jxl']['bytes'] == 1
+
+    encoders._resolved.clear()
+    backends(FakeEncoder(True, data=b'x' * (len(data) + 1), decoded=img.copy()))
+    _, meta, alternates = encode_variant(img, params)
+    assert alternates == {}
+    assert meta['alternates'] == {'jxl': None}
+
+
+def test_avif_round_trip(make_image):
+    encoder = get_encoder('avif')
+    if encoder is None:
+        pytest.skip('no AVIF encoder installed')
+    with Image.open(make_image('src.png', size=(96, 64))) as img:
+        decoded = encoder.decode(encoder.encode(img, 60))
+    assert decoded.size == (96, 64)
+    assert decoded.mode == 'RGB'
+
+
+def test_backend_missing_a_method_fails_when_created():
+    class NoDecode(Encoder):
+        def available(self):
+            return True
+
+        def encode(self, img, quality):
+            return b''
+
+    with pytest.raises(TypeError):
+        NoDecode('jxl')
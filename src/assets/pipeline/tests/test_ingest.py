@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from pipeline import ingest
+from pipeline.ingest import (Variant, decode_original, derive_order, encode_original, fit_params, load_original,
+                             square_params)
+from pipeline.tiled import open_large_tiff
+
+
+def _ladder(tmp_path, sizes=(400, 200, 100)):
+    cascade = list(sizes)
+    return [Variant(dict(fit_params('test', size, 80), cascade=cascade), [tmp_path / f"out-{size}.webp"])
+            for size in sizes]
+
+
+def test_derive_order_is_largest_first(tmp_path):
+    variants = [Variant(fit_params('test', size, 80), []) for size in (100, 400, 200)]
+    assert derive_order(variants) == [1, 2, 0]
+
+
+def test_source_is_decoded_once(make_image, tmp_path, monkeypatch):
+    source = make_image('src.png', size=(800, 600))
+    calls = []
+    load_original = ingest.load_original
+    monkeypatch.setattr(ingest, 'load_original', lambda *args: calls.append(args) or load_original(*args))
+
+    variants = _ladder(tmp_path) + [Variant(square_params('square', 64, 80), [tmp_path / 'square.webp'])]
+    assert all(encode_original(source, variants))
+    assert len(calls) == 1
+
+
+def test_cascade_step_matches_when_encoded_alone(make_image, tmp_path):
+    source = make_image('src.png', size=(800, 600))
+    variants = _ladder(tmp_path)
+
+    together = encode_original(source, variants)
+    for variant, (data, meta, _) in zip(variants, together):
+        alone_data, alone_meta, _ = encode_original(source, [variant])[0]
+        assert alone_data == data
+        assert (alone_meta['width'], alone_meta['height']) == (meta['width'], meta['height'])
+
+
+def test_square_crop_does_not_depend_on_other_variants(make_image, tmp_path):
+    source = make_image('src.png', size=(800, 600))
+    square = Variant(square_params('square', 64, 80), [tmp_path / 'square.webp'])
+
+    alone = encode_original(source, [square])[0]
+    together = encode_original(source, _ladder(tmp_path) + [square])[-1]
+    assert alone[0] == together[0]
+    assert (alone[1]['width'], alone[1]['height']) == (64, 64)
+
+
+def test_reduced_decode_keeps_full_decode_dimensions(make_image, tmp_path):
+    source = make_image('src.jpg', size=(1601, 1067))
+    full = Variant(fit_params('test', 300, 80), [tmp_path / 'full.webp'])
+    reduced = Variant(dict(full.params, reduced_decode=True), [tmp_path / 'reduced.webp'])
+
+    full_meta = encode_original(source, [full])[0][1]
+    reduced_meta = encode_original(source, [reduced])[0][1]
+    assert (reduced_meta['width'], reduced_meta['height']) == (full_meta['width'], full_meta['height']) == (300, 199)
+
+
+def test_16_bit_tiff_matches_the_streamed_path(tmp_path):
+    source = tmp_path / 'stack.tif'
+    gradient = np.linspace(0, 65535, 1000)[None, :].repeat(1000, 0)
+    Image.fromarray(np.rint(gradient).astype(np.uint16)).save(source)
+    streamed = Variant(dict(fit_params('test', 1000, 80), memory_limit_mb=1), [])
+    assert open_large_tiff(source, 1) is not None
+
+    whole = np.asarray(load_original(source), dtype=np.int16)
+    reduced = np.asarray(decode_original(source, [streamed]), dtype=np.int16)
+    assert whole.shape == reduced.shape == (1000, 1000, 3)
+    assert np.abs(whole - reduced).max() <= 1
+    assert whole[:, 500].mean() == pytest.approx(128, abs=1)
@@ -0,0 +1,57 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from pipeline.ledger import load_ledger, save_ledger
+from pipeline.workers import ingest_all
+
+SCRIPT = Path(__file__).resolve().parents[2] / 'photos' / 'optimize_photos.py'
+
+
+@pytest.fixture
+def optimize_photos():
+    spec = importlib.util.spec_from_file_location('optimize_photos', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def collection(make_image, tmp_path, monkeypatch, optimize_photos):
+    """astro/ with three published images imported from originals recorded in the ledger."""
+    monkeypatch.chdir(tmp_path)
+    originals_dir = tmp_path / 'astro' / 'originals'
+    originals_dir.mkdir(parents=True)
+    ledger = {}
+    jobs = []
+    for n in (1, 2, 3):
+        original = make_image(f"astro/originals/IMG_{n}.png", size=(480, 320), seed=n)
+        name = f"astro-{n:02d}.webp"
+        ledger[name] = {'source': original.name, 'sha256': 'unused', 'original': original.name}
+        jobs.append(optimize_photos.IngestJob(original, optimize_photos.gallery_variants('astro', name, widths=[])))
+    save_ledger(originals_dir, ledger)
+    return jobs
+
+
+def _published(tmp_path):
+    return {p.name: p.read_bytes() for p in sorted((tmp_path / 'astro').glob('astro-*.webp'))}
+
+
+def test_rebuild_keeps_the_budget_encodes(collection, optimize_photos, tmp_path, cache):
+    ingest_all(cache, collection)
+    normal = sum(len(data) for data in _published(tmp_path).values())
+    budget = int(normal * 0.75)
+
+    optimize_photos.apply_budgets(cache, ['astro'], {'astro': budget})
+    budgeted = _published(tmp_path)
+    params = {name: entry['params'] for name, entry in load_ledger(tmp_path / 'astro' / 'originals').items()}
+    assert sum(len(data) for data in budgeted.values()) <= budget
+    assert any(p['quality'] < optimize_photos.PHOTO_PARAMS['quality'] for p in params.values())
+
+    result = optimize_photos.rebuild_library(cache, ['astro'], widths=[])
+    assert result['failed'] == []
+    assert _published(tmp_path) == budgeted
+    ledger = load_ledger(tmp_path / 'astro' / 'originals')
+    assert {name: entry['params'] for name, entry in ledger.items()} == params
+
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from pipeline import pyramid
+from pipeline.pyramid import (Level, _halve, build_pyramid, level_size, load_dzi, max_level, pyramid_paths,
+                              write_pyramids)
+
+TILE = 16
+
+
+@pytest.fixture(autouse=True)
+def small_tiles(monkeypatch):
+    monkeypatch.setattr(pyramid, 'TILE_SIZE', TILE)
+
+
+def _pixels(width, height, seed=25):
+    return np.random.default_rng(seed).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+def _reference_levels(pixels):
+    """Every level, full size, from halving the whole level above (an odd last row on its own)."""
+    levels = [pixels]
+    height, width = pixels.shape[:2]
+    for level in range(max_level(width, height) - 1, -1, -1):
+        above = levels[0]
+        even = len(above) - len(above) % 2
+        halves = [_halve(above[:even])] if even else []
+        if len(above) % 2:
+            halves.append(_halve(above[-1:]))
+        levels.insert(0, np.concatenate(halves))
+        assert levels[0].shape[:2] == level_size(width, height, level)[::-1]
+    return levels
+
+
+def test_level_sizes():
+    assert max_level(600, 400) == 10
+    assert max_level(512, 512) == 9
+    assert level_size(600, 400, 10) == (600, 400)
+    assert level_size(600, 400, 9) == (300, 200)
+    assert level_size(600, 400, 1) == (2, 1)
+    assert level_size(600, 400, 0) == (1, 1)
+
+
+@pytest.mark.parametrize('width, height, band', [(100, 70, 16), (64, 64, 7), (33, 90, 1)])
+def test_tiles_match_the_whole_level(width, height, band):
+    pixels = _pixels(width, height)
+    tiles = {}
+    head = None
+    for level in range(max_level(width, height) + 1):
+        head = Level(level, *level_size(width, height, level),
+                     lambda *args: tiles.setdefault(args[:3], args[3]), head)
+    for top in range(0, height, band):
+        head.push(pixels[top:top + band])
+    head.finish()
+
+    for level, full in enumerate(_reference_levels(pixels)):
+        level_height, level_width = full.shape[:2]
+        columns, rows = -(-level_width // TILE), -(-level_height // TILE)
+        cut = {(c, r): tile for (l, c, r), tile in tiles.items() if l == level}
+        assert set(cut) == {(c, r) for c in range(columns) for r in range(rows)}
+        for (c, r), tile in cut.items():
+            # Each tile overlaps its neighbours by OVERLAP pixels, clipped at the edges
+            left, top = max(0, c * TILE - 1), max(0, r * TILE - 1)
+            right, bottom = min(level_width, (c + 1) * TILE + 1), min(level_height, (r + 1) * TILE + 1)
+            assert np.array_equal(tile, full[top:bottom, left:right]), (level, c, r)
+
+
+def test_build_pyramid_writes_dzi_and_tiles(tmp_path, cache):
+    source = tmp_path / 'astro-01.png'
+    Image.fromarray(_pixels(50, 30)).save(source)
+    dzi, files_dir = pyramid_paths(tmp_path, 'astro', 'astro-01.webp')
+
+    assert write_pyramids(cache, [(source, dzi)]) == {'built': 1, 'fresh': 0, 'failed': []}
+    assert load_dzi(dzi) == (50, 30)
+    assert sorted(int(p.name) for p in files_dir.iterdir()) == list(range(max_level(50, 30) + 1))
+    assert sorted(p.name for p in (files_dir / '6').iterdir()) == [f"{c}_{r}.webp" for c in range(4) for r in range(2)]
+    with Image.open(files_dir / '6' / '3_1.webp') as tile:
+        assert tile.size == (50 - 47, 30 - 15)
+    assert not files_dir.with_name(files_dir.name + '.partial').exists()
+
+    assert write_pyramids(cache, [(source, dzi)]) == {'built': 0, 'fresh': 1, 'failed': []}
+
+
+def test_failed_pyramid_leaves_no_partial(tmp_path, cache):
+    source = tmp_path / 'broken.png'
+    source.write_bytes(b'not an image')
+    dzi, files_dir = pyramid_paths(tmp_path, 'astro', 'broken.webp')
+    assert write_pyramids(cache, [(source, dzi)])['failed'] == [str(source)]
+    assert not dzi.exists()
+    with pytest.raises(Exception):
+        build_pyramid(source, dzi)
+    assert not files_dir.with_name(files_dir.name + '.partial').exists()
@@ -0,0 +1,58 @@
+import io
+
+import pytest
+from PIL import Image, ImageFilter
+
+from pipeline.quality import decode_score, search_quality, ssim, with_target
+
+
+@pytest.fixture
+def img(make_image):
+    with Image.open(make_image('src.png', size=(160, 120))) as img:
+        return img.copy()
+
+
+def _blurred(img, quality):
+    """Stand-in decoder: the lower the quality byte, the blurrier the image."""
+    return img.filter(ImageFilter.GaussianBlur((100 - quality) / 20))
+
+
+def test_ssim_is_one_for_identical_images(img):
+    assert ssim(img, img.copy()) == pytest.approx(1.0)
+    assert ssim(img, _blurred(img, 40)) < ssim(img, _blurred(img, 80)) < 1.0
+
+
+def test_search_finds_the_lowest_passing_quality(img):
+    target = ssim(img, _blurred(img, 70))
+    quality, data, score = search_quality(img, lambda q: bytes([q]), target,
+                                          decode=lambda data: _blurred(img, data[0]))
+    assert quality == min(q for q in range(40, 96) if ssim(img, _blurred(img, q)) >= target)
+    assert data == bytes([quality])
+    assert score >= target
+
+
+def test_search_returns_the_ceiling_when_the_target_is_out_of_reach(img):
+    quality, data, score = search_quality(img, lambda q: bytes([q]), 1.5,
+                                          decode=lambda data: _blurred(img, data[0]))
+    assert (quality, data) == (95, bytes([95]))
+    assert score < 1.5
+
+
+def test_search_with_webp(img):
+    def encode_at(quality):
+        buffer = io.BytesIO()
+        img.save(buffer, 'WEBP', quality=quality, method=4)
+        return buffer.getvalue()
+
+    quality, data, score = search_quality(img, encode_at, 0.95)
+    assert score >= 0.95
+    assert score == decode_score(img, data)
+    if quality > 40:
+        assert decode_score(img, encode_at(quality - 1)) < 0.95
+
+
+def test_with_target_only_adds_a_set_target():
+    params = {'kind': 'photo', 'quality': 85}
+    assert with_target(params, None) is params
+    assert with_target(params, 0.99) == {'kind': 'photo', 'quality': 85, 'target_ssim': 0.99}
+    assert 'target_ssim' not in params
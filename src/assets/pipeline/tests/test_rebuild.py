@@ -0,0 +1,118 @@
+import pytest
+from PIL import Image
+
+from pipeline import rebuild as rebuild_module
+from pipeline.ingest import IngestJob, Variant, fit_params
+from pipeline.rebuild import REBUILD_DIR, RebuildItem, load_checkpoint, rebuild
+
+SETTINGS = {'params': fit_params('test', 100, 80)}
+OLD = b'old encode'
+
+
+@pytest.fixture
+def library(make_image, tmp_path):
+    """Two groups of two published files (holding OLD), each with an original."""
+    items = []
+    for group in ('astro', 'portrait'):
+        (tmp_path / group).mkdir()
+        for n in (1, 2):
+            source = make_image(f"{group}-{n}.png", seed=n)
+            published = tmp_path / group / f"{group}-{n:02d}.webp"
+            published.write_bytes(OLD)
+            items.append(RebuildItem(f"{group}/{published.name}", group,
+                                     IngestJob(source, [Variant(SETTINGS['params'], [published])])))
+    return items
+
+
+def _published(items):
+    return [item.job.variants[0].output_paths[0] for item in items]
+
+
+def _is_new(path):
+    if path.read_bytes() == OLD:
+        return False
+    with Image.open(path) as img:
+        return max(img.size) == 100
+
+
+def test_rebuild_swaps_every_group_in(library, tmp_path, cache):
+    result = rebuild(cache, library, SETTINGS, root=tmp_path)
+    assert result == {'rebuilt': 4, 'unchanged': 0, 'failed': [], 'groups': ['astro', 'portrait']}
+    assert all(_is_new(path) for path in _published(library))
+    assert not (tmp_path / REBUILD_DIR).exists()
+
+    before = [path.read_bytes() for path in _published(library)]
+    result = rebuild(cache, library, SETTINGS, root=tmp_path)
+    assert result == {'rebuilt': 0, 'unchanged': 4, 'failed': [], 'groups': []}
+    assert [path.read_bytes() for path in _published(library)] == before
+
+
+def test_interrupted_rebuild_resumes_from_the_checkpoint(library, tmp_path, cache, monkeypatch):
+    monkeypatch.setattr(rebuild_module, 'BATCH_PER_WORKER', 1)
+    ingest_all = rebuild_module.ingest_all
+    encoded = []
+
+    def interrupt_second_batch(cache, jobs, workers):
+        if encoded:
+            raise KeyboardInterrupt
+        encoded.extend(job.input_path.name for job in jobs)
+        return ingest_all(cache, jobs, workers)
+    monkeypatch.setattr(rebuild_module, 'ingest_all', interrupt_second_batch)
+    with pytest.raises(KeyboardInterrupt):
+        rebuild(cache, library, SETTINGS, root=tmp_path)
+    assert load_checkpoint(tmp_path)['done'] == ['astro/astro-01.webp']
+    assert not any(_is_new(path) for path in _published(library))
+
+    def count(cache, jobs, workers):
+        encoded.extend(job.input_path.name for job in jobs)
+        return ingest_all(cache, jobs, workers)
+    monkeypatch.setattr(rebuild_module, 'ingest_all', count)
+    result = rebuild(cache, library, SETTINGS, root=tmp_path)
+    assert encoded == ['astro-1.png', 'astro-2.png', 'portrait-1.png', 'portrait-2.png']
+    assert result['groups'] == ['astro', 'portrait']
+    assert all(_is_new(path) for path in _published(library))
+
+
+def test_cut_short_swap_is_finished_first(library, tmp_path, cache, monkeypatch):
+    finish_swap = rebuild_module.finish_swap
+
+    def move_one_then_crash(pairs):
+        finish_swap(pairs[:1])
+        raise RuntimeError('power cut')
+    monkeypatch.setattr(rebuild_module, 'finish_swap', move_one_then_crash)
+    with pytest.raises(RuntimeError):
+        rebuild(cache, library, SETTINGS, root=tmp_path)
+    astro = [item for item in library if item.group == 'astro']
+    assert [_is_new(path) for path in _published(astro)] == [True, False]
+
+    monkeypatch.setattr(rebuild_module, 'finish_swap', finish_swap)
+    swapped = []
+    result = rebuild(cache, library, SETTINGS, root=tmp_path, on_swapped=lambda group, items: swapped.append(group))
+    assert swapped == ['astro', 'portrait']
+    assert result['groups'] == ['portrait']
+    assert all(_is_new(path) for path in _published(library))
+
+
+def test_failed_item_keeps_its_group_published(library, make_image, tmp_path, cache):
+    library[2].job.input_path.write_bytes(b'not an image')
+    result = rebuild(cache, library, SETTINGS, root=tmp_path)
+    assert result['failed'] == ['portrait/portrait-01.webp']
+    assert result['groups'] == ['astro']
+    assert [_is_new(path) for path in _published(library)] == [True, True, False, False]
+    assert load_checkpoint(tmp_path)['swapped'] == ['astro']
+
+    make_image('portrait-1.png', seed=1)
+    result = rebuild(cache, library, SETTINGS, root=tmp_path)
+    assert result['groups'] == ['portrait']
+    assert all(_is_new(path) for path in _published(library))
+
+
+def test_changed_settings_start_over(library, tmp_path, cache):
+    library[2].job.input_path.write_bytes(b'not an image')
+    rebuild(cache, library, SETTINGS, root=tmp_path)
+    staged = tmp_path / REBUILD_DIR / 'portrait' / 'portrait-02.webp'
+    assert staged.exists()
+
+    rebuild(cache, library, dict(SETTINGS, widths=[480]), root=tmp_path)
+    assert load_checkpoint(tmp_path)['settings'] == dict(SETTINGS, widths=[480])
+    assert load_checkpoint(tmp_path)['swapped'] == []
@@ -0,0 +1,47 @@
+import os
+import signal
+import sqlite3
+
+import pytest
+
+from pipeline import watch as watch_module
+from pipeline.ingest import IngestJob, Variant, fit_params
+from pipeline.watch import WatchTarget, watch
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(watch_module, 'POLL_SECONDS', 0.05)
+    monkeypatch.setattr(watch_module, 'IDLE_SECONDS', 0.05)
+
+
+def test_catalog_is_writable_while_watching(tmp_path, make_image, cache):
+    import_dir = tmp_path / 'import'
+    import_dir.mkdir()
+    make_image('import/new.png')
+    output = tmp_path / 'new.webp'
+    published = []
+    written = []
+
+    def plan(path):
+        return {'job': IngestJob(path, [Variant(fit_params('test', 160, 80), [output])])}
+
+    def on_idle():
+        # Another script (e.g. optimize_hero_thumbs.py) writing to the same catalog, without waiting for a lock
+        other = sqlite3.connect(str(cache.path), timeout=0)
+        other.execute("INSERT INTO encodes (key, meta) VALUES ('other-script', '{}')")
+        other.commit()
+        written.extend(other.execute('SELECT key FROM outputs WHERE path = ?', (str(output),)).fetchall())
+        other.close()
+        # Stopped the way a service manager would
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    target = WatchTarget(import_dir, plan, lambda entry, statuses: None, lambda: published.append(True))
+    previous = signal.getsignal(signal.SIGTERM)
+    watch(cache, [target], jobs=1, debounce=0, on_idle=on_idle)
+
+    assert signal.getsignal(signal.SIGTERM) == previous
+    assert published == [True]
+    assert len(written) == 1
+    assert output.exists()
+    assert cache.lookup_meta('other-script') == {}
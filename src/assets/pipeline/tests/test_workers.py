@@ -0,0 +1,38 @@
+from pipeline.ingest import IngestJob, Variant, fit_params
+from pipeline.workers import ingest_all, run_parallel
+
+
+def _jobs(make_image, tmp_path, prefix):
+    jobs = []
+    for i in range(4):
+        source = make_image(f"src-{i}.png", seed=i)
+        jobs.append(IngestJob(source, [Variant(fit_params('test', 160, 80), [tmp_path / f"{prefix}-{i}-160.webp"]),
+                                       Variant(fit_params('test', 80, 80), [tmp_path / f"{prefix}-{i}-80.webp"])]))
+    return jobs
+
+
+def test_run_parallel_keeps_input_order():
+    args = [(2, n) for n in range(8)]
+    assert run_parallel(pow, args, jobs=2) == [2 ** n for n in range(8)]
+
+
+def test_ingest_all_matches_serial_run(make_image, tmp_path):
+    serial = _jobs(make_image, tmp_path, 'serial')
+    parallel = _jobs(make_image, tmp_path, 'parallel')
+
+    assert ingest_all(None, serial, jobs=1) == [['encoded', 'encoded']] * 4
+    assert ingest_all(None, parallel, jobs=2) == [['encoded', 'encoded']] * 4
+    for a, b in zip(serial, parallel):
+        for va, vb in zip(a.variants, b.variants):
+            assert va.output_paths[0].read_bytes() == vb.output_paths[0].read_bytes()
+
+
+def test_ingest_all_reuses_the_cache(make_image, tmp_path, cache):
+    jobs = _jobs(make_image, tmp_path, 'cached')
+    assert ingest_all(cache, jobs, jobs=2) == [['encoded', 'encoded']] * 4
+    assert ingest_all(cache, jobs, jobs=2) == [['fresh', 'fresh']] * 4
+
+    jobs[1].variants[0].output_paths[0].unlink()
+    statuses = ingest_all(cache, jobs, jobs=2)
+    assert statuses[1] == ['restored', 'fresh']
+    assert jobs[1].variants[0].output_paths[0].exists()
@@ -0,0 +1,226 @@
+"""
+Bounded-memory reader for very large TIFFs (stacked astro frames, panoramas).
+
+Pillow decodes a compressed TIFF as one libtiff call into a full-resolution
+frame - a 16-bit stack at 60MP is hundreds of MB before the RGB conversion
+copies it again. When a TIFF's decoded size would exceed the memory limit,
+its strips (or rows of tiles) are instead read straight from the file one at
+a time, decompressed here, box-downsampled by an integer factor and
+converted to 8 bits, so only a band of rows plus the reduced frame is ever
+held in memory. The last LANCZOS step in ingest.py does the rest.
+
+Handles chunky (interleaved) 8- and 16-bit gray/RGB with optional alpha,
+uncompressed or LZW/Deflate/PackBits/LZMA/Zstd, with or without the
+horizontal predictor. Compressed strips are handed to Pillow's libtiff one
+at a time, wrapped as tiny standalone TIFFs. Anything else (float samples,
+planar layout, one giant compressed strip, JPEG-in-TIFF) falls back to the
+regular whole-frame path with a warning.
+"""
+
+import io
+import struct
+
+import numpy as np
+from PIL import Image, features
+
+TIFF_MEMORY_LIMIT_MB = 512
+
+# Compressions that are self-contained per strip (JPEG-in-TIFF needs shared tables)
+COMPRESSIONS = {1: 'raw', 5: 'lzw', 8: 'deflate', 32946: 'deflate', 32773: 'packbits', 34925: 'lzma', 50000: 'zstd'}
+MODES = {(1, 1): 'L', (1, 2): 'LA', (2, 3): 'RGB', (2, 4): 'RGBA'}  # (photometric, samples) -> mode
+
+# EXIF orientation -> transpose, applied to the reduced frame
+ORIENTATIONS = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+
+def _one_strip_tiff(compression, data, row_bytes, rows):
+    """
+    Wrap one compressed strip or tile in a minimal TIFF declaring it as 8-bit
+    gray, row_bytes wide, without predictor: libtiff then hands back the
+    decompressed bytes exactly as stored.
+    """
+    entries = [
+        (256, 4, row_bytes),    # width
+        (257, 4, rows),         # height
+        (258, 3, 8),            # bits per sample
+        (259, 3, compression),
+        (262, 3, 1),            # black is zero
+        (273, 4, 8),            # strip offset: right after the header
+        (277, 3, 1),            # samples per pixel
+        (278, 4, rows),         # rows per strip
+        (279, 4, len(data)),    # strip byte count
+    ]
+    # Values fit in the 4-byte slot; a little-endian SHORT is just the low half
+    ifd = struct.pack('<H', len(entries)) + b''.join(struct.pack('<HHII', *entry[:2], 1, entry[2]) for entry in entries)
+    return b'II*\x00' + struct.pack('<I', 8 + len(data)) + data + ifd + struct.pack('<I', 0)
+
+
+def decompress(compression, data, row_bytes, rows):
+    """Raw bytes of one strip or tile, decompressed by Pillow's libtiff."""
+    if compression == 1:
+        return data
+    with Image.open(io.BytesIO(_one_strip_tiff(compression, data, row_bytes, rows))) as img:
+        return img.tobytes()
+
+
+def _box_reduce(block, factor):
+    """Average factor x factor boxes of an (rows, width, samples) block; a short last band is averaged as is."""
+    rows, width, samples = block.shape
+    pad = -width % factor
+    if pad:
+        block = np.pad(block, ((0, 0), (0, pad), (0, 0)), mode='edge')
+    groups = max(rows // factor, 1)
+    return block.reshape(groups, rows // groups, -1, factor, samples).mean(axis=(1, 3), dtype=np.float32)
+
+
+class LargeTiff:
+    """A TIFF read chunk by chunk; construct with open_large_tiff()."""
+
+    def __init__(self, path, img):
+        tags = img.tag_v2
+        self.path = path
+        # Not img.size: Pillow reports that already rotated when libtiff applies the orientation
+        self.width, self.height = tags[256], tags[257]
+        self.samples = tags.get(277, 1)
+        bits = tags.get(258, (1,))
+        self.bits = bits[0] if isinstance(bits, tuple) else bits
+        self.dtype = np.dtype(np.uint8 if self.bits == 8 else tags._endian + 'u2')
+        self.compression = tags.get(259, 1)
+        self.predictor = tags.get(317, 1)
+        self.orientation = tags.get(274, 1)
+        self.mode = MODES.get((tags.get(262), self.samples))
+
+        self.unsupported = None
+        if self.bits not in (8, 16) or tags.get(339, 1) != 1:
+            self.unsupported = f"{self.bits}-bit or non-integer samples"
+        elif self.mode is None:
+            self.unsupported = "color layout"
+        elif tags.get(284, 1) != 1:
+            self.unsupported = "planar layout"
+        elif self.compression not in COMPRESSIONS:
+            self.unsupported = f"compression {self.compression}"
+        elif self.compression != 1 and not features.check('libtiff'):
+            self.unsupported = "Pillow built without libtiff"
+        elif self.predictor not in (1, 2):
+            self.unsupported = "floating-point predictor"
+
+        if 324 in tags:
+            self.tile_width, self.chunk_height = tags[322], tags[323]
+            self.offsets, self.counts = tags[324], tags[325]
+        else:
+            self.tile_width, self.chunk_height = self.width, min(tags.get(278, self.height), self.height)
+            self.offsets, self.counts = tags.get(273, ()), tags.get(279, ())
+
+    @property
+    def full_size(self):
+        """Size after EXIF rotation."""
+        return (self.height, self.width) if self.orientation in (5, 6, 7, 8) else (self.width, self.height)
+
+    @property
+    def row_bytes(self):
+        return self.tile_width * self.samples * self.dtype.itemsize
+
+    def decoded_bytes(self):
+        return self.height * self.width * self.samples * self.dtype.itemsize
+
+    def band_bytes(self):
+        """Decoded size of one strip or row of tiles."""
+        return self.chunk_height * self.row_bytes * -(-self.width // self.tile_width)
+
+    def split_raw_strips(self, max_bytes):
+        """Uncompressed strips can be read in pieces: re-slice them into chunks of at most max_bytes."""
+        strip_rows = self.chunk_height
+        rows = max([d for d in range(1, strip_rows + 1)
+                    if strip_rows % d == 0 and d * self.row_bytes <= max_bytes] or [1])
+        offsets, counts = [], []
+        for top in range(0, self.height, rows):
+            offsets.append(self.offsets[top // strip_rows] + (top % strip_rows) * self.row_bytes)
+            counts.append(min(rows, self.height - top) * self.row_bytes)
+        self.chunk_height, self.offsets, self.counts = rows, offsets, counts
+
+    def _chunk(self, f, index, rows):
+        f.seek(self.offsets[index])
+        data = decompress(self.compression, f.read(self.counts[index]), self.row_bytes, rows)
+        pixels = np.frombuffer(data, self.dtype)
+        pixels = pixels[:len(pixels) - len(pixels) % (self.tile_width * self.samples)]
+        pixels = pixels.reshape(-1, self.tile_width, self.samples)
+        if self.predictor == 2:
+            pixels = np.cumsum(pixels, axis=1, dtype=self.dtype)
+        return pixels
+
+    def bands(self):
+        """Yield (rows, width, samples) arrays from top to bottom, one strip or row of tiles at a time."""
+        across = -(-self.width // self.tile_width)
+        with open(self.path, 'rb') as f:
+            for top in range(0, self.height, self.chunk_height):
+                rows = min(self.chunk_height, self.height - top)
+                first = (top // self.chunk_height) * across
+                if across == 1:
+                    yield self._chunk(f, first, rows)[:rows]
+                else:
+                    tiles = [self._chunk(f, first + i, self.chunk_height) for i in range(across)]
+                    yield np.concatenate(tiles, axis=1)[:rows, :self.width]
+
+    def reduced(self, factor, memory_limit_mb=TIFF_MEMORY_LIMIT_MB):
+        """
+        Decode at 1/factor scale, 8 bits per sample, EXIF rotation applied.
+
+        Rows are reduced in slices small enough that the float working copy
+        stays within a quarter of the memory limit.
+        """
+        slice_rows = factor * max(1, (memory_limit_mb << 20) // (4 * 4 * self.width * self.samples * factor))
+        scale = 1 / 257 if self.bits == 16 else 1
+        out = []
+        pending = np.empty((0, self.width, self.samples), self.dtype)
+
+        for band in self.bands():
+            pending = np.concatenate([pending, band]) if len(pending) else band
+            usable = len(pending) - len(pending) % factor
+            for start in range(0, usable, slice_rows):
+                reduced = _box_reduce(pending[start:min(start + slice_rows, usable)], factor)
+                out.append(np.rint(reduced * scale).astype(np.uint8))
+            pending = pending[usable:].copy()
+        if len(pending):
+            out.append(np.rint(_box_reduce(pending, factor) * scale).astype(np.uint8))
+
+        pixels = np.concatenate(out)
+        img = Image.fromarray(pixels[:, :, 0] if self.samples == 1 else pixels, self.mode)
+        if self.orientation in ORIENTATIONS:
+            img = img.transpose(ORIENTATIONS[self.orientation])
+        return img
+
+
+def open_large_tiff(input_path, memory_limit_mb=TIFF_MEMORY_LIMIT_MB):
+    """
+    A LargeTiff when input_path is a TIFF too big to decode whole within the
+    memory limit and its layout can be streamed; None otherwise (use the
+    regular path).
+    """
+    try:
+        with Image.open(input_path) as img:
+            if img.format != 'TIFF':
+                return None
+            tiff = LargeTiff(input_path, img)
+    except Exception:
+        return None
+
+    limit = memory_limit_mb << 20
+    if tiff.decoded_bytes() <= limit:
+        return None
+    if tiff.compression == 1 and tiff.tile_width == tiff.width:
+        tiff.split_raw_strips(limit // 8)
+    if tiff.unsupported is None and tiff.band_bytes() > limit // 4:
+        tiff.unsupported = "strips too large"
+    if tiff.unsupported:
+        print(f"⚠ {input_path}: {tiff.decoded_bytes() >> 20}MB decoded exceeds the {memory_limit_mb}MB limit "
+              f"but can't be streamed ({tiff.unsupported}); decoding whole")
+        return None
+    return tiff
@@ -0,0 +1,133 @@
+"""
+Per-stage timing for every file the ingest stage touches.
+
+ingest.py (and the reader in workers.py) wraps each step in stage():
+
+    read             reading the original ahead of its decode (bytes_in = file size)
+    decode           decompressing the original (bytes_in = file size unless read ahead)
+    exif_transpose   applying the EXIF orientation
+    convert          flattening to RGB
+    resize           reduced-decode box reduction, fitting and center-square cropping
+    encode           WebP (+ quality search, alternates)
+    write            writing outputs, on the writer thread (bytes_out = bytes written)
+
+Each stage costs two perf_counter_ns() calls and a list append, so tracing
+is on by default. Pool workers hand their events back with their results
+(see workers.py); after a run the scripts call finish_trace(), which
+appends the events to src/assets/.asset-trace.jsonl - or writes a Chrome
+trace (chrome://tracing, Perfetto) when --trace names a .json file - and
+prints the slowest files and the time spent per stage.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from .cache import ASSETS_DIR
+
+DEFAULT_TRACE_PATH = ASSETS_DIR / '.asset-trace.jsonl'
+TRACE_MAX_BYTES = 16 * 1024 * 1024  # the JSON-lines log rolls over to .1 past this
+STAGES = ('read', 'decode', 'exif_transpose', 'convert', 'resize', 'encode', 'write')
+SLOWEST_FILES = 5
+
+_events = []
+
+
+@contextmanager
+def stage(name, file, **counters):
+    """Time the enclosed block as one stage of file (counters: bytes_in / bytes_out)."""
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _events.append({'stage': name, 'file': os.path.relpath(file), 'start_ns': start,
+                        'ns': time.perf_counter_ns() - start, 'pid': os.getpid(),
+                        'tid': threading.get_native_id(), **counters})
+
+
+def drain():
+    """Every event recorded in this process so far (and forget them)."""
+    events = _events[:]
+    _events.clear()
+    return events
+
+
+def extend(events):
+    """Adopt events recorded in a worker process."""
+    _events.extend(events)
+
+
+def add_trace_arguments(parser):
+    """Add the --trace / --no-trace flags every script shares."""
+    parser.add_argument('--trace', default=str(DEFAULT_TRACE_PATH),
+                        help='Stage timings log: JSON lines, or a Chrome trace if it ends in .json '
+                             '(default: %(default)s)')
+    parser.add_argument('--no-trace', action='store_true', help='Do not record stage timings')
+
+
+def _append_json_lines(path, events, script, run):
+    if path.exists() and path.stat().st_size > TRACE_MAX_BYTES:
+        os.replace(path, path.with_name(path.name + '.1'))
+    with open(path, 'a') as f:
+        for event in events:
+            line = {'run': run, 'script': script, **event}
+            line['start_us'], line['us'] = line.pop('start_ns') // 1000, line.pop('ns') // 1000
+            f.write(json.dumps(line) + '\n')
+
+
+def _write_chrome_trace(path, events, script):
+    trace_events = [
+        {'name': event['stage'], 'cat': script, 'ph': 'X', 'ts': event['start_ns'] / 1000,
+         'dur': event['ns'] / 1000, 'pid': event['pid'], 'tid': event.get('tid', event['pid']),
+         'args': {k: v for k, v in event.items() if k not in ('stage', 'start_ns', 'ns', 'pid', 'tid')}}
+        for event in events
+    ]
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+
+
+def summarize(events):
+    """(per-file totals sorted slowest first, per-stage seconds)."""
+    files = {}
+    stages = {}
+    for event in events:
+        seconds = event['ns'] / 1e9
+        entry = files.setdefault(event['file'], {'seconds': 0.0, 'stages': {}, 'bytes_in': 0, 'bytes_out': 0})
+        entry['seconds'] += seconds
+        entry['stages'][event['stage']] = entry['stages'].get(event['stage'], 0.0) + seconds
+        entry['bytes_in'] += event.get('bytes_in', 0)
+        entry['bytes_out'] += event.get('bytes_out', 0)
+        stages[event['stage']] = stages.get(event['stage'], 0.0) + seconds
+    return sorted(files.items(), key=lambda item: -item[1]['seconds']), stages
+
+
+def print_summary(events, slowest=SLOWEST_FILES):
+    files, stages = summarize(events)
+    total = sum(stages.values())
+    if not total:
+        return
+    print("\nSlowest files:")
+    for name, entry in files[:slowest]:
+        breakdown = ', '.join(f"{s} {entry['stages'][s]:.2f}s" for s in STAGES if s in entry['stages'])
+        print(f"  {name}: {entry['seconds']:.2f}s ({breakdown}), "
+              f"{entry['bytes_in']/1024:.0f}KB in -> {entry['bytes_out']/1024:.0f}KB out")
+    print("Time by stage:")
+    for name in sorted(stages, key=lambda s: -stages[s]):
+        print(f"  {name:<15} {stages[name]:7.2f}s {stages[name] / total * 100:5.1f}%")
+
+
+def finish_trace(args, script):
+    """Write this run's events (unless --no-trace) and print the summary."""
+    events = drain()
+    if args.no_trace or not events:
+        return
+    path = Path(args.trace)
+    if path.suffix == '.json':
+        _write_chrome_trace(path, events, script)
+    else:
+        _append_json_lines(path, events, script, time.strftime('%Y-%m-%dT%H:%M:%S'))
+    print_summary(events)
+    print(f"✓ Stage timings written to {path}")
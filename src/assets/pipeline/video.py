@@ -0,0 +1,369 @@
+"""
+Video stage: web-ready transcodes and poster frames through a local ffmpeg.
+
+An import <project>/import/<name>.mov (or .mp4, .m4v, .webm) becomes
+
+    <project>/<name>_optimized.mp4                      H.264 High, yuv420p, AAC, faststart
+    <project>/<name>_optimized_av1.mp4                  SVT-AV1 (with --codecs h264,av1)
+    <project>/thumbnails/<name>_optimized_thumb.webp    poster frame
+    <project>/thumbnails/<name>_optimized_thumb.jpg     same poster, for pages still importing JPEGs
+
+Every encode is bounded: at most max_height lines, CRF quality with a VBV
+maxrate/bufsize cap so a busy scene can't blow up the file. Posters come
+from the H.264 output (what viewers actually see), POSTER_TIME seconds in
+to skip black lead-in frames.
+
+Several files encode at once under a CPU budget: the encodes share
+--cpu-budget threads (default: every core), each ffmpeg getting
+budget // jobs of them. The work happens in ffmpeg, so the pool is threads.
+
+Duration, resolution, codec, bitrate and bytes are stored in the asset
+cache's encode metadata (the catalog), keyed by output path, together with
+the poster paths; video_poster() looks them up there. Videos are recorded
+without keeping a blob copy in the cache.
+
+Hover loops are short square animated WebPs cut from a published video for
+the Installations previews: LOOP_SECONDS at LOOP_FPS, center-cropped exactly
+like the static preview thumbnails (ffmpeg's crop centers the same way
+center_crop_to_square does) and held under a byte budget - quality steps
+down first, then every other frame is dropped, so a loop never costs more
+than a couple of still thumbnails.
+"""
+
+import argparse
+import io
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from .files import atomic_write_bytes
+from .workers import default_jobs, resolve_jobs, run_parallel
+
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.m4v', '.webm', '.MP4', '.MOV', '.M4V', '.WEBM')
+MAX_HEIGHT = 1080
+POSTER_TIME = 0.5
+POSTER_QUALITY = 85
+
+CODECS = {
+    'h264': {
+        'suffix': '_optimized.mp4',
+        'crf': 23,
+        'maxrate_kbps': 2500,
+        'args': ['-c:v', 'libx264', '-preset', 'slow', '-profile:v', 'high', '-pix_fmt', 'yuv420p'],
+    },
+    'av1': {
+        'suffix': '_optimized_av1.mp4',
+        'crf': 35,
+        'maxrate_kbps': 1500,
+        'args': ['-c:v', 'libsvtav1', '-preset', '6', '-pix_fmt', 'yuv420p'],
+    },
+}
+AUDIO_ARGS = ['-c:a', 'aac', '-b:a', '128k']
+
+LOOP_SIZE = 256
+LOOP_SECONDS = 2.5
+LOOP_FPS = 8
+LOOP_MAX_KB = 120
+LOOP_METHOD = 5  # method 6 is ~10x slower for a few percent
+LOOP_QUALITIES = (70, 60, 50, 40, 30)
+
+# params: cache key / encode settings; output_path: where the encode goes
+VideoOutput = namedtuple('VideoOutput', 'params output_path')
+VideoJob = namedtuple('VideoJob', 'input_path outputs poster_paths')
+LoopJob = namedtuple('LoopJob', 'video_path output_path params')
+
+
+def ffmpeg_available():
+    return bool(shutil.which('ffmpeg') and shutil.which('ffprobe'))
+
+
+def parse_codecs(value):
+    """Parse a --codecs value like 'h264,av1'; H.264 is always included (posters come from it)."""
+    names = [name.strip().lower() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in CODECS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown codec(s): {', '.join(unknown)} (choose from {', '.join(CODECS)})")
+    return ['h264'] + [name for name in names if name != 'h264']
+
+
+def video_params(codec, max_height=MAX_HEIGHT):
+    settings = CODECS[codec]
+    return {'kind': 'video', 'codec': codec, 'crf': settings['crf'],
+            'maxrate_kbps': settings['maxrate_kbps'], 'max_height': max_height}
+
+
+def poster_params():
+    return {'kind': 'poster', 'time': POSTER_TIME, 'quality': POSTER_QUALITY}
+
+
+def loop_params(size=LOOP_SIZE, seconds=LOOP_SECONDS, fps=LOOP_FPS, max_kb=LOOP_MAX_KB):
+    return {'kind': 'preview-loop', 'size': size, 'seconds': seconds, 'fps': fps, 'max_kb': max_kb,
+            'start': POSTER_TIME, 'method': LOOP_METHOD, 'crop': 'center-square'}
+
+
+def output_paths_for(input_path, project_dir, codecs):
+    """(VideoOutputs, poster paths) for one import, following the _optimized naming."""
+    stem = Path(input_path).stem
+    outputs = [VideoOutput(video_params(codec), Path(project_dir) / f"{stem}{CODECS[codec]['suffix']}")
+               for codec in codecs]
+    thumbs = Path(project_dir) / 'thumbnails'
+    return outputs, [thumbs / f"{stem}_optimized_thumb.webp", thumbs / f"{stem}_optimized_thumb.jpg"]
+
+
+def probe(path):
+    """{'duration', 'width', 'height', 'codec', 'bitrate_kbps', 'bytes'} via ffprobe."""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+         '-show_entries', 'stream=codec_name,width,height:format=duration,bit_rate', '-of', 'json', str(path)],
+        check=True, capture_output=True, text=True
+    )
+    info = json.loads(result.stdout)
+    stream = (info.get('streams') or [{}])[0]
+    fmt = info.get('format', {})
+    return {
+        'duration': round(float(fmt.get('duration', 0)), 3),
+        'width': stream.get('width'),
+        'height': stream.get('height'),
+        'codec': stream.get('codec_name'),
+        'bitrate_kbps': round(int(fmt.get('bit_rate', 0)) / 1000),
+        'bytes': os.path.getsize(path),
+    }
+
+
+def transcode(input_path, output_path, params, threads):
+    """Encode input_path to output_path (atomically) and return the probed result."""
+    settings = CODECS[params['codec']]
+    output_path = Path(output_path)
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, prefix='.tmp-', suffix='.mp4')
+    os.close(fd)
+    try:
+        subprocess.run(
+            ['ffmpeg', '-y', '-v', 'error', '-i', str(input_path),
+             # Never upscale; keep the width even for yuv420p
+             '-vf', f"scale=-2:'min({params['max_height']},ih)'",
+             *settings['args'],
+             '-crf', str(params['crf']),
+             '-maxrate', f"{params['maxrate_kbps']}k", '-bufsize', f"{params['maxrate_kbps'] * 2}k",
+             '-threads', str(threads),
+             *AUDIO_ARGS, '-movflags', '+faststart', tmp_path],
+            check=True, capture_output=True
+        )
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return probe(output_path)
+
+
+def read_frame(video_path, time=POSTER_TIME):
+    """Decode one frame (or the first one, for clips shorter than time) as a PIL image."""
+    for seek in (time, 0):
+        result = subprocess.run(
+            ['ffmpeg', '-v', 'error', '-ss', str(seek), '-i', str(video_path),
+             '-frames:v', '1', '-f', 'image2pipe', '-c:v', 'png', '-'],
+            check=True, capture_output=True
+        )
+        if result.stdout:
+            img = Image.open(io.BytesIO(result.stdout))
+            img.load()
+            return img.convert('RGB')
+    raise RuntimeError(f"no frame decoded from {video_path}")
+
+
+def write_poster(video_path, poster_paths, params):
+    """Save the poster frame as WebP (and JPEG); returns its metadata."""
+    img = read_frame(video_path, params['time'])
+    meta = {'width': img.width, 'height': img.height}
+    for path in poster_paths:
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True)
+        buffer = io.BytesIO()
+        img.save(buffer, 'WEBP' if path.suffix == '.webp' else 'JPEG', quality=params['quality'])
+        atomic_write_bytes(path, buffer.getvalue())
+    meta['bytes'] = os.path.getsize(poster_paths[0])
+    return meta
+
+
+def video_poster(cache, video_path):
+    """Poster image for a published video: the catalog's record first, then the naming convention."""
+    video_path = Path(video_path)
+    poster = cache.output_meta(video_path).get('poster') if cache else None
+    candidates = [video_path.parent / poster] if poster else []
+    stem = video_path.stem[:-len('_optimized')] if video_path.stem.endswith('_optimized') else video_path.stem
+    candidates += [video_path.parent / 'thumbnails' / f"{stem}_optimized_thumb{ext}" for ext in ('.webp', '.jpg')]
+    return next((path for path in candidates if path.exists()), None)
+
+
+def _encode_outputs(job, stale, threads):
+    metas = []
+    name = os.path.basename(job.input_path)
+    for output in stale:
+        try:
+            meta = transcode(job.input_path, output.output_path, output.params, threads)
+        except (subprocess.CalledProcessError, OSError) as e:
+            stderr = getattr(e, 'stderr', b'') or b''
+            print(f"✗ Error transcoding {name}: {stderr.decode(errors='replace').strip() or e}")
+            metas.append(None)
+            continue
+        print(f"✓ Transcoded: {name} -> {output.output_path.name} ({meta['width']}x{meta['height']}, "
+              f"{meta['duration']:.1f}s, {meta['bytes']/1024/1024:.1f}MB)")
+        metas.append(meta)
+    return metas
+
+
+def encode_all(cache, video_jobs, jobs=1, cpu_budget=None):
+    """
+    Transcode every stale output and (re)write posters, several files at a time.
+
+    Returns, per job, one status per output plus one for the poster:
+    'fresh', 'encoded', or None when ffmpeg failed.
+    """
+    jobs = resolve_jobs(jobs)
+    threads = max(1, (cpu_budget or default_jobs()) // jobs)
+    statuses = [[None] * (len(job.outputs) + 1) for job in video_jobs]
+
+    pending = []
+    for i, job in enumerate(video_jobs):
+        stale = []
+        for o, output in enumerate(job.outputs):
+            key = cache.make_key(job.input_path, **output.params)
+            if cache.is_fresh(key, output.output_path):
+                statuses[i][o] = 'fresh'
+            else:
+                stale.append((o, key))
+        if stale:
+            pending.append((i, stale))
+
+    # Cache reads and writes stay on this thread; only ffmpeg runs in the pool
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(
+            lambda entry: _encode_outputs(video_jobs[entry[0]], [video_jobs[entry[0]].outputs[o] for o, _ in entry[1]],
+                                          threads),
+            pending
+        ))
+
+    for (i, stale), metas in zip(pending, results):
+        job = video_jobs[i]
+        for (o, key), meta in zip(stale, metas):
+            if meta is None:
+                continue
+            output_path = job.outputs[o].output_path
+            meta['poster'] = os.path.relpath(job.poster_paths[0], output_path.parent)
+            cache.store(key, output_path, job.input_path, meta, keep_blob=False)
+            statuses[i][o] = 'encoded'
+
+    # Posters come from the H.264 output, so they follow it
+    for i, job in enumerate(video_jobs):
+        source = job.outputs[0].output_path
+        if not statuses[i][0] or not source.exists():
+            continue
+        key = cache.make_key(source, **poster_params())
+        if cache.is_fresh(key, job.poster_paths):
+            statuses[i][-1] = 'fresh'
+            continue
+        try:
+            meta = write_poster(source, job.poster_paths, poster_params())
+        except (subprocess.CalledProcessError, OSError, RuntimeError) as e:
+            print(f"✗ Error extracting poster from {source.name}: {e}")
+            continue
+        cache.store(key, job.poster_paths[0], source, meta)
+        for extra in job.poster_paths[1:]:
+            cache.record_outputs(key, extra, source)
+        print(f"✓ Poster: {source.name} -> {job.poster_paths[0].name}")
+        statuses[i][-1] = 'encoded'
+
+    return statuses
+
+
+def read_loop_frames(video_path, params):
+    """The loop's frames, center-cropped and scaled to size x size by ffmpeg, as RGB images."""
+    size = params['size']
+    result = subprocess.run(
+        ['ffmpeg', '-v', 'error', '-ss', str(params['start']), '-t', str(params['seconds']), '-i', str(video_path),
+         '-vf', f"fps={params['fps']},crop='min(iw,ih)':'min(iw,ih)',scale={size}:{size}:flags=lanczos",
+         '-an', '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-'],
+        check=True, capture_output=True
+    )
+    frame_bytes = size * size * 3
+    return [Image.frombytes('RGB', (size, size), result.stdout[i:i + frame_bytes])
+            for i in range(0, len(result.stdout) - frame_bytes + 1, frame_bytes)]
+
+
+def encode_loop(frames, fps, quality, method=LOOP_METHOD):
+    buffer = io.BytesIO()
+    frames[0].save(buffer, 'WEBP', save_all=True, append_images=frames[1:], duration=round(1000 / fps),
+                   loop=0, quality=quality, method=method, minimize_size=True)
+    return buffer.getvalue()
+
+
+def write_loop(video_path, output_path, params):
+    """
+    Encode the hover loop for video_path within params['max_kb'] and write it;
+    returns its metadata, or None when ffmpeg failed.
+    """
+    try:
+        frames = read_loop_frames(video_path, params)
+    except (subprocess.CalledProcessError, OSError) as e:
+        stderr = getattr(e, 'stderr', b'') or b''
+        print(f"✗ Error reading frames from {os.path.basename(video_path)}: "
+              f"{stderr.decode(errors='replace').strip() or e}")
+        return None
+    if not frames:
+        print(f"✗ No frames decoded from {os.path.basename(video_path)}")
+        return None
+
+    budget = params['max_kb'] * 1024
+    fps = params['fps']
+    smallest = None
+    # Lower quality first, then half the frame rate
+    for step, quality in ((step, quality) for step in (1, 2) for quality in LOOP_QUALITIES):
+        data = encode_loop(frames[::step], fps / step, quality, params['method'])
+        if smallest is None or len(data) < len(smallest[0]):
+            smallest = (data, quality, step)
+        if len(data) <= budget:
+            break
+    data, quality, step = smallest
+    if len(data) > budget:
+        print(f"⚠ {os.path.basename(output_path)}: {len(data)/1024:.0f}KB even at quality {quality} "
+              f"and {fps / step:g}fps (budget {params['max_kb']}KB)")
+
+    atomic_write_bytes(output_path, data)
+    return {'width': params['size'], 'height': params['size'], 'frames': len(frames[::step]),
+            'fps': fps / step, 'quality': quality, 'bytes': len(data)}
+
+
+def encode_loops(cache, loop_jobs, jobs=1):
+    """
+    Write every hover loop the cache can't satisfy (several at once with jobs > 1).
+
+    Returns one status per job: 'fresh', 'restored', 'encoded', or None.
+    """
+    statuses = [None] * len(loop_jobs)
+    pending = []
+    for i, job in enumerate(loop_jobs):
+        key = cache.make_key(job.video_path, **job.params)
+        if cache.is_fresh(key, job.output_path):
+            statuses[i] = 'fresh'
+        elif cache.restore(key, job.output_path, job.video_path):
+            statuses[i] = 'restored'
+        else:
+            pending.append((i, key))
+
+    results = run_parallel(write_loop, [(loop_jobs[i].video_path, loop_jobs[i].output_path, loop_jobs[i].params)
+                                        for i, _ in pending], jobs)
+    for (i, key), meta in zip(pending, results):
+        if meta is None:
+            continue
+        cache.store(key, loop_jobs[i].output_path, loop_jobs[i].video_path, meta)
+        print(f"✓ Loop: {os.path.basename(loop_jobs[i].video_path)} -> {os.path.basename(loop_jobs[i].output_path)} "
+              f"({meta['frames']} frames, {meta['bytes']/1024:.1f}KB, q{meta['quality']})")
+        statuses[i] = 'encoded'
+    return statuses
@@ -0,0 +1,288 @@
+"""
+Watch mode: ingest files as they land instead of on the next full run.
+
+Each WatchTarget names a directory and how to handle a file in it:
+
+    plan(path)              -> entry dict with a 'job' (IngestJob), or None to skip the file
+    finish(entry, statuses) -> after the encode (statuses as ingest_all() returns them)
+    publish()               -> once the queue has drained, e.g. to rewrite a manifest
+
+Directories are watched with inotify on Linux (through ctypes, no extra
+dependency) and by polling everywhere else. A file is only handed to plan()
+once its size and mtime have stayed the same for the debounce period, so a
+copy that is still in progress (or stalls halfway through) is never decoded.
+plan() runs in this process, one file at a time in path order, so anything
+it numbers is numbered the same way a one-shot run would; the encode goes to
+a process pool that stays up for the whole session, and each finished file
+is handled as soon as its worker returns.
+
+Files already waiting when the watch starts are picked up like new arrivals.
+Restarting is safe because nothing here is remembered between sessions: the
+asset cache skips outputs that were already written, and a plan() that
+assigns names records them somewhere durable (see ledger.py) before the
+encode starts. The catalog is committed after every batch of finished files
+and again once they are published, so other scripts can write to it while a
+watch is running. SIGTERM stops the watch the same way Ctrl-C does.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import trace
+from .workers import ingest_args, ingest_traced, lookup_variants, resolve_jobs, store_results
+
+DEBOUNCE_SECONDS = 2.0
+POLL_SECONDS = 0.25   # how often settling files and running encodes are checked
+IDLE_SECONDS = 5.0    # how long to block when nothing is in progress
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tiff', '.tif')
+
+WatchTarget = namedtuple('WatchTarget', 'directory plan finish publish')
+
+# inotify(7)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def add_watch_arguments(parser):
+    """Add the --watch / --debounce flags."""
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and ingest new files as they land (Ctrl-C to stop)')
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_SECONDS,
+                        help='Seconds a new file must stay unchanged before it is ingested (default: %(default)s)')
+
+
+def is_candidate(path, extensions=IMAGE_EXTENSIONS):
+    """An image file, skipping dotfiles (partial downloads, Finder and rsync temp files)."""
+    return path.suffix.lower() in extensions and not path.name.startswith('.')
+
+
+def _signature(path):
+    """(size, mtime) of a non-empty regular file, or None."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not st.st_size or not os.path.isfile(path):
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class InotifyWatcher:
+    """Reports paths created, written or moved into the watched directories."""
+
+    def __init__(self, directories):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.directories = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+            self.directories[wd] = Path(directory)
+
+    def wait(self, timeout):
+        """Paths with activity within timeout seconds (every candidate on a queue overflow)."""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        changed = set()
+        try:
+            while True:
+                data = os.read(self.fd, 64 * 1024)
+                offset = 0
+                while offset < len(data):
+                    wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                    offset += EVENT_HEADER.size
+                    name = data[offset:offset + length].rstrip(b'\0')
+                    offset += length
+                    if mask & IN_Q_OVERFLOW:
+                        changed.update(p for d in self.directories.values() for p in d.iterdir())
+                    elif wd in self.directories and name:
+                        changed.add(self.directories[wd] / os.fsdecode(name))
+        except BlockingIOError:
+            pass
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Same interface as InotifyWatcher, by comparing directory listings."""
+
+    def __init__(self, directories):
+        self.directories = [Path(d) for d in directories]
+        self.seen = self._snapshot()
+
+    def _snapshot(self):
+        seen = {}
+        for directory in self.directories:
+            for path in directory.iterdir():
+                seen[path] = _signature(path)
+        return seen
+
+    def wait(self, timeout):
+        time.sleep(min(timeout, 1.0))
+        current = self._snapshot()
+        changed = {path for path, signature in current.items() if self.seen.get(path) != signature}
+        self.seen = current
+        return changed
+
+    def close(self):
+        pass
+
+
+def _ignore_interrupts():
+    # Pool initializer: the encodes already running finish when the watch is stopped
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def open_watcher(directories):
+    """inotify where the platform has it, polling otherwise."""
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError) as e:
+            print(f"⚠ inotify unavailable ({e}); polling instead")
+    return PollingWatcher(directories)
+
+
+def watch(cache, targets, jobs=1, debounce=DEBOUNCE_SECONDS, on_idle=None):
+    """
+    Ingest every settled file in the targets' directories until interrupted.
+
+    on_idle() runs after the publish() calls each time the queue drains.
+    """
+    by_directory = {Path(target.directory).resolve(): target for target in targets}
+    watcher = open_watcher(list(by_directory))
+    pool = ProcessPoolExecutor(max_workers=resolve_jobs(jobs), initializer=_ignore_interrupts)
+    settling = {}   # path -> (target, signature, unchanged since)
+    running = {}    # future -> (target, path, entry, stale, statuses)
+    busy = set()    # import paths with an encode in flight
+    dirty = []      # targets with finished work not yet published
+
+    def note(path):
+        target = by_directory.get(path.parent.resolve())
+        if target is not None and is_candidate(path):
+            settling[path] = (target, _signature(path), time.monotonic())
+
+    def done(target, entry, statuses):
+        try:
+            target.finish(entry, statuses)
+        except Exception as e:
+            print(f"✗ Error finishing {entry['job'].input_path}: {e}")
+        if target not in dirty:
+            dirty.append(target)
+
+    def dispatch(target, path):
+        entry = target.plan(path)
+        if entry is None:
+            return
+        job = entry['job']
+        statuses, stale = lookup_variants(cache, job)
+        if not stale:
+            done(target, entry, statuses)
+            return
+        future = pool.submit(ingest_traced, *ingest_args(job, stale))
+        running[future] = (target, path, entry, stale, statuses)
+        busy.add(path)
+
+    def collect(futures):
+        for future in futures:
+            target, path, entry, stale, statuses = running.pop(future)
+            busy.discard(path)
+            try:
+                metas, events = future.result()
+            except BaseException as e:
+                print(f"✗ Error processing {entry['job'].input_path}: {e!r}")
+                metas, events = [None] * len(stale), []
+            trace.extend(events)
+            store_results(cache, entry['job'], stale, metas, statuses)
+            done(target, entry, statuses)
+
+    def publish():
+        # Targets may share one publish() (e.g. a manifest covering several folders)
+        for target_publish in dict.fromkeys(target.publish for target in dirty if target.publish is not None):
+            target_publish()
+        dirty.clear()
+        cache.commit()
+        if on_idle is not None:
+            on_idle()
+
+    for directory in by_directory:
+        for path in sorted(directory.iterdir()):
+            note(path)
+
+    kind = 'inotify' if isinstance(watcher, InotifyWatcher) else 'polling'
+    print(f"\nWatching {len(by_directory)} folders ({kind}, {debounce:g}s debounce); Ctrl-C to stop")
+    for directory in by_directory:
+        print(f"  {os.path.relpath(directory)}")
+
+    previous_sigterm = signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        while True:
+            for path in watcher.wait(POLL_SECONDS if settling or running else IDLE_SECONDS):
+                note(path)
+
+            now = time.monotonic()
+            settled = []
+            for path, (target, signature, since) in list(settling.items()):
+                current = _signature(path)
+                if current is None:
+                    del settling[path]
+                elif current != signature:
+                    settling[path] = (target, current, now)
+                elif now - since >= debounce and path not in busy:
+                    del settling[path]
+                    settled.append((path, target))
+            for path, target in sorted(settled, key=lambda item: item[0]):
+                try:
+                    dispatch(target, path)
+                except Exception as e:
+                    print(f"✗ Error processing {path}: {e}")
+
+            finished = [f for f in running if f.done()]
+            collect(finished)
+            if finished or settled:
+                # Don't hold the catalog's write lock while waiting for the next files
+                cache.commit()
+
+            if dirty and not running and not settling:
+                publish()
+                print("Waiting for new files...")
+    except KeyboardInterrupt:
+        print("\nStopping watch (unfinished files stay in import/ and are picked up next time)")
+        # Workers ignore SIGINT, so the encodes already running finish and are kept
+        collect([f for f in list(running) if not f.cancel()])
+        if dirty:
+            publish()
+    finally:
+        signal.signal(signal.SIGTERM, previous_sigterm)
+        pool.shutdown(wait=True, cancel_futures=True)
+        watcher.close()
+        cache.commit()
@@ -0,0 +1,220 @@
+"""
+Process-pool encode engine shared by the asset optimization scripts.
+
+Scripts describe their work as a list of IngestJob entries (one per source
+image, each with the variants to derive from it). Cache lookups and cache
+writes happen in the parent process (SQLite is not shared across workers);
+only the decode + encode of stale variants fans out to the pool, and each
+worker sends its stage timings (trace.py) back with its results. Results
+always come back in job order, so anything done afterwards - moving
+originals, printing a summary - happens in the same order as a serial run.
+watch.py drives the same lookup / encode / store steps one job at a time.
+
+ingest_all() streams the stale jobs through three stages, so reading from
+slow media, encoding and writing overlap instead of taking turns:
+
+    read     a thread reads source files ahead into memory (at most
+             PREFETCH_DEPTH x jobs files waiting, none over PREFETCH_MAX_MB;
+             bigger files are decoded from disk by the worker)
+    encode   decode, resize and encode from those bytes, on the pool (or in
+             this process with --jobs 1), PREFETCH_DEPTH x jobs in flight
+    write    files.AsyncWriter writes each result atomically (temp file,
+             then rename) on its own thread, in the order results arrive
+
+Each queue is bounded, so a slow stage holds the earlier ones back rather
+than letting decoded files pile up in memory.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from . import trace
+from .files import AsyncWriter
+from .ingest import encode_original, ingest_original, write_variant
+from .trace import stage
+
+PREFETCH_DEPTH = 2     # files read ahead / encodes in flight, per worker
+PREFETCH_MAX_MB = 64   # larger sources (huge TIFFs) stay on disk for the worker to stream
+
+
+def default_jobs():
+    """Worker count used for --jobs 0: one per available CPU."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def add_jobs_argument(parser):
+    """Add the --jobs flag every script shares."""
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Parallel encode processes (0 = one per CPU, default: %(default)s)')
+
+
+def resolve_jobs(jobs):
+    return default_jobs() if jobs <= 0 else jobs
+
+
+def run_parallel(func, arg_lists, jobs=1):
+    """Call func(*args) for every entry of arg_lists, returning results in input order."""
+    jobs = resolve_jobs(jobs)
+    if jobs <= 1 or len(arg_lists) <= 1:
+        return [func(*args) for args in arg_lists]
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(arg_lists))) as pool:
+        futures = [pool.submit(func, *args) for args in arg_lists]
+        return [future.result() for future in futures]
+
+
+def ingest_traced(input_path, variants):
+    """ingest_original plus the stage events it recorded (they live in the worker process otherwise)."""
+    results = ingest_original(input_path, variants)
+    return results, trace.drain()
+
+
+def encode_traced(input_path, variants, data=None):
+    """encode_original plus the stage events it recorded."""
+    results = encode_original(input_path, variants, data)
+    return results, trace.drain()
+
+
+def read_source(path):
+    """The bytes of path to decode from memory, or None if it is too large to hold (or unreadable)."""
+    try:
+        size = os.path.getsize(path)
+        if size > PREFETCH_MAX_MB * 1024 * 1024:
+            return None
+        with stage('read', path, bytes_in=size):
+            with open(path, 'rb') as f:
+                return f.read()
+    except OSError:
+        return None  # the worker reports it when it opens the file
+
+
+def _prefetch(items, reads, stop):
+    # Reader thread: (job index, path) -> (job index, bytes) on reads, then None
+    for i, path in items:
+        data = read_source(path)
+        while not stop.is_set():
+            try:
+                reads.put((i, data), timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        if stop.is_set():
+            return
+    reads.put(None)
+
+
+def lookup_variants(cache, job):
+    """
+    Check the cache for every variant of job, restoring what it can.
+
+    Returns (statuses, stale): statuses as ingest_all() reports them, with
+    None for every variant still to encode, and stale as (variant index,
+    cache key) pairs for those.
+    """
+    statuses = [None] * len(job.variants)
+    stale = []
+    for v, variant in enumerate(job.variants):
+        key = None
+        if cache is not None:
+            key = cache.make_key(job.input_path, **variant.params)
+            if cache.is_fresh(key, variant.output_paths):
+                statuses[v] = 'fresh'
+                continue
+            if cache.restore(key, variant.output_paths, job.input_path):
+                statuses[v] = 'restored'
+                continue
+        stale.append((v, key))
+    return statuses, stale
+
+
+def ingest_args(job, stale):
+    """Arguments for ingest_traced() covering just the stale variants."""
+    return job.input_path, [job.variants[v] for v, _ in stale]
+
+
+def store_results(cache, job, stale, metas, statuses):
+    """Record the encodes a worker finished for job and mark them 'encoded' in statuses."""
+    for (v, key), meta in zip(stale, metas):
+        if meta is None:
+            continue
+        if cache is not None:
+            cache.store(key, job.variants[v].output_paths, job.input_path, meta)
+        statuses[v] = 'encoded'
+
+
+def ingest_all(cache, ingest_jobs, jobs=1):
+    """
+    Derive every variant the cache can't satisfy, decoding each source once.
+
+    Returns, per job, one status per variant: 'fresh', 'restored',
+    'encoded', or None when the encode failed.
+    """
+    statuses = []
+    pending = {}
+
+    for i, job in enumerate(ingest_jobs):
+        job_statuses, stale = lookup_variants(cache, job)
+        statuses.append(job_statuses)
+        if stale:
+            pending[i] = stale
+    if not pending:
+        return statuses
+
+    jobs = resolve_jobs(jobs)
+    depth = PREFETCH_DEPTH * jobs
+    reads = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    reader = threading.Thread(target=_prefetch, args=([(i, ingest_jobs[i].input_path) for i in pending], reads, stop),
+                              name='asset-reader', daemon=True)
+    writer = AsyncWriter()
+    pool = ProcessPoolExecutor(max_workers=min(jobs, len(pending))) if jobs > 1 and len(pending) > 1 else None
+    running = {}    # future -> job index
+    writes = {}     # job index -> [write future or None] per stale variant
+
+    def encoded(i, results):
+        job, stale = ingest_jobs[i], pending[i]
+        writes[i] = [writer.submit(write_variant, job.input_path, job.variants[v], result)
+                     if result is not None else None for (v, _), result in zip(stale, results)]
+
+    reader.start()
+    try:
+        exhausted = False
+        while not exhausted or running:
+            while not exhausted and len(running) < depth:
+                item = reads.get()
+                if item is None:
+                    exhausted = True
+                    break
+                i, data = item
+                args = ingest_args(ingest_jobs[i], pending[i]) + (data,)
+                if pool is None:
+                    encoded(i, encode_original(*args))
+                else:
+                    running[pool.submit(encode_traced, *args)] = i
+            if running:
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    try:
+                        results, events = future.result()
+                    except Exception as e:
+                        print(f"✗ Error processing {ingest_jobs[i].input_path}: {e}")
+                        results, events = [None] * len(pending[i]), []
+                    trace.extend(events)
+                    encoded(i, results)
+    finally:
+        stop.set()
+        writer.close()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    for i, stale in pending.items():
+        metas = [future.result() if future is not None else None for future in writes.get(i, [])]
+        store_results(cache, ingest_jobs[i], stale, metas, statuses[i])
+
+    return statuses
@@ -753,30 +753,36 @@ export class UIWebButton extends UIObj{
         this.imageAlpha = 0;
         this.targetImageAlpha = 0;
 
-        // Load project image
-        if (project.image) {
-            try {
-                // Use getMediaPath to handle imported assets properly
-                const imagePath = getMediaPath(project.image);
-                // Don't store the initial return value, wait for callback
-                p.loadImage(imagePath, (img) => {
-                    // Ensure we have a valid image with dimensions
-                    if (img && img.width > 0 && img.height > 0) {
-                        this.image = img; // Store the callback-provided image object
-                        this.imageLoaded = true;
-                        this.targetImageAlpha = 255; // Trigger fade-in animation
-                    } else {
-                        console.error('Invalid image loaded for', project.name, '- no dimensions');
-                        this.imageLoaded = false;
-                    }
-                }, (err) => {
-                    console.error('Image load failed for', project.name, ':', err);
-                    this.imageLoaded = false;
-                });
-            } catch (err) {
-                console.error('Error calling loadImage for', project.name, ':', err);
+        // Load project image (projects in a thumbnail atlas get theirs from the page via setImage)
+        if (project.image && !project.imageAtlas) {
+            this.loadImage();
+        }
+    }
+
+    loadImage(){
+        try {
+            // Use getMediaPath to handle imported assets properly
+            const imagePath = getMediaPath(this.project.image);
+            // Don't store the initial return value, wait for callback
+            this.p5.loadImage(imagePath, (img) => this.setImage(img), (err) => {
+                console.error('Image load failed for', this.project.name, ':', err);
                 this.imageLoaded = false;
-            }
+            });
+        } catch (err) {
+            console.error('Error calling loadImage for', this.project.name, ':', err);
+            this.imageLoaded = false;
+        }
+    }
+
+    setImage(img){
+        // Ensure we have a valid image with dimensions
+        if (img && img.width > 0 && img.height > 0) {
+            this.image = img; // Store the callback-provided image object
+            this.imageLoaded = true;
+            this.targetImageAlpha = 255; // Trigger fade-in animation
+        } else {
+            console.error('Invalid image loaded for', this.project.name, '- no dimensions');
+            this.imageLoaded = false;
         }
     }
 
@@ -83,16 +83,11 @@ import theReaderVideoThumb from 'url:../../assets/interactive/live/the-reader/th
 import wePlayVideoThumb from 'url:../../assets/interactive/live/we-play/thumbnails/IMG_7210_optimized_thumb.jpg';
 import lw131VideoThumb from 'url:../../assets/interactive/live/lw-13-1/thumbnails/LW13-1_comp_optimized_thumb.jpg';
 
-// Preview thumbnails (256x256 optimized for fast hover loading)
-import sketchingFlockPreview from 'url:../../assets/interactive/live/preview-thumbs/sketching-flock.webp';
-import wePlayPreview from 'url:../../assets/interactive/live/preview-thumbs/we-play.webp';
-import blindSpotsPreview from 'url:../../assets/interactive/live/preview-thumbs/blind-spots.webp';
-import theReaderPreview from 'url:../../assets/interactive/live/preview-thumbs/the-reader.webp';
-import longWinter131Preview from 'url:../../assets/interactive/live/preview-thumbs/long-winter-13-1.webp';
-import gameSetMatchPreview from 'url:../../assets/interactive/live/preview-thumbs/game-set-match.webp';
-import liveCodingPreview from 'url:../../assets/interactive/live/preview-thumbs/live-coding.webp';
-import birdConductorPreview from 'url:../../assets/interactive/live/preview-thumbs/bird-conductor.webp';
-import surveillYourselfPreview from 'url:../../assets/interactive/live/preview-thumbs/surveil-yourself.webp';
+// Preview thumbnails (256x256 optimized for fast hover loading), listed in the
+// manifest that optimize_preview_thumbs.py generates. Video projects may also
+// have an animated <slug>-loop.webp (optimize_preview_thumbs.py --loops), and
+// previewAtlas says where each still sits in preview-thumbs/atlas.webp (--atlas).
+import { assets as previewThumbs } from '../../assets/interactive/live/preview-thumbs/manifest.js';
 
 export const projects = [
     {
@@ -113,7 +108,9 @@ export const projects = [
             [sketchingFlockVideo1]: sketchingFlockVideo1Thumb,
             [sketchingFlockVideo2]: sketchingFlockVideo2Thumb
         },
-        previewThumbnail: sketchingFlockPreview
+        previewThumbnail: previewThumbs['sketching-flock.webp'].url,
+        previewAtlas: previewThumbs['sketching-flock.webp'].atlas,
+        previewLoop: previewThumbs['sketching-flock-loop.webp']?.url
     },
     {
         name: "We Play In The World They Make",
@@ -132,7 +129,9 @@ export const projects = [
         thumbnails: {
             [wePlayVideo]: wePlayVideoThumb
         },
-        previewThumbnail: wePlayPreview
+        previewThumbnail: previewThumbs['we-play.webp'].url,
+        previewAtlas: previewThumbs['we-play.webp'].atlas,
+        previewLoop: previewThumbs['we-play-loop.webp']?.url
     },
     {
         name: "Blind Spots",
@@ -150,7 +149,8 @@ export const projects = [
             [blindSpotsVideo1]: blindSpotsVideo1Thumb,
             [blindSpotsVideo2]: blindSpotsVideo2Thumb
         },
-        previewThumbnail: blindSpotsPreview
+        previewThumbnail: previewThumbs['blind-spots.webp'].url,
+        previewAtlas: previewThumbs['blind-spots.webp'].atlas
     },
     {
         name: "The Reader",
@@ -167,7 +167,9 @@ export const projects = [
         thumbnails: {
             [theReaderVideo]: theReaderVideoThumb
         },
-        previewThumbnail: theReaderPreview
+        previewThumbnail: previewThumbs['the-reader.webp'].url,
+        previewAtlas: previewThumbs['the-reader.webp'].atlas,
+        previewLoop: previewThumbs['the-reader-loop.webp']?.url
     },
     {
         name: "Long Winter 13.1",
@@ -188,7 +190,9 @@ export const projects = [
         thumbnails: {
             [lw131Video]: lw131VideoThumb
         },
-        previewThumbnail: longWinter131Preview
+        previewThumbnail: previewThumbs['long-winter-13-1.webp'].url,
+        previewAtlas: previewThumbs['long-winter-13-1.webp'].atlas,
+        previewLoop: previewThumbs['long-winter-13-1-loop.webp']?.url
     },
     {
         name: "Game, Set, Match",
@@ -209,7 +213,8 @@ export const projects = [
             [gameSetMatchVideo2]: gameSetMatchVideo2Thumb,
             [gameSetMatchVideo3]: gameSetMatchVideo3Thumb
         },
-        previewThumbnail: gameSetMatchPreview
+        previewThumbnail: previewThumbs['game-set-match.webp'].url,
+        previewAtlas: previewThumbs['game-set-match.webp'].atlas
     },
     {
         name: "Live Coding",
@@ -234,7 +239,9 @@ export const projects = [
             [liveCodingVideo4]: liveCodingVideo4Thumb,
             [liveCodingVideo5]: liveCodingVideo5Thumb
         },
-        previewThumbnail: liveCodingPreview
+        previewThumbnail: previewThumbs['live-coding.webp'].url,
+        previewAtlas: previewThumbs['live-coding.webp'].atlas,
+        previewLoop: previewThumbs['live-coding-loop.webp']?.url
     },
     {
         name: "Bird Conductor",
@@ -252,7 +259,9 @@ export const projects = [
         thumbnails: {
             [birdConductorVideo]: birdConductorVideoThumb
         },
-        previewThumbnail: birdConductorPreview
+        previewThumbnail: previewThumbs['bird-conductor.webp'].url,
+        previewAtlas: previewThumbs['bird-conductor.webp'].atlas,
+        previewLoop: previewThumbs['bird-conductor-loop.webp']?.url
     },
     {
         name: "Surveil Yourself",
@@ -275,7 +284,9 @@ export const projects = [
             [surveillYourselfVideo2]: surveillYourselfVideo2Thumb,
             [surveillYourselfVideo3]: surveillYourselfVideo3Thumb
         },
-        previewThumbnail: surveillYourselfPreview
+        previewThumbnail: previewThumbs['surveil-yourself.webp'].url,
+        previewAtlas: previewThumbs['surveil-yourself.webp'].atlas,
+        previewLoop: previewThumbs['surveil-yourself-loop.webp']?.url
     },
 ];
 
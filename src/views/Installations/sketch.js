@@ -1,5 +1,6 @@
 import { getViewportSize, UIPlanetButton, smoothFollow, loadGoogleFontSet, widthCheck, updateCursor, getMediaPath, isVideoFile, calculateCropDimensions, daysSince, radialToCartesian, isDesktopOnly } from "../../utils";
 import { projects, findProjectBySlug, getProjectIndexBySlug } from "./project-details";
+import { assets as previewThumbs } from '../../assets/interactive/live/preview-thumbs/manifest.js';
 
 export const sketch = function (p, options = {}) {
     let short = 128;
@@ -1217,11 +1218,67 @@ export const sketch = function (p, options = {}) {
     }
 
 
+    // Every planet's still comes out of one shared atlas request when the preview manifest has an atlas
+    let previewAtlasSheet = null;
+    let previewAtlasWaiting = null;
+
+    function loadPreviewAtlas(frame, onLoad, onError) {
+        const sheet = previewThumbs[frame.file];
+        if (previewAtlasSheet) {
+            onLoad(previewAtlasSheet, previewAtlasSheet.width / sheet.width);
+            return;
+        }
+        if (previewAtlasWaiting) {
+            previewAtlasWaiting.push({ onLoad, onError });
+            return;
+        }
+        previewAtlasWaiting = [{ onLoad, onError }];
+
+        // Smallest sheet whose cells still cover the drawn preview
+        const drawnSize = (mobile ? 70 : 160) * p.pixelDensity();
+        const hiDpi = sheet.variants.find((variant) => variant.width === sheet.width * 2);
+        const url = hiDpi && frame.width < drawnSize ? hiDpi.url : sheet.url;
+        p.loadImage(url, (img) => {
+            previewAtlasSheet = img;
+            previewAtlasWaiting.forEach((waiting) => waiting.onLoad(img, img.width / sheet.width));
+            previewAtlasWaiting = null;
+        }, (err) => {
+            console.warn('Failed to load preview atlas:', err);
+            previewAtlasWaiting.forEach((waiting) => waiting.onError());
+            previewAtlasWaiting = null;
+        });
+    }
+
     function loadPreviewMedia(planetButton, project) {
+        if (project && project.previewAtlas) {
+            const frame = project.previewAtlas;
+            loadPreviewAtlas(frame, (sheet, scale) => {
+                planetButton.previewMedia = sheet.get(frame.x * scale, frame.y * scale,
+                    frame.width * scale, frame.height * scale);
+                loadPreviewLoop(planetButton, project);
+            }, () => loadPreviewThumbnail(planetButton, project));
+        } else {
+            loadPreviewThumbnail(planetButton, project);
+        }
+    }
+
+    function loadPreviewLoop(planetButton, project) {
+        // Swap in the animated loop once it arrives; the still shows meanwhile
+        if (project.previewLoop) {
+            p.loadImage(project.previewLoop, (loop) => {
+                planetButton.previewMedia = loop;
+            }, (err) => {
+                console.warn('Failed to load preview loop:', err);
+            });
+        }
+    }
+
+    function loadPreviewThumbnail(planetButton, project) {
         if (project && project.previewThumbnail) {
             // Use optimized 256x256 preview thumbnail for fast loading
             p.loadImage(project.previewThumbnail, (img) => {
                 planetButton.previewMedia = img;
+                loadPreviewLoop(planetButton, project);
             }, (err) => {
                 console.warn('Failed to load preview thumbnail:', err);
                 // Fallback to original logic if preview thumbnail fails
@@ -1,93 +1,65 @@
-// Portrait collection media imports
-import portraitHero from 'url:../../assets/photos/portrait/hero.webp';
+// The photos the galleries show are listed in the generated manifest (written
+// by src/assets/photos/optimize_photos.py and optimize_hero_thumbs.py)
+import { assets, galleries, placeholders } from '../../assets/photos/manifest.js';
 
-// Optimized hero thumbnails (768x768 for fast loading)
-import portraitHeroThumb from 'url:../../assets/photos/hero-thumbs/portrait-hero.webp';
-import performanceHeroThumb from 'url:../../assets/photos/hero-thumbs/performance-hero.webp';
-import aberrantHeroThumb from 'url:../../assets/photos/hero-thumbs/aberrant-hero.webp';
-import astroHeroThumb from 'url:../../assets/photos/hero-thumbs/astro-hero.webp';
-import portrait01 from 'url:../../assets/photos/portrait/portrait-01.webp';
-import portrait02 from 'url:../../assets/photos/portrait/portrait-02.webp';
-import portrait03 from 'url:../../assets/photos/portrait/portrait-03.webp';
-import portrait04 from 'url:../../assets/photos/portrait/portrait-04.webp';
-import portrait05 from 'url:../../assets/photos/portrait/portrait-05.webp';
-import portrait06 from 'url:../../assets/photos/portrait/portrait-06.webp';
-import portrait07 from 'url:../../assets/photos/portrait/portrait-07.webp';
-import portrait08 from 'url:../../assets/photos/portrait/portrait-08.webp';
-import portrait09 from 'url:../../assets/photos/portrait/portrait-09.webp';
-import portrait10 from 'url:../../assets/photos/portrait/portrait-10.webp';
-import portrait11 from 'url:../../assets/photos/portrait/portrait-11.webp';
-import portrait12 from 'url:../../assets/photos/portrait/portrait-12.webp';
-import portrait13 from 'url:../../assets/photos/portrait/portrait-13.webp';
-import portrait14 from 'url:../../assets/photos/portrait/portrait-14.webp';
-import portrait15 from 'url:../../assets/photos/portrait/portrait-15.webp';
-import portrait16 from 'url:../../assets/photos/portrait/portrait-16.webp';
-import portrait17 from 'url:../../assets/photos/portrait/portrait-17.webp';
-import portrait18 from 'url:../../assets/photos/portrait/portrait-18.webp';
-import portrait19 from 'url:../../assets/photos/portrait/portrait-19.webp';
-import portrait21 from 'url:../../assets/photos/portrait/portrait-21.webp';
-import portrait22 from 'url:../../assets/photos/portrait/portrait-22.webp';
-import portrait23 from 'url:../../assets/photos/portrait/portrait-23.webp';
-import portrait24 from 'url:../../assets/photos/portrait/portrait-24.webp';
-import portrait25 from 'url:../../assets/photos/portrait/portrait-25.webp';
-import portrait26 from 'url:../../assets/photos/portrait/portrait-26.webp';
-import portrait27 from 'url:../../assets/photos/portrait/portrait-27.webp';
-import portrait28 from 'url:../../assets/photos/portrait/portrait-28.webp';
+// URL of a published photo by its path under src/assets/photos; fails loudly
+// if the file is missing instead of leaving a hole in a gallery
+const photo = (path) => {
+    const asset = assets[path];
+    if (!asset) {
+        throw new Error(`Photo not in manifest: ${path} (re-run optimize_photos.py)`);
+    }
+    return asset.url;
+};
+
+// Manifest entry (dimensions, colors, placeholder once loaded) for a photo URL
+const assetsByUrl = new Map(Object.entries(assets).map(([path, asset]) => [asset.url, { path, ...asset }]));
+export const photoDetails = (url) => assetsByUrl.get(url);
 
-// Performance collection media imports
-import performanceHero from 'url:../../assets/photos/performance/hero.webp';
-import performance01 from 'url:../../assets/photos/performance/performance-01.webp';
-import performance02 from 'url:../../assets/photos/performance/performance-02.webp';
-import performance03 from 'url:../../assets/photos/performance/performance-03.webp';
-import performance05 from 'url:../../assets/photos/performance/performance-05.webp';
-import performance06 from 'url:../../assets/photos/performance/performance-06.webp';
-import performance07 from 'url:../../assets/photos/performance/performance-07.webp';
-import performance08 from 'url:../../assets/photos/performance/performance-08.webp';
-import performance09 from 'url:../../assets/photos/performance/performance-09.webp';
-import performance10 from 'url:../../assets/photos/performance/performance-10.webp';
-import performance11 from 'url:../../assets/photos/performance/performance-11.webp';
-import performance12 from 'url:../../assets/photos/performance/performance-12.webp';
-import performance13 from 'url:../../assets/photos/performance/performance-13.webp';
-import performance14 from 'url:../../assets/photos/performance/performance-14.webp';
-import performance15 from 'url:../../assets/photos/performance/performance-15.webp';
-import performance16 from 'url:../../assets/photos/performance/performance-16.webp';
-import performance17 from 'url:../../assets/photos/performance/performance-17.webp';
-import performance18 from 'url:../../assets/photos/performance/performance-18.webp';
-import performance19 from 'url:../../assets/photos/performance/performance-19.webp';
-import performance20 from 'url:../../assets/photos/performance/performance-20.webp';
-import performance21 from 'url:../../assets/photos/performance/performance-21.webp';
+// The srcset ladder of a photo, smallest first: its WebP variants in the
+// manifest (the sizes/ files srcset.json lists) plus the full image
+const photoLadder = (url) => {
+    const details = assetsByUrl.get(url);
+    if (!details) {
+        return [];
+    }
+    const steps = details.variants.filter(v => v.format === 'webp' && v.width < details.width);
+    return [...steps, details].sort((a, b) => a.width - b.width);
+};
 
-// Aberrant collection media imports
-import aberrantHero from 'url:../../assets/photos/aberrant/hero.webp';
-import aberrant01 from 'url:../../assets/photos/aberrant/aberrant-01.webp';
-import aberrant02 from 'url:../../assets/photos/aberrant/aberrant-02.webp';
-import aberrant03 from 'url:../../assets/photos/aberrant/aberrant-03.webp';
-import aberrant04 from 'url:../../assets/photos/aberrant/aberrant-04.webp';
-import aberrant05 from 'url:../../assets/photos/aberrant/aberrant-05.webp';
-import aberrant06 from 'url:../../assets/photos/aberrant/aberrant-06.webp';
-import aberrant07 from 'url:../../assets/photos/aberrant/aberrant-07.webp';
-import aberrant08 from 'url:../../assets/photos/aberrant/aberrant-08.webp';
-import aberrant09 from 'url:../../assets/photos/aberrant/aberrant-09.webp';
-import aberrant10 from 'url:../../assets/photos/aberrant/aberrant-10.webp';
-import aberrant11 from 'url:../../assets/photos/aberrant/aberrant-11.webp';
-import aberrant12 from 'url:../../assets/photos/aberrant/aberrant-12.webp';
-import aberrant13 from 'url:../../assets/photos/aberrant/aberrant-13.webp';
-import aberrant14 from 'url:../../assets/photos/aberrant/aberrant-14.webp';
-import aberrant15 from 'url:../../assets/photos/aberrant/aberrant-15.webp';
+// srcset attribute for a photo URL
+export const photoSrcset = (url) => photoLadder(url).map(step => `${step.url} ${step.width}w`).join(', ');
 
-// Astro collection media imports
-import astroHero from 'url:../../assets/photos/astro/hero.webp';
-import astro01 from 'url:../../assets/photos/astro/astro-01.webp';
-import astro02 from 'url:../../assets/photos/astro/astro-02.webp';
-import astro03 from 'url:../../assets/photos/astro/astro-03.webp';
-import astro04 from 'url:../../assets/photos/astro/astro-04.webp';
-import astro05 from 'url:../../assets/photos/astro/astro-05.webp';
-import astro06 from 'url:../../assets/photos/astro/astro-06.webp';
-import astro07 from 'url:../../assets/photos/astro/astro-07.webp';
-import astro08 from 'url:../../assets/photos/astro/astro-08.webp';
-import astro09 from 'url:../../assets/photos/astro/astro-09.webp';
-import astro10 from 'url:../../assets/photos/astro/astro-10.webp';
-import astro11 from 'url:../../assets/photos/astro/astro-11.webp';
+// Smallest ladder step at least `width` pixels wide (the full image if none is)
+export const photoSource = (url, width) => {
+    const ladder = photoLadder(url);
+    const step = ladder.find(s => s.width >= width) || ladder[ladder.length - 1];
+    return step ? step.url : url;
+};
+
+// Blurred placeholders are split out per collection so they stay out of the
+// startup bundle; fetched once when a gallery opens
+const placeholderLoads = new Map();
+export const loadPlaceholders = (slug) => {
+    if (!placeholderLoads.has(slug) && placeholders[slug]) {
+        placeholderLoads.set(slug, placeholders[slug]().then((module) => {
+            assetsByUrl.forEach((details) => {
+                if (module.placeholders[details.path]) {
+                    details.placeholder = module.placeholders[details.path];
+                }
+            });
+        }));
+    }
+    return placeholderLoads.get(slug) || Promise.resolve();
+};
+
+// Hero first, then the numbered gallery images in the order
+// src/assets/photos/galleries.json gives (numbers left out are published but
+// not shown; new imports are appended there)
+const gallery = (slug) => [
+    photo(`${slug}/hero.webp`),
+    ...galleries[slug].map(n => photo(`${slug}/${slug}-${String(n).padStart(2, '0')}.webp`))
+];
 
 // Photo collections data structure
 export const photoCollections = [
@@ -96,114 +68,36 @@ export const photoCollections = [
         name: 'PORTRAIT',
         slug: 'portrait',
         description: 'Subjects in controlled and natural environments',
-        heroImage: portraitHero,
-        heroImageThumb: portraitHeroThumb,
-        images: [
-            portraitHero, // Hero image as first gallery item
-            portrait27,
-            portrait26,
-            portrait01,
-            portrait17,
-            portrait18,
-            portrait15,
-            portrait21,
-            portrait28,
-            portrait19,
-            portrait10,
-            portrait06,
-            portrait24,
-            portrait25,
-            portrait11,
-            portrait16,
-            portrait04,
-            portrait05,
-            portrait07,
-            portrait22,
-            portrait08,
-            portrait23,
-            portrait09,
-            portrait12,
-            portrait13,
-            portrait14,
-            portrait02,
-            portrait03,
-        ]
+        heroImage: photo('portrait/hero.webp'),
+        heroImageThumb: photo('hero-thumbs/portrait-hero.webp'),
+        images: gallery('portrait')
     },
     {
         id: 'aberrant',
         name: 'ABERRANT',
         slug: 'aberrant',
         description: 'Experimental and conceptual photographic explorations',
-        heroImage: aberrantHero,
-        heroImageThumb: aberrantHeroThumb,
-        images: [
-            aberrantHero, // Hero image as first gallery item
-            aberrant15,
-            aberrant13,
-            aberrant01,
-            aberrant02,
-            aberrant07,
-            aberrant08,
-            aberrant03,
-            aberrant04,
-            aberrant05,
-            aberrant06,
-            aberrant09,
-            aberrant10,
-            aberrant11,
-            aberrant12,
-            aberrant14,
-        ]
+        heroImage: photo('aberrant/hero.webp'),
+        heroImageThumb: photo('hero-thumbs/aberrant-hero.webp'),
+        images: gallery('aberrant')
     },
     {
         id: 'performance',
         name: 'PERFORMANCE',
         slug: 'performance',
         description: 'Concerts, live events, and artistic performances',
-        heroImage: performanceHero,
-        heroImageThumb: performanceHeroThumb,
-        images: [
-            performanceHero, // Hero image as first gallery item
-            performance20,
-            performance18,
-            performance08,
-            performance09,
-            performance17,
-            performance01,
-            performance12,
-            performance14,
-            performance15,
-            performance11,
-            performance03,
-            performance10,
-            performance02,
-            performance19,
-            performance06,
-            performance07,
-            performance05,
-            performance21,
-        ]
+        heroImage: photo('performance/hero.webp'),
+        heroImageThumb: photo('hero-thumbs/performance-hero.webp'),
+        images: gallery('performance')
     },
     {
         id: 'astro',
         name: 'ASTRO',
         slug: 'astro',
         description: 'Celestial objects and astronomical phenomena',
-        heroImage: astroHero,
-        heroImageThumb: astroHeroThumb,
-        images: [
-            astroHero, // Hero image as first gallery item
-            astro01,
-            astro02,
-            astro09,
-            astro03,
-            astro04,
-            astro05,
-            astro06,
-            astro07,
-            astro10,
-            astro11
-        ]
+        heroImage: photo('astro/hero.webp'),
+        heroImageThumb: photo('hero-thumbs/astro-hero.webp'),
+        images: gallery('astro')
     }
 ];
 
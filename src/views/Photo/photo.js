@@ -1,6 +1,10 @@
 import { html } from "lit-html";
 
-import { photoCollections, findCollectionBySlug } from './photo-collections';
+import { photoCollections, findCollectionBySlug, photoSrcset } from './photo-collections';
+
+// Grid cells are square with object-fit: cover, so a 3:2 photo is drawn at
+// 1.5x the cell width (cells are 25% of the grid, 50% on phones)
+const GALLERY_SIZES = '(max-width: 768px) 75vw, min(38vw, 600px)';
 
 export default (props) => {
     const options = {};
@@ -27,6 +31,8 @@ export default (props) => {
                         <div class="photo-gallery-item" data-index="${index}">
                             <img 
                                 src="${imagePath}" 
+                                srcset="${photoSrcset(imagePath)}"
+                                sizes="${GALLERY_SIZES}"
                                 alt="${collection.name} ${index + 1}"
                                 class="photo-gallery-image"
                                 data-lightbox-index="${index}"
@@ -1,5 +1,5 @@
 import { getViewportSize, smoothFollow, loadGoogleFontSet, widthCheck, updateCursor, daysSince } from "../../utils";
-import { photoCollections, findCollectionBySlug, getCollectionIndexBySlug, getNextCollection, getPreviousCollection } from "./photo-collections";
+import { photoCollections, findCollectionBySlug, getCollectionIndexBySlug, getNextCollection, getPreviousCollection, photoDetails, loadPlaceholders, photoSource } from "./photo-collections";
 
 export const sketch = function (p, options = {}) {
     let mode = 'collections'; // 'collections' or 'gallery'
@@ -94,6 +94,11 @@ export const sketch = function (p, options = {}) {
 
         if (mode === 'collections') {
             setupCollectionCards();
+        } else if (currentCollection) {
+            // The lightbox placeholders come in a separate chunk per collection
+            loadPlaceholders(currentCollection.slug).then(() => {
+                needsRedraw = true;
+            });
         }
 
         layoutInitialized = true;
@@ -286,8 +291,8 @@ export const sketch = function (p, options = {}) {
         // Check if we're waiting for a lightbox image to load
         const waitingForLightboxImage = lightboxOpen && currentCollection &&
             lightboxImageIndex < currentCollection.images.length &&
-            (!loadedImages.get(currentCollection.images[lightboxImageIndex]) ||
-             !loadedImages.get(currentCollection.images[lightboxImageIndex]).loaded);
+            (!loadedImages.get(lightboxSource(lightboxImageIndex)) ||
+             !loadedImages.get(lightboxSource(lightboxImageIndex)).loaded);
 
         animating = lightboxAnimating || hasActiveAnimations || waitingForLightboxImage;
 
@@ -523,26 +528,12 @@ export const sketch = function (p, options = {}) {
         p.rect(0, 0, p.width, p.height);
 
         const imagePath = currentCollection.images[lightboxImageIndex];
-        const loadedImg = loadedImages.get(imagePath);
+        const imageSource = lightboxSource(lightboxImageIndex);
+        const loadedImg = loadedImages.get(imageSource);
 
         // Render image if loaded
         if (loadedImg && loadedImg.loaded) {
-            // Calculate image size to fit screen
-            const maxWidth = p.width * 0.9;
-            const maxHeight = p.height * 0.8;
-            const aspectRatio = loadedImg.element.width / loadedImg.element.height;
-
-            let imgWidth, imgHeight;
-            if (aspectRatio > maxWidth / maxHeight) {
-                imgWidth = maxWidth;
-                imgHeight = maxWidth / aspectRatio;
-            } else {
-                imgHeight = maxHeight;
-                imgWidth = maxHeight * aspectRatio;
-            }
-
-            const imgX = (p.width - imgWidth) / 2;
-            const imgY = (p.height - imgHeight) / 2;
+            const { imgX, imgY, imgWidth, imgHeight } = lightboxImageRect(loadedImg.element.width / loadedImg.element.height);
 
             // Render image
             p.push();
@@ -551,7 +542,10 @@ export const sketch = function (p, options = {}) {
             p.pop();
         } else {
             // Load image if not already loaded
-            loadImage(imagePath);
+            loadImage(imageSource);
+
+            // Paint the blurred placeholder from the manifest until the full image arrives
+            renderPlaceholder(photoDetails(imagePath));
 
             // Start timing if not already started for this image
             if (lightboxImageLoadStart === 0) {
@@ -746,25 +740,10 @@ export const sketch = function (p, options = {}) {
     function handleLightboxClick() {
         if (!currentCollection) return;
 
-        const imagePath = currentCollection.images[lightboxImageIndex];
-        const loadedImg = loadedImages.get(imagePath);
+        const loadedImg = loadedImages.get(lightboxSource(lightboxImageIndex));
 
         if (loadedImg && loadedImg.loaded) {
-            const maxWidth = p.width * 0.9;
-            const maxHeight = p.height * 0.8;
-            const aspectRatio = loadedImg.element.width / loadedImg.element.height;
-
-            let imgWidth, imgHeight;
-            if (aspectRatio > maxWidth / maxHeight) {
-                imgWidth = maxWidth;
-                imgHeight = maxWidth / aspectRatio;
-            } else {
-                imgHeight = maxHeight;
-                imgWidth = maxHeight * aspectRatio;
-            }
-
-            const imgX = (p.width - imgWidth) / 2;
-            const imgY = (p.height - imgHeight) / 2;
+            const { imgX, imgY, imgWidth, imgHeight } = lightboxImageRect(loadedImg.element.width / loadedImg.element.height);
 
             // Navigation arrows with static position and wrapping
             if (currentCollection.images.length > 1) {
@@ -873,6 +852,55 @@ export const sketch = function (p, options = {}) {
         }
     }
 
+    // The srcset ladder step that covers the lightbox at the current canvas size,
+    // so a phone fetches a 960px file instead of the 1920px original
+    function lightboxSource(index) {
+        const imagePath = currentCollection.images[index];
+        const details = photoDetails(imagePath);
+        if (!details) return imagePath;
+        return photoSource(imagePath, lightboxImageRect(details.width / details.height).imgWidth);
+    }
+
+    // Largest rect with the given aspect ratio that fits the lightbox area
+    function lightboxImageRect(aspectRatio) {
+        const maxWidth = p.width * 0.9;
+        const maxHeight = p.height * 0.8;
+
+        let imgWidth, imgHeight;
+        if (aspectRatio > maxWidth / maxHeight) {
+            imgWidth = maxWidth;
+            imgHeight = maxWidth / aspectRatio;
+        } else {
+            imgHeight = maxHeight;
+            imgWidth = maxHeight * aspectRatio;
+        }
+
+        return { imgX: (p.width - imgWidth) / 2, imgY: (p.height - imgHeight) / 2, imgWidth, imgHeight };
+    }
+
+    function renderPlaceholder(details) {
+        if (!details) return;
+
+        const { imgX, imgY, imgWidth, imgHeight } = lightboxImageRect(details.width / details.height);
+        const placeholder = details.placeholder && loadedImages.get(details.placeholder);
+
+        p.push();
+        if (placeholder && placeholder.loaded) {
+            p.tint(255, lightboxAlpha);
+            p.image(placeholder.element, imgX, imgY, imgWidth, imgHeight);
+        } else {
+            if (details.placeholder) {
+                loadImage(details.placeholder);
+            }
+            const color = p.color(details.color);
+            color.setAlpha(lightboxAlpha);
+            p.noStroke();
+            p.fill(color);
+            p.rect(imgX, imgY, imgWidth, imgHeight);
+        }
+        p.pop();
+    }
+
     function loadImage(imagePath) {
         if (loadedImages.has(imagePath)) return;
 
@@ -1,13 +1,6 @@
-// Web thumbnail imports
-import asteroidsThumb from 'url:../../assets/interactive/web/thumbnails/asteroids.webp';
-import dimensionDoorThumb from 'url:../../assets/interactive/web/thumbnails/dimension-door.webp';
-import flowFieldsThumb from 'url:../../assets/interactive/web/thumbnails/flow-fields.webp';
-import galaxyCollisionThumb from 'url:../../assets/interactive/web/thumbnails/galaxy-collision.webp';
-import infiniteBauhausThumb from 'url:../../assets/interactive/web/thumbnails/infinite-bauhaus.webp';
-import koiPondThumb from 'url:../../assets/interactive/web/thumbnails/koi-pond.webp';
-import lavaLampThumb from 'url:../../assets/interactive/web/thumbnails/lava-lamp.webp';
-import nissan300zxThumb from 'url:../../assets/interactive/web/thumbnails/nissan-300zx-z31.webp';
-import strangeInkThumb from 'url:../../assets/interactive/web/thumbnails/strange-ink.webp';
+// Web thumbnails, listed in the manifest that optimize_thumbnails.py generates;
+// imageAtlas says where each sits in thumbnails/atlas.webp (--atlas)
+import { assets as webThumbs } from '../../assets/interactive/web/thumbnails/manifest.js';
 
 // Web Experiences Project Data
 // Each project represents an interactive web experience or creative coding project
@@ -17,7 +10,7 @@ import strangeInkThumb from 'url:../../assets/interactive/web/thumbnails/strange
 //   - "local": hosted on same domain, allows framerate optimization
 //   - "external": third-party platforms (OpenProcessing, CodePen, etc.)
 // - url: path to HTML file (local) or embed URL (external)
-// - image: imported thumbnail reference
+// - image: thumbnail URL from the thumbnail manifest (imageAtlas: its cell in the atlas)
 //
 // Local Project Directory Structure:
 // src/assets/interactive/sketches/
@@ -37,7 +30,8 @@ export const projects = [
         year: "2024",
         description: "A swirling psychedelic vortex of multicoloured squares twists aggressively back and forth, seemingly descending into the black background.",
         subtitle: "SKETCH",
-        image: dimensionDoorThumb,
+        image: webThumbs['dimension-door.webp'].url,
+        imageAtlas: webThumbs['dimension-door.webp'].atlas,
         type: "local", // "local" or "external"
         url: null // Local sketches use slug for lookup, no URL needed
     },
@@ -47,7 +41,8 @@ export const projects = [
         year: "2025",
         description: "An extremely simple program that produces a fascinating, liquid-like output using no physics or simulation algorithms.",
         subtitle: "INTERACTIVE",
-        image: strangeInkThumb,
+        image: webThumbs['strange-ink.webp'].url,
+        imageAtlas: webThumbs['strange-ink.webp'].atlas,
         type: "local",
         url: null // Local sketches use slug for lookup, no URL needed
     },
@@ -57,7 +52,8 @@ export const projects = [
         year: "2024",
         description: "Fishy :)",
         subtitle: "SKETCH",
-        image: koiPondThumb,
+        image: webThumbs['koi-pond.webp'].url,
+        imageAtlas: webThumbs['koi-pond.webp'].atlas,
         type: "local", // Example of a local project
         url: null // Local sketches use slug for lookup, no URL needed
     },
@@ -67,7 +63,8 @@ export const projects = [
         year: "2023",
         description: "Groovy.",
         subtitle: "SKETCH",
-        image: lavaLampThumb,
+        image: webThumbs['lava-lamp.webp'].url,
+        imageAtlas: webThumbs['lava-lamp.webp'].atlas,
         type: "local",
         url: null // Local sketches use slug for lookup, no URL needed
     },
@@ -77,7 +74,8 @@ export const projects = [
         year: "2023",
         description: "Bauhaus, infinitely.",
         subtitle: "SKETCH",
-        image: infiniteBauhausThumb,
+        image: webThumbs['infinite-bauhaus.webp'].url,
+        imageAtlas: webThumbs['infinite-bauhaus.webp'].atlas,
         type: "local",
         url: null // Local sketches use slug for lookup, no URL needed
     },
@@ -87,7 +85,8 @@ export const projects = [
         year: "2024",
         description: "Oop.",
         subtitle: "SKETCH",
-        image: galaxyCollisionThumb,
+        image: webThumbs['galaxy-collision.webp'].url,
+        imageAtlas: webThumbs['galaxy-collision.webp'].atlas,
         type: "local",
         url: null // Local sketches use slug for lookup, no URL needed
     },
@@ -97,7 +96,8 @@ export const projects = [
         year: "2023",
         description: "Configurable perlin noise field driving particle velocity.",
         subtitle: "INTERACTIVE",
-        image: flowFieldsThumb,
+        image: webThumbs['flow-fields.webp'].url,
+        imageAtlas: webThumbs['flow-fields.webp'].atlas,
         type: "local",
         url: null // Local sketches use slug for lookup, no URL needed
     },
@@ -107,7 +107,8 @@ export const projects = [
         year: "2024",
         description: "Asteroids!",
         subtitle: "GAME",
-        image: asteroidsThumb,
+        image: webThumbs['asteroids.webp'].url,
+        imageAtlas: webThumbs['asteroids.webp'].atlas,
         type: "local",
         url: null // Local sketches use slug for lookup, no URL needed
     },
@@ -117,7 +118,8 @@ export const projects = [
         year: "2023",
         description: "A close digital clone of the speedometer and tachometer from the 1987 Nizzan 300ZX Z31",
         subtitle: "INTERACTIVE",
-        image: nissan300zxThumb,
+        image: webThumbs['nissan-300zx-z31.webp'].url,
+        imageAtlas: webThumbs['nissan-300zx-z31.webp'].atlas,
         type: "local",
         url: null // Local sketches use slug for lookup, no URL needed
     }
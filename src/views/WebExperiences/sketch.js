@@ -1,5 +1,6 @@
 import { getViewportSize, loadGoogleFontSet, widthCheck, daysSince, UIWebButton, updateCursor, getMediaPath } from "../../utils";
 import { projects } from "./project-details.js";
+import { assets as webThumbs } from '../../assets/interactive/web/thumbnails/manifest.js';
 import { localSketches } from "./webexperiences.js";
 
 export const sketch = function (p, options = {}) {
@@ -83,11 +84,36 @@ export const sketch = function (p, options = {}) {
 
 			webButtons.push(button);
 		}
+		loadThumbnailAtlas();
 
 		// Calculate days since project start (different from installations)
 		sols = daysSince('2019-09-05');
 	};
 
+	// Every thumbnail in the atlas comes out of one shared request; the rest load their own file
+	function loadThumbnailAtlas() {
+		const atlased = webButtons.filter((button) => button.project.imageAtlas);
+		if (atlased.length === 0) {
+			return;
+		}
+		const sheet = webThumbs[atlased[0].project.imageAtlas.file];
+
+		// Smallest sheet whose cells still cover the largest drawn thumbnail
+		const drawnSize = p.max(atlased.map((button) => button.scale)) * p.pixelDensity();
+		const hiDpi = sheet.variants.find((variant) => variant.width === sheet.width * 2);
+		const url = hiDpi && atlased[0].project.imageAtlas.width < drawnSize ? hiDpi.url : sheet.url;
+		p.loadImage(url, (img) => {
+			const scale = img.width / sheet.width;
+			atlased.forEach((button) => {
+				const frame = button.project.imageAtlas;
+				button.setImage(img.get(frame.x * scale, frame.y * scale, frame.width * scale, frame.height * scale));
+			});
+		}, (err) => {
+			console.warn('Failed to load thumbnail atlas:', err);
+			atlased.forEach((button) => button.loadImage());
+		});
+	}
+
 	p.draw = function() {
 		p.background(22);
         t++;